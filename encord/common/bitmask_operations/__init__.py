@@ -1,26 +1,76 @@
+# Backends in order of preference: compiled pycocotools, vectorised NumPy, pure Python
 try:
-    from encord.common.bitmask_operations.bitmask_operations_numpy import (
+    from encord.common.bitmask_operations.bitmask_operations_pycocotools import (
         _mask_to_rle,
         _rle_to_mask,
         _rle_to_string,
         _string_to_rle,
+        coco_rle_to_row_major_string,
         deserialise_bitmask,
         serialise_bitmask,
         transpose_bytearray,
     )
 except ImportError:
-    from encord.common.bitmask_operations.bitmask_operations import (
-        _mask_to_rle,
-        _rle_to_mask,
-        _rle_to_string,
-        _string_to_rle,
-        deserialise_bitmask,
-        serialise_bitmask,
-        transpose_bytearray,
-    )
+    try:
+        from encord.common.bitmask_operations.bitmask_operations_numpy import (
+            _mask_to_rle,
+            _rle_to_mask,
+            _rle_to_string,
+            _string_to_rle,
+            coco_rle_to_row_major_string,
+            deserialise_bitmask,
+            serialise_bitmask,
+            transpose_bytearray,
+        )
+    except ImportError:
+        from encord.common.bitmask_operations.bitmask_operations import (
+            _mask_to_rle,
+            _rle_to_mask,
+            _rle_to_string,
+            _string_to_rle,
+            coco_rle_to_row_major_string,
+            deserialise_bitmask,
+            serialise_bitmask,
+            transpose_bytearray,
+        )
+
+# Operations on runs scale with the number of runs rather than pixels, so they need no accelerated backend
+from encord.common.bitmask_operations.bitmask_operations import (
+    crop_ranges,
+    intersect_ranges,
+    intersection_area,
+    merge_ranges,
+    merge_rle_counts,
+    ranges_area,
+    ranges_bbox,
+    ranges_to_mask_rle_counts,
+    rle_counts_area,
+    rle_counts_bbox,
+    rle_counts_intersection,
+    rle_counts_iou,
+    rle_counts_to_ranges,
+    rle_counts_union,
+    uncrop_ranges,
+)
 
 __all__ = [
+    "coco_rle_to_row_major_string",
+    "crop_ranges",
     "deserialise_bitmask",
+    "intersect_ranges",
+    "intersection_area",
+    "merge_ranges",
+    "merge_rle_counts",
+    "ranges_area",
+    "ranges_bbox",
+    "ranges_to_mask_rle_counts",
+    "rle_counts_area",
+    "rle_counts_bbox",
+    "rle_counts_intersection",
+    "rle_counts_iou",
+    "rle_counts_to_ranges",
+    "rle_counts_union",
     "serialise_bitmask",
     "transpose_bytearray",
+    "uncrop_ranges",
 ]
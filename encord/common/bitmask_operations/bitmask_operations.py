@@ -1,5 +1,8 @@
+import bisect
+import heapq
+import sys
 from itertools import groupby
-from typing import List, Sequence, Set, Tuple
+from typing import Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 
 def _string_to_rle(mask_string: str) -> List[int]:
@@ -32,7 +35,7 @@ def _string_to_rle(mask_string: str) -> List[int]:
 
 def _rle_to_string(rle: Sequence[int]) -> str:
     """COCO-compatible RLE-encoded mask to string serialisation"""
-    rle_string = ""
+    chars: List[str] = []
     for i, x in enumerate(rle):
         if i > 2:
             x -= rle[i - 2]
@@ -51,9 +54,9 @@ def _rle_to_string(rle: Sequence[int]) -> str:
                 c |= 0x20
 
             c += 48
-            rle_string += chr(c)
+            chars.append(chr(c))
 
-    return rle_string
+    return "".join(chars)
 
 
 def _mask_to_rle(mask: bytes) -> List[int]:
@@ -102,6 +105,15 @@ def transpose_bytearray(byte_data: bytes, shape: Tuple[int, int]) -> bytes:
     return transposed_byte_data
 
 
+def coco_rle_to_row_major_string(counts: Union[str, Sequence[int]], shape: Tuple[int, int]) -> str:
+    """Convert a column-major COCO RLE, given as counts or as a string, to a row-major Encord RLE string"""
+    height, width = shape
+    rle = _string_to_rle(counts) if isinstance(counts, str) else list(counts)
+    mask = _rle_to_mask(rle, height * width)
+    mask = transpose_bytearray(mask, shape=(width, height))
+    return _rle_to_string(_mask_to_rle(mask))
+
+
 def ranges_to_rle_counts(ranges: Sequence[Tuple[int, int]]) -> List[int]:
     """Convert sorted non-overlapping ranges to RLE counts.
 
@@ -131,18 +143,244 @@ def ranges_to_rle_counts(ranges: Sequence[Tuple[int, int]]) -> List[int]:
     return run_lengths
 
 
-def rle_string_to_points(rle_string: str) -> Set[int]:
-    points: Set[int] = set()
-    if not rle_string:
-        return points
+def rle_counts_to_ranges(rle_counts: Sequence[int]) -> List[Tuple[int, int]]:
+    """Convert RLE counts to sorted, merged, inclusive ranges. The inverse of :func:`ranges_to_rle_counts`.
 
-    rle_counts = _string_to_rle(rle_string)
+    This is O(number of runs), the present points are never materialised.
+
+    Args:
+        rle_counts: RLE counts alternating between empty and present runs, starting with an empty run.
+
+    Returns:
+        Sorted list of non-overlapping (start, end) tuples representing inclusive ranges.
+    """
+    ranges: List[Tuple[int, int]] = []
     current_index = 0
 
-    # RLE counts alternate between empty and present runs
     for i, count in enumerate(rle_counts):
-        if i % 2 != 0:
-            points.update(range(current_index, current_index + count))
+        if i % 2 != 0 and count > 0:
+            start, end = current_index, current_index + count - 1
+            if ranges and ranges[-1][1] == start - 1:
+                # Merge runs separated by an empty run of length 0
+                start = ranges[-1][0]
+                ranges[-1] = (start, end)
+            else:
+                ranges.append((start, end))
         current_index += count
 
+    return ranges
+
+
+def rle_string_to_ranges(rle_string: str) -> List[Tuple[int, int]]:
+    if not rle_string:
+        return []
+    return rle_counts_to_ranges(_string_to_rle(rle_string))
+
+
+def rle_string_to_points(rle_string: str) -> Set[int]:
+    points: Set[int] = set()
+    for start, end in rle_string_to_ranges(rle_string):
+        points.update(range(start, end + 1))
     return points
+
+
+def _first_range_ending_at_or_after(ranges: Sequence[Tuple[int, int]], value: int, lo: int) -> int:
+    # Ranges are sorted and disjoint, so the only range starting at or before `value` that can reach it is the last one
+    i = bisect.bisect_right(ranges, (value, sys.maxsize), lo) - 1
+    if i >= lo and ranges[i][1] >= value:
+        return i
+    return max(i + 1, lo)
+
+
+def _overlapping_ranges(a: Sequence[Tuple[int, int]], b: Sequence[Tuple[int, int]]) -> Iterator[Tuple[int, int]]:
+    i = j = 0
+    while i < len(a) and j < len(b):
+        a_start, a_end = a[i]
+        b_start, b_end = b[j]
+        if a_end < b_start:
+            i = _first_range_ending_at_or_after(a, b_start, i + 1)
+        elif b_end < a_start:
+            j = _first_range_ending_at_or_after(b, a_start, j + 1)
+        else:
+            yield max(a_start, b_start), min(a_end, b_end)
+            if a_end < b_end:
+                i += 1
+            else:
+                j += 1
+
+
+def intersect_ranges(a: Sequence[Tuple[int, int]], b: Sequence[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Intersection of two lists of sorted, disjoint, inclusive ranges, such as from :func:`rle_counts_to_ranges`.
+
+    Ranges of one list that lie in a gap of the other are skipped over by bisection, so masks that only overlap in a
+    small region are intersected in about O(k log R) for k overlapping ranges.
+    """
+    return list(_overlapping_ranges(a, b))
+
+
+def intersection_area(a: Sequence[Tuple[int, int]], b: Sequence[Tuple[int, int]]) -> int:
+    """Number of values in the intersection of two lists of ranges, without building the intersection"""
+    return sum(end - start + 1 for start, end in _overlapping_ranges(a, b))
+
+
+def merge_ranges(ranges_list: Iterable[Sequence[Tuple[int, int]]]) -> List[Tuple[int, int]]:
+    """Union of any number of lists of sorted, disjoint, inclusive ranges, as sorted and merged ranges.
+
+    This is O(R log M) for R ranges in M lists.
+    """
+    merged: List[Tuple[int, int]] = []
+    for start, end in heapq.merge(*ranges_list):
+        if merged and start <= merged[-1][1] + 1:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def ranges_area(ranges: Iterable[Tuple[int, int]]) -> int:
+    return sum(end - start + 1 for start, end in ranges)
+
+
+def ranges_bbox(ranges: Iterable[Tuple[int, int]], width: int) -> Optional[Tuple[int, int, int, int]]:
+    """Bounding box of the ranges of a row-major mask with rows of `width` values.
+
+    Returns:
+        The bounding box in pixels as `(top, left, height, width)`, or None if there are no ranges.
+    """
+    top = left = bottom = right = -1
+    for start, end in ranges:
+        start_row, start_col = divmod(start, width)
+        end_row, end_col = divmod(end, width)
+        if start_row != end_row:
+            # The range wraps around at least one row end, so it covers a full row's worth of columns
+            start_col, end_col = 0, width - 1
+        if top < 0:
+            top, left, right = start_row, start_col, end_col
+        else:
+            left, right = min(left, start_col), max(right, end_col)
+        bottom = end_row
+
+    if top < 0:
+        return None
+    return top, left, bottom - top + 1, right - left + 1
+
+
+def ranges_to_mask_rle_counts(ranges: Sequence[Tuple[int, int]], size: int) -> List[int]:
+    """RLE counts of a mask of `size` values, with the same runs as serialising the decoded mask would produce.
+
+    Unlike :func:`ranges_to_rle_counts`, the counts include the empty run at the end of the mask. Ranges must be
+    merged, such as from :func:`merge_ranges`.
+    """
+    rle_counts = ranges_to_rle_counts(ranges)
+    trailing_empty_run_length = size - (ranges[-1][1] + 1 if ranges else 0)
+    if trailing_empty_run_length > 0:
+        rle_counts.append(trailing_empty_run_length)
+    return rle_counts
+
+
+def rle_counts_area(rle_counts: Sequence[int]) -> int:
+    """Number of present values in the mask, i.e. the sum of the present runs"""
+    return sum(rle_counts[1::2])
+
+
+def rle_counts_bbox(rle_counts: Sequence[int], width: int) -> Optional[Tuple[int, int, int, int]]:
+    """Bounding box in pixels as `(top, left, height, width)` of a row-major mask, or None if the mask is empty"""
+    return ranges_bbox(rle_counts_to_ranges(rle_counts), width)
+
+
+def rle_counts_union(a: Sequence[int], b: Sequence[int], size: int) -> List[int]:
+    """RLE counts of the union of two masks of `size` values"""
+    return merge_rle_counts([a, b], size)
+
+
+def rle_counts_intersection(a: Sequence[int], b: Sequence[int], size: int) -> List[int]:
+    """RLE counts of the intersection of two masks of `size` values"""
+    ranges = intersect_ranges(rle_counts_to_ranges(a), rle_counts_to_ranges(b))
+    return ranges_to_mask_rle_counts(ranges, size)
+
+
+def rle_counts_iou(a: Sequence[int], b: Sequence[int]) -> float:
+    """Intersection over union of two masks. Two empty masks have an IoU of 0, as in pycocotools."""
+    overlap = intersection_area(rle_counts_to_ranges(a), rle_counts_to_ranges(b))
+    union_area = rle_counts_area(a) + rle_counts_area(b) - overlap
+    if union_area == 0:
+        return 0.0
+    return overlap / union_area
+
+
+def merge_rle_counts(rle_counts_list: Iterable[Sequence[int]], size: int) -> List[int]:
+    """RLE counts of the union of any number of masks of `size` values"""
+    ranges = merge_ranges(rle_counts_to_ranges(rle_counts) for rle_counts in rle_counts_list)
+    return ranges_to_mask_rle_counts(ranges, size)
+
+
+def crop_ranges(
+    ranges: Sequence[Tuple[int, int]], width: int, crop: Tuple[int, int, int, int]
+) -> List[Tuple[int, int]]:
+    """Restrict the ranges of a row-major mask with rows of `width` values to a crop window.
+
+    Args:
+        ranges: Sorted, merged, inclusive ranges of the mask.
+        width: Width of the mask.
+        crop: The crop window as `(top, left, height, width)`.
+
+    Returns:
+        The sorted, merged ranges of the cropped mask, in the row-major coordinates of the crop.
+    """
+    top, left, crop_height, crop_width = crop
+    if crop_height == 0 or crop_width == 0:
+        return []
+
+    first, last = top * width, (top + crop_height) * width - 1
+    if crop_width == width:
+        # Full rows are contiguous in both masks, so the ranges only need clipping and shifting
+        return [
+            (max(start, first) - first, min(end, last) - first)
+            for start, end in ranges
+            if start <= last and end >= first
+        ]
+
+    cropped: List[Tuple[int, int]] = []
+    for start, end in ranges:
+        if end < first or start > last:
+            continue
+        for row in range(max(start // width, top), min(end // width, top + crop_height - 1) + 1):
+            row_start = max(start, row * width + left)
+            row_end = min(end, row * width + left + crop_width - 1)
+            if row_start <= row_end:
+                offset = (row - top) * crop_width - row * width - left
+                cropped.append((row_start + offset, row_end + offset))
+    return merge_ranges([cropped])
+
+
+def uncrop_ranges(
+    ranges: Sequence[Tuple[int, int]], width: int, crop: Tuple[int, int, int, int]
+) -> List[Tuple[int, int]]:
+    """Place the ranges of a cropped mask into a row-major mask with rows of `width` values. The inverse of
+    :func:`crop_ranges`.
+
+    Args:
+        ranges: Sorted, merged, inclusive ranges of the cropped mask.
+        width: Width of the full mask.
+        crop: The position of the crop in the full mask as `(top, left, height, width)`.
+
+    Returns:
+        The sorted, merged ranges in the row-major coordinates of the full mask.
+    """
+    top, left, _, crop_width = crop
+    if crop_width == width:
+        offset = top * width
+        return [(start + offset, end + offset) for start, end in ranges]
+
+    # Rows of a narrower crop are not contiguous in the full mask, so ranges spanning rows are split per row
+    uncropped: List[Tuple[int, int]] = []
+    for start, end in ranges:
+        first_row, first_col = divmod(start, crop_width)
+        last_row, last_col = divmod(end, crop_width)
+        for row in range(first_row, last_row + 1):
+            offset = (top + row) * width + left
+            col_start = first_col if row == first_row else 0
+            col_end = last_col if row == last_row else crop_width - 1
+            uncropped.append((offset + col_start, offset + col_end))
+    return uncropped
@@ -1,9 +1,81 @@
-from typing import List, Sequence, Tuple
+from typing import List, Sequence, Tuple, Union
 
 import numpy as np
 
-# Importing python implementations of functions that not have numpy implementation
-from .bitmask_operations import _rle_to_mask, _rle_to_string, _string_to_rle
+# Enough 5-bit chunks to encode any int64 count
+_MAX_CHUNKS_PER_COUNT = 13
+
+
+def _string_to_rle(mask_string: str) -> List[int]:
+    """COCO-compatible string to RLE-encoded mask de-serialisation"""
+    if not mask_string:
+        return []
+
+    chars = np.frombuffer(mask_string.encode("ascii"), dtype=np.uint8).astype(np.int64) - 48
+    more = (chars & 0x20) != 0
+
+    # Every count is a little-endian group of 5-bit chunks, terminated by a chunk without the "more" bit
+    group_ends = np.flatnonzero(~more)
+    if more[-1]:
+        group_ends = np.append(group_ends, len(chars) - 1)
+    group_starts = np.concatenate(([0], group_ends[:-1] + 1))
+    group_lengths = group_ends - group_starts + 1
+
+    chunk_positions = np.arange(len(chars)) - np.repeat(group_starts, group_lengths)
+    counts = np.add.reduceat((chars & 0x1F) << (5 * chunk_positions), group_starts)
+
+    # A terminating chunk with the sign bit set encodes a negative number
+    negative = ~more[group_ends] & ((chars[group_ends] & 0x10) != 0)
+    counts[negative] -= np.left_shift(1, 5 * group_lengths[negative])
+
+    # From the fourth count on, counts are stored as the difference to the count two positions before
+    counts[1::2] = np.cumsum(counts[1::2])
+    counts[2::2] = np.cumsum(counts[2::2])
+
+    return counts.tolist()
+
+
+def _rle_to_string(rle: Sequence[int]) -> str:
+    """COCO-compatible RLE-encoded mask to string serialisation"""
+    if len(rle) == 0:
+        return ""
+
+    values = np.asarray(rle, dtype=np.int64)
+    values[3:] = values[3:] - values[1:-2]
+
+    # Emit one 5-bit chunk of every value per round, until every value is fully encoded
+    chunks = np.zeros((_MAX_CHUNKS_PER_COUNT, len(values)), dtype=np.uint8)
+    emitted = np.zeros((_MAX_CHUNKS_PER_COUNT, len(values)), dtype=np.bool_)
+    active = np.ones(len(values), dtype=np.bool_)
+    for i in range(_MAX_CHUNKS_PER_COUNT):
+        chunk = values & 0x1F
+        values = values >> 5
+        more = np.where((chunk & 0x10) != 0, values != -1, values != 0)
+        chunks[i] = (chunk | (more * 0x20)) + 48
+        emitted[i] = active
+        active &= more
+        if not active.any():
+            break
+
+    # Transposing puts the chunks of each value next to each other, in order
+    return chunks.T[emitted.T].tobytes().decode("ascii")
+
+
+def _rle_to_mask(rle: List[int], size: int) -> bytes:
+    """COCO-compatible RLE to bitmask"""
+    res = np.zeros(size, dtype=np.uint8)
+    if len(rle) == 0:
+        return res.tobytes()
+
+    counts = np.asarray(rle, dtype=np.int64)
+    # Counts alternate between runs of zeros and runs of ones
+    run_values = (np.arange(len(counts)) % 2).astype(np.uint8)
+    decoded = np.repeat(run_values, counts)
+    if len(decoded) > size:
+        raise IndexError(f"RLE counts cover {len(decoded)} values, more than the mask size {size}.")
+    res[: len(decoded)] = decoded
+
+    return res.tobytes()
 
 
 def _mask_to_rle(mask: bytes) -> List[int]:
@@ -35,3 +107,12 @@ def deserialise_bitmask(serialised_bitmask: str, length: int) -> bytes:
 def transpose_bytearray(byte_data: bytes, shape: Tuple[int, int]) -> bytes:
     np_byte_data = np.frombuffer(byte_data, dtype=np.int8).reshape(shape)
     return bytearray(np_byte_data.T.tobytes())
+
+
+def coco_rle_to_row_major_string(counts: Union[str, Sequence[int]], shape: Tuple[int, int]) -> str:
+    """Convert a column-major COCO RLE, given as counts or as a string, to a row-major Encord RLE string"""
+    height, width = shape
+    rle = _string_to_rle(counts) if isinstance(counts, str) else list(counts)
+    mask = _rle_to_mask(rle, height * width)
+    mask = transpose_bytearray(mask, shape=(width, height))
+    return _rle_to_string(_mask_to_rle(mask))
@@ -0,0 +1,49 @@
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+from pycocotools import mask as cocomask
+
+from encord.common.bitmask_operations import bitmask_operations_numpy
+from encord.common.bitmask_operations.bitmask_operations_numpy import (
+    _mask_to_rle,
+    _rle_to_mask,
+    _rle_to_string,
+    _string_to_rle,
+    transpose_bytearray,
+)
+
+# pycocotools works on column-major (Fortran-contiguous) 2D masks, while Encord bitmasks are row-major. A row-major
+# buffer of length N has the same memory layout as a column-major mask of shape (N, 1), so the compiled encoder and
+# decoder can be used on Encord's 1D RLE strings without any transposition.
+
+
+def serialise_bitmask(bitmask: bytes) -> str:
+    if len(bitmask) == 0:
+        return ""
+    buffer = np.frombuffer(bitmask, dtype=np.uint8).reshape((len(bitmask), 1))
+    return cocomask.encode(np.asfortranarray(buffer))["counts"].decode("ascii")
+
+
+def deserialise_bitmask(serialised_bitmask: str, length: int) -> bytes:
+    rle = _string_to_rle(serialised_bitmask)
+    # pycocotools leaves the tail of the mask uninitialised when the counts cover less than its size
+    if length == 0 or sum(rle) != length:
+        return _rle_to_mask(rle, length)
+    decoded = cocomask.decode({"size": [length, 1], "counts": serialised_bitmask.encode("ascii")})
+    return decoded.tobytes(order="F")
+
+
+def coco_rle_to_row_major_string(counts: Union[str, Sequence[int]], shape: Tuple[int, int]) -> str:
+    """Convert a column-major COCO RLE, given as counts or as a string, to a row-major Encord RLE string"""
+    height, width = shape
+    rle_counts: List[int] = _string_to_rle(counts) if isinstance(counts, str) else list(counts)
+    if height * width == 0 or sum(rle_counts) != height * width:
+        return bitmask_operations_numpy.coco_rle_to_row_major_string(rle_counts, shape)
+
+    if isinstance(counts, str):
+        rle = {"size": [height, width], "counts": counts.encode("ascii")}
+    else:
+        rle = cocomask.frPyObjects({"size": [height, width], "counts": rle_counts}, height, width)
+    mask = cocomask.decode(rle)
+    # The column-major layout of the transposed mask is the row-major layout of the mask
+    return cocomask.encode(np.asfortranarray(mask.T))["counts"].decode("ascii")
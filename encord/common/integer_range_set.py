@@ -58,6 +58,18 @@ class IntegerRangeSet:
 
         return overlaps
 
+    def intersects(self, start: int, end: int) -> bool:
+        """
+        Returns whether any value in [start, end] is in the set.
+        Complexity: O(log N).
+        """
+        if start > end:
+            return False
+
+        # The last range starting at or before 'end' is the only one that can reach back into [start, end]
+        i = bisect.bisect_right(self._ranges, (end, sys.maxsize)) - 1
+        return i >= 0 and self._ranges[i][1] >= start
+
     def remove(self, start: int, end: int) -> None:
         """Removes a range, splitting or deleting existing ranges."""
         if start > end:
@@ -96,5 +108,10 @@ class IntegerRangeSet:
     def clear(self) -> None:
         self._ranges = []
 
+    def __contains__(self, value: int) -> bool:
+        """Complexity: O(log N)."""
+        i = bisect.bisect_right(self._ranges, (value, sys.maxsize)) - 1
+        return i >= 0 and self._ranges[i][1] >= value
+
     def __repr__(self) -> str:
         return f"IntegerRangeSet({self._ranges})"
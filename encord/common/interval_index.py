@@ -0,0 +1,143 @@
+import bisect
+from typing import Generic, Iterator, List, Optional, Tuple, TypeVar
+
+K = TypeVar("K")
+
+Interval = Tuple[int, int, K]
+
+_BLOCK_SIZE = 256
+
+
+class IntervalIndex(Generic[K]):
+    """Index of possibly overlapping, inclusive integer intervals, each labelled with a key.
+
+    Answers overlap, stabbing-point and nearest-neighbour queries without scanning all intervals. Intervals are kept
+    sorted by `(start, end, key)` in blocks of bounded size, and every block tracks the largest end it contains, so
+    whole blocks that end before a query are skipped. Keys must be orderable, e.g. object hashes.
+    """
+
+    def __init__(self) -> None:
+        self._blocks: List[List[Interval[K]]] = []
+        # Parallel to _blocks: the first interval and the largest end of each block
+        self._block_firsts: List[Interval[K]] = []
+        self._block_max_ends: List[int] = []
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Interval[K]]:
+        for block in self._blocks:
+            yield from block
+
+    def __repr__(self) -> str:
+        return f"IntervalIndex({list(self)})"
+
+    def add(self, start: int, end: int, key: K) -> None:
+        if start > end:
+            raise ValueError(f"Start of interval {start} must not be greater than end {end}.")
+
+        interval = (start, end, key)
+        if not self._blocks:
+            self._blocks.append([interval])
+            self._block_firsts.append(interval)
+            self._block_max_ends.append(end)
+            self._len = 1
+            return
+
+        i = max(0, bisect.bisect_right(self._block_firsts, interval) - 1)
+        block = self._blocks[i]
+        bisect.insort(block, interval)
+        self._block_firsts[i] = block[0]
+        self._block_max_ends[i] = max(self._block_max_ends[i], end)
+        self._len += 1
+
+        if len(block) > 2 * _BLOCK_SIZE:
+            self._split_block(i)
+
+    def remove(self, start: int, end: int, key: K) -> bool:
+        """Remove one interval. Returns whether it was in the index."""
+        interval = (start, end, key)
+        i = bisect.bisect_right(self._block_firsts, interval) - 1
+        if i < 0:
+            return False
+
+        block = self._blocks[i]
+        j = bisect.bisect_left(block, interval)
+        if j == len(block) or block[j] != interval:
+            return False
+
+        del block[j]
+        self._len -= 1
+        if not block:
+            del self._blocks[i]
+            del self._block_firsts[i]
+            del self._block_max_ends[i]
+        else:
+            self._block_firsts[i] = block[0]
+            if end == self._block_max_ends[i]:
+                self._block_max_ends[i] = max(e for _, e, _ in block)
+        return True
+
+    def clear(self) -> None:
+        self._blocks = []
+        self._block_firsts = []
+        self._block_max_ends = []
+        self._len = 0
+
+    def overlapping(self, start: int, end: int) -> List[Interval[K]]:
+        """Return all intervals that share at least one value with [start, end], sorted by start."""
+        ret: List[Interval[K]] = []
+        for block, first, max_end in zip(self._blocks, self._block_firsts, self._block_max_ends):
+            if first[0] > end:
+                break
+            if max_end < start:
+                continue
+            for interval in block:
+                if interval[0] > end:
+                    break
+                if interval[1] >= start:
+                    ret.append(interval)
+        return ret
+
+    def at(self, point: int) -> List[Interval[K]]:
+        """Return all intervals that contain `point`, sorted by start."""
+        return self.overlapping(point, point)
+
+    def nearest(self, point: int) -> Optional[Interval[K]]:
+        """Return the interval closest to `point`, or None if the index is empty.
+
+        An interval that contains `point` has distance 0. On a tie, the interval before `point` is returned.
+        """
+        containing = self.at(point)
+        if containing:
+            return containing[0]
+
+        # `(point + 1,)` sorts before every interval starting at `point + 1`, whatever its end and key
+        k = bisect.bisect_left(self._block_firsts, (point + 1,))
+        after = self._blocks[k][0] if k < len(self._blocks) else None
+        before: Optional[Interval[K]] = None
+        if k > 0:
+            last_block = self._blocks[k - 1]
+            j = bisect.bisect_left(last_block, (point + 1,))
+            if j < len(last_block):
+                after = last_block[j]
+
+            # No interval contains the point, so all intervals starting before it also end before it, and the
+            # closest one is the one with the largest end. Only the block holding it needs to be scanned.
+            candidates = last_block[:j]
+            if k > 1:
+                best_block = max(range(k - 1), key=self._block_max_ends.__getitem__)
+                candidates.extend(self._blocks[best_block])
+            before = max(candidates, key=lambda interval: interval[1], default=None)
+
+        if before is None or (after is not None and after[0] - point < point - before[1]):
+            return after
+        return before
+
+    def _split_block(self, i: int) -> None:
+        block = self._blocks[i]
+        left, right = block[:_BLOCK_SIZE], block[_BLOCK_SIZE:]
+        self._blocks[i : i + 1] = [left, right]
+        self._block_firsts[i : i + 1] = [left[0], right[0]]
+        self._block_max_ends[i : i + 1] = [max(e for _, e, _ in left), max(e for _, e, _ in right)]
@@ -0,0 +1,137 @@
+import json
+from typing import Any, BinaryIO, Collection, Iterator, NamedTuple
+
+JSON_STREAM_READ_SIZE = 1 << 20
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_DELIMITERS = ",]}" + _WHITESPACE
+
+
+class JsonArrayItem(NamedTuple):
+    """An item of an array that is the value of a key of the top-level JSON object"""
+
+    key: str
+    value: Any
+    start: int
+    """Byte offset of the first byte of the item in the file"""
+    end: int
+    """Byte offset after the last byte of the item in the file"""
+
+
+class _Reader:
+    """Incrementally decodes JSON values from a binary file, keeping only the undecoded rest of the file in memory.
+
+    The bytes are decoded as Latin-1, so every byte is one character and positions in the buffer are byte offsets.
+    JSON syntax is ASCII, so this only garbles non-ASCII characters of strings, which are decoded again as UTF-8.
+    """
+
+    def __init__(self, file: BinaryIO, read_size: int) -> None:
+        self._file = file
+        self._read_size = read_size
+        self._buffer = ""
+        self._pos = 0
+        self._offset = 0  # Byte offset of the start of the buffer
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read more of the file into the buffer. Returns False at the end of the file."""
+        if self._eof:
+            return False
+        # Reading at least as much as is already buffered keeps decoding values larger than `read_size` linear
+        data = self._file.read(max(self._read_size, len(self._buffer) - self._pos))
+        if not data:
+            self._eof = True
+            return False
+        self._offset += self._pos
+        self._buffer = self._buffer[self._pos :] + data.decode("latin-1")
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or an empty string at the end of the file."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._fill():
+                return self._buffer[self._pos : self._pos + 1]
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise ValueError(f"Expected one of {list(chars)} at byte {self.tell()}, found {char!r}")
+        self._pos += 1
+        return char
+
+    def tell(self) -> int:
+        return self._offset + self._pos
+
+    def decode_value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = json.JSONDecoder().raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number is only complete when followed by a delimiter, as "12" or "1." may be the start of "12.5e3"
+            if (
+                isinstance(value, (int, float))
+                and (end == len(self._buffer) or self._buffer[end] not in _NUMBER_DELIMITERS)
+                and self._fill()
+            ):
+                continue
+
+            text = self._buffer[self._pos : end]
+            self._pos = end
+            if not text.isascii():
+                value = json.loads(text.encode("latin-1"))
+            return value
+
+
+def iter_json_array_items(
+    file: BinaryIO,
+    keys: Collection[str],
+    read_size: int = JSON_STREAM_READ_SIZE,
+) -> Iterator[JsonArrayItem]:
+    """Iterate over the items of the arrays under `keys` of a top-level JSON object, without loading the whole file.
+
+    Only one item is decoded at a time, so the memory used is bounded by the size of the largest item, not by the size
+    of the file. The values of other keys are decoded and discarded, arrays one item at a time.
+
+    Args:
+        file: The JSON file, opened in binary mode. It must be encoded as UTF-8.
+        keys: The keys whose arrays to iterate over. Keys whose values are not arrays are skipped.
+        read_size: The number of bytes to read from the file at a time.
+
+    Returns:
+        The items in the order of the file, with the key of their array and their position in the file.
+    """
+    reader = _Reader(file, read_size)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+
+    while True:
+        key = reader.decode_value()
+        if not isinstance(key, str):
+            raise ValueError(f"Expected a key of the top-level object at byte {reader.tell()}")
+        reader.expect(":")
+
+        if reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() != "]":
+                while True:
+                    start = reader.tell()
+                    value = reader.decode_value()
+                    if key in keys:
+                        yield JsonArrayItem(key, value, start, reader.tell())
+                    if reader.expect(",]") == "]":
+                        break
+            else:
+                reader.expect("]")
+        else:
+            reader.decode_value()
+
+        if reader.expect(",}") == "}":
+            return
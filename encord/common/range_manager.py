@@ -53,6 +53,18 @@ class RangeManager:
         for r in ranges_to_remove:
             self.remove_range(r)
 
+    def __contains__(self, frame: int) -> bool:
+        """Check whether the frame is within any of the ranges."""
+        return frame in self._range_set
+
+    def intersects(self, other: "RangeManager") -> bool:
+        """Check whether any frame is in both range managers.
+
+        The ranges of the smaller manager are looked up by bisection in the larger one.
+        """
+        smaller, larger = (self, other) if len(self.ranges) <= len(other.ranges) else (other, self)
+        return any(larger._range_set.intersects(start, end) for start, end in smaller.ranges)
+
     def clear_ranges(self) -> None:
         """Clear all ranges."""
         self._range_set.clear()
@@ -0,0 +1,132 @@
+import bisect
+from copy import deepcopy
+from typing import Callable, Generic, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class RangeMap(Generic[T]):
+    """Maps disjoint, inclusive integer ranges to values.
+
+    Consecutive keys that map to equal values share one stored value, so data that is the same on every frame of a long
+    video costs one entry rather than one entry per frame. Lookups use bisection.
+
+    Because stored values can be shared between many keys, values must only be mutated in place after calling
+    :meth:`isolate` for the keys that should change.
+    """
+
+    def __init__(self, copy_value: Callable[[T], T] = deepcopy) -> None:
+        # Parallel lists of sorted, disjoint segments [start, end] -> value
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._values: List[T] = []
+        self._copy_value = copy_value
+
+    def __bool__(self) -> bool:
+        return bool(self._starts)
+
+    def __contains__(self, key: int) -> bool:
+        return self._index_of(key) >= 0
+
+    def __repr__(self) -> str:
+        return f"RangeMap({list(self.items())})"
+
+    def get(self, key: int) -> Optional[T]:
+        i = self._index_of(key)
+        return self._values[i] if i >= 0 else None
+
+    def items(self) -> Iterator[Tuple[int, int, T]]:
+        """Iterate over the stored segments as `(start, end, value)`, in ascending order."""
+        return zip(self._starts, self._ends, self._values)
+
+    def keys(self) -> Iterator[int]:
+        """Iterate over all keys that have a value, in ascending order."""
+        for start, end in zip(self._starts, self._ends):
+            yield from range(start, end + 1)
+
+    def ranges(self) -> List[Tuple[int, int]]:
+        """Return the sorted, merged ranges of keys that have a value, regardless of the values."""
+        ret: List[Tuple[int, int]] = []
+        for start, end in zip(self._starts, self._ends):
+            if ret and ret[-1][1] == start - 1:
+                ret[-1] = (ret[-1][0], end)
+            else:
+                ret.append((start, end))
+        return ret
+
+    def intersects(self, start: int, end: int) -> bool:
+        """Whether any key in [start, end] has a value."""
+        i = bisect.bisect_right(self._starts, end) - 1
+        return i >= 0 and self._ends[i] >= start
+
+    def set(self, start: int, end: int, value: T) -> None:
+        """Map all keys in [start, end] to `value`, replacing existing values.
+
+        If an adjacent segment holds an equal value, the segments are merged and share the existing value object.
+        """
+        if start > end:
+            raise ValueError(f"Start of range {start} must not be greater than end {end}.")
+
+        lo, hi = self._split_around(start, end)
+
+        if lo > 0 and self._ends[lo - 1] == start - 1 and self._values[lo - 1] == value:
+            lo -= 1
+            start = self._starts[lo]
+            value = self._values[lo]
+        if hi < len(self._starts) and self._starts[hi] == end + 1 and self._values[hi] == value:
+            end = self._ends[hi]
+            hi += 1
+
+        self._starts[lo:hi] = [start]
+        self._ends[lo:hi] = [end]
+        self._values[lo:hi] = [value]
+
+    def remove(self, start: int, end: int) -> List[Tuple[int, int]]:
+        """Remove all keys in [start, end] and return the ranges that actually had a value."""
+        if start > end:
+            return []
+
+        lo, hi = self._split_around(start, end)
+        removed = list(zip(self._starts[lo:hi], self._ends[lo:hi]))
+
+        del self._starts[lo:hi]
+        del self._ends[lo:hi]
+        del self._values[lo:hi]
+        return removed
+
+    def isolate(self, start: int, end: int) -> List[Tuple[int, int, T]]:
+        """Return the segments within [start, end] as `(start, end, value)`.
+
+        Segments that extend beyond [start, end] are split first, so the returned values are not shared with any key
+        outside of the range and can be mutated in place.
+        """
+        if start > end:
+            return []
+
+        lo, hi = self._split_around(start, end)
+        return list(zip(self._starts[lo:hi], self._ends[lo:hi], self._values[lo:hi]))
+
+    def _index_of(self, key: int) -> int:
+        i = bisect.bisect_right(self._starts, key) - 1
+        if i >= 0 and self._ends[i] >= key:
+            return i
+        return -1
+
+    def _split_at(self, key: int) -> None:
+        """Split the segment containing `key` so that a segment starts at `key`."""
+        i = self._index_of(key)
+        if i < 0 or self._starts[i] == key:
+            return
+
+        self._starts.insert(i + 1, key)
+        self._ends.insert(i + 1, self._ends[i])
+        self._values.insert(i + 1, self._copy_value(self._values[i]))
+        self._ends[i] = key - 1
+
+    def _split_around(self, start: int, end: int) -> Tuple[int, int]:
+        """Split segments at the boundaries of [start, end] and return the slice of segments within it."""
+        self._split_at(start)
+        self._split_at(end + 1)
+        lo = bisect.bisect_left(self._starts, start)
+        hi = bisect.bisect_right(self._starts, end)
+        return lo, hi
@@ -12,10 +12,11 @@ category: "64e481b57b6027003f20aaa0"
 import logging
 import mimetypes
 import os.path
-from concurrent.futures import ThreadPoolExecutor
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple, Type, Union
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Type, Union
 
 from tqdm import tqdm
 
@@ -37,7 +38,10 @@ from encord.orm.storage import StorageItemType, UploadSignedUrl
 PROGRESS_BAR_FILE_FACTOR = 100
 CACHE_DURATION_IN_SECONDS = 24 * 60 * 60  # 1 day
 UPLOAD_TO_SIGNED_URL_LIST_MAX_WORKERS = 4
+UPLOAD_TO_SIGNED_URL_LIST_MAX_WORKERS_LIMIT = 32
 UPLOAD_TO_SIGNED_URL_LIST_SIGNED_URLS_BATCH_SIZE = 200
+UPLOAD_CONCURRENCY_WINDOW_UPLOADS_PER_WORKER = 4
+UPLOAD_CONCURRENCY_MIN_GAIN = 1.1
 
 logger = logging.getLogger(__name__)
 
@@ -168,21 +172,63 @@ class UploadPresignedUrlsGetParams(BaseDTO):
     """The type of item being uploaded (e.g., IMAGE, VIDEO, AUDIO, DICOM)."""
 
 
+class _UploadConcurrency:
+    """Number of uploads to run at the same time, doubled for as long as doing so raises the measured throughput."""
+
+    def __init__(self, initial: int, limit: int, now: float) -> None:
+        self.concurrency = initial
+        self._limit = limit
+        self._best_throughput = 0.0
+        self._best_concurrency = initial
+        self._window_start = now
+        self._window_bytes = 0
+        self._window_count = 0
+
+    def record(self, num_bytes: int, now: float) -> None:
+        """Record a finished upload of `num_bytes` bytes."""
+        if self.concurrency >= self._limit:
+            return
+
+        self._window_bytes += num_bytes
+        self._window_count += 1
+        # A few uploads per worker, so that a single small or large file does not decide
+        if self._window_count < UPLOAD_CONCURRENCY_WINDOW_UPLOADS_PER_WORKER * self.concurrency:
+            return
+
+        throughput = self._window_bytes / max(now - self._window_start, 1e-9)
+        if throughput >= self._best_throughput * UPLOAD_CONCURRENCY_MIN_GAIN:
+            self._best_throughput = throughput
+            self._best_concurrency = self.concurrency
+            self.concurrency = min(2 * self.concurrency, self._limit)
+        else:
+            # More workers did not help, so the uplink or the server is the bottleneck
+            self.concurrency = self._limit = self._best_concurrency
+        self._window_start = now
+        self._window_bytes = 0
+        self._window_count = 0
+
+
 def upload_to_signed_url_list(
     file_paths: Iterable[Union[str, Path]],
     config: BaseConfig,
     api_client: ApiClient,
     upload_item_type: StorageItemType,
     cloud_upload_settings: CloudUploadSettings,
+    max_workers: Optional[int] = None,
 ) -> List[Dict]:
     """Upload multiple files to signed URLs and return upload results.
 
+    The next batch of signed URLs is requested while the files of the previous batch upload. Unless `max_workers` is
+    set, uploads start on ``UPLOAD_TO_SIGNED_URL_LIST_MAX_WORKERS`` threads, which are doubled up to
+    ``UPLOAD_TO_SIGNED_URL_LIST_MAX_WORKERS_LIMIT`` for as long as this increases the measured throughput.
+
     Args:
         file_paths (Iterable[Union[str, Path]]): Paths of files to upload.
         config (BaseConfig): Configuration object with request settings.
         api_client (ApiClient): API client used to fetch presigned URLs.
         upload_item_type (StorageItemType): Type of items being uploaded.
         cloud_upload_settings (CloudUploadSettings): Upload configuration.
+        max_workers (Optional[int]): Fixed number of files to upload at the same time.
 
     Returns:
         List[Dict]: A list of dictionaries containing upload metadata:
@@ -194,57 +240,83 @@ def upload_to_signed_url_list(
         EncordException: If any file path does not exist.
         CloudUploadError: If uploads fail and ``allow_failures`` is False.
     """
+    file_paths = list(file_paths)
     for file_path in file_paths:
         if not os.path.exists(file_path):
             raise EncordException(message=f"{file_path} does not point to a file.")
 
-    signed_urls = []
-
-    for file_path_batch in get_batches(list(file_paths), n=UPLOAD_TO_SIGNED_URL_LIST_SIGNED_URLS_BATCH_SIZE):
-        file_names_batch = [os.path.basename(str(x)) for x in file_path_batch]
-
+    def get_signed_urls(file_path_batch: List[Union[str, Path]]) -> List[Dict]:
         signed_urls_batch = [
             {
                 "data_hash": str(x.item_uuid),
                 "file_link": x.object_key,
                 "signed_url": x.signed_url,
+                "title": os.path.basename(str(file_path)),
             }
-            for x in api_client.get(
-                "presigned-urls",
-                params=UploadPresignedUrlsGetParams(
-                    count=len(file_names_batch),
-                    upload_item_type=upload_item_type,
-                ),
-                result_type=Page[UploadSignedUrl],
-            ).results
+            for file_path, x in zip(
+                file_path_batch,
+                api_client.get(
+                    "presigned-urls",
+                    params=UploadPresignedUrlsGetParams(
+                        count=len(file_path_batch),
+                        upload_item_type=upload_item_type,
+                    ),
+                    result_type=Page[UploadSignedUrl],
+                ).results,
+            )
         ]
-        assert len(file_names_batch) == len(signed_urls_batch)
+        assert len(file_path_batch) == len(signed_urls_batch)
+        return signed_urls_batch
 
-        for file_name, signed_url in zip(file_names_batch, signed_urls_batch):
-            signed_url["title"] = file_name
-            signed_urls.append(signed_url)
+    def upload(file_path: Union[str, Path], signed_url: Dict) -> int:
+        upload_to_signed_url_list_for_single_file(
+            failures,
+            file_path,
+            signed_url["title"],
+            signed_url["signed_url"],
+            upload_item_type,
+            max_retries=cloud_upload_settings.max_retries or config.requests_settings.max_retries,
+            backoff_factor=cloud_upload_settings.backoff_factor or config.requests_settings.backoff_factor,
+        )
+        return os.path.getsize(file_path)
 
+    signed_urls: List[Dict] = []
     failures: List[UploadToSignedUrlFailure] = []
-    assert len(list(file_paths)) == len(signed_urls)
-
-    with ThreadPoolExecutor(max_workers=UPLOAD_TO_SIGNED_URL_LIST_MAX_WORKERS) as executor:
-        list(
-            tqdm(
-                executor.map(
-                    lambda args: upload_to_signed_url_list_for_single_file(
-                        failures,
-                        args[0],
-                        args[1]["title"],
-                        args[1]["signed_url"],
-                        upload_item_type,
-                        max_retries=cloud_upload_settings.max_retries or config.requests_settings.max_retries,
-                        backoff_factor=cloud_upload_settings.backoff_factor or config.requests_settings.backoff_factor,
-                    ),
-                    zip(file_paths, signed_urls),
-                ),
-                total=len(list(file_paths)),
-            )
-        )
+    file_path_batches = get_batches(file_paths, n=UPLOAD_TO_SIGNED_URL_LIST_SIGNED_URLS_BATCH_SIZE)
+    concurrency = _UploadConcurrency(
+        initial=max_workers or UPLOAD_TO_SIGNED_URL_LIST_MAX_WORKERS,
+        limit=max_workers or UPLOAD_TO_SIGNED_URL_LIST_MAX_WORKERS_LIMIT,
+        now=time.perf_counter(),
+    )
+
+    signed_urls_executor = ThreadPoolExecutor(max_workers=1)
+    executor = ThreadPoolExecutor(max_workers=max_workers or UPLOAD_TO_SIGNED_URL_LIST_MAX_WORKERS_LIMIT)
+    with signed_urls_executor, executor, tqdm(total=len(file_paths)) as progress:
+        uploading: Set[Future] = set()
+
+        def wait_for_uploads(max_uploading: int) -> None:
+            nonlocal uploading
+            while len(uploading) > max_uploading:
+                done, uploading = wait(uploading, return_when=FIRST_COMPLETED)
+                for future in done:
+                    concurrency.record(future.result(), time.perf_counter())
+                progress.update(len(done))
+
+        next_signed_urls = signed_urls_executor.submit(get_signed_urls, file_path_batches[0]) if file_paths else None
+        for batch_index, file_path_batch in enumerate(file_path_batches):
+            assert next_signed_urls is not None
+            signed_urls_batch = next_signed_urls.result()
+            if batch_index + 1 < len(file_path_batches):
+                next_signed_urls = signed_urls_executor.submit(get_signed_urls, file_path_batches[batch_index + 1])
+
+            for file_path, signed_url in zip(file_path_batch, signed_urls_batch):
+                wait_for_uploads(concurrency.concurrency - 1)
+                uploading.add(executor.submit(upload, file_path, signed_url))
+            signed_urls.extend(signed_urls_batch)
+
+        wait_for_uploads(0)
+
+    assert len(file_paths) == len(signed_urls)
 
     if failures:
         if cloud_upload_settings.allow_failures:
@@ -252,7 +324,7 @@ def upload_to_signed_url_list(
         else:
             raise failures[0].exception
 
-    signed_urls_failed = [x.signed_url for x in failures]
+    signed_urls_failed = {x.signed_url for x in failures}
 
     return [
         {
@@ -2,6 +2,7 @@ from encord.objects.attributes import ChecklistAttribute, RadioAttribute, TextAt
 from encord.objects.classification import Classification
 from encord.objects.classification_instance import ClassificationInstance
 from encord.objects.common import Shape
+from encord.objects.label_row_cache import LabelRowCache
 from encord.objects.metadata import DICOMSeriesMetadata, DICOMSliceMetadata
 from encord.objects.ontology_labels_impl import LabelRowV2
 from encord.objects.ontology_object import Object
@@ -17,6 +18,7 @@ __all__ = [
     "DICOMSeriesMetadata",
     "DICOMSliceMetadata",
     "FlatOption",
+    "LabelRowCache",
     "LabelRowV2",
     "NestableOption",
     "Object",
@@ -11,9 +11,26 @@ category: "64e481b57b6027003f20aaa0"
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Protocol, Union, runtime_checkable
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Protocol, Sequence, Tuple, Union, runtime_checkable
 
-from encord.common.bitmask_operations import deserialise_bitmask, serialise_bitmask
+from encord.common.bitmask_operations import (
+    _rle_to_mask,
+    _rle_to_string,
+    _string_to_rle,
+    crop_ranges,
+    deserialise_bitmask,
+    intersect_ranges,
+    intersection_area,
+    merge_ranges,
+    ranges_area,
+    ranges_bbox,
+    ranges_to_mask_rle_counts,
+    rle_counts_to_ranges,
+    serialise_bitmask,
+    uncrop_ranges,
+)
 from encord.exceptions import EncordException
 from encord.orm.base_dto import BaseDTO
 
@@ -30,6 +47,80 @@ class ArrayProtocol(Protocol):
     def tobytes(self) -> bytes: ...
 
 
+class _DecodedBitmaskCache:
+    """Bounded LRU cache of decoded bitmask buffers.
+
+    Buffers are keyed by the encoded mask rather than by the BitmaskCoordinates object, so masks of every label row
+    share the cache, and a buffer stays valid for as long as it is referenced. The buffers are immutable `bytes`,
+    which is what makes handing out zero-copy views of them safe.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._buffers: OrderedDict[Hashable, bytes] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        with self._lock:
+            data = self._buffers.get(key)
+            if data is not None:
+                self._buffers.move_to_end(key)
+            return data
+
+    def put(self, key: Hashable, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._buffers:
+                self._buffers.move_to_end(key)
+                return
+            self._buffers[key] = data
+            self._total_bytes += len(data)
+            while self._total_bytes > self.max_bytes:
+                _, evicted = self._buffers.popitem(last=False)
+                self._total_bytes -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buffers.clear()
+            self._total_bytes = 0
+
+
+_decoded_bitmask_cache: Optional[_DecodedBitmaskCache] = None
+
+
+def set_decoded_bitmask_cache_size(max_bytes: int) -> None:
+    """Enables a process-wide LRU cache of decoded bitmasks, holding at most `max_bytes` of decoded data.
+
+    Decoded masks take one byte per pixel, so e.g. 500 MB holds about sixty 4K masks. With the cache enabled, repeated
+    `np.array(...)`, `.to_numpy_array()` and `.to_numpy_view()` calls on the same mask decode it only once.
+    Passing 0 disables the cache, which is the default.
+    """
+    global _decoded_bitmask_cache
+    if max_bytes < 0:
+        raise ValueError(f"The cache size must not be negative, got {max_bytes}.")
+
+    if max_bytes == 0:
+        _decoded_bitmask_cache = None
+    elif _decoded_bitmask_cache is None or _decoded_bitmask_cache.max_bytes != max_bytes:
+        _decoded_bitmask_cache = _DecodedBitmaskCache(max_bytes)
+
+
+def clear_decoded_bitmask_cache() -> None:
+    """Drops all buffers from the decoded bitmask cache, if it is enabled."""
+    if _decoded_bitmask_cache is not None:
+        _decoded_bitmask_cache.clear()
+
+
+class _BitmaskRuns(NamedTuple):
+    rle_string: str
+    ranges: List[Tuple[int, int]]
+    area: int
+    bbox: Optional[Tuple[int, int, int, int]]
+
+
 class BitmaskCoordinates:
     class EncodedBitmask(BaseDTO):
         top: int
@@ -45,22 +136,40 @@ class BitmaskCoordinates:
             except EncordException:
                 return None
 
-    def __init__(self, source: Union[ArrayProtocol, BitmaskCoordinates.EncodedBitmask, Dict[str, Any]]):
+    def __init__(
+        self,
+        source: Union[ArrayProtocol, BitmaskCoordinates.EncodedBitmask, Dict[str, Any]],
+        *,
+        cropped: bool = False,
+    ):
         """Creates a BitmaskCoordinates object from a NumPy array, or other objects that implement
         :ref:`NumPy array interface <https://numpy.org/doc/stable/reference/arrays.interface.html>`,
         such as Pillow images.
 
+        If `cropped` is True, only the tight bounding box of the mask is kept in memory. The mask still behaves like a
+        full-frame mask, e.g. in `.to_dict` and `np.array(...)`, but `.to_numpy_array(cropped=True)` decodes just the
+        bounding box. This makes small objects on large frames much cheaper to decode and hold.
+
         For detailed information please refer to :ref:`bitmask tutorial <tutorials/bitmasks:Bitmasks>`
         """
+        self._runs_cache: Optional[_BitmaskRuns] = None
+        self._encoded_bitmask_cache: Optional[BitmaskCoordinates.EncodedBitmask] = None
+        self._encoded_bitmask_cache_key: Optional[str] = None
+        # Set if `_bitmask` only holds the crop of the mask at its top/left, with height/width of the crop
+        self._frame_shape: Optional[Tuple[int, int]] = None
+
         if isinstance(source, BitmaskCoordinates.EncodedBitmask):
-            self._encoded_bitmask = source
+            self._bitmask = source
         elif isinstance(source, ArrayProtocol):
-            self._encoded_bitmask = BitmaskCoordinates._from_array(source)
+            self._bitmask = BitmaskCoordinates._from_array(source)
         elif bitmask := BitmaskCoordinates.EncodedBitmask.try_from_dict(source):
-            self._encoded_bitmask = bitmask
+            self._bitmask = bitmask
         else:
             raise ValueError(f"Failed to create BitmaskCoordinates from an object of type {type(source)}")
 
+        if cropped:
+            self._crop()
+
     @staticmethod
     def from_dict(d: Dict[str, Any]) -> BitmaskCoordinates:
         """This method is used to construct object from Encord bitmask dictionary format.
@@ -95,6 +204,31 @@ class BitmaskCoordinates:
 
         return BitmaskCoordinates.EncodedBitmask(top=0, left=0, height=shape[0], width=shape[1], rle_string=rle_string)
 
+    @property
+    def _encoded_bitmask(self) -> BitmaskCoordinates.EncodedBitmask:
+        """The full-frame encoded mask, which is what the Encord bitmask dictionary format contains.
+
+        Encoding a cropped mask walks the whole frame, so the result is cached, keyed by the RLE string of the crop.
+        Use `_shape()` to only get the dimensions of the frame.
+        """
+        if self._frame_shape is None:
+            return self._bitmask
+
+        rle_string = self._bitmask.rle_string
+        if self._encoded_bitmask_cache is None or self._encoded_bitmask_cache_key is not rle_string:
+            height, width = self._frame_shape
+            rle_counts = ranges_to_mask_rle_counts(self._runs().ranges, height * width)
+            self._encoded_bitmask_cache = BitmaskCoordinates.EncodedBitmask(
+                top=0, left=0, height=height, width=width, rle_string=_rle_to_string(rle_counts)
+            )
+            self._encoded_bitmask_cache_key = rle_string
+        return self._encoded_bitmask_cache
+
+    @property
+    def is_cropped(self) -> bool:
+        """Whether only the bounding box of the mask is kept in memory."""
+        return self._frame_shape is not None
+
     def to_dict(self) -> Dict[str, Any]:
         """This method is used to serialize the object to Encord bitmask dictionary format.
         In most cases external users don't need it. Please consider using .to_numpy_array method, or just pass this
@@ -103,9 +237,121 @@ class BitmaskCoordinates:
         """
         return self._encoded_bitmask.to_dict()
 
-    def to_numpy_array(self):
+    def area(self) -> int:
+        """Returns the number of pixels in the mask, without decoding it."""
+        return self._runs().area
+
+    def bbox(self) -> Optional[Tuple[int, int, int, int]]:
+        """Returns the bounding box of the mask in pixels as `(top, left, height, width)`, or None if the mask is empty.
+
+        The mask is not decoded, the cost scales with the number of runs in the mask.
+        """
+        return self._runs().bbox
+
+    def union(self, other: BitmaskCoordinates) -> BitmaskCoordinates:
+        """Returns a mask of the pixels in either mask. Both masks must have the same shape."""
+        return BitmaskCoordinates.merge_many([self, other])
+
+    def intersection(self, other: BitmaskCoordinates) -> BitmaskCoordinates:
+        """Returns a mask of the pixels in both masks. Both masks must have the same shape."""
+        self._check_same_shape(other)
+        ranges = intersect_ranges(self._runs().ranges, other._runs().ranges)
+        return self._with_ranges(ranges)
+
+    def iou(self, other: BitmaskCoordinates) -> float:
+        """Returns the intersection over union of two masks of the same shape, without decoding them.
+
+        Two empty masks have an IoU of 0.
+        """
+        self._check_same_shape(other)
+        runs, other_runs = self._runs(), other._runs()
+        if runs.bbox is None or other_runs.bbox is None or not _bboxes_overlap(runs.bbox, other_runs.bbox):
+            return 0.0
+
+        overlap = intersection_area(runs.ranges, other_runs.ranges)
+        return overlap / (runs.area + other_runs.area - overlap)
+
+    @staticmethod
+    def merge_many(bitmasks: Sequence[BitmaskCoordinates]) -> BitmaskCoordinates:
+        """Returns a mask of the pixels in any of the masks. All masks must have the same shape.
+
+        The masks are merged in a single pass over their runs, without decoding them.
+        """
+        if not bitmasks:
+            raise EncordException("At least one bitmask is required to merge bitmasks.")
+
+        first = bitmasks[0]
+        for bitmask in bitmasks[1:]:
+            first._check_same_shape(bitmask)
+        return first._with_ranges(merge_ranges(bitmask._runs().ranges for bitmask in bitmasks))
+
+    def _runs(self) -> _BitmaskRuns:
+        """The full-frame runs of the mask, with its area and bounding box"""
+        # Comparing every mask of a frame against every other mask needs the runs of each mask many times, so they are
+        # cached, keyed by the RLE string they were parsed from
+        rle_string = self._bitmask.rle_string
+        if self._runs_cache is None or self._runs_cache.rle_string is not rle_string:
+            ranges = rle_counts_to_ranges(_string_to_rle(rle_string))
+            _, frame_width = self._shape()
+            if self._frame_shape is not None:
+                crop = (self._bitmask.top, self._bitmask.left, self._bitmask.height, self._bitmask.width)
+                ranges = uncrop_ranges(ranges, frame_width, crop)
+            self._runs_cache = _BitmaskRuns(
+                rle_string=rle_string,
+                ranges=ranges,
+                area=ranges_area(ranges),
+                bbox=ranges_bbox(ranges, frame_width),
+            )
+        return self._runs_cache
+
+    def _crop(self) -> None:
+        if self._frame_shape is not None:
+            return
+
+        runs = self._runs()
+        height, width = self._shape()
+        crop = runs.bbox or (0, 0, 0, 0)
+        crop_top, crop_left, crop_height, crop_width = crop
+        rle_counts = ranges_to_mask_rle_counts(crop_ranges(runs.ranges, width, crop), crop_height * crop_width)
+        self._bitmask = BitmaskCoordinates.EncodedBitmask(
+            top=crop_top, left=crop_left, height=crop_height, width=crop_width, rle_string=_rle_to_string(rle_counts)
+        )
+        self._frame_shape = (height, width)
+        # The full-frame runs did not change, only the string they are keyed by
+        self._runs_cache = runs._replace(rle_string=self._bitmask.rle_string)
+
+    def _shape(self) -> Tuple[int, int]:
+        """Height and width of the full frame"""
+        return self._frame_shape or (self._bitmask.height, self._bitmask.width)
+
+    def _size(self) -> int:
+        height, width = self._shape()
+        return height * width
+
+    def _check_same_shape(self, other: BitmaskCoordinates) -> None:
+        shape, other_shape = self._shape(), other._shape()
+        if shape != other_shape:
+            raise EncordException(f"Bitmasks must have the same shape, got {shape} and {other_shape}.")
+
+    def _with_ranges(self, ranges: List[Tuple[int, int]]) -> BitmaskCoordinates:
+        height, width = self._shape()
+        return BitmaskCoordinates(
+            BitmaskCoordinates.EncodedBitmask(
+                top=0,
+                left=0,
+                height=height,
+                width=width,
+                rle_string=_rle_to_string(ranges_to_mask_rle_counts(ranges, height * width)),
+            ),
+            cropped=self.is_cropped,
+        )
+
+    def to_numpy_array(self, cropped: bool = False):
         """Converts the mask to a 2D numpy array with dtype bool.
 
+        If `cropped` is True, only the bounding box of the mask is decoded and returned, see `.bbox()` for its
+        position. An empty mask gives an empty array.
+
         Numpy needs to be installed for this call to work.
         """
         try:
@@ -113,16 +359,78 @@ class BitmaskCoordinates:
         except ImportError as e:
             raise EncordException("Numpy is required for .to_numpy_array call.") from e
 
-        return np.array(self)
+        if not cropped:
+            return np.array(self)
+
+        if self._frame_shape is not None:
+            crop_height, crop_width = self._bitmask.height, self._bitmask.width
+            data = deserialise_bitmask(self._bitmask.rle_string, crop_height * crop_width)
+        else:
+            runs = self._runs()
+            crop = runs.bbox or (0, 0, 0, 0)
+            _, _, crop_height, crop_width = crop
+            ranges = crop_ranges(runs.ranges, self._bitmask.width, crop)
+            data = _rle_to_mask(ranges_to_mask_rle_counts(ranges, crop_height * crop_width), crop_height * crop_width)
+        return np.frombuffer(data, dtype=np.bool_).reshape(crop_height, crop_width).copy()
+
+    def to_numpy_view(self):
+        """Returns a read-only 2D numpy array with dtype bool over the decoded mask, without copying it.
+
+        With the decoded bitmask cache enabled (see :func:`set_decoded_bitmask_cache_size`), repeated calls return
+        views of the same cached buffer. Use `.to_numpy_array()` for an array that can be modified.
+
+        Numpy needs to be installed for this call to work.
+        """
+        try:
+            import numpy as np  # type: ignore[missing-import]
+        except ImportError as e:
+            raise EncordException("Numpy is required for .to_numpy_view call.") from e
+
+        return np.frombuffer(self._decoded_data(), dtype=np.bool_).reshape(self._shape())
+
+    def to_memoryview(self) -> memoryview:
+        """Returns a read-only memoryview over the decoded mask, one byte per pixel in row-major order."""
+        return memoryview(self._decoded_data())
+
+    def _decoded_data(self) -> bytes:
+        cache = _decoded_bitmask_cache
+        key = (
+            self._bitmask.rle_string,
+            self._bitmask.top,
+            self._bitmask.left,
+            self._bitmask.height,
+            self._bitmask.width,
+            self._frame_shape,
+        )
+        if cache is not None and (data := cache.get(key)) is not None:
+            return data
+
+        height, width = self._shape()
+        if self._frame_shape is None:
+            data = deserialise_bitmask(self._bitmask.rle_string, height * width)
+        else:
+            data = _rle_to_mask(ranges_to_mask_rle_counts(self._runs().ranges, height * width), height * width)
+
+        if cache is not None:
+            cache.put(key, data)
+        return data
 
     @property
     def __array_interface__(self):
-        data = deserialise_bitmask(
-            self._encoded_bitmask.rle_string, self._encoded_bitmask.height * self._encoded_bitmask.width
-        )
         return {
             "version": 3,
-            "data": data,
-            "shape": (self._encoded_bitmask.height, self._encoded_bitmask.width),
+            "data": self._decoded_data(),
+            "shape": self._shape(),
             "typestr": "|b1",
         }
+
+
+def _bboxes_overlap(a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]) -> bool:
+    a_top, a_left, a_height, a_width = a
+    b_top, b_left, b_height, b_width = b
+    return (
+        a_top < b_top + b_height
+        and b_top < a_top + a_height
+        and a_left < b_left + b_width
+        and b_left < a_left + a_width
+    )
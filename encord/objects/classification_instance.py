@@ -65,6 +65,19 @@ if TYPE_CHECKING:
 
 
 class ClassificationInstance:
+    __slots__ = (
+        "_ontology_classification",
+        "_classification_hash",
+        "_range_only",
+        "_parent",
+        "_static_answer_map",
+        "_instance_data",
+        "_range_manager",
+        "_frames_to_data",
+        "_include_instance_data",
+        "_spaces",
+    )
+
     def __init__(
         self,
         ontology_classification: Classification,
@@ -542,6 +555,8 @@ class ClassificationInstance:
         This is deprecated, we will be using the ClassificationAnnotation that this inherits from.
         """
 
+        __slots__ = ("_frame",)
+
         def __init__(self, classification_instance: ClassificationInstance, frame: int):
             self._classification_instance = classification_instance
             self._frame = frame
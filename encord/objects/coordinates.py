@@ -14,9 +14,9 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Type, Union, cast
+from typing import Any, Dict, List, Optional, Tuple, Type, Union, cast
 
-from encord.exceptions import LabelRowError
+from encord.exceptions import EncordException, LabelRowError
 from encord.objects.bitmask import BitmaskCoordinates
 from encord.objects.common import Shape
 from encord.objects.frames import Ranges
@@ -44,8 +44,24 @@ from encord.orm.base_dto import BaseDTO
 logger = logging.getLogger(__name__)
 
 
+class _FrozenSlotsMixin:
+    """Pickle and copy support for frozen dataclasses that declare `__slots__`.
+
+    Without an instance `__dict__`, the default protocol restores slots with `setattr`, which frozen dataclasses forbid.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
 @dataclass(frozen=True)
-class BoundingBoxCoordinates:
+class BoundingBoxCoordinates(_FrozenSlotsMixin):
     """Represents bounding box coordinates, where all values are percentages relative to the total image size.
 
     Attributes:
@@ -55,6 +71,8 @@ class BoundingBoxCoordinates:
         top_left_y (float): The y-coordinate of the top-left corner.
     """
 
+    __slots__ = ("height", "width", "top_left_x", "top_left_y")
+
     height: float
     width: float
     top_left_x: float
@@ -94,7 +112,7 @@ class BoundingBoxCoordinates:
 
 
 @dataclass(frozen=True)
-class RotatableBoundingBoxCoordinates:
+class RotatableBoundingBoxCoordinates(_FrozenSlotsMixin):
     """Represents rotatable bounding box coordinates, where all values are percentages relative to the total image size.
 
     Attributes:
@@ -105,6 +123,8 @@ class RotatableBoundingBoxCoordinates:
         theta (float): The angle of rotation originating at the center of the box.
     """
 
+    __slots__ = ("height", "width", "top_left_x", "top_left_y", "theta")
+
     height: float
     width: float
     top_left_x: float
@@ -292,7 +312,7 @@ def cuboid_2d_coordinates_from_dict(d: Cuboid2DFrameCoordinatesDict) -> Cuboid2D
 
 
 @dataclass(frozen=True)
-class PointCoordinate:
+class PointCoordinate(_FrozenSlotsMixin):
     """Represents a point coordinate, where all coordinates are a percentage relative to the total image size.
 
     Attributes:
@@ -300,6 +320,9 @@ class PointCoordinate:
         y (float): The y-coordinate of the point.
     """
 
+    # Polygons, polylines and skeletons hold many points, so keep them compact
+    __slots__ = ("x", "y")
+
     x: float
     y: float
 
@@ -329,7 +352,7 @@ class PointCoordinate:
 
 
 @dataclass(frozen=True)
-class PointCoordinate3D:
+class PointCoordinate3D(_FrozenSlotsMixin):
     """Represents a 3D point coordinate, where all coordinates are a percentage relative to the total image size.
 
     Attributes:
@@ -338,6 +361,8 @@ class PointCoordinate3D:
         z (float): The z-coordinate of the point.
     """
 
+    __slots__ = ("x", "y", "z")
+
     x: float
     y: float
     z: float
@@ -382,6 +407,9 @@ class PolygonCoordinates:
             values (List[PointCoordinate]): A list of PointCoordinate objects defining the polygon.
             polygons (List[List[List[PointCoordinate]]]): A list of polygons, where each polygon is a list of contours, where each contour is a list of points.
         """
+        # Set instead of the point lists by `from_polygon_arrays`, until the point lists are needed
+        self._polygon_arrays: Optional[List[List[Any]]] = None
+
         if not values and not polygons:
             raise LabelRowError("Either `values` or `polygons` must be provided")
         elif values and not polygons:
@@ -401,12 +429,59 @@ class PolygonCoordinates:
 
     @property
     def values(self) -> List[PointCoordinate]:
+        self._materialise_points()
         return self._values
 
     @property
     def polygons(self) -> List[List[List[PointCoordinate]]]:
+        self._materialise_points()
         return self._polygons
 
+    @staticmethod
+    def from_polygon_arrays(polygons: List[List[Any]]) -> PolygonCoordinates:
+        """Create a PolygonCoordinates instance from point arrays, without creating a PointCoordinate per point.
+
+        The point objects are only created when `.values` or `.polygons` is accessed, `.to_dict` works on the arrays
+        directly. The arrays must not be modified afterwards.
+
+        Numpy needs to be installed for this call to work.
+
+        Args:
+            polygons: A list of polygons, where each polygon is a list of contours, and each contour is an array of
+                shape [K, 2] of normalised `(x, y)` points.
+
+        Returns:
+            PolygonCoordinates: An instance of PolygonCoordinates.
+        """
+        try:
+            import numpy as np  # type: ignore[missing-import]
+        except ImportError as e:
+            raise EncordException("Numpy is required for creating coordinates from arrays.") from e
+
+        polygon_arrays = [[np.asarray(contour, dtype=np.float64) for contour in polygon] for polygon in polygons]
+        if not polygon_arrays or not polygon_arrays[0] or len(polygon_arrays[0][0]) == 0:
+            raise LabelRowError("Either `values` or `polygons` must be provided")
+        for polygon in polygon_arrays:
+            for contour in polygon:
+                if contour.ndim != 2 or contour.shape[1] != 2:
+                    raise LabelRowError(f"Expected an array of shape [K, 2] for each contour, got {contour.shape}.")
+
+        ret = PolygonCoordinates.__new__(PolygonCoordinates)
+        ret._polygon_arrays = polygon_arrays
+        return ret
+
+    def _materialise_points(self) -> None:
+        if self._polygon_arrays is None:
+            return
+
+        # `tolist` converts to Python floats in C, which is much faster than iterating over numpy scalars
+        self._polygons = [
+            [[PointCoordinate(x, y) for x, y in contour.tolist()] for contour in polygon]
+            for polygon in self._polygon_arrays
+        ]
+        self._values = list(self._polygons[0][0])
+        self._polygon_arrays = None
+
     @staticmethod
     def from_dict(d: PolygonFrameCoordinatesDict) -> "PolygonCoordinates":
         """Create a PolygonCoordinates instance from a dictionary.
@@ -503,6 +578,12 @@ class PolygonCoordinates:
         Returns:
             dict: A dictionary representation of the polygon coordinates.
         """
+        if self._polygon_arrays is not None:
+            if kind == PolygonCoordsToDict.single_polygon:
+                return {str(idx): {"x": x, "y": y} for idx, (x, y) in enumerate(self._polygon_arrays[0][0].tolist())}
+            elif kind == PolygonCoordsToDict.multiple_polygons:
+                return [[contour.reshape(-1).tolist() for contour in polygon] for polygon in self._polygon_arrays]
+
         if kind == PolygonCoordsToDict.single_polygon:
             return {str(idx): {"x": value.x, "y": value.y} for idx, value in enumerate(self._values)}
         elif kind == PolygonCoordsToDict.multiple_polygons:
@@ -749,7 +830,7 @@ def add_coordinates_to_frame_object_dict(
         result["point"] = coordinates.to_dict()
         result["shape"] = Shape.POINT.value
     elif isinstance(coordinates, BitmaskCoordinates):
-        if not (height == coordinates._encoded_bitmask.height and width == coordinates._encoded_bitmask.width):
+        if (height, width) != coordinates._shape():
             raise ValueError("Bitmask dimensions don't match the media dimensions")
         result["bitmask"] = coordinates.to_dict()
         result["shape"] = Shape.BITMASK.value
@@ -825,3 +906,88 @@ def get_geometric_coordinates_from_frame_object_dict(
 
     # The cast is safe because we've excluded the non-geometric types.
     return cast(GeometricCoordinates, coordinates)
+
+
+ARRAY_CONVERTIBLE_SHAPES = (
+    Shape.BOUNDING_BOX,
+    Shape.ROTATABLE_BOUNDING_BOX,
+    Shape.POINT,
+    Shape.POLYGON,
+    Shape.POLYLINE,
+)
+
+
+def coordinates_from_arrays(shape: Shape, values: Any) -> List[GeometricCoordinates]:
+    """Convert per-item coordinate arrays to coordinate objects in one pass.
+
+    All values are normalised to the image size, as for the coordinate classes themselves. Each item of `values`
+    gives the coordinates of one object on one frame:
+
+    * `Shape.BOUNDING_BOX`: an `[N, 4]` array of `(top_left_x, top_left_y, width, height)`.
+    * `Shape.ROTATABLE_BOUNDING_BOX`: an `[N, 5]` array of `(top_left_x, top_left_y, width, height, theta)`.
+    * `Shape.POINT`: an `[N, 2]` array of `(x, y)` or an `[N, 3]` array of `(x, y, z)`.
+    * `Shape.POLYGON` and `Shape.POLYLINE`: a sequence of `N` arrays of shape `[K, 2]`, one per item.
+
+    Numpy needs to be installed for this call to work.
+
+    Args:
+        shape: The shape of the ontology object the coordinates are for.
+        values: The coordinate arrays, in any form accepted by `numpy.asarray`.
+
+    Returns:
+        List[GeometricCoordinates]: One coordinates object per item.
+
+    Raises:
+        LabelRowError: If the shape is not supported or the arrays have the wrong dimensions.
+    """
+    try:
+        import numpy as np  # type: ignore[missing-import]
+    except ImportError as e:
+        raise EncordException("Numpy is required for creating coordinates from arrays.") from e
+
+    if len(values) == 0:
+        return []
+
+    if shape in (Shape.POLYGON, Shape.POLYLINE):
+        point_lists = []
+        for item in values:
+            points = np.asarray(item, dtype=np.float64)
+            if points.ndim != 2 or points.shape[1] != 2 or len(points) == 0:
+                raise LabelRowError(f"Expected an array of shape [K, 2] for each {shape.value}, got {points.shape}.")
+            # `tolist` converts to Python floats in C, which is much faster than iterating over numpy scalars
+            point_lists.append([PointCoordinate(x, y) for x, y in points.tolist()])
+
+        if shape == Shape.POLYGON:
+            return [PolygonCoordinates(values=points) for points in point_lists]
+        else:
+            return [PolylineCoordinates(values=points) for points in point_lists]
+
+    array = np.asarray(values, dtype=np.float64)
+    expected_widths = {
+        Shape.BOUNDING_BOX: (4,),
+        Shape.ROTATABLE_BOUNDING_BOX: (5,),
+        Shape.POINT: (2, 3),
+    }.get(shape)
+    if expected_widths is None:
+        raise LabelRowError(
+            f"Creating coordinates from arrays is only supported for the shapes {ARRAY_CONVERTIBLE_SHAPES}, got {shape}."
+        )
+    if array.ndim != 2 or array.shape[1] not in expected_widths:
+        raise LabelRowError(
+            f"Expected an array of shape [N, {' or '.join(map(str, expected_widths))}] for {shape.value}, "
+            f"got {array.shape}."
+        )
+
+    rows = array.tolist()
+    if shape == Shape.BOUNDING_BOX:
+        return [BoundingBoxCoordinates(height=h, width=w, top_left_x=x, top_left_y=y) for x, y, w, h in rows]
+    elif shape == Shape.ROTATABLE_BOUNDING_BOX:
+        return [
+            RotatableBoundingBoxCoordinates(height=h, width=w, top_left_x=x, top_left_y=y, theta=theta)
+            for x, y, w, h, theta in rows
+        ]
+    elif array.shape[1] == 3:
+        # 3D points are stored with the 2D geometric coordinates, as in `ACCEPTABLE_COORDINATES_FOR_ONTOLOGY_ITEMS`
+        return [cast(GeometricCoordinates, PointCoordinate3D(x, y, z)) for x, y, z in rows]
+    else:
+        return [PointCoordinate(x, y) for x, y in rows]
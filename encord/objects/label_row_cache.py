@@ -0,0 +1,219 @@
+"""---
+title: "Objects - Label Row Cache"
+slug: "sdk-ref-objects-label-row-cache"
+hidden: false
+metadata:
+  title: "Objects - Label Row Cache"
+  description: "Encord SDK Objects - Label Row Cache."
+category: "64e481b57b6027003f20aaa0"
+---
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Union
+
+import orjson
+
+log = logging.getLogger(__name__)
+
+DEFAULT_LABEL_ROW_CACHE_MAX_SIZE_BYTES = 1024**3
+LABEL_ROW_CACHE_FILE_SUFFIX = ".json.gz"
+
+
+@dataclass(frozen=True)
+class LabelRowCacheKey:
+    """Identifies one cached version of a label row.
+
+    Attributes:
+        label_hash: The label hash of the row.
+        branch_name: The label branch of the row.
+        last_edited_at: The `last_edited_at` timestamp reported in the label row metadata. A row edited on the
+            server since it was cached gets a different key, so stale entries are never returned.
+        variant: A fingerprint of the request options (feature hash filters, reviews, archived labels) that
+            changes the content of the downloaded label row.
+    """
+
+    label_hash: str
+    branch_name: str
+    last_edited_at: Optional[datetime]
+    variant: str = ""
+
+    @staticmethod
+    def variant_from_options(
+        include_object_feature_hashes: Optional[Set[str]] = None,
+        include_classification_feature_hashes: Optional[Set[str]] = None,
+        include_reviews: bool = False,
+        include_archived: bool = False,
+    ) -> str:
+        options = orjson.dumps(
+            [
+                sorted(include_object_feature_hashes) if include_object_feature_hashes is not None else None,
+                sorted(include_classification_feature_hashes)
+                if include_classification_feature_hashes is not None
+                else None,
+                include_reviews,
+                include_archived,
+            ]
+        )
+        return hashlib.sha256(options).hexdigest()[:16]
+
+    def _entry_prefix(self) -> str:
+        branch_and_variant = hashlib.sha256(f"{self.branch_name}\x00{self.variant}".encode()).hexdigest()[:16]
+        return f"{self.label_hash}.{branch_and_variant}"
+
+    def _file_name(self) -> str:
+        edited_at = self.last_edited_at.isoformat() if self.last_edited_at is not None else "none"
+        edited_at_digest = hashlib.sha256(edited_at.encode()).hexdigest()[:16]
+        return f"{self._entry_prefix()}.{edited_at_digest}{LABEL_ROW_CACHE_FILE_SUFFIX}"
+
+
+class LabelRowCache:
+    """Opt-in on-disk cache of downloaded label rows.
+
+    Label rows are stored as gzip-compressed JSON, one file per label row, keyed by `label_hash`, `branch_name` and
+    the `last_edited_at` timestamp from the label row metadata. Passing the cache to
+    :meth:`encord.objects.ontology_labels_impl.LabelRowV2.initialise_labels` initialises rows that have not changed
+    since they were cached without a network call, and stores the rows that had to be downloaded.
+
+    When the total size of the cache exceeds `max_size_bytes`, the least recently used entries are evicted.
+
+    The cache directory can be shared between runs of the same process, but it is not safe for concurrent writers.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_size_bytes: int = DEFAULT_LABEL_ROW_CACHE_MAX_SIZE_BYTES,
+        compression_level: int = 6,
+    ) -> None:
+        """Create a cache stored in `directory`, creating the directory if needed.
+
+        Args:
+            directory: Directory to store the cached label rows in.
+            max_size_bytes: Maximum total size of the cache files. Least recently used entries are evicted above it.
+            compression_level: gzip compression level, from 0 (no compression) to 9 (smallest files).
+        """
+        if max_size_bytes <= 0:
+            raise ValueError("`max_size_bytes` must be positive.")
+
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_size_bytes = max_size_bytes
+        self._compression_level = compression_level
+
+        # File name -> size in bytes, ordered from least to most recently used
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        # Entry prefix (label hash, branch and variant) -> file name of its only current version
+        self._prefix_to_file_name: Dict[str, str] = {}
+        self._size_bytes = 0
+        self._load_index()
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the cached label rows in bytes."""
+        return self._size_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: LabelRowCacheKey) -> bool:
+        return key._file_name() in self._entries
+
+    def get(self, key: LabelRowCacheKey) -> Optional[Dict[str, Any]]:
+        """Return the cached label row dictionary for `key`, or `None` if it is not cached."""
+        file_name = key._file_name()
+        if file_name not in self._entries:
+            return None
+
+        path = self._directory / file_name
+        try:
+            label_row_dict = orjson.loads(gzip.decompress(path.read_bytes()))
+        except (OSError, EOFError, orjson.JSONDecodeError):
+            log.warning(f"Discarding unreadable label row cache entry {path}")
+            self._remove_entry(file_name)
+            return None
+
+        self._entries.move_to_end(file_name)
+        os.utime(path)
+        return label_row_dict
+
+    def put(self, key: LabelRowCacheKey, label_row_dict: Dict[str, Any]) -> None:
+        """Store `label_row_dict` under `key`, replacing older versions of the same label row."""
+        file_name = key._file_name()
+        prefix = key._entry_prefix()
+
+        previous_file_name = self._prefix_to_file_name.get(prefix)
+        if previous_file_name is not None:
+            self._remove_entry(previous_file_name)
+
+        data = gzip.compress(orjson.dumps(label_row_dict), compresslevel=self._compression_level)
+        if len(data) > self._max_size_bytes:
+            log.debug(f"Label row {key.label_hash} is larger than the cache size limit and will not be cached")
+            return
+
+        # Write to a temporary file first, so that an interrupted write never leaves a truncated entry behind
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._directory / file_name)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        self._entries[file_name] = len(data)
+        self._prefix_to_file_name[prefix] = file_name
+        self._size_bytes += len(data)
+        self._evict()
+
+    def invalidate(self, label_hash: str) -> None:
+        """Remove all cached versions of the label row with `label_hash`."""
+        for file_name in [f for f in self._entries if f.startswith(f"{label_hash}.")]:
+            self._remove_entry(file_name)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        for file_name in list(self._entries):
+            self._remove_entry(file_name)
+
+    def _load_index(self) -> None:
+        paths = [p for p in self._directory.iterdir() if p.name.endswith(LABEL_ROW_CACHE_FILE_SUFFIX)]
+        stats = {p: p.stat() for p in paths}
+        for path in sorted(paths, key=lambda p: stats[p].st_mtime):
+            size = stats[path].st_size
+            prefix = path.name[: -len(LABEL_ROW_CACHE_FILE_SUFFIX)].rsplit(".", 1)[0]
+            self._entries[path.name] = size
+            self._prefix_to_file_name[prefix] = path.name
+            self._size_bytes += size
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._size_bytes > self._max_size_bytes and self._entries:
+            least_recently_used = next(iter(self._entries))
+            self._remove_entry(least_recently_used)
+
+    def _remove_entry(self, file_name: str) -> None:
+        size = self._entries.pop(file_name, None)
+        if size is None:
+            return
+        self._size_bytes -= size
+
+        prefix = file_name[: -len(LABEL_ROW_CACHE_FILE_SUFFIX)].rsplit(".", 1)[0]
+        if self._prefix_to_file_name.get(prefix) == file_name:
+            del self._prefix_to_file_name[prefix]
+
+        (self._directory / file_name).unlink(missing_ok=True)
@@ -13,10 +13,13 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from functools import partial
 from typing import (
     Any,
+    Callable,
+    Collection,
     Dict,
     Iterable,
     List,
@@ -41,7 +44,7 @@ from encord.common.time_parser import (
     format_datetime_to_long_string_optional,
     parse_datetime_optional,
 )
-from encord.constants.enums import DataType, SpaceType, is_geometric
+from encord.constants.enums import DATA_TYPES_WITH_UNKNOWN_LAST_FRAME, DataType, SpaceType, is_geometric
 from encord.exceptions import LabelRowError, WrongProjectTypeError
 from encord.http.bundle import Bundle, BundleResultHandler, BundleResultMapper, bundled_operation
 from encord.http.limits import (
@@ -85,17 +88,19 @@ from encord.objects.coordinates import (
     RotatableBoundingBoxCoordinates,
     SkeletonCoordinates,
     TextCoordinates,
+    coordinates_from_arrays,
     get_coordinates_from_frame_object_dict,
 )
 from encord.objects.frames import (
     Frames,
     Range,
     Ranges,
-    frames_class_to_frames_list,
+    frames_to_ranges,
     ranges_list_to_ranges,
     ranges_to_list,
 )
 from encord.objects.html_node import HtmlRange, HtmlRangeDict
+from encord.objects.label_row_cache import LabelRowCache, LabelRowCacheKey
 from encord.objects.metadata import DataGroupMetadata, DICOMSeriesMetadata, DICOMSliceMetadata
 from encord.objects.ontology_object import Object
 from encord.objects.ontology_object_instance import ObjectInstance
@@ -105,6 +110,7 @@ from encord.objects.spaces.annotation.base_annotation import (
     _ClassificationAnnotation,
     _ObjectAnnotation,
 )
+from encord.objects.spaces.annotation.geometric_annotation import _GeometricAnnotationData
 from encord.objects.spaces.base_space import Space, SpaceT
 from encord.objects.spaces.html_space import HTMLSpace
 from encord.objects.spaces.image_space import ImageSpace
@@ -129,7 +135,7 @@ from encord.objects.types import (
     ObjectAnswerForNonGeometric,
     _is_containing_metadata,
 )
-from encord.objects.utils import _lower_snake_case
+from encord.objects.utils import _lower_snake_case, check_email, short_uuid_str
 from encord.ontology import Ontology
 from encord.orm import storage as orm_storage
 from encord.orm.label_row import (
@@ -236,8 +242,8 @@ class LabelRowV2:
 
         self._is_labelling_initialised = False
 
-        self._frame_to_hashes: defaultdict[int, Set[str]] = defaultdict(set)
-        # ^ frames to object and classification hashes
+        self._hash_to_frames: defaultdict[str, RangeManager] = defaultdict(RangeManager)
+        # ^ object and classification hashes to the frames they are on, stored as ranges
 
         self._metadata: Optional[Union[DICOMSeriesMetadata, DataGroupMetadata]] = None
         self._frame_metadata: defaultdict[int, Optional[DICOMSliceMetadata]] = defaultdict(lambda: None)
@@ -249,7 +255,7 @@ class LabelRowV2:
         self._space_objects_map: dict[str, ObjectInstance] = {}
         self._space_classifications_map: dict[str, ClassificationInstance] = {}
 
-        self._classifications_to_frames: defaultdict[Classification, Set[int]] = defaultdict(set)
+        self._classifications_to_frames: defaultdict[Classification, RangeManager] = defaultdict(RangeManager)
         self._classifications_to_ranges: defaultdict[Classification, RangeManager] = defaultdict(RangeManager)
 
         self._objects_map: Dict[str, ObjectInstance] = dict()
@@ -705,6 +711,7 @@ class LabelRowV2:
         bundle: Optional[Bundle] = None,
         *,
         include_signed_url: bool = False,
+        cache: Optional[LabelRowCache] = None,
     ) -> None:
         """Initialize labels from the Encord server.
 
@@ -732,6 +739,10 @@ class LabelRowV2:
                 initialization is delayed and performed along with other objects in the same bundle.
             include_signed_url: If `True`, the :attr:`.data_link` property will contain a signed URL.
                 See documentation for :attr:`.data_link` for more details.
+            cache: Optional :class:`encord.objects.label_row_cache.LabelRowCache`. If the label row was cached
+                with the same `last_edited_at` and request options, it is initialised from the cache without a
+                network call. Otherwise, the downloaded label row is added to the cache. Rows requested with
+                `include_signed_url=True` bypass the cache, as signed URLs expire.
         """
         if self.is_labelling_initialised and not overwrite:
             raise LabelRowError(
@@ -754,6 +765,42 @@ class LabelRowV2:
                 limit=LABEL_ROW_BUNDLE_CREATE_LIMIT,
             )
         else:
+            result_handler: Callable[[dict], None] = self.from_labels_dict
+            if cache is not None and not include_signed_url:
+                cache_key = LabelRowCacheKey(
+                    label_hash=self.label_hash,
+                    branch_name=self.branch_name,
+                    last_edited_at=self.last_edited_at,
+                    variant=LabelRowCacheKey.variant_from_options(
+                        include_object_feature_hashes=include_object_feature_hashes,
+                        include_classification_feature_hashes=include_classification_feature_hashes,
+                        include_reviews=include_reviews,
+                        include_archived=include_archived,
+                    ),
+                )
+                cached_label_row_dict = cache.get(cache_key)
+                if cached_label_row_dict is not None:
+                    metadata_read_only_data = self._label_row_read_only_data
+                    self.from_labels_dict(cached_label_row_dict)
+                    # The workflow state, link and titles change without a label edit, so the cached values can be
+                    # stale.
+                    # Label rows parsed from a dict keep the task status as sent by the server, as a string.
+                    annotation_task_status = metadata_read_only_data.annotation_task_status
+                    if isinstance(annotation_task_status, AnnotationTaskStatus):
+                        annotation_task_status = annotation_task_status.value  # type: ignore[assignment]
+                    self._label_row_read_only_data = replace(
+                        self._label_row_read_only_data,
+                        label_status=metadata_read_only_data.label_status,
+                        annotation_task_status=annotation_task_status,
+                        workflow_graph_node=metadata_read_only_data.workflow_graph_node,
+                        data_link=metadata_read_only_data.data_link or self._label_row_read_only_data.data_link,
+                        data_title=metadata_read_only_data.data_title,
+                        dataset_title=metadata_read_only_data.dataset_title,
+                    )
+                    return
+
+                result_handler = partial(self._cache_and_parse_labels_dict, cache, cache_key)
+
             bundled_operation(
                 bundle,
                 operation=self._project_client.get_label_rows,
@@ -767,11 +814,17 @@ class LabelRowV2:
                 ),
                 result_mapper=BundleResultMapper[OrmLabelRow](
                     result_mapping_predicate=lambda r: r["label_hash"],
-                    result_handler=BundleResultHandler(predicate=self.label_hash, handler=self.from_labels_dict),
+                    result_handler=BundleResultHandler(predicate=self.label_hash, handler=result_handler),
                 ),
                 limit=LABEL_ROW_BUNDLE_GET_LIMIT,
             )
 
+    def _cache_and_parse_labels_dict(
+        self, cache: LabelRowCache, cache_key: LabelRowCacheKey, label_row_dict: dict
+    ) -> None:
+        cache.put(cache_key, label_row_dict)
+        self.from_labels_dict(label_row_dict)
+
     def from_labels_dict(self, label_row_dict: dict) -> None:
         """Initialize the LabelRow from a label row dictionary.
 
@@ -784,8 +837,8 @@ class LabelRowV2:
         self._is_labelling_initialised = True
 
         self._label_row_read_only_data = self._parse_label_row_dict(label_row_dict)
-        self._frame_to_hashes = defaultdict(set)
-        self._classifications_to_frames = defaultdict(set)
+        self._hash_to_frames = defaultdict(RangeManager)
+        self._classifications_to_frames = defaultdict(RangeManager)
         self._classifications_to_ranges = defaultdict(RangeManager)
 
         self._metadata = None
@@ -1187,10 +1240,8 @@ class LabelRowV2:
 
         ret: List[ObjectInstance] = list()
 
-        if filter_frames is not None:
-            filtered_frames_list = frames_class_to_frames_list(filter_frames)
-        else:
-            filtered_frames_list = list()
+        # Frames of each object are kept as ranges, so matching them against the filter is a bisection per range
+        filter_range_manager = RangeManager(filter_frames) if filter_frames is not None else None
 
         # Objects on label row
         for object_ in self._objects_map.values():
@@ -1202,18 +1253,12 @@ class LabelRowV2:
                 continue
 
             # filter by frame
-            if filter_frames is None:
-                append = True
-            else:
-                append = False
-            for frame in filtered_frames_list:
-                hashes = self._frame_to_hashes.get(frame, set())
-                if object_.object_hash in hashes:
-                    append = True
-                    break
+            if filter_range_manager is not None:
+                frames_of_object = self._hash_to_frames.get(object_.object_hash)
+                if frames_of_object is None or not frames_of_object.intersects(filter_range_manager):
+                    continue
 
-            if append:
-                ret.append(object_)
+            ret.append(object_)
 
         # Objects in space
         if include_spaces:
@@ -1233,34 +1278,13 @@ class LabelRowV2:
                         continue
 
                     # filter by frame
-                    if filter_frames is None:
-                        append = True
-                    else:
-                        append = False
-                    for frame in filtered_frames_list:
-                        if isinstance(space, VideoSpace):
-                            object_hash_map_on_frame = space._frames_to_object_hash_to_annotation_data.get(frame, {})
-                            if object_.object_hash in object_hash_map_on_frame:
-                                append = True
-                                break
-                        elif isinstance(space, ImageSpace):
-                            if frame != 0:
-                                continue
-                            if object_.object_hash in space._objects_map:
-                                append = True
-                                break
-                        elif isinstance(space, AudioSpace) or isinstance(space, TextSpace):
-                            # For backwards compatibility, we treat text as being on frame=0
-                            if frame != 0:
-                                continue
-
-                            if object_.object_hash in space._objects_map:
-                                append = True
-                                break
-
-                    if append:
-                        object_hashes.add(object_.object_hash)
-                        ret.append(object_)
+                    if filter_range_manager is not None:
+                        frames_on_space = space._get_object_frames(object_.object_hash)
+                        if frames_on_space is None or not frames_on_space.intersects(filter_range_manager):
+                            continue
+
+                    object_hashes.add(object_.object_hash)
+                    ret.append(object_)
 
         return ret
 
@@ -1319,6 +1343,125 @@ class LabelRowV2:
         frames = set(_frame_views_to_frame_numbers(object_instance.get_annotations()))
         self._add_to_frame_to_hashes_map(object_instance, frames)
 
+    def add_objects_from_arrays(
+        self,
+        ontology_object: Object,
+        frames: Union[int, Sequence[int], Any],
+        coordinates: Any,
+        confidences: Optional[Union[Sequence[float], Any]] = None,
+        object_hashes: Optional[Sequence[str]] = None,
+        *,
+        created_at: Optional[datetime] = None,
+        created_by: Optional[str] = None,
+        manual_annotation: bool = False,
+    ) -> List[ObjectInstance]:
+        """Create many single-frame object instances from arrays and add them to the label row in one pass.
+
+        This is the bulk equivalent of calling :meth:`encord.objects.ontology_object.Object.create_instance`,
+        :meth:`encord.objects.ontology_object_instance.ObjectInstance.set_for_frames` and
+        :meth:`add_object_instance` once per object, e.g. for pre-labelling with model detections. The inputs are
+        validated once for the whole batch.
+
+        Numpy needs to be installed for this call to work.
+
+        Args:
+            ontology_object: The ontology object to create instances of. Supported shapes are bounding box,
+                rotatable bounding box, point, polygon and polyline.
+            frames: The frame of each object, as an array of length `N`. A single int places all objects on the
+                same frame.
+            coordinates: The normalised coordinates of each object. See
+                :func:`encord.objects.coordinates.coordinates_from_arrays` for the expected layout per shape,
+                e.g. an `[N, 4]` array of `(top_left_x, top_left_y, width, height)` for bounding boxes.
+            confidences: Optionally, the confidence of each object as an array of length `N`. Defaults to `1.0`.
+            object_hashes: Optionally, the object hash of each object. Random hashes are generated by default.
+            created_at: Optionally specify the creation time of all objects. Defaults to `datetime.now()`.
+            created_by: Optionally specify the creator of all objects. Defaults to the current SDK user.
+            manual_annotation: Whether the objects were annotated manually. Defaults to `False`, as bulk-created
+                objects usually come from a model.
+
+        Returns:
+            List[ObjectInstance]: The created object instances, in input order.
+
+        Raises:
+            LabelRowError: If the inputs are inconsistent, the frames are not integers or out of bounds, or an object
+                hash is already in use on the label row.
+        """
+        import numpy as np  # type: ignore[missing-import]
+
+        self._check_labelling_is_initalised()
+
+        if not is_geometric(self.data_type):
+            raise LabelRowError(
+                f"Adding objects from arrays is only supported for geometric data types, got {self.data_type}."
+            )
+
+        coordinates_list = coordinates_from_arrays(ontology_object.shape, coordinates)
+        count = len(coordinates_list)
+
+        frames_array = np.asarray(frames)
+        # Casting would silently truncate fractional frames, an empty list is the only non-integer array allowed
+        if frames_array.size > 0 and not np.issubdtype(frames_array.dtype, np.integer):
+            raise LabelRowError(f"Frames must be integers, got an array of type {frames_array.dtype}.")
+        frames_array = frames_array.astype(np.int64)
+        if frames_array.ndim == 0:
+            frames_array = np.full(count, frames_array)
+        if frames_array.shape != (count,):
+            raise LabelRowError(f"Expected {count} frames, got an array of shape {frames_array.shape}.")
+        if count > 0:
+            last_frame = float("inf") if self.data_type in DATA_TYPES_WITH_UNKNOWN_LAST_FRAME else self.number_of_frames
+            if frames_array.min() < 0 or frames_array.max() >= last_frame:
+                raise LabelRowError(
+                    f"All frames must be within the acceptable bounds of `0` to `{last_frame}`, "
+                    f"got frames from `{frames_array.min()}` to `{frames_array.max()}`."
+                )
+
+        if confidences is None:
+            confidences_list = [DEFAULT_CONFIDENCE] * count
+        else:
+            confidences_list = np.asarray(confidences, dtype=np.float64).tolist()
+            if len(confidences_list) != count:
+                raise LabelRowError(f"Expected {count} confidences, got {len(confidences_list)}.")
+
+        if object_hashes is None:
+            object_hashes_list = [short_uuid_str() for _ in range(count)]
+        else:
+            object_hashes_list = list(object_hashes)
+            if len(object_hashes_list) != count:
+                raise LabelRowError(f"Expected {count} object hashes, got {len(object_hashes_list)}.")
+            if len(set(object_hashes_list)) != count:
+                raise LabelRowError("The supplied object hashes are not unique.")
+        already_present = self._objects_map.keys() & set(object_hashes_list)
+        if already_present:
+            raise LabelRowError(f"The object hashes {sorted(already_present)} are already used on the label row.")
+
+        if created_by is not None:
+            check_email(created_by)
+        created_at = created_at or datetime.now()
+
+        object_instances: List[ObjectInstance] = []
+        for object_hash, frame, frame_coordinates, confidence in zip(
+            object_hashes_list, frames_array.tolist(), coordinates_list, confidences_list
+        ):
+            object_instance = ObjectInstance(ontology_object, object_hash=object_hash)
+            object_instance._frames_to_instance_data[frame] = _GeometricAnnotationData(
+                annotation_metadata=_AnnotationMetadata(
+                    created_at=created_at,
+                    created_by=created_by,
+                    last_edited_at=created_at,
+                    last_edited_by=created_by,
+                    confidence=confidence,
+                    manual_annotation=manual_annotation,
+                ),
+                coordinates=frame_coordinates,
+            )
+            object_instance._parent = self
+
+            self._objects_map[object_hash] = object_instance
+            self._hash_to_frames[object_hash].add_range(Range(frame, frame))
+            object_instances.append(object_instance)
+
+        return object_instances
+
     def add_classification_instance(self, classification_instance: ClassificationInstance, force: bool = False) -> None:
         """Add a classification instance to the label row.
 
@@ -1378,7 +1521,7 @@ class LabelRowV2:
                     f"classification does not yet exist."
                 )
 
-            self._classifications_to_frames[classification_instance.ontology_item].update(frames)
+            self._classifications_to_frames[classification_instance.ontology_item].add_ranges(frames_to_ranges(frames))
             self._add_to_frame_to_hashes_map(classification_instance, frames)
 
         self._add_classification_instance_for_range(
@@ -1446,10 +1589,10 @@ class LabelRowV2:
 
         all_frames = self._classifications_to_frames[classification_instance.ontology_item]
         actual_frames = _frame_views_to_frame_numbers(classification_instance.get_annotations())
-        for actual_frame in actual_frames:
-            all_frames.remove(actual_frame)
-        if len(all_frames) == 0:
+        all_frames.remove_ranges(frames_to_ranges(actual_frames))
+        if len(all_frames.ranges) == 0:
             del self._classifications_to_frames[classification_instance.ontology_item]
+        self._hash_to_frames.pop(classification_hash, None)
 
         # The instance no longer has a parent
         classification_instance._parent = None
@@ -1461,9 +1604,9 @@ class LabelRowV2:
         self._check_labelling_is_initalised()
 
         if isinstance(label_item, ObjectInstance):
-            self._frame_to_hashes[frame].add(label_item.object_hash)
+            self._hash_to_frames[label_item.object_hash].add_range(Range(frame, frame))
         elif isinstance(label_item, ClassificationInstance):
-            self._frame_to_hashes[frame].add(label_item.classification_hash)
+            self._hash_to_frames[label_item.classification_hash].add_range(Range(frame, frame))
         else:
             raise NotImplementedError(f"Got an unexpected label item class `{type(label_item)}`")
 
@@ -1500,10 +1643,7 @@ class LabelRowV2:
 
         ret: List[ClassificationInstance] = list()
 
-        if filter_frames is not None:
-            filtered_frames_list = frames_class_to_frames_list(filter_frames)
-        else:
-            filtered_frames_list = list()
+        filter_range_manager = RangeManager(filter_frames) if filter_frames is not None else None
 
         for classification in self._classifications_map.values():
             # filter by ontology object
@@ -1514,16 +1654,10 @@ class LabelRowV2:
                 continue
 
             # filter by frame
-            if filter_frames is None:
-                append = True
-            else:
-                append = False
-
-            if classification.is_on_frame(filtered_frames_list):
-                append = True
+            if filter_range_manager is not None and not classification._range_manager.intersects(filter_range_manager):
+                continue
 
-            if append:
-                ret.append(classification)
+            ret.append(classification)
 
         if include_spaces:
             # Needed to remove filter out duplicate classification instances across spaces
@@ -1541,47 +1675,13 @@ class LabelRowV2:
                         continue
 
                     # filter by frame
-                    if filter_frames is None:
-                        append = True
-                    else:
-                        append = False
-
-                    for frame in filtered_frames_list:
-                        if isinstance(space, VideoSpace):
-                            # TODO: In VideoSpace, track classificationHash to ranges to improve performance here.
-                            classifications_on_frames = space._frames_to_classification_hash_to_annotation_data.get(
-                                frame, {}
-                            )
-                            if classification.classification_hash in classifications_on_frames:
-                                append = True
-                                break
-                        elif isinstance(space, ImageSpace):
-                            if frame != 0:
-                                continue
-
-                            if classification.classification_hash in space._classifications_map:
-                                append = True
-                                break
-                        elif isinstance(space, AudioSpace):
-                            # For backwards compatibility, all audio classifications are treated as being on frame 0
-                            if frame != 0:
-                                continue
-
-                            if classification.classification_hash in space._classifications_map:
-                                append = True
-                                break
-                        elif isinstance(space, TextSpace):
-                            # For backwards compatibility, all text classifications are treated as being on frame 0
-                            if frame != 0:
-                                continue
-
-                            if classification.classification_hash in space._classifications_map:
-                                append = True
-                                break
-
-                    if append:
-                        classification_hashes.add(classification.classification_hash)
-                        ret.append(classification)
+                    if filter_range_manager is not None:
+                        frames_on_space = space._get_classification_frames(classification.classification_hash)
+                        if frames_on_space is None or not frames_on_space.intersects(filter_range_manager):
+                            continue
+
+                    classification_hashes.add(classification.classification_hash)
+                    ret.append(classification)
 
         return ret
 
@@ -2390,7 +2490,11 @@ class LabelRowV2:
             or data_type == DataType.PDF
             or data_type == DataType.SCENE
         ):
-            for frame in self._frame_to_hashes.keys():
+            labelled_frames = RangeManager()
+            for item_frames in self._hash_to_frames.values():
+                labelled_frames.add_ranges(item_frames.get_ranges())
+
+            for frame in sorted(labelled_frames.get_ranges_as_frames()):
                 ret[str(frame)] = self._to_encord_label(frame)
 
         elif data_type == DataType.AUDIO or data_type == DataType.PLAIN_TEXT:
@@ -2476,10 +2580,7 @@ class LabelRowV2:
             encord_object["point"] = coordinates.to_dict()
         elif isinstance(coordinates, BitmaskCoordinates):
             frame_view = self.get_frame_view(frame)
-            if not (
-                frame_view.height == coordinates._encoded_bitmask.height
-                and frame_view.width == coordinates._encoded_bitmask.width
-            ):
+            if (frame_view.height, frame_view.width) != coordinates._shape():
                 raise ValueError("Bitmask dimensions don't match the media dimensions")
             encord_object["bitmask"] = coordinates.to_dict()
         elif isinstance(coordinates, SkeletonCoordinates):
@@ -2542,14 +2643,14 @@ class LabelRowV2:
         classification = classification_instance.ontology_item
 
         range_manager = RangeManager(frame_class=frames)
-        frames_set = range_manager.get_ranges_as_frames()
+        ranges = range_manager.get_ranges()
 
-        self._classifications_to_ranges[classification].add_ranges(range_manager.get_ranges())
+        self._classifications_to_ranges[classification].add_ranges(ranges)
 
         if not classification_instance.is_range_only():
-            self._classifications_to_frames[classification].update(frames_set)
-            for frame in frames_set:
-                self.add_to_single_frame_to_hashes_map(classification_instance, frame)
+            self._check_labelling_is_initalised()
+            self._classifications_to_frames[classification].add_ranges(ranges)
+            self._hash_to_frames[classification_instance.classification_hash].add_ranges(ranges)
 
     def _remove_frames_from_classification(
         self, classification_instance: ClassificationInstance, frames: Frames
@@ -2561,23 +2662,39 @@ class LabelRowV2:
         self._classifications_to_ranges[classification].remove_ranges(range_manager.get_ranges())
 
         if not classification_instance.is_range_only():
-            present_frames = self._classifications_to_frames.get(classification, set())
+            ranges = range_manager.get_ranges()
+
+            present_frames = self._classifications_to_frames.get(classification)
+            if present_frames is not None:
+                present_frames.remove_ranges(ranges)
 
-            frames_set = range_manager.get_ranges_as_frames()
-            for frame in frames_set:
-                present_frames.remove(frame)
-                self._frame_to_hashes[frame].remove(classification_instance.classification_hash)
+            frames_of_classification = self._hash_to_frames.get(classification_instance.classification_hash)
+            if frames_of_classification is not None:
+                frames_of_classification.remove_ranges(ranges)
 
     def _add_to_frame_to_hashes_map(
-        self, label_item: Union[ObjectInstance, ClassificationInstance], frames: Iterable[int]
+        self, label_item: Union[ObjectInstance, ClassificationInstance], frames: Collection[int]
     ) -> None:
-        for frame in frames:
-            self.add_to_single_frame_to_hashes_map(label_item, frame)
+        self._check_labelling_is_initalised()
+
+        if isinstance(label_item, ObjectInstance):
+            item_hash = label_item.object_hash
+        elif isinstance(label_item, ClassificationInstance):
+            item_hash = label_item.classification_hash
+        else:
+            raise NotImplementedError(f"Got an unexpected label item class `{type(label_item)}`")
+
+        self._hash_to_frames[item_hash].add_ranges(frames_to_ranges(frames))
 
     @deprecated("Only used in the ObjectInstance removal")
-    def _remove_from_frame_to_hashes_map(self, frames: Iterable[int], item_hash: str):
-        for frame in frames:
-            self._frame_to_hashes[frame].remove(item_hash)
+    def _remove_from_frame_to_hashes_map(self, frames: Collection[int], item_hash: str):
+        frames_of_item = self._hash_to_frames.get(item_hash)
+        if frames_of_item is None:
+            return
+
+        frames_of_item.remove_ranges(frames_to_ranges(frames))
+        if len(frames_of_item.ranges) == 0:
+            del self._hash_to_frames[item_hash]
 
     def _initiate_spaces(
         self,
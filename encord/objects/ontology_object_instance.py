@@ -27,6 +27,7 @@ from typing import (
     Tuple,
     Union,
     cast,
+    get_args,
 )
 
 from encord.common.deprecated import deprecated
@@ -46,6 +47,7 @@ from encord.objects.coordinates import (
     GeometricCoordinates,
     HtmlCoordinates,
     TextCoordinates,
+    coordinates_from_arrays,
 )
 from encord.objects.frames import (
     Frames,
@@ -71,7 +73,7 @@ from encord.objects.types import (
     BaseFrameObject,
     DynamicAttributeObject,
 )
-from encord.objects.utils import short_uuid_str
+from encord.objects.utils import check_email, short_uuid_str
 
 if TYPE_CHECKING:
     from encord.objects.ontology_labels_impl import LabelRowV2
@@ -81,6 +83,18 @@ if TYPE_CHECKING:
 class ObjectInstance:
     """An object instance is an object that has coordinates and can be placed on one or multiple frames in a label row."""
 
+    __slots__ = (
+        "_ontology_object",
+        "_object_hash",
+        "_parent",
+        "_static_answer_map",
+        "_dynamic_answer_manager",
+        "_non_geometric",
+        "_instance_metadata",
+        "_frames_to_instance_data",
+        "_spaces",
+    )
+
     def __init__(self, ontology_object: Object, *, object_hash: Optional[str] = None):
         self._ontology_object = ontology_object
         self._object_hash = object_hash or short_uuid_str()
@@ -623,6 +637,160 @@ class ObjectInstance:
             if self._parent:
                 self._parent.add_to_single_frame_to_hashes_map(self, frame)
 
+    def set_track(
+        self,
+        frames: Union[Sequence[int], Any],
+        coordinates: Union[Sequence[Coordinates], Any],
+        *,
+        confidences: Optional[Union[Sequence[float], Any]] = None,
+        manual_annotations: Optional[Sequence[bool]] = None,
+        overwrite: bool = False,
+        created_at: Optional[datetime] = None,
+        created_by: Optional[str] = None,
+        last_edited_at: Optional[datetime] = None,
+        last_edited_by: Optional[str] = None,
+    ) -> None:
+        """Place the object onto many frames at once, with different coordinates on each frame.
+
+        This is the batch equivalent of calling :meth:`set_for_frames` once per frame, e.g. to write the output of an
+        object tracker. The inputs are validated once for the whole track, and the label row the object belongs to
+        (if any) is updated in one pass. If any input is invalid, the object instance is left unchanged.
+
+        Numpy needs to be installed for this call to work.
+
+        Args:
+            frames: The frames of the track, as an array of length `N`. Frames must be unique.
+            coordinates: The coordinates on each frame. Either a sequence of `N` coordinate objects, or arrays in the
+                layout described in :func:`encord.objects.coordinates.coordinates_from_arrays`, e.g. an `[N, 4]`
+                array of `(top_left_x, top_left_y, width, height)` for bounding boxes.
+            confidences: Optionally, the confidence on each frame as an array of length `N`. For new frames this
+                defaults to `1.0`; existing frames keep their value.
+            manual_annotations: Optionally, whether the object was manually annotated on each frame, as a sequence
+                of length `N`. For new frames this defaults to `True`; existing frames keep their value.
+            overwrite: If `True`, overwrite existing data for the given frames.
+                If `False` and data already exists for any of the given frames, raises an error.
+            created_at: Optionally specify the creation time of the object instance on all frames.
+                Defaults to `datetime.now()`.
+            created_by: Optionally specify the creator of the object instance on all frames.
+                Defaults to the current SDK user.
+            last_edited_at: Optionally specify the last edit time of the object instance on all frames.
+                Defaults to `datetime.now()`.
+            last_edited_by: Optionally specify the last editor of the object instance on all frames.
+                Defaults to the current SDK user.
+
+        Raises:
+            LabelRowError: If the inputs are inconsistent, the coordinates do not match the ontology shape, a frame is
+                not an integer or out of bounds, or data already exists for a frame and `overwrite` is `False`.
+            ValueError: If `created_by` or `last_edited_by` is not a valid email address.
+        """
+        import numpy as np  # type: ignore[missing-import]
+
+        if self._non_geometric:
+            raise LabelRowError(
+                f"For objects with a non-geometric shape (e.g. {Shape.TEXT} and {Shape.AUDIO}), "
+                f"there is only one frame. Please use `set_for_frames` instead."
+            )
+
+        self._operation_not_allowed_for_objects_on_space(
+            extended_message="For adding the object to different frames on a space, use Space.place_object."
+        )
+
+        frames_array = np.asarray(frames)
+        # Casting would silently truncate fractional frames, an empty list is the only non-integer array allowed
+        if frames_array.size > 0 and not np.issubdtype(frames_array.dtype, np.integer):
+            raise LabelRowError(f"Frames must be integers, got an array of type {frames_array.dtype}.")
+        frames_array = frames_array.astype(np.int64)
+        if frames_array.ndim != 1:
+            raise LabelRowError(
+                f"Expected a one-dimensional array of frames, got an array of shape {frames_array.shape}."
+            )
+        frames_list: List[int] = frames_array.tolist()
+        count = len(frames_list)
+        if len(set(frames_list)) != count:
+            raise LabelRowError("The supplied frames are not unique.")
+
+        coordinates_list: Sequence[Coordinates]
+        if (
+            isinstance(coordinates, (list, tuple))
+            and len(coordinates) > 0
+            and isinstance(coordinates[0], get_args(Coordinates))
+        ):
+            coordinates_list = coordinates
+            # The coordinate check only depends on the type, so check one instance of every type
+            for representative in {type(item): item for item in coordinates_list}.values():
+                check_coordinate_type(representative, self._ontology_object, self._parent)
+        else:
+            coordinates_list = coordinates_from_arrays(self._ontology_object.shape, coordinates)
+            # All coordinates built from arrays have the same type
+            if len(coordinates_list) > 0:
+                check_coordinate_type(coordinates_list[0], self._ontology_object, self._parent)
+        if len(coordinates_list) != count:
+            raise LabelRowError(f"Expected {count} coordinates, got {len(coordinates_list)}.")
+
+        confidences_list: List[Optional[float]]
+        if confidences is None:
+            confidences_list = [None] * count
+        else:
+            confidences_list = np.asarray(confidences, dtype=np.float64).tolist()
+            if len(confidences_list) != count:
+                raise LabelRowError(f"Expected {count} confidences, got {len(confidences_list)}.")
+
+        manual_annotations_list: List[Optional[bool]]
+        if manual_annotations is None:
+            manual_annotations_list = [None] * count
+        else:
+            manual_annotations_list = list(manual_annotations)
+            if len(manual_annotations_list) != count:
+                raise LabelRowError(f"Expected {count} manual annotation flags, got {len(manual_annotations_list)}.")
+
+        if count > 0:
+            self.check_within_range(min(frames_list))
+            self.check_within_range(max(frames_list))
+
+        if not overwrite and not self._frames_to_instance_data.keys().isdisjoint(frames_list):
+            raise LabelRowError("Cannot overwrite existing data for a frame. Set `overwrite` to `True` to overwrite.")
+
+        # New frames are created without going through the metadata setters, so the emails are checked here
+        if created_by is not None:
+            check_email(created_by)
+        if last_edited_by is not None:
+            check_email(last_edited_by)
+
+        # Share one timestamp across the track, rather than calling `datetime.now()` per frame
+        now = datetime.now()
+        for frame, frame_coordinates, confidence, manual_annotation in zip(
+            frames_list, coordinates_list, confidences_list, manual_annotations_list
+        ):
+            geometric_coordinates = cast(GeometricCoordinates, frame_coordinates)
+            existing_frame_data = self._frames_to_instance_data.get(frame)
+            if existing_frame_data is None:
+                self._frames_to_instance_data[frame] = _GeometricAnnotationData(
+                    annotation_metadata=_AnnotationMetadata(
+                        created_at=created_at or now,
+                        created_by=created_by,
+                        last_edited_at=last_edited_at or now,
+                        last_edited_by=last_edited_by,
+                        confidence=confidence if confidence is not None else DEFAULT_CONFIDENCE,
+                        manual_annotation=manual_annotation
+                        if manual_annotation is not None
+                        else DEFAULT_MANUAL_ANNOTATION,
+                    ),
+                    coordinates=geometric_coordinates,
+                )
+            else:
+                existing_frame_data.annotation_metadata.update_from_optional_fields(
+                    created_at=created_at,
+                    created_by=created_by,
+                    last_edited_at=last_edited_at,
+                    last_edited_by=last_edited_by,
+                    confidence=confidence,
+                    manual_annotation=manual_annotation,
+                )
+                cast(_GeometricAnnotationData, existing_frame_data).coordinates = geometric_coordinates
+
+        if self._parent:
+            self._parent._add_to_frame_to_hashes_map(self, frames_list)
+
     def _get_non_geometric_annotation(self) -> Optional[Annotation]:
         # Non-geometric annotations (e.g. Audio and Text) only have one frame.
         if 0 not in self._frames_to_instance_data:
@@ -774,6 +942,8 @@ class ObjectInstance:
         This is deprecated, we will be using the ObjectAnnotation that this inherits from.
         """
 
+        __slots__ = ("_frame",)
+
         def __init__(self, object_instance: ObjectInstance, frame: int):
             self._object_instance = object_instance
             self._frame = frame
@@ -840,6 +1010,8 @@ class ObjectInstance:
             annotation_metadata (_AnnotationMetadata): The frame's metadata information.
         """
 
+        __slots__ = ("coordinates", "annotation_metadata")
+
         coordinates: Coordinates
         annotation_metadata: _AnnotationMetadata
         # Probably the above can be flattened out into this class.
@@ -22,22 +22,60 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(init=False)
 class _AnnotationMetadata:
     """Contains metadata information about an annotation (on a frame or a range)"""
 
-    created_at: datetime = field(default_factory=datetime.now)
-    created_by: Optional[str] = None
+    # One of these exists per annotated frame, so keep the instances compact.
+    __slots__ = (
+        "created_at",
+        "created_by",
+        "last_edited_at",
+        "last_edited_by",
+        "confidence",
+        "manual_annotation",
+        "is_deleted",
+        "reviews",
+    )
+
+    created_at: datetime
+    created_by: Optional[str]
     """None defaults to the user of the SDK once uploaded to the server."""
-    last_edited_at: datetime = field(default_factory=datetime.now)
-    last_edited_by: Optional[str] = None
+    last_edited_at: datetime
+    last_edited_by: Optional[str]
     """None defaults to the user of the SDK once uploaded to the server."""
-    confidence: float = DEFAULT_CONFIDENCE
-    manual_annotation: bool = DEFAULT_MANUAL_ANNOTATION
+    confidence: float
+    manual_annotation: bool
     # TODO: Classifications do not have this field. We also want to deprecate this field.
-    is_deleted: Optional[bool] = None
+    is_deleted: Optional[bool]
     # TODO: We want tod deprecate this field.
-    reviews: Optional[List[dict[Any, Any]]] = None
+    reviews: Optional[List[dict[Any, Any]]]
+
+    def __init__(
+        self,
+        created_at: Optional[datetime] = None,
+        created_by: Optional[str] = None,
+        last_edited_at: Optional[datetime] = None,
+        last_edited_by: Optional[str] = None,
+        confidence: float = DEFAULT_CONFIDENCE,
+        manual_annotation: bool = DEFAULT_MANUAL_ANNOTATION,
+        is_deleted: Optional[bool] = None,
+        reviews: Optional[List[dict[Any, Any]]] = None,
+    ) -> None:
+        if created_at is None or last_edited_at is None:
+            # datetimes are immutable, so both defaults can share one object
+            now = datetime.now()
+            created_at = created_at or now
+            last_edited_at = last_edited_at or now
+
+        self.created_at = created_at
+        self.created_by = created_by
+        self.last_edited_at = last_edited_at
+        self.last_edited_by = last_edited_by
+        self.confidence = confidence
+        self.manual_annotation = manual_annotation
+        self.is_deleted = is_deleted
+        self.reviews = reviews
 
     @staticmethod
     def from_dict(d: BaseFrameObject | FrameClassification | ClassificationAnswer) -> "_AnnotationMetadata":
@@ -116,6 +154,8 @@ class _AnnotationData:
         annotation_metadata (_AnnotationMetadata): The annotation's metadata information.
     """
 
+    __slots__ = ("annotation_metadata",)
+
     annotation_metadata: _AnnotationMetadata
 
 
@@ -124,6 +164,8 @@ class _Annotation(ABC):
     Class providing common annotation properties.
     """
 
+    __slots__ = ("_space",)
+
     def __init__(self, space: Space):
         self._space = space
 
@@ -135,6 +177,13 @@ class _Annotation(ABC):
         """
         pass
 
+    def _get_annotation_data_for_update(self) -> _AnnotationData:
+        """Get the underlying annotation data, to be mutated in place.
+
+        Spaces that share annotation data between frames override this to return data that is not shared.
+        """
+        return self._get_annotation_data()
+
     @abstractmethod
     def _check_if_annotation_is_valid(self) -> None:
         """Validate that the annotation still exists and is accessible.
@@ -170,7 +219,7 @@ class _Annotation(ABC):
     def created_at(self, created_at: datetime) -> None:
         """Set the creation timestamp of the annotation."""
         self._check_if_annotation_is_valid()
-        self._get_annotation_data().annotation_metadata.created_at = created_at
+        self._get_annotation_data_for_update().annotation_metadata.created_at = created_at
 
     @property
     def created_by(self) -> Optional[str]:
@@ -189,7 +238,7 @@ class _Annotation(ABC):
         self._check_if_annotation_is_valid()
         if created_by is not None:
             check_email(created_by)
-        self._get_annotation_data().annotation_metadata.created_by = created_by
+        self._get_annotation_data_for_update().annotation_metadata.created_by = created_by
 
     @property
     def last_edited_at(self) -> datetime:
@@ -201,7 +250,7 @@ class _Annotation(ABC):
     def last_edited_at(self, last_edited_at: datetime) -> None:
         """Set the last edited timestamp of the annotation."""
         self._check_if_annotation_is_valid()
-        self._get_annotation_data().annotation_metadata.last_edited_at = last_edited_at
+        self._get_annotation_data_for_update().annotation_metadata.last_edited_at = last_edited_at
 
     @property
     def last_edited_by(self) -> Optional[str]:
@@ -220,7 +269,7 @@ class _Annotation(ABC):
         self._check_if_annotation_is_valid()
         if last_edited_by is not None:
             check_email(last_edited_by)
-        self._get_annotation_data().annotation_metadata.last_edited_by = last_edited_by
+        self._get_annotation_data_for_update().annotation_metadata.last_edited_by = last_edited_by
 
     @property
     def confidence(self) -> float:
@@ -232,7 +281,7 @@ class _Annotation(ABC):
     def confidence(self, confidence: float) -> None:
         """Set the confidence score of the annotation."""
         self._check_if_annotation_is_valid()
-        self._get_annotation_data().annotation_metadata.confidence = confidence
+        self._get_annotation_data_for_update().annotation_metadata.confidence = confidence
 
     @property
     def manual_annotation(self) -> bool:
@@ -244,7 +293,7 @@ class _Annotation(ABC):
     def manual_annotation(self, manual_annotation: bool) -> None:
         """Set whether this annotation was created manually."""
         self._check_if_annotation_is_valid()
-        self._get_annotation_data().annotation_metadata.manual_annotation = manual_annotation
+        self._get_annotation_data_for_update().annotation_metadata.manual_annotation = manual_annotation
 
 
 class _ObjectAnnotation(_Annotation):
@@ -252,6 +301,8 @@ class _ObjectAnnotation(_Annotation):
     Provides access to annotation metadata for a SpaceObject.
     """
 
+    __slots__ = ("_object_instance",)
+
     def __init__(self, space: Space, object_instance: ObjectInstance):
         super().__init__(space)
         self._object_instance = object_instance
@@ -282,6 +333,8 @@ class _ClassificationAnnotation(_Annotation):
     Allows setting or getting annotation data for the Classification.
     """
 
+    __slots__ = ("_classification_instance",)
+
     def __init__(self, space: Space, classification_instance: ClassificationInstance):
         super().__init__(space)
         self._classification_instance = classification_instance
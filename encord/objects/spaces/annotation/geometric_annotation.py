@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from encord.exceptions import LabelRowError
 from encord.objects.coordinates import GeometricCoordinates
@@ -21,12 +21,16 @@ if TYPE_CHECKING:
 class _GeometricAnnotationData(_AnnotationData):
     """Annotation Data for 2D objects. Contains coordinates."""
 
+    __slots__ = ("coordinates",)
+
     coordinates: GeometricCoordinates
 
 
 class _GeometricObjectAnnotation(_ObjectAnnotation):
     """Annotations for single-frame 2D objects."""
 
+    __slots__ = ()
+
     def __init__(self, space: ImageSpace, object_instance: ObjectInstance):
         super().__init__(space, object_instance)
         self._space: ImageSpace = space
@@ -62,6 +66,8 @@ class _GeometricObjectAnnotation(_ObjectAnnotation):
 class _GeometricFrameObjectAnnotation(_ObjectAnnotation):
     """Annotations for multi-frame geometric object labels (e.g. Video)."""
 
+    __slots__ = ("_frame",)
+
     def __init__(self, space: MultiFrameSpace, object_instance: ObjectInstance, frame: int):
         super().__init__(space, object_instance)
         self._space: MultiFrameSpace = space
@@ -91,14 +97,21 @@ class _GeometricFrameObjectAnnotation(_ObjectAnnotation):
         )
 
     def _get_annotation_data(self) -> _GeometricAnnotationData:
-        return self._space._frames_to_object_hash_to_annotation_data[self._frame][self._object_instance.object_hash]
+        return cast(
+            _GeometricAnnotationData,
+            self._space._get_frame_object_annotation_data(self._object_instance.object_hash, self._frame),
+        )
+
+    def _get_annotation_data_for_update(self) -> _GeometricAnnotationData:
+        return cast(
+            _GeometricAnnotationData,
+            self._space._get_frame_object_annotation_data(
+                self._object_instance.object_hash, self._frame, for_update=True
+            ),
+        )
 
     def _check_if_annotation_is_valid(self) -> None:
-        if (
-            self._frame not in self._space._frames_to_object_hash_to_annotation_data
-            or self._object_instance.object_hash
-            not in self._space._frames_to_object_hash_to_annotation_data[self._frame]
-        ):
+        if self._space._get_frame_object_annotation_data(self._object_instance.object_hash, self._frame) is None:
             raise LabelRowError(
                 "Trying to use an ObjectInstance.FrameAnnotation for a VideoObjectInstance that is not on the frame"
             )
@@ -107,6 +120,8 @@ class _GeometricFrameObjectAnnotation(_ObjectAnnotation):
 class _FrameClassificationAnnotation(_ClassificationAnnotation):
     """Annotations for multi-frame classifications (e.g. Video)."""
 
+    __slots__ = ("_frame",)
+
     def __init__(self, space: MultiFrameSpace, classification_instance: ClassificationInstance, frame: int):
         super().__init__(space, classification_instance)
         self._space: MultiFrameSpace = space
@@ -121,15 +136,27 @@ class _FrameClassificationAnnotation(_ClassificationAnnotation):
         return self._frame
 
     def _get_annotation_data(self) -> _AnnotationData:
-        return self._space._frames_to_classification_hash_to_annotation_data[self._frame][
-            self._classification_instance.classification_hash
-        ]
+        return cast(
+            _AnnotationData,
+            self._space._get_frame_classification_annotation_data(
+                self._classification_instance.classification_hash, self._frame
+            ),
+        )
+
+    def _get_annotation_data_for_update(self) -> _AnnotationData:
+        return cast(
+            _AnnotationData,
+            self._space._get_frame_classification_annotation_data(
+                self._classification_instance.classification_hash, self._frame, for_update=True
+            ),
+        )
 
     def _check_if_annotation_is_valid(self) -> None:
         if (
-            self._frame not in self._space._frames_to_classification_hash_to_annotation_data
-            or self._classification_instance.classification_hash
-            not in self._space._frames_to_classification_hash_to_annotation_data[self._frame]
+            self._space._get_frame_classification_annotation_data(
+                self._classification_instance.classification_hash, self._frame
+            )
+            is None
         ):
             raise LabelRowError(
                 "Trying to use an ObjectInstance.FrameAnnotation for a VideoObjectInstance that is not on the frame"
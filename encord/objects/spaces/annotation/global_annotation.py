@@ -17,6 +17,8 @@ class _GlobalClassificationAnnotation(_ClassificationAnnotation):
     For video space, this can be contrasted with the FrameClassificationAnnotation, where the classification exists on certain frames.
     """
 
+    __slots__ = ()
+
     def __init__(self, space: Space, classification_instance: ClassificationInstance):
         super().__init__(space, classification_instance)
 
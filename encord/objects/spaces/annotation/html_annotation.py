@@ -21,12 +21,16 @@ if TYPE_CHECKING:
 class _HtmlAnnotationData(_AnnotationData):
     """Annotation Data for HTML-based objects. Contains HtmlRanges."""
 
+    __slots__ = ("ranges",)
+
     ranges: HtmlRanges
 
 
 class _HtmlObjectAnnotation(_ObjectAnnotation):
     """Annotations for HTML modality with XPath-based coordinates."""
 
+    __slots__ = ()
+
     def __init__(self, space: HTMLSpace, object_instance: ObjectInstance):
         super().__init__(space, object_instance)
         self._space: HTMLSpace = space
@@ -51,7 +55,7 @@ class _HtmlObjectAnnotation(_ObjectAnnotation):
         if isinstance(ranges, HtmlRange):
             ranges = [ranges]
 
-        self._space._object_hash_to_html_ranges[self._object_instance.object_hash] = ranges
+        self._space._set_object_html_ranges(self._object_instance.object_hash, ranges)
 
     @property
     def coordinates(self) -> HtmlCoordinates:
@@ -72,7 +76,7 @@ class _HtmlObjectAnnotation(_ObjectAnnotation):
             coordinates: The new HtmlCoordinates to set.
         """
         self._check_if_annotation_is_valid()
-        self._space._object_hash_to_html_ranges[self._object_instance.object_hash] = coordinates.range
+        self._space._set_object_html_ranges(self._object_instance.object_hash, coordinates.range)
 
     def _get_annotation_data(self) -> _HtmlAnnotationData:
         return _HtmlAnnotationData(
@@ -90,6 +94,8 @@ class _HtmlObjectAnnotation(_ObjectAnnotation):
 class _HtmlClassificationAnnotation(_ClassificationAnnotation):
     """Classification annotations for HTML modality."""
 
+    __slots__ = ()
+
     def __init__(self, space: HTMLSpace, classification_instance: ClassificationInstance):
         super().__init__(space, classification_instance)  # type: ignore[arg-type]
         self._space: HTMLSpace = space  # type: ignore[assignment]
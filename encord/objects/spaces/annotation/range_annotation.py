@@ -22,12 +22,16 @@ if TYPE_CHECKING:
 class _RangeObjectAnnotationData(_AnnotationData):
     """Annotation Data for Range-based objects. Contains a range manager."""
 
+    __slots__ = ("range_manager",)
+
     range_manager: RangeManager
 
 
 class _RangeObjectAnnotation(_ObjectAnnotation):
     """Annotations for range-based modalities (e.g. Text, Audio)."""
 
+    __slots__ = ()
+
     def __init__(self, space: RangeSpace, object_instance: ObjectInstance):
         super().__init__(space, object_instance)
         self._space: RangeSpace = space
@@ -49,8 +53,7 @@ class _RangeObjectAnnotation(_ObjectAnnotation):
     @ranges.setter
     def ranges(self, ranges: Union[Range, Ranges]) -> None:
         self._check_if_annotation_is_valid()
-        new_range_manager = RangeManager(ranges)
-        self._space._object_hash_to_range_manager[self._object_instance.object_hash] = new_range_manager
+        self._set_range_manager(RangeManager(ranges))
 
     @property
     def coordinates(self) -> AudioCoordinates | TextCoordinates:
@@ -71,8 +74,13 @@ class _RangeObjectAnnotation(_ObjectAnnotation):
     def coordinates(self, coordinates: AudioCoordinates | TextCoordinates) -> None:
         """This field is deprecated. It is only here for backwards compatibility. Use .ranges instead."""
         self._check_if_annotation_is_valid()
-        new_range_manager = RangeManager(frame_class=coordinates.range)
-        self._space._object_hash_to_range_manager[self._object_instance.object_hash] = new_range_manager
+        self._set_range_manager(RangeManager(frame_class=coordinates.range))
+
+    def _set_range_manager(self, range_manager: RangeManager) -> None:
+        object_hash = self._object_instance.object_hash
+        previous_ranges = self._space._object_hash_to_range_manager[object_hash].ranges
+        self._space._object_hash_to_range_manager[object_hash] = range_manager
+        self._space._reindex_object_ranges(object_hash, previous_ranges)
 
     def _get_annotation_data(self) -> _RangeObjectAnnotationData:
         return _RangeObjectAnnotationData(
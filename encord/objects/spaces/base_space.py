@@ -15,6 +15,7 @@ from typing import (
     overload,
 )
 
+from encord.common.range_manager import RangeManager
 from encord.common.time_parser import format_datetime_to_long_string
 from encord.exceptions import LabelRowError
 from encord.objects.spaces.annotation.base_annotation import (
@@ -106,6 +107,20 @@ class Space(ABC, Generic[ObjectAnnotationT, ClassificationAnnotationT, Classific
     def remove_classification_instance(self, classification_hash: str) -> Optional[ClassificationInstance]:
         pass
 
+    def _get_object_frames(self, object_hash: str) -> Optional[RangeManager]:
+        """Get the frames that an object is on, used to filter the instances of a label row by frame.
+
+        Returns None if the object is not on this space, or if this space does not place labels on frames.
+        """
+        return None
+
+    def _get_classification_frames(self, classification_hash: str) -> Optional[RangeManager]:
+        """Get the frames that a classification is on, used to filter the instances of a label row by frame.
+
+        Returns None if the classification is not on this space, or if this space does not place labels on frames.
+        """
+        return None
+
     @overload
     def get_annotations(
         self,
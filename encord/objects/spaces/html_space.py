@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import logging
+import sys
+from collections import defaultdict
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Union, cast
+from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Tuple, Union, cast
 
+from encord.common.interval_index import IntervalIndex
 from encord.common.time_parser import format_datetime_to_long_string, format_datetime_to_long_string_optional
 from encord.constants.enums import SpaceType
 from encord.exceptions import LabelRowError
@@ -47,6 +50,8 @@ class HTMLSpace(Space[_HtmlObjectAnnotation, _GlobalClassificationAnnotation, Ht
     def __init__(self, space_id: str, label_row: LabelRowV2, space_info: SpaceInfo):
         super().__init__(space_id, label_row, space_info)
         self._object_hash_to_html_ranges: dict[str, HtmlRanges] = dict()
+        # Character offsets covered by each object within each node, for queries by position
+        self._xpath_to_span_index: defaultdict[str, IntervalIndex[str]] = defaultdict(IntervalIndex)
 
     def put_object_instance(
         self,
@@ -109,7 +114,7 @@ class HTMLSpace(Space[_HtmlObjectAnnotation, _GlobalClassificationAnnotation, Ht
             manual_annotation=manual_annotation,
         )
 
-        self._object_hash_to_html_ranges[object_instance.object_hash] = ranges_list
+        self._set_object_html_ranges(object_instance.object_hash, ranges_list)
 
     def put_classification_instance(
         self,
@@ -170,7 +175,7 @@ class HTMLSpace(Space[_HtmlObjectAnnotation, _GlobalClassificationAnnotation, Ht
         """
         self._label_row._check_labelling_is_initalised()
         object_instance = self._objects_map.pop(object_hash, None)
-        self._object_hash_to_html_ranges.pop(object_hash, None)
+        self._set_object_html_ranges(object_hash, None)
         if object_instance is not None:
             object_instance._remove_from_space(self.space_id)
 
@@ -189,6 +194,80 @@ class HTMLSpace(Space[_HtmlObjectAnnotation, _GlobalClassificationAnnotation, Ht
         classification_instance = self._classifications_map[classification_hash]
         return self._remove_global_classification_instance(classification=classification_instance)
 
+    def get_overlapping_object_instances(self, html_range: HtmlRange) -> List[ObjectInstance]:
+        """Get the object instances that overlap a range of characters within one HTML node.
+
+        This uses an index of the ranges of all objects per node, so it does not scan every object. Ranges that start
+        and end in different nodes are indexed on their start and end nodes only, as the order of the nodes in between
+        is not known to the space.
+
+        Args:
+            html_range: The range to check. Its start and end must be in the same node.
+
+        Returns:
+            List[ObjectInstance]: The overlapping object instances, ordered by their start offset in the node.
+
+        Raises:
+            LabelRowError: If the start and end of `html_range` are in different nodes.
+        """
+        self._label_row._check_labelling_is_initalised()
+        if html_range.start.xpath != html_range.end.xpath:
+            raise LabelRowError("Overlap queries are only supported for ranges within a single node.")
+
+        span_index = self._xpath_to_span_index.get(html_range.start.xpath)
+        if span_index is None:
+            return []
+        return self._object_instances_from_spans(span_index.overlapping(html_range.start.offset, html_range.end.offset))
+
+    def get_object_instances_at(self, node: HtmlNode) -> List[ObjectInstance]:
+        """Get the object instances that contain the character at an offset in an HTML node.
+
+        Args:
+            node: The node and character offset to check.
+
+        Returns:
+            List[ObjectInstance]: The object instances at the position, ordered by their start offset in the node.
+        """
+        self._label_row._check_labelling_is_initalised()
+        span_index = self._xpath_to_span_index.get(node.xpath)
+        if span_index is None:
+            return []
+        return self._object_instances_from_spans(span_index.at(node.offset))
+
+    def get_nearest_object_instance(self, node: HtmlNode) -> Optional[ObjectInstance]:
+        """Get the object instance closest to a character offset, among the objects in the same HTML node.
+
+        Args:
+            node: The node and character offset to check.
+
+        Returns:
+            Optional[ObjectInstance]: The nearest object instance, or None if there are no objects in the node.
+        """
+        self._label_row._check_labelling_is_initalised()
+        span_index = self._xpath_to_span_index.get(node.xpath)
+        nearest = span_index.nearest(node.offset) if span_index is not None else None
+        return self._objects_map[nearest[2]] if nearest is not None else None
+
+    def _object_instances_from_spans(self, spans: List[Tuple[int, int, str]]) -> List[ObjectInstance]:
+        # dict.fromkeys removes objects with several matching ranges, keeping the first
+        return [self._objects_map[object_hash] for object_hash in dict.fromkeys(key for _, _, key in spans)]
+
+    def _set_object_html_ranges(self, object_hash: str, ranges: Optional[HtmlRanges]) -> None:
+        """Replace the ranges of an object, or remove them if `ranges` is None, keeping the span index up to date."""
+        previous_ranges = self._object_hash_to_html_ranges.pop(object_hash, [])
+        for xpath, start, end in _html_ranges_to_node_spans(previous_ranges):
+            span_index = self._xpath_to_span_index[xpath]
+            span_index.remove(start, end, object_hash)
+            if not span_index:
+                del self._xpath_to_span_index[xpath]
+
+        if ranges is None:
+            return
+
+        self._object_hash_to_html_ranges[object_hash] = ranges
+        for xpath, start, end in _html_ranges_to_node_spans(ranges):
+            self._xpath_to_span_index[xpath].add(start, end, object_hash)
+
     def _create_new_object(self, feature_hash: str, object_hash: str) -> ObjectInstance:
         from encord.objects.ontology_object import Object, ObjectInstance
 
@@ -387,3 +466,17 @@ class HTMLSpace(Space[_HtmlObjectAnnotation, _GlobalClassificationAnnotation, Ht
                 ret[classification.classification_hash] = classification_answer
 
         return ret
+
+
+def _html_ranges_to_node_spans(ranges: HtmlRanges) -> List[Tuple[str, int, int]]:
+    """Split HTML ranges into inclusive character offset spans per node, as `(xpath, start, end)`."""
+    spans: List[Tuple[str, int, int]] = []
+    for html_range in ranges:
+        start, end = html_range.start, html_range.end
+        if start.xpath == end.xpath:
+            spans.append((start.xpath, min(start.offset, end.offset), max(start.offset, end.offset)))
+        else:
+            # The range covers the rest of its start node and the beginning of its end node
+            spans.append((start.xpath, start.offset, sys.maxsize))
+            spans.append((end.xpath, 0, end.offset))
+    return spans
@@ -4,6 +4,7 @@ import logging
 from datetime import datetime
 from typing import TYPE_CHECKING, Dict, Optional, Sequence, cast
 
+from encord.common.range_manager import RangeManager
 from encord.constants.enums import SpaceType
 from encord.exceptions import LabelRowError
 from encord.objects.coordinates import (
@@ -205,6 +206,13 @@ class ImageSpace(Space[_GeometricObjectAnnotation, _GlobalClassificationAnnotati
         classification_instance = self._classifications_map[classification_hash]
         return self._remove_global_classification_instance(classification=classification_instance)
 
+    def _get_object_frames(self, object_hash: str) -> Optional[RangeManager]:
+        # An image only has frame 0
+        return RangeManager(0) if object_hash in self._objects_map else None
+
+    def _get_classification_frames(self, classification_hash: str) -> Optional[RangeManager]:
+        return RangeManager(0) if classification_hash in self._classifications_map else None
+
     """INTERNAL METHODS FOR DESERDE"""
 
     def _create_new_object_from_frame_object_dict(self, frame_object_label: FrameObject) -> ObjectInstance:
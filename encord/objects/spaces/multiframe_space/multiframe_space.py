@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import heapq
 import logging
 from abc import abstractmethod
 from collections import defaultdict
 from datetime import datetime
-from itertools import chain
+from itertools import chain, repeat
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Iterable,
     Iterator,
@@ -17,11 +19,13 @@ from typing import (
     Sequence,
     Set,
     Tuple,
+    TypeVar,
     Union,
     cast,
 )
 
 from encord.common.range_manager import RangeManager
+from encord.common.range_map import RangeMap
 from encord.constants.enums import SpaceType
 from encord.exceptions import LabelRowError
 from encord.objects.answers import NumericAnswerValue
@@ -44,6 +48,7 @@ from encord.objects.frames import (
     Ranges,
     frames_class_to_frames_list,
     ranges_list_to_ranges,
+    ranges_to_frames,
     ranges_to_list,
 )
 from encord.objects.internal_helpers import _infer_attribute_from_answer
@@ -80,6 +85,7 @@ if TYPE_CHECKING:
     from encord.objects.ontology_object import ObjectInstance
 
 FrameOverlapStrategy = Union[Literal["error"], Literal["replace"]]
+AnnotationDataT = TypeVar("AnnotationDataT", bound=_AnnotationData)
 
 
 class MultiFrameSpace(Space[_GeometricFrameObjectAnnotation, _FrameClassificationAnnotation, FrameOverlapStrategy]):
@@ -94,13 +100,11 @@ class MultiFrameSpace(Space[_GeometricFrameObjectAnnotation, _FrameClassificatio
     ):
         super().__init__(space_id, label_row, space_info)
 
-        # Keeps track of object/classification annotation data on each frame
-        self._frames_to_object_hash_to_annotation_data: defaultdict[int, dict[str, _GeometricAnnotationData]] = (
-            defaultdict(dict)
-        )
-        self._frames_to_classification_hash_to_annotation_data: defaultdict[int, dict[str, _AnnotationData]] = (
-            defaultdict(dict)
-        )
+        # Keeps track of object/classification annotation data on each frame.
+        # Consecutive frames with equal annotation data share one entry, so long tracks and scene-level
+        # classifications are stored per range rather than per frame.
+        self._object_hash_to_frames_annotation_data: dict[str, RangeMap[_GeometricAnnotationData]] = {}
+        self._classification_hash_to_frames_annotation_data: dict[str, RangeMap[_AnnotationData]] = {}
 
         # Keeps track of global classification annotation data across whole space
         self._global_classification_hash_to_annotation_data: dict[str, _AnnotationData] = {}
@@ -151,6 +155,32 @@ class MultiFrameSpace(Space[_GeometricFrameObjectAnnotation, _FrameClassificatio
                 classification_instance=existing_classification_instance, frames=conflicting_ranges
             )
 
+    @staticmethod
+    def _frame_range_annotation_data(
+        frames_annotation_data: RangeMap[AnnotationDataT],
+        frame_range: Range,
+        create_annotation_data: Callable[[], AnnotationDataT],
+    ) -> List[Tuple[int, int, AnnotationDataT]]:
+        """Return the annotation data for all frames in `frame_range` as `(start, end, data)` segments.
+
+        Existing data is split off from frames outside of the range, so it can be updated in place. Frames without
+        data get a new annotation data object, shared by each run of consecutive frames.
+        """
+        segments: List[Tuple[int, int, AnnotationDataT]] = []
+        next_frame = frame_range.start
+        for start, end, annotation_data in frames_annotation_data.isolate(frame_range.start, frame_range.end):
+            if start > next_frame:
+                segments.append((next_frame, start - 1, create_annotation_data()))
+            segments.append((start, end, annotation_data))
+            next_frame = end + 1
+        if next_frame <= frame_range.end:
+            segments.append((next_frame, frame_range.end, create_annotation_data()))
+        return segments
+
+    def _are_ranges_valid(self, ranges: Ranges) -> None:
+        if ranges:
+            self._are_frames_valid([ranges[0].start, ranges[-1].end])
+
     def _are_frames_valid(self, frames: List[int]) -> None:
         max_frame = max(frames)
         min_frame = min(frames)
@@ -178,52 +208,50 @@ class MultiFrameSpace(Space[_GeometricFrameObjectAnnotation, _FrameClassificatio
         confidence: Optional[float] = None,
         manual_annotation: Optional[bool] = None,
     ) -> None:
-        frame_list = frames_class_to_frames_list(frames)
-        self._are_frames_valid(frame_list)
+        frame_ranges = RangeManager(frame_class=frames).get_ranges()
+        self._are_ranges_valid(frame_ranges)
         self._objects_map[object_instance.object_hash] = object_instance
 
         object_instance._add_to_space(self)
 
         check_coordinate_type(coordinates, object_instance._ontology_object, self._label_row)
 
-        # Checks overlap
-        for frame in frame_list:
-            objects_on_frame = self._frames_to_object_hash_to_annotation_data.get(frame)
-            if objects_on_frame is None:
-                continue
-
-            existing_frame_data = objects_on_frame.get(object_instance.object_hash)
-            if on_overlap == "error" and existing_frame_data is not None:
-                raise LabelRowError(
-                    f"Annotation already exists on frame {frame}. Set 'on_overlap' to 'replace' to overwrite existing annotations."
-                )
-
-        range_manager = RangeManager(frames)
-        self._object_hash_to_range_manager[object_instance.object_hash].add_ranges(range_manager.get_ranges())
+        frames_annotation_data = self._object_hash_to_frames_annotation_data.get(object_instance.object_hash)
 
-        for frame in frame_list:
-            existing_frame_annotation_data = self._get_frame_object_annotation_data(
-                object_hash=object_instance.object_hash, frame=frame
-            )
-            if existing_frame_annotation_data is None:
-                existing_frame_annotation_data = _GeometricAnnotationData(
-                    annotation_metadata=_AnnotationMetadata(),
-                    coordinates=coordinates,
-                )
-
-                self._frames_to_object_hash_to_annotation_data[frame][object_instance.object_hash] = (
-                    existing_frame_annotation_data
+        # Checks overlap
+        if on_overlap == "error" and frames_annotation_data is not None:
+            for frame_range in frame_ranges:
+                if frames_annotation_data.intersects(frame_range.start, frame_range.end):
+                    frame = next(
+                        f for f in range(frame_range.start, frame_range.end + 1) if f in frames_annotation_data
+                    )
+                    raise LabelRowError(
+                        f"Annotation already exists on frame {frame}. Set 'on_overlap' to 'replace' to overwrite existing annotations."
+                    )
+
+        if frames_annotation_data is None:
+            frames_annotation_data = RangeMap()
+            self._object_hash_to_frames_annotation_data[object_instance.object_hash] = frames_annotation_data
+
+        self._object_hash_to_range_manager[object_instance.object_hash].add_ranges(frame_ranges)
+
+        for frame_range in frame_ranges:
+            for start, end, annotation_data in self._frame_range_annotation_data(
+                frames_annotation_data,
+                frame_range,
+                lambda: _GeometricAnnotationData(annotation_metadata=_AnnotationMetadata(), coordinates=coordinates),
+            ):
+                annotation_data.annotation_metadata.update_from_optional_fields(
+                    created_at=created_at,
+                    created_by=created_by,
+                    last_edited_at=last_edited_at,
+                    last_edited_by=last_edited_by,
+                    confidence=confidence,
+                    manual_annotation=manual_annotation,
                 )
-
-            existing_frame_annotation_data.annotation_metadata.update_from_optional_fields(
-                created_at=created_at,
-                created_by=created_by,
-                last_edited_at=last_edited_at,
-                last_edited_by=last_edited_by,
-                confidence=confidence,
-                manual_annotation=manual_annotation,
-            )
-            existing_frame_annotation_data.coordinates = coordinates
+                annotation_data.coordinates = coordinates
+                # Re-insert, so that the frames merge with neighbouring frames that now hold equal data
+                frames_annotation_data.set(start, end, annotation_data)
 
     def put_object_instance(
         self,
@@ -283,19 +311,7 @@ class MultiFrameSpace(Space[_GeometricFrameObjectAnnotation, _FrameClassificatio
         object_hash = object_instance.object_hash
         object_instance._remove_from_space(self.space_id)
         self._object_hash_to_range_manager.pop(object_hash)
-
-        frames_to_remove: list[int] = []
-        for frame, object_to_annotation_data_map in self._frames_to_object_hash_to_annotation_data.items():
-            if object_hash in object_to_annotation_data_map:
-                object_to_annotation_data_map.pop(object_hash)
-
-            if not bool(object_to_annotation_data_map):
-                frames_to_remove.append(frame)
-
-        # If no objects on frame, remove it from the map
-        for frame in frames_to_remove:
-            self._frames_to_object_hash_to_annotation_data.pop(frame)
-
+        self._object_hash_to_frames_annotation_data.pop(object_hash, None)
         self._objects_map.pop(object_hash, None)
 
     def _remove_object_instance_from_frames(
@@ -303,17 +319,10 @@ class MultiFrameSpace(Space[_GeometricFrameObjectAnnotation, _FrameClassificatio
         object_instance: ObjectInstance,
         frames: Frames,
     ) -> List[int]:
-        frame_list = frames_class_to_frames_list(frames)
-
         # Tracks frames that are actually removed. User might have passed in frames that object doesn't even exist on.
-        frames_removed: list[int] = []
-
-        for frame in frame_list:
-            object_removed_from_frame = self._frames_to_object_hash_to_annotation_data[frame].pop(
-                object_instance.object_hash, None
-            )
-            if object_removed_from_frame is not None:
-                frames_removed.append(frame)
+        frames_removed = self._remove_frames_annotation_data(
+            self._object_hash_to_frames_annotation_data, object_instance.object_hash, frames
+        )
 
         range_manager_for_object_hash = self._object_hash_to_range_manager[object_instance.object_hash]
         temp_range_manager = RangeManager(frames)
@@ -321,7 +330,13 @@ class MultiFrameSpace(Space[_GeometricFrameObjectAnnotation, _FrameClassificatio
         if len(range_manager_for_object_hash.get_ranges()) == 0:
             self._objects_map.pop(object_instance.object_hash)
 
-        return frames_removed
+        return ranges_to_frames(frames_removed)
+
+    def _get_object_frames(self, object_hash: str) -> Optional[RangeManager]:
+        return self._object_hash_to_range_manager.get(object_hash)
+
+    def _get_classification_frames(self, classification_hash: str) -> Optional[RangeManager]:
+        return self._classification_hash_to_range_manager.get(classification_hash)
 
     def _check_object_on_space(self, object_hash: str) -> None:
         if object_hash not in self._objects_map:
@@ -522,10 +537,11 @@ class MultiFrameSpace(Space[_GeometricFrameObjectAnnotation, _FrameClassificatio
         confidence: Optional[float],
         manual_annotation: Optional[bool],
     ) -> None:
-        frame_list = frames_class_to_frames_list(frames)
-        self._are_frames_valid(frame_list)
+        range_manager = RangeManager(frame_class=frames)
+        ranges_to_add = range_manager.get_ranges()
+        self._are_ranges_valid(ranges_to_add)
         is_present, conflicting_ranges = self._is_classification_present_on_frames(
-            classification_instance._ontology_classification, frame_list
+            classification_instance._ontology_classification, ranges_to_add
         )
 
         if is_present:
@@ -540,31 +556,32 @@ class MultiFrameSpace(Space[_GeometricFrameObjectAnnotation, _FrameClassificatio
                     classification=classification_instance,
                     conflicting_ranges=conflicting_ranges,
                 )
-        for frame in frame_list:
-            existing_frame_classification_annotation_data = self._get_frame_classification_annotation_data(
-                classification_hash=classification_instance.classification_hash, frame=frame
-            )
-
-            if existing_frame_classification_annotation_data is None:
-                existing_frame_classification_annotation_data = _AnnotationData(
-                    annotation_metadata=_AnnotationMetadata(),
-                )
-
-                self._frames_to_classification_hash_to_annotation_data[frame][
-                    classification_instance.classification_hash
-                ] = existing_frame_classification_annotation_data
 
-            existing_frame_classification_annotation_data.annotation_metadata.update_from_optional_fields(
-                created_at=created_at,
-                created_by=created_by,
-                last_edited_at=last_edited_at,
-                last_edited_by=last_edited_by,
-                confidence=confidence,
-                manual_annotation=manual_annotation,
+        frames_annotation_data = self._classification_hash_to_frames_annotation_data.get(
+            classification_instance.classification_hash
+        )
+        if frames_annotation_data is None:
+            frames_annotation_data = RangeMap()
+            self._classification_hash_to_frames_annotation_data[classification_instance.classification_hash] = (
+                frames_annotation_data
             )
 
-        range_manager = RangeManager(frame_class=frame_list)
-        ranges_to_add = range_manager.get_ranges()
+        for frame_range in ranges_to_add:
+            for start, end, annotation_data in self._frame_range_annotation_data(
+                frames_annotation_data,
+                frame_range,
+                lambda: _AnnotationData(annotation_metadata=_AnnotationMetadata()),
+            ):
+                annotation_data.annotation_metadata.update_from_optional_fields(
+                    created_at=created_at,
+                    created_by=created_by,
+                    last_edited_at=last_edited_at,
+                    last_edited_by=last_edited_by,
+                    confidence=confidence,
+                    manual_annotation=manual_annotation,
+                )
+                # Re-insert, so that the frames merge with neighbouring frames that now hold equal data
+                frames_annotation_data.set(start, end, annotation_data)
 
         existing_range_manager = self._classifications_ontology_to_ranges.get(
             classification_instance._ontology_classification
@@ -583,9 +600,7 @@ class MultiFrameSpace(Space[_GeometricFrameObjectAnnotation, _FrameClassificatio
         classification_instance: ClassificationInstance,
     ) -> None:
         classification_instance._remove_from_space(self.space_id)
-        for frame, classification in self._frames_to_classification_hash_to_annotation_data.items():
-            if classification_instance.classification_hash in classification:
-                classification.pop(classification_instance.classification_hash)
+        self._classification_hash_to_frames_annotation_data.pop(classification_instance.classification_hash, None)
 
         self._classification_hash_to_range_manager.pop(classification_instance.classification_hash)
         self._classifications_map.pop(classification_instance.classification_hash)
@@ -595,19 +610,10 @@ class MultiFrameSpace(Space[_GeometricFrameObjectAnnotation, _FrameClassificatio
         classification_instance: ClassificationInstance,
         frames: Frames,
     ) -> List[int]:
-        frame_list = frames_class_to_frames_list(frames)
-
         # Keeps track of frames that are actually removed. User might pass in frames that the classification does not exist on.
-        frames_removed: list[int] = []
-        for frame in frame_list:
-            classification_removed = self._frames_to_classification_hash_to_annotation_data[frame].pop(
-                classification_instance.classification_hash, None
-            )
-            if classification_removed is not None:
-                frames_removed.append(frame)
-
-        range_manager = RangeManager(frame_class=frames_removed)
-        ranges_to_remove = range_manager.get_ranges()
+        ranges_to_remove = self._remove_frames_annotation_data(
+            self._classification_hash_to_frames_annotation_data, classification_instance.classification_hash, frames
+        )
 
         classification_ontology_range_manager = self._classifications_ontology_to_ranges.get(
             classification_instance._ontology_classification
@@ -623,7 +629,7 @@ class MultiFrameSpace(Space[_GeometricFrameObjectAnnotation, _FrameClassificatio
         if len(range_manager_for_classification_instance.get_ranges()) == 0:
             self._classifications_map.pop(classification_instance.classification_hash)
 
-        return frames_removed
+        return ranges_to_frames(ranges_to_remove)
 
     def _get_object_annotation_on_frame(self, object_hash: str, frame: int = 0) -> _GeometricFrameObjectAnnotation:
         return _GeometricFrameObjectAnnotation(space=self, object_instance=self._objects_map[object_hash], frame=frame)
@@ -666,8 +672,7 @@ class MultiFrameSpace(Space[_GeometricFrameObjectAnnotation, _FrameClassificatio
 
         return (
             self._get_object_annotation_on_frame(object_hash=obj_hash, frame=frame)
-            for frame, obj in dict(sorted(self._frames_to_object_hash_to_annotation_data.items())).items()
-            for obj_hash in obj.keys()
+            for frame, obj_hash in self._iterate_frames_and_hashes(self._object_hash_to_frames_annotation_data)
             if filter_set is None or obj_hash in filter_set
         )
 
@@ -683,10 +688,9 @@ class MultiFrameSpace(Space[_GeometricFrameObjectAnnotation, _FrameClassificatio
                 classification_instance=self._classifications_map[classification_hash],
                 frame=frame,
             )
-            for frame, classification in dict(
-                sorted(self._frames_to_classification_hash_to_annotation_data.items())
-            ).items()
-            for classification_hash, annotation in classification.items()
+            for frame, classification_hash in self._iterate_frames_and_hashes(
+                self._classification_hash_to_frames_annotation_data
+            )
             if filter_set is None or classification_hash in filter_set
         )
 
@@ -793,21 +797,73 @@ class MultiFrameSpace(Space[_GeometricFrameObjectAnnotation, _FrameClassificatio
 
         return new_classification_instance
 
-    def _get_frame_object_annotation_data(self, object_hash: str, frame: int) -> Optional[_GeometricAnnotationData]:
-        object_to_frame_annotation_data = self._frames_to_object_hash_to_annotation_data.get(frame)
-        if object_to_frame_annotation_data is None:
-            return None
-        else:
-            return object_to_frame_annotation_data.get(object_hash)
+    def _get_frame_object_annotation_data(
+        self, object_hash: str, frame: int, *, for_update: bool = False
+    ) -> Optional[_GeometricAnnotationData]:
+        return self._get_frame_annotation_data(
+            self._object_hash_to_frames_annotation_data, object_hash, frame, for_update
+        )
 
     def _get_frame_classification_annotation_data(
-        self, classification_hash: str, frame: int
+        self, classification_hash: str, frame: int, *, for_update: bool = False
     ) -> Optional[_AnnotationData]:
-        classification_to_frame_annotation_data = self._frames_to_classification_hash_to_annotation_data.get(frame)
-        if classification_to_frame_annotation_data is None:
+        return self._get_frame_annotation_data(
+            self._classification_hash_to_frames_annotation_data, classification_hash, frame, for_update
+        )
+
+    @staticmethod
+    def _get_frame_annotation_data(
+        hash_to_frames_annotation_data: Dict[str, RangeMap[AnnotationDataT]],
+        item_hash: str,
+        frame: int,
+        for_update: bool,
+    ) -> Optional[AnnotationDataT]:
+        """Get the annotation data of an object or classification on a frame.
+
+        With `for_update`, the data is first split off from the other frames it is shared with, so that it can be
+        mutated in place.
+        """
+        frames_annotation_data = hash_to_frames_annotation_data.get(item_hash)
+        if frames_annotation_data is None:
             return None
+        elif for_update:
+            isolated = frames_annotation_data.isolate(frame, frame)
+            return isolated[0][2] if isolated else None
         else:
-            return classification_to_frame_annotation_data.get(classification_hash)
+            return frames_annotation_data.get(frame)
+
+    @staticmethod
+    def _remove_frames_annotation_data(
+        hash_to_frames_annotation_data: Dict[str, RangeMap[AnnotationDataT]], item_hash: str, frames: Frames
+    ) -> Ranges:
+        """Remove the annotation data of an object or classification from frames, and return the removed ranges."""
+        frames_annotation_data = hash_to_frames_annotation_data.get(item_hash)
+        if frames_annotation_data is None:
+            return []
+
+        removed: Ranges = []
+        for frame_range in RangeManager(frame_class=frames).get_ranges():
+            removed.extend(
+                Range(start, end) for start, end in frames_annotation_data.remove(frame_range.start, frame_range.end)
+            )
+
+        if not frames_annotation_data:
+            del hash_to_frames_annotation_data[item_hash]
+        return removed
+
+    @staticmethod
+    def _iterate_frames_and_hashes(
+        hash_to_frames_annotation_data: Dict[str, RangeMap[AnnotationDataT]],
+    ) -> Iterator[Tuple[int, str]]:
+        """Iterate over all `(frame, hash)` pairs with annotation data, ordered by frame."""
+        # The index keeps the insertion order of hashes on the same frame
+        frames_and_hashes = heapq.merge(
+            *(
+                zip(frames_annotation_data.keys(), repeat(index), repeat(item_hash))
+                for index, (item_hash, frames_annotation_data) in enumerate(hash_to_frames_annotation_data.items())
+            )
+        )
+        return ((frame, item_hash) for frame, _, item_hash in frames_and_hashes)
 
     def _to_encord_object(
         self,
@@ -864,47 +920,35 @@ class MultiFrameSpace(Space[_GeometricFrameObjectAnnotation, _FrameClassificatio
 
     def _build_frame_labels_dict(self) -> dict[str, LabelBlob]:
         """Export space to dictionary format."""
-        labels: dict[str, LabelBlob] = {}
-        frames_with_objects = list(self._frames_to_object_hash_to_annotation_data.keys())
-        frames_with_classifications = list(self._frames_to_classification_hash_to_annotation_data.keys())
-        frames_with_both_objects_and_classifications = sorted(set(frames_with_objects + frames_with_classifications))
+        frame_labels: defaultdict[int, LabelBlob] = defaultdict(lambda: LabelBlob(objects=[], classifications=[]))
 
-        for frame in frames_with_both_objects_and_classifications:
-            frame_label = self._build_frame_label_dict(frame=frame)
-            labels[str(frame)] = frame_label
-
-        return labels
-
-    def _build_frame_label_dict(self, frame: int) -> LabelBlob:
-        object_list: List[FrameObject] = []
-        classification_list: List[FrameClassification] = []
-
-        objects_to_annotation_data = self._frames_to_object_hash_to_annotation_data.get(frame, {})
-        classifications_to_annotation_data = self._frames_to_classification_hash_to_annotation_data.get(frame, {})
-
-        for object_hash, frame_object_annotation_data in objects_to_annotation_data.items():
+        for object_hash, object_frames_annotation_data in self._object_hash_to_frames_annotation_data.items():
             space_object = self._objects_map[object_hash]
-            object_list.append(
-                self._to_encord_object(
-                    object_instance=space_object,
-                    frame_object_annotation_data=frame_object_annotation_data,
-                    frame_number=frame,
-                )
-            )
-
-        for classification_hash, frame_classification_annotation_data in classifications_to_annotation_data.items():
+            for start, end, frame_object_annotation_data in object_frames_annotation_data.items():
+                for frame in range(start, end + 1):
+                    frame_labels[frame]["objects"].append(
+                        self._to_encord_object(
+                            object_instance=space_object,
+                            frame_object_annotation_data=frame_object_annotation_data,
+                            frame_number=frame,
+                        )
+                    )
+
+        for (
+            classification_hash,
+            classification_frames_annotation_data,
+        ) in self._classification_hash_to_frames_annotation_data.items():
             space_classification = self._classifications_map[classification_hash]
-            classification_list.append(
-                self._to_encord_classification(
+            for start, end, frame_classification_annotation_data in classification_frames_annotation_data.items():
+                # The classification dict does not depend on the frame, so it is built once per range
+                classification_dict = self._to_encord_classification(
                     classification_instance=space_classification,
                     frame_classification_annotation_data=frame_classification_annotation_data,
                 )
-            )
+                for frame in range(start, end + 1):
+                    frame_labels[frame]["classifications"].append(classification_dict.copy())
 
-        return LabelBlob(
-            objects=object_list,
-            classifications=classification_list,
-        )
+        return {str(frame): frame_labels[frame] for frame in sorted(frame_labels)}
 
     def _to_object_answers(self, existing_object_answers: dict[str, ObjectAnswer]) -> Dict[str, ObjectAnswer]:
         ret: dict[str, ObjectAnswerForGeometric] = {}
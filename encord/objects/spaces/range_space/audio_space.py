@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Union, cast
+from typing import TYPE_CHECKING, Optional, Union, cast
 
+from encord.common.range_manager import RangeManager
 from encord.constants.enums import SpaceType
 from encord.exceptions import LabelRowError
 from encord.objects.frames import Range, Ranges
@@ -32,6 +33,13 @@ class AudioSpace(RangeSpace):
                 f"Range ending with {end_of_range} is invalid. This audio file is only {self._duration_ms} ms long."
             )
 
+    def _get_object_frames(self, object_hash: str) -> Optional[RangeManager]:
+        # For backwards compatibility, all audio labels are treated as being on frame 0
+        return RangeManager(0) if object_hash in self._objects_map else None
+
+    def _get_classification_frames(self, classification_hash: str) -> Optional[RangeManager]:
+        return RangeManager(0) if classification_hash in self._classifications_map else None
+
     def _to_space_dict(self) -> SpaceInfo:
         return AudioSpaceInfo(
             space_type=SpaceType.AUDIO,
@@ -1,20 +1,23 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Union, cast
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Mapping, Optional, Sequence, Tuple, Union, cast
 
 from encord.common.bitmask_operations.bitmask_operations import (
     _rle_to_string,
     ranges_to_rle_counts,
-    rle_string_to_points,
+    rle_string_to_ranges,
 )
 from encord.common.range_manager import RangeManager
 from encord.common.time_parser import format_datetime_to_long_string
 from encord.constants.enums import SpaceType
 from encord.exceptions import LabelRowError
 from encord.objects.common import Shape
-from encord.objects.frames import Ranges, frames_to_ranges
+from encord.objects.frames import Range, Ranges
+from encord.objects.ontology_object import Object
+from encord.objects.ontology_object_instance import ObjectInstance
 from encord.objects.spaces.annotation.base_annotation import _AnnotationMetadata
-from encord.objects.spaces.range_space.range_space import RangeSpace
+from encord.objects.spaces.range_space.range_space import RangeOverlapStrategy, RangeSpace
 from encord.objects.spaces.types import PointCloudFileSpaceInfo, SceneMetadata, SpaceInfo
 from encord.objects.types import (
     FrameObject,
@@ -45,6 +48,150 @@ class PointCloudFileSpace(RangeSpace):
         if start_of_range < 0:
             raise LabelRowError(f"Range starting with {start_of_range} is invalid. Negative ranges are not supported.")
 
+    def to_label_array(
+        self,
+        num_points: int,
+        by: Literal["feature", "instance"] = "feature",
+        label_ids: Optional[Mapping[str, int]] = None,
+    ) -> Any:
+        """Export the segmentations on this point cloud as a label id per point, e.g. to train a segmentation model.
+
+        Numpy needs to be installed for this call to work.
+
+        Args:
+            num_points: The number of points in the point cloud file.
+            by: Whether the label ids identify the ontology object (`"feature"`) or the object instance
+                (`"instance"`) of each point.
+            label_ids: Optionally, a mapping from feature hash (for `by="feature"`) or object hash (for
+                `by="instance"`) to label id. Objects missing from the mapping are not exported. By default, ontology
+                objects are numbered from 1 in ontology order, and object instances from 1 in the order of
+                :meth:`get_object_instances`.
+
+        Returns:
+            An `int32` array of shape `[num_points]`. Points without a label have id 0. Where objects overlap, the
+            object that was placed on this space last takes precedence.
+
+        Raises:
+            LabelRowError: If `by` is invalid, or a segmentation covers points beyond `num_points`.
+        """
+        import numpy as np  # type: ignore[missing-import]
+
+        self._label_row._check_labelling_is_initalised()
+        if by not in ("feature", "instance"):
+            raise LabelRowError(f"Expected `by` to be 'feature' or 'instance', got {by!r}.")
+
+        object_instances = self.get_object_instances()
+        if label_ids is None:
+            if by == "feature":
+                label_ids = {
+                    ontology_object.feature_node_hash: label_id
+                    for label_id, ontology_object in enumerate(self._label_row.ontology_structure.objects, start=1)
+                }
+            else:
+                label_ids = {obj.object_hash: label_id for label_id, obj in enumerate(object_instances, start=1)}
+
+        label_array = np.zeros(num_points, dtype=np.int32)
+        for obj in object_instances:
+            label_id = label_ids.get(obj.feature_hash if by == "feature" else obj.object_hash)
+            ranges = self._object_hash_to_range_manager[obj.object_hash].ranges
+            if label_id is None or not ranges:
+                continue
+
+            if ranges[-1][1] >= num_points:
+                raise LabelRowError(
+                    f"Object instance with hash '{obj.object_hash}' covers point {ranges[-1][1]}, "
+                    f"but the point cloud only has {num_points} points."
+                )
+            label_array[_ranges_to_point_indices(ranges)] = label_id
+
+        return label_array
+
+    def from_label_array(
+        self,
+        label_array: Any,
+        labels: Optional[Mapping[int, Union[Object, ObjectInstance]]] = None,
+        *,
+        on_overlap: RangeOverlapStrategy = "error",
+        created_at: Optional[datetime] = None,
+        created_by: Optional[str] = None,
+        last_edited_at: Optional[datetime] = None,
+        last_edited_by: Optional[str] = None,
+        confidence: Optional[float] = None,
+        manual_annotation: Optional[bool] = None,
+    ) -> List[ObjectInstance]:
+        """Import segmentations from a label id per point, e.g. the output of a segmentation model.
+
+        The array is run-length encoded and every label id is placed on the ranges of points that have it. For a label
+        id that maps to an ontology object, a new object instance is created. A label id can also map to an existing
+        object instance, e.g. to place the same object on several point clouds of a scene.
+
+        Numpy needs to be installed for this call to work.
+
+        Args:
+            label_array: An integer array of shape `[num_points]`. Points with id 0 are not labelled.
+            labels: Optionally, a mapping from label id to the ontology object or object instance it represents. By
+                default, ontology objects are numbered from 1 in ontology order, as in :meth:`to_label_array`.
+            on_overlap: Strategy for object instances that are already on this space. See :meth:`put_object_instance`.
+            created_at: Optional timestamp when the annotations were created.
+            created_by: Optional identifier of who created the annotations.
+            last_edited_at: Optional timestamp when the annotations were last edited.
+            last_edited_by: Optional identifier of who last edited the annotations.
+            confidence: Optional confidence score for the annotations (0.0 to 1.0).
+            manual_annotation: Optional flag indicating if the annotations were made manually.
+
+        Returns:
+            List[ObjectInstance]: The object instances placed on this space, in ascending order of label id.
+
+        Raises:
+            LabelRowError: If the array is not a 1-dimensional integer array, or contains a label id that is not in
+                `labels`.
+        """
+        import numpy as np  # type: ignore[missing-import]
+
+        self._label_row._check_labelling_is_initalised()
+
+        label_array = np.asarray(label_array)
+        if label_array.ndim != 1 or not np.issubdtype(label_array.dtype, np.integer):
+            raise LabelRowError(
+                f"Expected a 1-dimensional integer array of label ids, got dtype {label_array.dtype} "
+                f"and shape {label_array.shape}."
+            )
+        if labels is None:
+            labels = dict(enumerate(self._label_row.ontology_structure.objects, start=1))
+
+        run_starts, run_ends, run_ids = _label_array_to_runs(label_array)
+        missing_label_ids = set(np.unique(run_ids).tolist()) - set(labels)
+        if missing_label_ids:
+            raise LabelRowError(
+                f"No ontology object or object instance given for label ids {sorted(missing_label_ids)}."
+            )
+
+        # Group the runs by label id. The sort is stable, so the runs of each id stay in order of points.
+        order = np.argsort(run_ids, kind="stable")
+        label_ids, group_starts = np.unique(run_ids[order], return_index=True)
+        ret: List[ObjectInstance] = []
+        for label_id, starts, ends in zip(
+            label_ids.tolist(),
+            np.split(run_starts[order], group_starts[1:]),
+            np.split(run_ends[order], group_starts[1:]),
+        ):
+            label = labels[label_id]
+            object_instance = label.create_instance() if isinstance(label, Object) else label
+            self.put_object_instance(
+                object_instance=object_instance,
+                ranges=[Range(start, end) for start, end in zip(starts.tolist(), ends.tolist())],
+                on_overlap=on_overlap,
+                created_at=created_at,
+                created_by=created_by,
+                last_edited_at=last_edited_at,
+                last_edited_by=last_edited_by,
+                confidence=confidence,
+                manual_annotation=manual_annotation,
+            )
+            ret.append(object_instance)
+
+        return ret
+
     def _parse_space_dict(
         self,
         space_info: SpaceInfo,
@@ -59,8 +206,8 @@ class PointCloudFileSpace(RangeSpace):
             if not isinstance(segmentation, str) or not segmentation:
                 continue
 
-            points = rle_string_to_points(segmentation)
-            ranges = frames_to_ranges(points)
+            # Decode straight to ranges, a segmentation can cover millions of points
+            ranges = [Range(start, end) for start, end in rle_string_to_ranges(segmentation)]
 
             if not ranges:
                 continue
@@ -175,6 +322,32 @@ class PointCloudFileSpace(RangeSpace):
 
 
 def _to_rle_string(manager: RangeManager) -> str:
-    ranges = [(r.start, r.end) for r in manager.get_ranges()]
-    rle_counts = ranges_to_rle_counts(ranges)
+    rle_counts = ranges_to_rle_counts(manager.ranges)
     return _rle_to_string(rle_counts)
+
+
+def _ranges_to_point_indices(ranges: Sequence[Tuple[int, int]]) -> Any:
+    """Expand sorted inclusive ranges to the array of point indices they cover, without a Python loop per range."""
+    import numpy as np  # type: ignore[missing-import]
+
+    bounds = np.asarray(ranges, dtype=np.int64)
+    lengths = bounds[:, 1] - bounds[:, 0] + 1
+    # Each index is its position in the output, shifted by the gap between its run's start and its run's output offset
+    shifts = np.repeat(bounds[:, 0] - (np.cumsum(lengths) - lengths), lengths)
+    return np.arange(shifts.shape[0], dtype=np.int64) + shifts
+
+
+def _label_array_to_runs(label_array: Any) -> Tuple[Any, Any, Any]:
+    """Run-length encode a label array into the inclusive starts, ends and label ids of its labelled runs."""
+    import numpy as np  # type: ignore[missing-import]
+
+    if label_array.shape[0] == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty
+
+    run_starts = np.concatenate(([0], np.flatnonzero(label_array[1:] != label_array[:-1]) + 1))
+    run_ends = np.append(run_starts[1:] - 1, label_array.shape[0] - 1)
+    run_ids = label_array[run_starts]
+
+    labelled = run_ids != 0
+    return run_starts[labelled], run_ends[labelled], run_ids[labelled]
@@ -3,8 +3,9 @@ from __future__ import annotations
 import logging
 from abc import abstractmethod
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, Literal, Optional, Union, cast
+from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Tuple, Union, cast
 
+from encord.common.interval_index import IntervalIndex
 from encord.common.range_manager import RangeManager
 from encord.common.time_parser import format_datetime_to_long_string, format_datetime_to_long_string_optional
 from encord.exceptions import LabelRowError
@@ -49,6 +50,8 @@ class RangeSpace(Space[_RangeObjectAnnotation, _GlobalClassificationAnnotation,
     def __init__(self, space_id: str, label_row: LabelRowV2, space_info: SpaceInfo):
         super().__init__(space_id, label_row, space_info)
         self._object_hash_to_range_manager: dict[str, RangeManager] = dict()
+        # The ranges of all objects, labelled with their object hash, for queries by position
+        self._span_index: IntervalIndex[str] = IntervalIndex()
 
     @abstractmethod
     def _are_ranges_valid(self, ranges: Ranges) -> None:
@@ -114,6 +117,9 @@ class RangeSpace(Space[_RangeObjectAnnotation, _GlobalClassificationAnnotation,
         self._are_ranges_valid(ranges)
 
         existing_annotation_range_manager = self._object_hash_to_range_manager.get(object_instance.object_hash)
+        previous_ranges = (
+            list(existing_annotation_range_manager.ranges) if existing_annotation_range_manager is not None else []
+        )
         has_overlap = False
 
         if existing_annotation_range_manager is not None:
@@ -147,6 +153,8 @@ class RangeSpace(Space[_RangeObjectAnnotation, _GlobalClassificationAnnotation,
         else:
             existing_annotation_range_manager.add_ranges(ranges)
 
+        self._reindex_object_ranges(object_instance.object_hash, previous_ranges)
+
     def remove_object_instance_from_range(self, object_instance: ObjectInstance, ranges: Ranges | Range) -> Ranges:
         """Remove an object instance from specific ranges in the space.
 
@@ -170,6 +178,7 @@ class RangeSpace(Space[_RangeObjectAnnotation, _GlobalClassificationAnnotation,
             ranges = [ranges]
 
         range_manager_for_object = self._object_hash_to_range_manager[object_instance.object_hash]
+        previous_ranges = list(range_manager_for_object.ranges)
 
         # Users might pass in ranges where the object does not actually exist on
         actual_ranges_to_remove = range_manager_for_object.intersection(ranges)
@@ -179,6 +188,7 @@ class RangeSpace(Space[_RangeObjectAnnotation, _GlobalClassificationAnnotation,
             self._objects_map.pop(object_instance.object_hash)
             self._object_hash_to_range_manager.pop(object_instance.object_hash)
 
+        self._reindex_object_ranges(object_instance.object_hash, previous_ranges)
         return actual_ranges_to_remove
 
     def put_classification_instance(
@@ -244,6 +254,67 @@ class RangeSpace(Space[_RangeObjectAnnotation, _GlobalClassificationAnnotation,
             raise LabelRowError(f"Object instance with hash '{object_instance.object_hash}' is not on this space.")
         return range_manager.get_ranges()
 
+    def get_overlapping_object_instances(self, range_: Range) -> List[ObjectInstance]:
+        """Get the object instances with at least one range that overlaps the given range.
+
+        This uses an index of the ranges of all objects on the space, so it does not scan every object. For example,
+        use it to find the entities around a selection of characters in a text file.
+
+        Args:
+            range_: The range to check, inclusive of its start and end.
+
+        Returns:
+            List[ObjectInstance]: The overlapping object instances, ordered by the start of their first overlapping
+                range.
+        """
+        self._label_row._check_labelling_is_initalised()
+        return self._object_instances_from_spans(self._span_index.overlapping(range_.start, range_.end))
+
+    def get_object_instances_at(self, position: int) -> List[ObjectInstance]:
+        """Get the object instances with a range that contains the given position.
+
+        For example, use it to find the audio segments active at a point in time, in milliseconds.
+
+        Args:
+            position: The position to check, e.g. a character index or a timestamp in milliseconds.
+
+        Returns:
+            List[ObjectInstance]: The object instances at the position, ordered by the start of their range.
+        """
+        self._label_row._check_labelling_is_initalised()
+        return self._object_instances_from_spans(self._span_index.at(position))
+
+    def get_nearest_object_instance(self, position: int) -> Optional[ObjectInstance]:
+        """Get the object instance with the range closest to the given position.
+
+        An object with a range that contains the position is closest. On a tie, the object with a range before the
+        position is returned.
+
+        Args:
+            position: The position to check, e.g. a character index or a timestamp in milliseconds.
+
+        Returns:
+            Optional[ObjectInstance]: The nearest object instance, or None if there are no objects on the space.
+        """
+        self._label_row._check_labelling_is_initalised()
+        nearest = self._span_index.nearest(position)
+        return self._objects_map[nearest[2]] if nearest is not None else None
+
+    def _object_instances_from_spans(self, spans: List[Tuple[int, int, str]]) -> List[ObjectInstance]:
+        # dict.fromkeys removes objects with several matching ranges, keeping the first
+        return [self._objects_map[object_hash] for object_hash in dict.fromkeys(key for _, _, key in spans)]
+
+    def _reindex_object_ranges(self, object_hash: str, previous_ranges: List[Tuple[int, int]]) -> None:
+        """Update the span index after the ranges of an object changed from `previous_ranges`."""
+        range_manager = self._object_hash_to_range_manager.get(object_hash)
+        current = set(range_manager.ranges) if range_manager is not None else set()
+        previous = set(previous_ranges)
+
+        for start, end in previous - current:
+            self._span_index.remove(start, end, object_hash)
+        for start, end in current - previous:
+            self._span_index.add(start, end, object_hash)
+
     def _create_object_annotation(self, obj_hash: str) -> _RangeObjectAnnotation:
         return _RangeObjectAnnotation(space=self, object_instance=self._objects_map[obj_hash])
 
@@ -261,7 +332,8 @@ class RangeSpace(Space[_RangeObjectAnnotation, _GlobalClassificationAnnotation,
         self._label_row._check_labelling_is_initalised()
         object_instance = self._objects_map.pop(object_hash, None)
         # self._object_hash_to_annotation_data.pop(object_hash)
-        self._object_hash_to_range_manager.pop(object_hash)
+        range_manager = self._object_hash_to_range_manager.pop(object_hash)
+        self._reindex_object_ranges(object_hash, range_manager.ranges)
         if object_instance is not None:
             object_instance._remove_from_space(self.space_id)
 
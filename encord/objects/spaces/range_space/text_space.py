@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Union, cast
+from typing import TYPE_CHECKING, Optional, Union, cast
 
+from encord.common.range_manager import RangeManager
 from encord.constants.enums import SpaceType
 from encord.exceptions import LabelRowError
 from encord.objects.frames import Range, Ranges
@@ -27,6 +28,13 @@ class TextSpace(RangeSpace):
         if start_of_range < 0:
             raise LabelRowError(f"Range starting with {start_of_range} is invalid. Negative ranges are not supported.")
 
+    def _get_object_frames(self, object_hash: str) -> Optional[RangeManager]:
+        # For backwards compatibility, all text labels are treated as being on frame 0
+        return RangeManager(0) if object_hash in self._objects_map else None
+
+    def _get_classification_frames(self, classification_hash: str) -> Optional[RangeManager]:
+        return RangeManager(0) if classification_hash in self._classifications_map else None
+
     def _to_space_dict(self) -> SpaceInfo:
         return TextSpaceInfo(
             space_type=SpaceType.TEXT,
@@ -10,6 +10,8 @@ category: "64e481b57b6027003f20aaa0"
 """
 
 import datetime
+from collections import defaultdict, deque
+from pathlib import Path
 from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from uuid import UUID
 
@@ -17,8 +19,10 @@ from encord.client import EncordClientProject
 from encord.collection import ProjectCollection
 from encord.common.deprecated import deprecated
 from encord.common.utils import ensure_list, ensure_uuid_list
+from encord.constants.enums import DataType
 from encord.filter_preset import ProjectFilterPreset
 from encord.http.bundle import Bundle
+from encord.http.limits import LABEL_ROW_BUNDLE_GET_LIMIT
 from encord.http.v2.api_client import ApiClient
 from encord.objects import LabelRowV2, OntologyStructure
 from encord.ontology import Ontology
@@ -63,6 +67,67 @@ from encord.utilities.hash_utilities import convert_to_uuid
 from encord.utilities.project_user import ProjectUser, ProjectUserRole
 from encord.workflow import Workflow
 
+# Data types whose server label dicts are exported like `LabelRowV2.to_encord_dict()` once normalised, see
+# `_normalise_label_dict_for_export`. Other label rows are parsed into a `LabelRowV2` first.
+_DIRECT_EXPORT_DATA_TYPES = {
+    DataType.IMAGE,
+    DataType.IMG_GROUP,
+    DataType.VIDEO,
+    DataType.DICOM,
+    DataType.NIFTI,
+    DataType.AUDIO,
+    DataType.PLAIN_TEXT,
+}
+_MULTI_FRAME_DATA_TYPES = {DataType.VIDEO, DataType.DICOM, DataType.NIFTI}
+
+
+def _has_overlapping_object_actions(object_actions: Dict[str, Any]) -> bool:
+    """Whether an object has several answers to the same attribute on one frame.
+
+    The UI writes each option of a checklist as a separate answer, which `LabelRowV2` merges.
+    """
+    for object_action in object_actions.values():
+        ranges_by_feature_hash: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        for action in object_action["actions"]:
+            ranges_by_feature_hash[action["featureHash"]].extend((start, end) for start, end in action["range"])
+        for ranges in ranges_by_feature_hash.values():
+            last_end = -1
+            for start, end in sorted(ranges):
+                if start <= last_end:
+                    return True
+                last_end = max(last_end, end)
+    return False
+
+
+def _normalise_label_dict_for_export(label_dict: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Bring a server label dict into the shape of :meth:`LabelRowV2.to_encord_dict` for the COCO exporter.
+
+    The server sends every frame of multi-frame data, with the metadata of DICOM slices, while `to_encord_dict` only
+    has the objects and classifications of labelled frames, in order. Returns `None` if the label dict has to be
+    parsed into a `LabelRowV2` to get that shape.
+    """
+    data_type = DataType(label_dict["data_type"])
+    if data_type not in _DIRECT_EXPORT_DATA_TYPES or _has_overlapping_object_actions(label_dict["object_actions"]):
+        return None
+    if data_type not in _MULTI_FRAME_DATA_TYPES:
+        return label_dict
+
+    data_units: Dict[str, Any] = {}
+    for data_unit_hash, data_unit in label_dict["data_units"].items():
+        labelled_frames = sorted(
+            (int(frame), frame_labels)
+            for frame, frame_labels in data_unit["labels"].items()
+            if frame_labels["objects"] or frame_labels["classifications"]
+        )
+        data_units[data_unit_hash] = {
+            **data_unit,
+            "labels": {
+                str(frame): {"objects": frame_labels["objects"], "classifications": frame_labels["classifications"]}
+                for frame, frame_labels in labelled_frames
+            },
+        }
+    return {**label_dict, "data_units": data_units}
+
 
 class Project:
     """Access project related data and manipulate the project."""
@@ -964,15 +1029,22 @@ class Project:
         image_id_to_frame_index: Dict[ImageID, FrameIndex],
         branch_name: Optional[str] = None,
         confidence_field_name: Optional[str] = None,
+        chunk_size: int = 100,
+        max_workers: Optional[int] = None,
     ) -> None:
         """Import labels in COCO format to an Encord Project.
 
+        Label rows are initialised, labelled and saved `chunk_size` rows at a time, so only a few chunks of labels are
+        held in memory at once.
+
         Args:
             labels_dict (Dict[str, Any]): A dictionary in COCO annotation format.
             category_id_to_feature_hash (Dict[CategoryID, str]): A mapping of category IDs from the COCO data to their corresponding feature hashes in the Project's Ontology.
             image_id_to_frame_index (Dict[ImageID, FrameIndex]): A mapping of image IDs to FrameIndex(data_hash, frame_offset), used to locate the corresponding frames in the Encord Project.
             branch_name (Optional[str]): Optionally specify a branch name. Defaults to the `main` branch.
             confidence_field_name (Optional[str]): Optionally specify the name of the confidence field in the COCO annotations. Defaults to assigning `1.0` as confidence value to all annotations.
+            chunk_size (int): Number of label rows to initialise, label and save at a time.
+            max_workers (Optional[int]): Number of threads used to find the contours of RLE masks imported as polygons.
         """
         from encord.utilities.coco.datastructure import CocoRootModel
         from encord.utilities.coco.importer import import_coco_labels
@@ -985,6 +1057,45 @@ class Project:
             image_id_to_frame_index,
             branch_name=branch_name,
             confidence_field_name=confidence_field_name,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+        )
+
+    def import_coco_labels_from_file(
+        self,
+        path: Union[str, Path],
+        category_id_to_feature_hash: Dict[CategoryID, str],
+        image_id_to_frame_index: Dict[ImageID, FrameIndex],
+        branch_name: Optional[str] = None,
+        confidence_field_name: Optional[str] = None,
+        chunk_size: int = 100,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Import labels from a COCO annotation file to an Encord Project.
+
+        Unlike :meth:`import_coco_labels`, the file is streamed rather than loaded, so files too large to fit in
+        memory can be imported.
+
+        Args:
+            path (Union[str, Path]): Path to a JSON file in COCO annotation format.
+            category_id_to_feature_hash (Dict[CategoryID, str]): A mapping of category IDs from the COCO data to their corresponding feature hashes in the Project's Ontology.
+            image_id_to_frame_index (Dict[ImageID, FrameIndex]): A mapping of image IDs to FrameIndex(data_hash, frame_offset), used to locate the corresponding frames in the Encord Project.
+            branch_name (Optional[str]): Optionally specify a branch name. Defaults to the `main` branch.
+            confidence_field_name (Optional[str]): Optionally specify the name of the confidence field in the COCO annotations. Defaults to assigning `1.0` as confidence value to all annotations.
+            chunk_size (int): Number of label rows to initialise, label and save at a time.
+            max_workers (Optional[int]): Number of threads used to find the contours of RLE masks imported as polygons.
+        """
+        from encord.utilities.coco.importer import import_coco_labels_from_file
+
+        import_coco_labels_from_file(
+            self,
+            path,
+            category_id_to_feature_hash,
+            image_id_to_frame_index,
+            branch_name=branch_name,
+            confidence_field_name=confidence_field_name,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
         )
 
     def export_coco_labels(
@@ -1018,17 +1129,100 @@ class Project:
         from encord.utilities.coco.exporter import CocoExporter
 
         label_rows = self.list_label_rows_v2(label_hashes=label_hashes, branch_name=branch_name)
-        with self.create_bundle() as bundle:
-            for row in label_rows:
-                row.initialise_labels(
-                    include_object_feature_hashes=include_object_feature_hashes,
-                    include_classification_feature_hashes=include_classification_feature_hashes,
-                    bundle=bundle,
-                )
-        labels = [row.to_encord_dict() for row in label_rows]
+        labels = self._get_label_dicts(label_rows, include_object_feature_hashes, include_classification_feature_hashes)
         coco_labels = CocoExporter(labels, ontology=self.ontology_structure).export()
         return coco_labels
 
+    def export_coco_labels_to(
+        self,
+        path: Union[str, Path],
+        label_hashes: Optional[List[str]] = None,
+        include_object_feature_hashes: Optional[Set[str]] = None,
+        include_classification_feature_hashes: Optional[Set[str]] = None,
+        branch_name: Optional[str] = None,
+        chunk_size: int = 100,
+    ) -> None:
+        """Export labels from the project to a COCO JSON file, with memory bounded by the chunk size.
+        This method requires the 'coco' extra to be installed. Install it using:
+        `pip install encord[coco]`.
+
+        Unlike :meth:`export_coco_labels`, label rows are fetched and converted `chunk_size` rows at a time, and the
+        images and annotations are written to the file incrementally. The file contains the same JSON as
+        :meth:`export_coco_labels` returns, including the ids.
+
+        Args:
+            path: The file to write the COCO JSON to.
+            label_hashes: List of label hashes to include. If not provided, all label rows will be included.
+            include_object_feature_hashes: If `None`, all objects will be included.
+                 Otherwise, only objects with the specified feature hashes will be included.
+            include_classification_feature_hashes: If `None`, all classifications will be included.
+                Otherwise, only classifications with the specified feature hashes will be included.
+            branch_name: Optionally specify a branch name. Defaults to the `main` branch.
+            chunk_size: Number of label rows to fetch and convert at a time.
+
+        Raises:
+            ImportError: If the 'coco' extra dependencies are not installed.
+        """
+        from encord.utilities.coco.exporter import CocoExporter
+
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
+        def labels_chunks() -> Iterator[List[Dict[str, Any]]]:
+            # Rows are popped once converted, so the labels of earlier chunks can be freed
+            pending = deque(self.list_label_rows_v2(label_hashes=label_hashes, branch_name=branch_name))
+            while pending:
+                rows = [pending.popleft() for _ in range(min(chunk_size, len(pending)))]
+                yield self._get_label_dicts(rows, include_object_feature_hashes, include_classification_feature_hashes)
+
+        CocoExporter([], ontology=self.ontology_structure).export_to_file(path, labels_chunks())
+
+    def _get_label_dicts(
+        self,
+        label_rows: List[LabelRowV2],
+        include_object_feature_hashes: Optional[Set[str]],
+        include_classification_feature_hashes: Optional[Set[str]],
+    ) -> List[Dict[str, Any]]:
+        """Fetch the label dicts of the given rows in the format of :meth:`LabelRowV2.to_encord_dict`.
+
+        The dicts of labelled rows are normalised as the server sends them, without parsing them into the object model
+        and serialising them again, see :func:`_normalise_label_dict_for_export`. Dicts that cannot be normalised are
+        parsed into their row. Rows that have no labels yet are initialised as in :meth:`LabelRowV2.initialise_labels`.
+        """
+        label_hashes = [row.label_hash for row in label_rows if row.label_hash is not None]
+        label_dicts_by_hash: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(label_hashes), LABEL_ROW_BUNDLE_GET_LIMIT):
+            label_dicts = self._client.get_label_rows(
+                label_hashes[start : start + LABEL_ROW_BUNDLE_GET_LIMIT],
+                get_signed_url=False,
+                include_object_feature_hashes=include_object_feature_hashes,
+                include_classification_feature_hashes=include_classification_feature_hashes,
+            )
+            label_dicts_by_hash.update((label_dict["label_hash"], label_dict) for label_dict in label_dicts)
+
+        unlabelled_rows = [row for row in label_rows if row.label_hash is None]
+        if unlabelled_rows:
+            with self.create_bundle() as bundle:
+                for row in unlabelled_rows:
+                    row.initialise_labels(
+                        include_object_feature_hashes=include_object_feature_hashes,
+                        include_classification_feature_hashes=include_classification_feature_hashes,
+                        bundle=bundle,
+                    )
+
+        # Initialising the unlabelled rows sets their label hashes, so they are told apart by the hashes fetched
+        result: List[Dict[str, Any]] = []
+        for row in label_rows:
+            label_dict = label_dicts_by_hash.get(row.label_hash) if row.label_hash is not None else None
+            if label_dict is not None:
+                normalised_label_dict = _normalise_label_dict_for_export(label_dict)
+                if normalised_label_dict is not None:
+                    result.append(normalised_label_dict)
+                    continue
+                row.from_labels_dict(label_dict)
+            result.append(row.to_encord_dict())
+        return result
+
     def get_collection(self, collection_uuid: Union[str, UUID]) -> ProjectCollection:
         return ProjectCollection._get_collection(
             project_client=self._client,
@@ -14,10 +14,13 @@ import logging
 import mimetypes
 import os
 import time
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from math import ceil
 from pathlib import Path
-from typing import Any, Collection, Dict, Iterable, List, Literal, Optional, Sequence, TextIO, Union
+from typing import Any, Collection, Dict, Iterable, List, Literal, Optional, Sequence, TextIO, Tuple, Type, Union
 from uuid import UUID
 
 import requests
@@ -26,10 +29,16 @@ import encord
 import encord.orm.storage as orm_storage
 from encord.client import LONG_POLLING_RESPONSE_RETRY_N, LONG_POLLING_SLEEP_ON_FAILURE_SECONDS
 from encord.common.deprecated import deprecated
-from encord.exceptions import EncordException
+from encord.exceptions import CloudUploadError, EncordException
 from encord.http.bundle import Bundle, BundleResultHandler, BundleResultMapper, bundled_operation
 from encord.http.constants import DEFAULT_REQUESTS_SETTINGS
-from encord.http.utils import CloudUploadSettings, _upload_single_file
+from encord.http.utils import (
+    UPLOAD_TO_SIGNED_URL_LIST_MAX_WORKERS,
+    UPLOAD_TO_SIGNED_URL_LIST_SIGNED_URLS_BATCH_SIZE,
+    CloudUploadSettings,
+    _upload_single_file,
+    get_batches,
+)
 from encord.http.v2.api_client import ApiClient
 from encord.http.v2.payloads import Page
 from encord.orm.dataset import LongPollingStatus
@@ -62,6 +71,41 @@ from encord.orm.storage import (
 logger = logging.getLogger(__name__)
 
 STORAGE_BUNDLE_CREATE_LIMIT = 1000
+UPLOAD_FILES_JOB_MAX_ITEMS = 10000
+
+_UploadFilesItem = Union[
+    orm_storage.DataUploadImage,
+    orm_storage.DataUploadVideo,
+    orm_storage.DataUploadAudio,
+    orm_storage.DataUploadText,
+    orm_storage.DataUploadPDF,
+]
+
+# The field of `DataUploadItems` and the item class used to register each type of file uploaded by `upload_files`
+_UPLOAD_FILES_ITEM_TYPES: Dict[StorageItemType, Tuple[str, Type[_UploadFilesItem]]] = {
+    StorageItemType.IMAGE: ("images", orm_storage.DataUploadImage),
+    StorageItemType.VIDEO: ("videos", orm_storage.DataUploadVideo),
+    StorageItemType.AUDIO: ("audio", orm_storage.DataUploadAudio),
+    StorageItemType.PLAIN_TEXT: ("text", orm_storage.DataUploadText),
+    StorageItemType.PDF: ("pdf", orm_storage.DataUploadPDF),
+}
+
+
+@dataclass
+class UploadFileResult:
+    """Result of uploading a single file with :meth:`StorageFolder.upload_files`."""
+
+    file_path: Union[Path, str]
+    """Path of the uploaded file."""
+
+    title: str
+    """Title of the storage item, the name of the file."""
+
+    item_uuid: Optional[UUID] = None
+    """UUID of the created storage item, or `None` if the file could not be uploaded or registered."""
+
+    error: Optional[str] = None
+    """Why the file could not be uploaded or registered, if it could not."""
 
 
 class StorageFolder:
@@ -317,6 +361,134 @@ class StorageFolder:
         else:
             return upload_result.items_with_names[0].item_uuid
 
+    def upload_files(
+        self,
+        file_paths: Sequence[Union[Path, str]],
+        item_type: StorageItemType,
+        max_workers: int = UPLOAD_TO_SIGNED_URL_LIST_MAX_WORKERS,
+        cloud_upload_settings: CloudUploadSettings = CloudUploadSettings(),
+    ) -> List[UploadFileResult]:
+        """Uploads many files of the same type to a folder in Encord storage.
+
+        Unlike calling :meth:`upload_image` and similar methods for every file, upload locations are requested in
+        batches, the files are uploaded on `max_workers` threads, and the uploaded files are registered with as few
+        upload jobs as possible, which are only waited for once all files are uploaded.
+
+        A file that fails to upload or register does not stop the others: its result has an `error` instead of an
+        `item_uuid`. This includes failures to get upload locations for a batch of files, or to start or wait for the
+        job registering them, which only fail the files of that batch or job.
+
+        Args:
+            file_paths (Sequence[Union[Path, str]]): Paths to the files. The file names are used as titles.
+            item_type (StorageItemType): The type of all files: `IMAGE`, `VIDEO`, `AUDIO`, `PLAIN_TEXT` or `PDF`.
+            max_workers (int): Number of files to upload at the same time.
+            cloud_upload_settings (CloudUploadSettings): Settings for uploading data into the cloud. Change this object
+                                                        to overwrite the default values.
+
+        Returns:
+            List[UploadFileResult]: The result of each file, in the order of `file_paths`.
+
+        Raises:
+            ValueError: If files of `item_type` cannot be uploaded with this method.
+        """
+        if item_type not in _UPLOAD_FILES_ITEM_TYPES:
+            raise ValueError(f"Unsupported upload item type `{item_type}`")
+
+        results = [
+            UploadFileResult(file_path=file_path, title=self._guess_title(None, file_path)) for file_path in file_paths
+        ]
+
+        def upload(result: UploadFileResult, url_info: orm_storage.UploadSignedUrl) -> bool:
+            try:
+                self._upload_local_file(
+                    result.file_path, result.title, item_type, url_info.signed_url, cloud_upload_settings
+                )
+            except (CloudUploadError, OSError, ValueError) as e:
+                result.error = str(e)
+                return False
+            return True
+
+        jobs: List[Tuple[UUID, List[Tuple[UploadFileResult, orm_storage.UploadSignedUrl]]]] = []
+        uploaded: List[Tuple[UploadFileResult, orm_storage.UploadSignedUrl]] = []
+
+        def start_job() -> None:
+            try:
+                jobs.append(self._start_upload_files_job(item_type, uploaded))
+            except (EncordException, requests.exceptions.RequestException) as e:
+                for result, _ in uploaded:
+                    result.error = f"Could not register {result.title}: {e}"
+            uploaded.clear()
+
+        def register(batch_uploads: List[Tuple[UploadFileResult, orm_storage.UploadSignedUrl, Future]]) -> None:
+            for result, url_info, future in batch_uploads:
+                if future.result():
+                    uploaded.append((result, url_info))
+            if len(uploaded) >= UPLOAD_FILES_JOB_MAX_ITEMS:
+                start_job()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            previous_batch_uploads: Optional[List[Tuple[UploadFileResult, orm_storage.UploadSignedUrl, Future]]] = None
+            for batch in get_batches(results, UPLOAD_TO_SIGNED_URL_LIST_SIGNED_URLS_BATCH_SIZE):
+                # Requested while the previous batch uploads, so the signed URLs do not expire before they are used
+                try:
+                    upload_url_info = self._get_upload_signed_urls(
+                        item_type=item_type, count=len(batch), frames_subfolder_name=None
+                    )
+                    if len(upload_url_info) != len(batch):
+                        raise EncordException("Can't access upload location")
+                except (EncordException, requests.exceptions.RequestException) as e:
+                    for result in batch:
+                        result.error = f"Could not get an upload location for {result.title}: {e}"
+                    upload_url_info = []
+                batch_uploads = [
+                    (result, url_info, executor.submit(upload, result, url_info))
+                    for result, url_info in zip(batch, upload_url_info)
+                ]
+                if previous_batch_uploads is not None:
+                    register(previous_batch_uploads)
+                previous_batch_uploads = batch_uploads
+
+            if previous_batch_uploads is not None:
+                register(previous_batch_uploads)
+        if uploaded:
+            start_job()
+
+        for upload_job_id, job_uploads in jobs:
+            try:
+                upload_result = self._add_data_to_folder_get_result(upload_job_id)
+            except (EncordException, requests.exceptions.RequestException) as e:
+                for result, _ in job_uploads:
+                    result.error = f"Could not register {result.title}: {e}"
+                continue
+
+            registered_item_uuids = (
+                {item.item_uuid for item in upload_result.items_with_names}
+                if upload_result.status == LongPollingStatus.DONE
+                else set()
+            )
+            unit_errors_by_object_url: Dict[str, List[str]] = defaultdict(list)
+            for unit_error in upload_result.unit_errors:
+                for object_url in unit_error.object_urls:
+                    unit_errors_by_object_url[object_url].append(unit_error.error)
+            for result, url_info in job_uploads:
+                # The placeholder item becomes the registered item
+                if url_info.item_uuid in registered_item_uuids:
+                    result.item_uuid = url_info.item_uuid
+                elif url_info.object_key in unit_errors_by_object_url:
+                    result.error = f"Could not register {result.title}: {'; '.join(unit_errors_by_object_url[url_info.object_key])}"
+                else:
+                    # The errors of the job are not tied to files, and there can be many of them
+                    result.error = (
+                        f"Could not register {result.title}, upload job {upload_job_id} finished with status "
+                        f"{upload_result.status.value} and {len(upload_result.errors)} errors"
+                    )
+
+        failed_count = sum(result.item_uuid is None for result in results)
+        if failed_count:
+            logger.warning(f"{failed_count} of {len(results)} files could not be uploaded, see the returned errors")
+
+        return results
+
     def re_encode_videos(self, storage_items: List[UUID], process_title: str, force_full_reencoding: bool) -> UUID:
         """Re-encodes the specified video items.
 
@@ -1455,6 +1627,26 @@ class StorageFolder:
             backoff_factor=backoff_factor,
         )
 
+    def _start_upload_files_job(
+        self, item_type: StorageItemType, uploaded: List[Tuple[UploadFileResult, orm_storage.UploadSignedUrl]]
+    ) -> Tuple[UUID, List[Tuple[UploadFileResult, orm_storage.UploadSignedUrl]]]:
+        field_name, item_class = _UPLOAD_FILES_ITEM_TYPES[item_type]
+        items: Dict[str, Any] = {}
+        items[field_name] = [
+            item_class(
+                object_url=url_info.object_key,  # this is actually ignored when placeholder_item_uuid is set
+                placeholder_item_uuid=url_info.item_uuid,
+                title=result.title,
+            )
+            for result, url_info in uploaded
+        ]
+        upload_job_id = self._add_data_to_folder_start(
+            integration_id=None,
+            private_files=DataUploadItems(**items),
+            ignore_errors=True,
+        )
+        return upload_job_id, list(uploaded)
+
     def _add_data(
         self,
         integration_id: Optional[str],
@@ -1,13 +1,7 @@
 from dataclasses import dataclass
 from typing import Any, List, NamedTuple, Optional, Union
 
-from encord.common.bitmask_operations import (
-    _mask_to_rle,
-    _rle_to_mask,
-    _rle_to_string,
-    _string_to_rle,
-    transpose_bytearray,
-)
+from encord.common.bitmask_operations import coco_rle_to_row_major_string
 from encord.objects.coordinates import BitmaskCoordinates, BoundingBoxCoordinates, PointCoordinate, PolygonCoordinates
 from encord.orm.base_dto import BaseDTO, BaseDTOWithExtra, dto_validator
 
@@ -83,20 +77,12 @@ class CocoRLE(BaseDTO):
             # This is not RLE
             raise ValueError
 
-        # Note: It's essential to transpose the input and output coordinates when using pycocotools' functions,
-        # in order to address the distinction between treating masks as C-contiguous (row-major order, Encord's
-        # implementation) versus pycocotools' expectation of Fortran-contiguous (column-major order, COCO's API
-        # implementation) data.
-
-        if isinstance(_value["counts"], list):
-            mask = _rle_to_mask(_value["counts"], _value["size"][0] * _value["size"][1])
-            mask = transpose_bytearray(mask, shape=(_value["size"][1], _value["size"][0]))
-            rle = {"size": _value["size"], "counts": _rle_to_string(_mask_to_rle(mask))}
-        elif isinstance(_value["counts"], str):
-            mask = _rle_to_mask(_string_to_rle(_value["counts"]), _value["size"][0] * _value["size"][1])
-            mask = transpose_bytearray(mask, shape=(_value["size"][1], _value["size"][0]))
-            rle_str = _rle_to_string(_mask_to_rle(mask))
-            rle = {"size": _value["size"], "counts": rle_str}
+        # Note: COCO masks are Fortran-contiguous (column-major order, COCO's API implementation), while Encord treats
+        # masks as C-contiguous (row-major order), so the counts have to be re-encoded in row-major order.
+
+        if isinstance(_value["counts"], (list, str)):
+            size = _value["size"]
+            rle = {"size": size, "counts": coco_rle_to_row_major_string(_value["counts"], shape=(size[0], size[1]))}
         else:
             rle = _value
         return rle
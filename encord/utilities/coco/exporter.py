@@ -8,12 +8,20 @@ except ImportError as e:
         "Install them with: `pip install encord[coco]`"
     ) from e
 
+import copy
+import json
 import logging
+import math
+import os
+import shutil
+import tempfile
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from itertools import chain
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import numpy as np
 from pycocotools import mask as cocomask
@@ -32,6 +40,8 @@ logger = logging.getLogger(__name__)
 ShapelyPolygonRing = Tuple[Tuple[float, float], ...]
 ShapelyPolygonHoles = List[ShapelyPolygonRing]
 ShapelyPolygon = Union[Tuple[ShapelyPolygonRing,], Tuple[ShapelyPolygonRing, ShapelyPolygonHoles]]
+PolygonGeometry = Tuple[List[float], float, Tuple[float, float, float, float]]
+"""The flat segmentation, area and bbox of a simple polygon"""
 
 PDF_MIME_TYPES = ["application/pdf"]
 TEXT_MIME_TYPES = ["application/json", "application/xml", "text/plain", "text/html", "text/xml"]
@@ -40,6 +50,19 @@ NIFTI1_MIME_TYPE = "application/nifti1"
 NIFTI2_MIME_TYPE = "application/nifti2"
 NIFTI_MIME_TYPES = {NIFTI1_MIME_TYPE, NIFTI2_MIME_TYPE}
 
+# The shapes for which `CocoExporter.get_annotations` creates an annotation
+COCO_ANNOTATION_SHAPES = {
+    Shape.BOUNDING_BOX.value,
+    Shape.ROTATABLE_BOUNDING_BOX.value,
+    Shape.POLYGON.value,
+    Shape.POLYLINE.value,
+    Shape.BITMASK.value,
+    Shape.POINT.value,
+    Shape.SKELETON.value,
+}
+# Every worker of `CocoExporter.export_parallel` gets this many shards, so that uneven label rows balance out
+SHARDS_PER_WORKER = 4
+
 
 @dataclass(frozen=True)
 class DicomAnnotationData:
@@ -132,6 +155,17 @@ class CocoExporter:
         self._id_and_object_hash_to_answers_map: Optional[Dict[Tuple[int, str], Dict]] = None
         self._include_videos = include_videos
 
+        # Lookup tables for the per-annotation path, so that it does not scan the ontology or the images
+        self._object_feature_hash_to_attributes_map: Dict[str, List[Attribute]] = {}
+        for object_ in ontology.objects:
+            self._object_feature_hash_to_attributes_map.setdefault(object_.feature_node_hash, list(object_.attributes))
+        self._unselected_attributes_cache: Dict[Tuple[str, bool], Dict[str, Optional[bool]]] = {}
+        self._checklist_option_labels_cache: Dict[str, List[str]] = {}
+        self._image_id_to_size_map: Dict[int, Size] = {}
+        self._image_id_to_size_map_source: Optional[List[Dict[str, Any]]] = None
+        # Segmentation, area and bbox of the simple polygons of the image being converted, by `id()` of the object
+        self._simple_polygon_geometries: Dict[int, PolygonGeometry] = {}
+
     def export(self) -> Dict[str, Any]:
         self._coco_json["info"] = self.get_info()
         self._coco_json["categories"] = self.get_categories()
@@ -140,6 +174,125 @@ class CocoExporter:
 
         return self._coco_json
 
+    def export_parallel(self, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """Same as :meth:`export`, but the annotations are converted on a pool of processes.
+
+        Converting polygons and bitmasks is CPU-bound, so label rows are split into contiguous shards that are
+        converted independently. Image ids are assigned up front and annotation and track ids in a merge step, in the
+        order of the label rows, so the result is identical to that of :meth:`export`. The exporter, including the
+        ontology, is pickled to the workers, so subclasses must be defined at module level.
+
+        Args:
+            max_workers: The number of processes, defaults to the number of CPUs.
+        """
+        self._coco_json["info"] = self.get_info()
+        self._coco_json["categories"] = self.get_categories()
+        self._coco_json["images"] = self.get_images()
+
+        if max_workers == 1 or len(self._labels_list) <= 1:
+            self._coco_json["annotations"] = [x.to_dict() for x in self.get_all_annotations()]
+            return self._coco_json
+
+        # The serial exporter takes the dynamic classifications of all rows from the first annotated row
+        first_object_actions = self._get_first_annotated_object_actions()
+        if first_object_actions is not None:
+            self.get_id_and_object_hash_to_answers_map(first_object_actions)
+
+        num_workers = max_workers or os.cpu_count() or 1
+        shard_size = math.ceil(len(self._labels_list) / (num_workers * SHARDS_PER_WORKER))
+        shards = [
+            self._get_shard_exporter(self._labels_list[start : start + shard_size])
+            for start in range(0, len(self._labels_list), shard_size)
+        ]
+
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            annotations = []
+            for shard_annotations, shard_track_ids in executor.map(_get_shard_annotations, shards):
+                object_hashes_by_track_id = {track_id: object_hash for object_hash, track_id in shard_track_ids.items()}
+                for annotation in shard_annotations:
+                    annotation.id_ = self.next_annotation_id()
+                    if annotation.track_id is not None:
+                        annotation.track_id = self.get_and_set_track_id(object_hashes_by_track_id[annotation.track_id])
+                    annotations.append(annotation.to_dict())
+
+        self._coco_json["annotations"] = annotations
+        return self._coco_json
+
+    def _get_first_annotated_object_actions(self) -> Optional[Dict[str, Any]]:
+        for labels in self._labels_list:
+            for objects, _ in self._iter_objects_by_image(labels):
+                if any(object_["shape"] in COCO_ANNOTATION_SHAPES for object_ in objects):
+                    return labels["object_actions"]
+        return None
+
+    def _get_shard_exporter(self, labels_list: List[Dict[str, Any]]) -> "CocoExporter":
+        """Copy the exporter with only the state needed to convert the annotations of `labels_list`."""
+        data_hashes = {data_unit["data_hash"] for labels in labels_list for data_unit in labels["data_units"].values()}
+        data_hash_to_image_id_map = {
+            key: image_id for key, image_id in self._data_hash_to_image_id_map.items() if key[0] in data_hashes
+        }
+        image_ids = set(data_hash_to_image_id_map.values())
+
+        shard = copy.copy(self)
+        shard._labels_list = labels_list
+        shard._coco_json = {"images": [image for image in self._coco_json["images"] if image["id"] in image_ids]}
+        shard._data_hash_to_image_id_map = data_hash_to_image_id_map
+        shard._current_annotation_id = 0
+        shard._object_hash_to_track_id_map = {}
+        shard._image_id_to_size_map = {}
+        shard._image_id_to_size_map_source = None
+        return shard
+
+    def export_to_file(
+        self,
+        path: Union[str, Path],
+        labels_chunks: Optional[Iterable[List[Dict[str, Any]]]] = None,
+    ) -> None:
+        """Write the COCO JSON to `path`, converting the labels one chunk at a time.
+
+        Only one chunk of labels and its images and annotations are held in memory at a time: images are written to
+        the file as they are converted, and annotations go to a temporary file until all images are written. Image,
+        annotation, track and category ids are assigned exactly as by :meth:`export`, so the file contains the same
+        JSON as exporting all chunks at once.
+
+        Args:
+            path: The file to write to.
+            labels_chunks: Chunks of label row dicts, e.g. from a generator that fetches label rows lazily. Defaults
+                to the labels passed to the constructor, as a single chunk.
+        """
+        chunks = iter(labels_chunks) if labels_chunks is not None else iter([self._labels_list])
+        first_chunk = next(chunks, [])
+
+        with (
+            open(path, "w", encoding="utf-8") as file,
+            tempfile.TemporaryFile("w+", encoding="utf-8") as annotations_file,
+        ):
+            self._labels_list = first_chunk
+            file.write(f'{{"info": {json.dumps(self.get_info())}, ')
+            file.write(f'"categories": {json.dumps(self.get_categories())}, "images": [')
+
+            images_written = annotations_written = False
+            for labels_chunk in chain([first_chunk], chunks):
+                self._labels_list = labels_chunk
+                # Annotations look up the size of their image here, so it only needs the images of this chunk
+                self._coco_json["images"] = self.get_images()
+                for image in self._coco_json["images"]:
+                    file.write(", " if images_written else "")
+                    json.dump(image, file)
+                    images_written = True
+                for annotation in self.get_all_annotations():
+                    annotations_file.write(", " if annotations_written else "")
+                    json.dump(annotation.to_dict(), annotations_file)
+                    annotations_written = True
+
+            file.write('], "annotations": [')
+            annotations_file.seek(0)
+            shutil.copyfileobj(annotations_file, file)
+            file.write("]}")
+
+        self._labels_list = []
+        self._coco_json = {}
+
     def get_info(self) -> Dict[str, Optional[str]]:
         return {
             "description": self.get_description(),
@@ -374,48 +527,43 @@ class CocoExporter:
         for labels in self._labels_list:
             object_answers = labels["object_answers"]
             object_actions = labels["object_actions"]
-            cord_data_type = labels["data_type"]  # This is set to FileType Enum
-
-            for data_unit in labels["data_units"].values():
-                data_hash = data_unit["data_hash"]
-                data_type = data_unit["data_type"]
-
-                is_video = "video" in data_type
-                if is_video and not self._include_videos:
-                    continue
 
-                if is_video or data_type == DICOM_MIME_TYPE or data_type in NIFTI_MIME_TYPES:
-                    for frame_num, frame_item in data_unit["labels"].items():
-                        image_id = self.get_image_id(data_hash, int(frame_num))
-                        objects = frame_item["objects"]
-                        annotations.extend(
-                            self.get_annotations(
-                                objects,
-                                image_id,
-                                object_answers,
-                                object_actions,
-                            )
-                        )
-                elif data_type in PDF_MIME_TYPES:
-                    continue
-                elif data_type in TEXT_MIME_TYPES:
-                    continue
-                elif cord_data_type.upper() == "AUDIO":
-                    continue
-                else:
-                    image_id = self.get_image_id(data_hash)
-                    objects = data_unit["labels"].get("objects") or []
-                    annotations.extend(
-                        self.get_annotations(
-                            objects,
-                            image_id,
-                            object_answers,
-                            object_actions,
-                        )
+            for objects, image_id in self._iter_objects_by_image(labels):
+                annotations.extend(
+                    self.get_annotations(
+                        objects,
+                        image_id,
+                        object_answers,
+                        object_actions,
                     )
+                )
 
         return annotations
 
+    def _iter_objects_by_image(self, labels: Dict[str, Any]) -> Iterator[Tuple[List[Dict], int]]:
+        """Yield the objects of every image of a label row that has COCO annotations, with the image id."""
+        cord_data_type = labels["data_type"]  # This is set to FileType Enum
+
+        for data_unit in labels["data_units"].values():
+            data_hash = data_unit["data_hash"]
+            data_type = data_unit["data_type"]
+
+            is_video = "video" in data_type
+            if is_video and not self._include_videos:
+                continue
+
+            if is_video or data_type == DICOM_MIME_TYPE or data_type in NIFTI_MIME_TYPES:
+                for frame_num, frame_item in data_unit["labels"].items():
+                    yield frame_item["objects"], self.get_image_id(data_hash, int(frame_num))
+            elif data_type in PDF_MIME_TYPES:
+                continue
+            elif data_type in TEXT_MIME_TYPES:
+                continue
+            elif cord_data_type.upper() == "AUDIO":
+                continue
+            else:
+                yield data_unit["labels"].get("objects") or [], self.get_image_id(data_hash)
+
     def get_annotations(
         self,
         objects: List[Dict],
@@ -423,19 +571,31 @@ class CocoExporter:
         object_answers: Dict,
         object_actions: Dict,
     ) -> List[CocoAnnotation]:
+        if not objects:
+            return []
+
         annotations = []
+        size = self.get_image_size(image_id)
+        # Points converted by an overridden `get_polygon_from_dict_or_list` are left to `get_polygon`
+        can_batch_polygons = type(self).get_polygon_from_dict_or_list is CocoExporter.get_polygon_from_dict_or_list
+        simple_polygons = [
+            object_
+            for object_ in objects
+            if can_batch_polygons
+            and object_["shape"] == Shape.POLYGON.value
+            and not self.is_multipolygon(object_)
+            and len(object_["polygon"]) >= 3
+        ]
+        geometries = self.get_simple_polygons_geometry(
+            [object_["polygon"] for object_ in simple_polygons], size.width, size.height
+        )
+        self._simple_polygon_geometries = {
+            id(object_): geometry for object_, geometry in zip(simple_polygons, geometries)
+        }
 
         for object_ in objects:
             shape = object_["shape"]
 
-            for image_data in self._coco_json["images"]:
-                if image_data["id"] == image_id:
-                    # Ensure a size of 1 for non-geometric data types
-                    size = Size(
-                        width=max(1, image_data["width"]),
-                        height=max(1, image_data["height"]),
-                    )
-
             if shape == Shape.BOUNDING_BOX.value:
                 annotations.append(
                     self.get_bounding_box(
@@ -507,8 +667,22 @@ class CocoExporter:
                     )
                 )
 
+        self._simple_polygon_geometries = {}
         return annotations
 
+    def get_image_size(self, image_id: int) -> Size:
+        # The map is rebuilt whenever the images are replaced, e.g. for every chunk of `export_to_file`
+        images = self._coco_json["images"]
+        if self._image_id_to_size_map_source is not images:
+            # Ensure a size of 1 for non-geometric data types
+            self._image_id_to_size_map = {
+                image_data["id"]: Size(width=max(1, image_data["width"]), height=max(1, image_data["height"]))
+                for image_data in images
+            }
+            self._image_id_to_size_map_source = images
+
+        return self._image_id_to_size_map[image_id]
+
     def get_bounding_box(
         self,
         object_: Dict,
@@ -605,20 +779,8 @@ class CocoExporter:
         category_id = self.get_category_id(object_)
         id_, is_crowd, track_id, encord_track_uuid, manual_annotation = self.get_coco_annotation_default_fields(object_)
 
-        is_multipolygon = (
-            # Check if the object contains the new [complex] 'polygons' field
-            object_.get("polygons")
-            and (
-                # A multipolygon is either:
-                # - More than one polygon present
-                len(object_["polygons"]) > 1
-                or
-                # - A single polygon that contains holes (more than one contour)
-                len(object_["polygons"][0]) > 1
-            )
-        )
         # Since COCO format doesn't support multipolygons, we must RLE encode complex polygons.
-        if is_multipolygon:
+        if self.is_multipolygon(object_):
             is_crowd = 1
             multipolygon = MultiPolygon(
                 self.get_multipolygon_from_polygons(object_["polygons"], size.width, size.height)
@@ -626,6 +788,9 @@ class CocoExporter:
             segmentation = self.get_rle_segmentation_from_multipolygon(multipolygon, size.width, size.height)
             bbox = tuple(cocomask.toBbox(segmentation))
             area = float(cocomask.area(segmentation))
+        elif id(object_) in self._simple_polygon_geometries:
+            flat_polygon, area, bbox = self._simple_polygon_geometries[id(object_)]
+            segmentation = [flat_polygon]
         else:
             polygon = self.get_polygon_from_dict_or_list(object_["polygon"], size.width, size.height)
             _polygon = Polygon(polygon)
@@ -659,6 +824,58 @@ class CocoExporter:
             manual_annotation=manual_annotation,
         )
 
+    def is_multipolygon(self, object_: Dict[str, Any]) -> bool:
+        return bool(
+            # Check if the object contains the new [complex] 'polygons' field
+            object_.get("polygons")
+            and (
+                # A multipolygon is either:
+                # - More than one polygon present
+                len(object_["polygons"]) > 1
+                or
+                # - A single polygon that contains holes (more than one contour)
+                len(object_["polygons"][0]) > 1
+            )
+        )
+
+    def get_simple_polygons_geometry(
+        self,
+        polygon_dicts: List[Union[Dict[str, Any], List]],
+        w: int,
+        h: int,
+    ) -> List[PolygonGeometry]:
+        """Compute the flat segmentation, area and bbox of many simple polygons of one image at once.
+
+        The points of all polygons are scaled and reduced to bounds as one array, and the areas are computed by the
+        vectorised shapely functions, so the results are identical to those of a shapely `Polygon` per polygon.
+        Every polygon must have at least 3 points.
+        """
+        if not polygon_dicts:
+            return []
+
+        points_lists = [
+            polygon_dict if isinstance(polygon_dict, list) else [polygon_dict[str(i)] for i in range(len(polygon_dict))]
+            for polygon_dict in polygon_dicts
+        ]
+        lengths = np.array([len(points) for points in points_lists])
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        points = np.array(
+            [(point["x"], point["y"]) for points in points_lists for point in points], dtype=np.float64
+        ) * np.array([w, h], dtype=np.float64)
+
+        areas = shapely.area(
+            shapely.polygons(shapely.linearrings(points, indices=np.repeat(np.arange(len(lengths)), lengths)))
+        )
+        mins = np.minimum.reduceat(points, offsets, axis=0)
+        maxs = np.maximum.reduceat(points, offsets, axis=0)
+        bboxes = np.concatenate([mins, maxs - mins], axis=1)
+
+        flat_polygons = np.split(points.reshape(-1), 2 * np.cumsum(lengths)[:-1])
+        return [
+            (flat_polygon.tolist(), area, (x, y, bbox_w, bbox_h))
+            for flat_polygon, area, (x, y, bbox_w, bbox_h) in zip(flat_polygons, areas.tolist(), bboxes.tolist())
+        ]
+
     def get_polygon_from_dict_or_list(
         self,
         polygon_dict: Union[Dict[str, Any], List],
@@ -702,21 +919,68 @@ class CocoExporter:
             return (polygon_ring,)
 
     def get_rle_segmentation_from_multipolygon(self, multipolygon: MultiPolygon, w: int, h: int):  # type: ignore[no-untyped-def]
-        mask = np.zeros((h, w), dtype=np.uint8)
-        for polygon in sorted(multipolygon.geoms, key=lambda p: p.area, reverse=True):
+        polygons = sorted(multipolygon.geoms, key=lambda p: p.area, reverse=True)
+        rings = [
+            (
+                np.array(polygon.exterior.coords, dtype=np.int32),
+                [np.array(interior.coords, dtype=np.int32) for interior in polygon.interiors],
+            )
+            for polygon in polygons
+        ]
+
+        # Only the window of the image that contains all points is rasterised, with the polygons shifted into it.
+        # Filling never sets pixels outside of the bounds of the points, so everything outside of the window is
+        # empty, and the window is clipped at the same image borders as the whole image would be.
+        x0 = y0 = x1 = y1 = 0
+        if rings:
+            all_points = np.concatenate([ring for exterior, interiors in rings for ring in [exterior, *interiors]])
+            x0, y0 = np.maximum(all_points.min(axis=0), 0)
+            x1, y1 = np.maximum(np.minimum(all_points.max(axis=0) + 1, [w, h]), [x0, y0])
+        window = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+        offset = (-int(x0), -int(y0))
+        for exterior, interiors in rings if window.size > 0 else []:
             # mypy being silly -- List item 0 has incompatible type "ndarray[Any, dtype[signedinteger[_32Bit]]]"; expected "Mat"
-            exterior = np.array(polygon.exterior.coords, dtype=np.int32)
-            cv2.fillPoly(mask, [exterior], color=(255, 255, 255))  # type: ignore[list-item]
-            for interior in polygon.interiors:
-                cv2.fillPoly(mask, [np.array(interior.coords, dtype=np.int32)], color=(0, 0, 0))  # type: ignore[list-item]
+            cv2.fillPoly(window, [exterior], color=(255, 255, 255), offset=offset)  # type: ignore[list-item]
+            for interior in interiors:
+                cv2.fillPoly(window, [interior], color=(0, 0, 0), offset=offset)  # type: ignore[list-item]
 
-        # Obtain the COCO compatible RLE string (convert from row-major to column-major order)
-        segmentation = cocomask.encode(np.asfortranarray(mask))
+        # Obtain the COCO compatible RLE string (column-major order) of the whole image from the window
+        counts = self.get_rle_counts_from_window(window, int(x0), int(y0), h, w)
+        segmentation = cocomask.frPyObjects({"size": [h, w], "counts": counts}, h, w)
         # Convert RLE string from bytes (which is not a JSON serializable type) to a string format
         segmentation["counts"] = segmentation["counts"].decode("ascii")
 
         return segmentation
 
+    def get_rle_counts_from_window(self, window: np.ndarray, x0: int, y0: int, h: int, w: int) -> List[int]:
+        """Uncompressed COCO RLE counts of an `h` x `w` mask that is empty outside of `window` at (`x0`, `y0`)."""
+        window_h, window_w = window.shape
+        # Each column of the window, padded with an empty pixel above and below, in column-major order
+        columns = np.zeros((window_w, window_h + 2), dtype=np.int8)
+        columns[:, 1:-1] = window.T != 0
+        changes = np.diff(columns, axis=1)
+        start_columns, start_rows = np.nonzero(changes == 1)
+        _, end_rows = np.nonzero(changes == -1)
+
+        # Runs as [start, end) in the column-major pixel order of the whole image
+        starts = (x0 + start_columns) * h + y0 + start_rows
+        ends = (x0 + start_columns) * h + y0 + end_rows
+        if len(starts) == 0:
+            return [h * w]
+
+        # Runs that continue from the bottom of one column into the top of the next one are a single run
+        is_continued = starts[1:] == ends[:-1]
+        starts = np.concatenate((starts[:1], starts[1:][~is_continued]))
+        ends = np.concatenate((ends[:-1][~is_continued], ends[-1:]))
+
+        counts = np.empty(2 * len(starts), dtype=np.int64)
+        counts[0::2] = starts - np.concatenate(([0], ends[:-1]))
+        counts[1::2] = ends - starts
+        ret: List[int] = counts.tolist()
+        if ends[-1] < h * w:
+            ret.append(h * w - int(ends[-1]))
+        return ret
+
     def get_multipolygon_from_polygons(
         self,
         polygons: List[List[List[float]]],
@@ -999,7 +1263,8 @@ class CocoExporter:
         feature_hash_to_attribute_map: Dict[str, Attribute],
     ) -> Dict[str, Any]:
         ret = {}
-        classifications = object_answers[object_hash]["classifications"]
+        # Server label dicts may omit the answers of objects without classifications, unlike `to_encord_dict()`
+        classifications = object_answers.get(object_hash, {}).get("classifications", [])
         for classification in classifications:
             feature_hash = classification["featureHash"]
             if feature_hash not in feature_hash_to_attribute_map:
@@ -1083,47 +1348,40 @@ class CocoExporter:
         added separately. NOTE: this assumes uniqueness of features. Quite an edge case but if it ever comes
         up it needs to be solved somewhere here.
         """
-        # TODO: This could be improved
-        all_attributes = self.get_attributes_for_feature_hash(feature_hash)
-        for attribute in all_attributes:
-            is_matching_attribute = attribute.dynamic == match_dynamic_attributes
-            if is_matching_attribute:
-                if attribute.get_property_type() == PropertyType.CHECKLIST:
-                    for option in attribute.options:  # type: ignore[union-attr]
-                        if option.label not in attributes_dict:
+        key = (feature_hash, match_dynamic_attributes)
+        defaults = self._unselected_attributes_cache.get(key)
+        if defaults is None:
+            defaults = {}
+            for attribute in self.get_attributes_for_feature_hash(feature_hash):
+                is_matching_attribute = attribute.dynamic == match_dynamic_attributes
+                if is_matching_attribute:
+                    if attribute.get_property_type() == PropertyType.CHECKLIST:
+                        for option in attribute.options:  # type: ignore[union-attr]
                             # We need to add the default of False.
-                            attributes_dict[option.label] = False
-                else:
-                    if attribute.name not in attributes_dict:
-                        attributes_dict[attribute.name] = None
+                            defaults.setdefault(option.label, False)
+                    else:
+                        defaults.setdefault(attribute.name, None)
+            self._unselected_attributes_cache[key] = defaults
 
-    def get_attributes_for_feature_hash(self, feature_hash: str) -> List[Attribute]:
-        ret = []
+        for name, default in defaults.items():
+            if name not in attributes_dict:
+                attributes_dict[name] = default
 
-        for object_ in self._ontology.objects:
-            if object_.feature_node_hash == feature_hash:
-                for attribute in object_.attributes:
-                    ret.append(attribute)
-                break
-
-        return ret
+    def get_attributes_for_feature_hash(self, feature_hash: str) -> List[Attribute]:
+        return list(self._object_feature_hash_to_attributes_map.get(feature_hash, []))
 
     def get_radio_answer(self, attribute: Attribute, answers: List[Dict[str, str]]) -> Dict[str, str]:
         answer = answers[0]  # radios only have one answer by definition
         return {attribute.name: answer["name"]}
 
     def get_checklist_answer(self, attribute: Attribute, answers: List[Dict[str, Any]]) -> Dict[str, bool]:
-        ret: Dict[str, bool] = {}
-        found_checklist_answers: Set[str] = set()
+        option_labels = self._checklist_option_labels_cache.get(attribute.feature_node_hash)
+        if option_labels is None:
+            option_labels = [option.label for option in attribute.options]  # type: ignore[union-attr]
+            self._checklist_option_labels_cache[attribute.feature_node_hash] = option_labels
 
-        for answer in answers:
-            found_checklist_answers.add(answer["name"])
-
-        for option in attribute.options:  # type: ignore[union-attr]
-            label = option.label
-            ret[label] = label in found_checklist_answers
-
-        return ret
+        found_checklist_answers: Set[str] = {answer["name"] for answer in answers}
+        return {label: label in found_checklist_answers for label in option_labels}
 
     def get_text_answer(self, attribute: Attribute, answers: str) -> Dict[str, Any]:
         return {attribute.name: answers}
@@ -1175,3 +1433,11 @@ class CocoExporter:
 
     def get_image_id(self, data_hash: str, frame_num: int = 0) -> int:
         return self._data_hash_to_image_id_map[(data_hash, frame_num)]
+
+
+def _get_shard_annotations(exporter: CocoExporter) -> Tuple[List[CocoAnnotation], Dict[str, int]]:
+    """Convert the annotations of a shard in a worker of :meth:`CocoExporter.export_parallel`.
+
+    Annotation and track ids start at 0 in every shard, the track ids are returned by object hash to be remapped.
+    """
+    return exporter.get_all_annotations(), exporter._object_hash_to_track_id_map
@@ -1,10 +1,26 @@
+import json
 import logging
+from array import array
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
+from pathlib import Path
 from typing import (
+    Callable,
+    Deque,
     Dict,
+    List,
+    NamedTuple,
     Optional,
+    Sequence,
+    Set,
+    Tuple,
     Union,
+    cast,
 )
 
+from encord.common.deprecated import deprecated
+from encord.common.json_stream import iter_json_array_items
 from encord.objects.bitmask import BitmaskCoordinates
 from encord.objects.common import Shape
 from encord.objects.coordinates import BoundingBoxCoordinates, PolygonCoordinates
@@ -14,16 +30,28 @@ from encord.project import Project
 from encord.utilities.coco.datastructure import (
     CategoryID,
     CocoAnnotationModel,
+    CocoImageModel,
     CocoPolygon,
     CocoRLE,
     CocoRootModel,
     FrameIndex,
     ImageID,
 )
-from encord.utilities.coco.polygon_utils import rle_to_polygons_coordinates
+from encord.utilities.coco.polygon_utils import rle_to_polygons_coordinates, rles_to_polygons_coordinates
 
 logger = logging.getLogger()
 
+IMPORT_COCO_LABELS_CHUNK_SIZE = 100
+
+EncordCoordinates = Union[PolygonCoordinates, BoundingBoxCoordinates, BitmaskCoordinates]
+
+
+class CocoAnnotationToImport(NamedTuple):
+    annotation: CocoAnnotationModel
+    frame_index: FrameIndex
+    ontology_object: Object
+    image: CocoImageModel
+
 
 def build_category_id_to_encord_ontology_object_map(
     project: Project,
@@ -37,6 +65,7 @@ def build_category_id_to_encord_ontology_object_map(
     return map_category_to_encord_object
 
 
+@deprecated(version="0.1.191", alternative="import_coco_labels")
 def initialise_label_rows(
     project: Project,
     image_id_to_frame_index: Dict[ImageID, FrameIndex],
@@ -50,6 +79,82 @@ def initialise_label_rows(
     return {lr.data_hash: lr for lr in label_rows}
 
 
+def _match_annotation(
+    i: int,
+    annotation: CocoAnnotationModel,
+    category_id_to_objects: Dict[CategoryID, Object],
+    image_id_to_frame_index: Dict[ImageID, FrameIndex],
+    data_hashes: Set[str],
+) -> Optional[Tuple[FrameIndex, Object]]:
+    """Match the `i`-th annotation with its frame and ontology object, or return `None` with a warning.
+
+    Raises a `ValueError` if the segmentation of the annotation cannot be imported as the shape of its object.
+    """
+    image_id, category_id = annotation.image_id, annotation.category_id
+    frame_idx = image_id_to_frame_index.get(image_id)
+    if frame_idx is None:
+        # TODO not clear how to propagate errors
+        logger.warning(
+            f'Image id `{image_id}` from `labels_dict["annotations"][{i}]` could not be matched with the provided `image_id_to_frame_index`. Skipping this annotation.'
+        )
+        return None
+
+    if frame_idx.data_hash not in data_hashes:
+        logger.warning(
+            f"Data hash `{frame_idx.data_hash}` from `image_id_to_frame_index` could not be matched with a data hash in the provided `project`. Skipping annotation ad index {i}."
+        )
+        # TODO not clear how to propagate errors
+        return None
+
+    ont_obj = category_id_to_objects.get(category_id)
+    if ont_obj is None:
+        logger.warning(
+            f'Category ID {category_id} from `labels_dict["annotations"][{i}]` could not be matched with the provided `category_id_to_feature_hash`. Skipping this annotation.'
+        )
+        # TODO not clear how to propagate errors
+        return None
+
+    _check_segmentation_matches_shape(annotation, ont_obj.shape)
+    return frame_idx, ont_obj
+
+
+def _missing_image_error(image_id: ImageID) -> ValueError:
+    return ValueError(
+        f"The provided coco annotation dictionary have annotations with `image_id`s that do not match any image ids in the provided `images` list. Couldn't find image id {image_id}."
+    )
+
+
+def group_annotations_by_data_hash(
+    coco: CocoRootModel,
+    category_id_to_objects: Dict[CategoryID, Object],
+    image_id_to_frame_index: Dict[ImageID, FrameIndex],
+    data_hashes: Set[str],
+) -> Dict[str, List[CocoAnnotationToImport]]:
+    """Match every annotation with its frame, ontology object and image, and group them by the data hash of the frame.
+
+    Annotations that cannot be matched are skipped with a warning, and a `ValueError` is raised for annotations whose
+    segmentation does not fit the shape of their object. Annotations of the same data hash keep their order.
+    """
+    coco_image_lookup = {i.id: i for i in coco.images}
+    annotations_by_data_hash: Dict[str, List[CocoAnnotationToImport]] = defaultdict(list)
+
+    for i, annotation in enumerate(coco.annotations):
+        match = _match_annotation(i, annotation, category_id_to_objects, image_id_to_frame_index, data_hashes)
+        if match is None:
+            continue
+        frame_idx, ont_obj = match
+
+        coco_image = coco_image_lookup.get(annotation.image_id)
+        if coco_image is None:
+            raise _missing_image_error(annotation.image_id)
+
+        annotations_by_data_hash[frame_idx.data_hash].append(
+            CocoAnnotationToImport(annotation, frame_idx, ont_obj, coco_image)
+        )
+
+    return annotations_by_data_hash
+
+
 def import_coco_labels(
     project: Project,
     coco: CocoRootModel,
@@ -57,84 +162,347 @@ def import_coco_labels(
     image_id_to_frame_index: Dict[ImageID, FrameIndex],
     branch_name: Optional[str] = None,
     confidence_field_name: Optional[str] = None,
+    chunk_size: int = IMPORT_COCO_LABELS_CHUNK_SIZE,
+    max_workers: Optional[int] = None,
 ) -> None:
-    label_rows = initialise_label_rows(project, image_id_to_frame_index, branch_name=branch_name)
+    """Import the annotations of `coco` into the label rows of `project`, `chunk_size` label rows at a time.
+
+    All annotations are matched before anything is saved, and their segmentation is checked against the shape of
+    their ontology object. Then the labels of every chunk of label rows are initialised, the annotations added and the
+    rows saved, while the next chunk is initialised and the previous one is saved in the background. At most three
+    chunks of labels are held in memory at a time.
+
+    Annotations are only converted to Encord coordinates with their chunk, so conversion errors, e.g. an empty RLE
+    mask imported as a polygon or a frame out of bounds, fail the import part-way through. The label rows of earlier
+    chunks are then already saved.
+
+    The annotations of a chunk are converted together, see :func:`coco_annotations_to_encord_coordinates`, with
+    `max_workers` threads for RLE masks imported as polygons.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
+    data_hashes = list({frame_index.data_hash for frame_index in image_id_to_frame_index.values()})
+    # Rows are popped from the queue once they are scheduled, so the labels of saved chunks can be freed
+    label_rows = deque(project.list_label_rows_v2(data_hashes=data_hashes, branch_name=branch_name))
     category_id_to_objects = build_category_id_to_encord_ontology_object_map(project, category_id_to_feature_hash)
-    coco_image_lookup = {i.id: i for i in coco.images}
+    annotations_by_data_hash = group_annotations_by_data_hash(
+        coco, category_id_to_objects, image_id_to_frame_index, {lr.data_hash for lr in label_rows}
+    )
 
-    for i, annotation in enumerate(coco.annotations):
-        frame_idx = image_id_to_frame_index.get(annotation.image_id)
-        if frame_idx is None:
-            # TODO not clear how to propagate errors
-            logger.warning(
-                f'Image id `{annotation.image_id}` from `labels_dict["annotations"][{i}]` could not be matched with the provided `image_id_to_frame_index`. Skipping this annotation.'
-            )
-            continue
+    def add_annotations(chunk: List[LabelRowV2]) -> None:
+        add_coco_annotations(
+            [
+                (label_row, annotation)
+                for label_row in chunk
+                for annotation in annotations_by_data_hash.pop(label_row.data_hash, [])
+            ],
+            confidence_field_name,
+            max_workers=max_workers,
+        )
 
-        label_row = label_rows.get(frame_idx.data_hash)
-        if label_row is None:
-            logger.warning(
-                f"Data hash `{frame_idx.data_hash}` from `image_id_to_frame_index` could not be matched with a data hash in the provided `project`. Skipping annotation ad index {i}."
-            )
-            # TODO not clear how to propagate errors
-            continue
+    _import_label_rows_in_chunks(project, label_rows, add_annotations, chunk_size)
 
-        ont_obj = category_id_to_objects.get(annotation.category_id)
-        if ont_obj is None:
-            logger.warning(
-                f'Category ID {annotation.category_id} from `labels_dict["annotations"][{i}]` could not be matched with the provided `category_id_to_feature_hash`. Skipping this annotation.'
-            )
-            # TODO not clear how to propagate errors
-            continue
 
-        coco_image = coco_image_lookup.get(annotation.image_id)
-        if coco_image is None:
-            raise ValueError(
-                f"The provided coco annotation dictionary have annotations with `image_id`s that do not match any image ids in the provided `images` list. Couldn't find image id {annotation.image_id}."
+def import_coco_labels_from_file(
+    project: Project,
+    path: Union[str, Path],
+    category_id_to_feature_hash: Dict[CategoryID, str],
+    image_id_to_frame_index: Dict[ImageID, FrameIndex],
+    branch_name: Optional[str] = None,
+    confidence_field_name: Optional[str] = None,
+    chunk_size: int = IMPORT_COCO_LABELS_CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+) -> None:
+    """Same as :func:`import_coco_labels`, but streams the COCO JSON file at `path` instead of loading it.
+
+    The file is parsed one item at a time. The first pass validates every annotation and checks its segmentation, but
+    keeps only the images and the position in the file of the matched annotations. Each annotation is then read again
+    and converted when the chunk of its label row is imported, so the memory used does not grow with the size of the
+    annotations. As with :func:`import_coco_labels`, a conversion error leaves the label rows of earlier chunks saved.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+
+    data_hashes = list({frame_index.data_hash for frame_index in image_id_to_frame_index.values()})
+    # Rows are popped from the queue once they are scheduled, so the labels of saved chunks can be freed
+    label_rows = deque(project.list_label_rows_v2(data_hashes=data_hashes, branch_name=branch_name))
+    label_row_data_hashes = {lr.data_hash for lr in label_rows}
+    category_id_to_objects = build_category_id_to_encord_ontology_object_map(project, category_id_to_feature_hash)
+
+    coco_image_lookup: Dict[ImageID, CocoImageModel] = {}
+    # Start and end byte offsets of the matched annotations, flattened, by data hash
+    annotation_offsets_by_data_hash: Dict[str, array] = defaultdict(lambda: array("q"))
+    annotated_image_ids: Dict[ImageID, None] = {}
+
+    with open(path, "rb") as f:
+        annotation_index = 0
+        for item in iter_json_array_items(f, ["images", "annotations"]):
+            if item.key == "images":
+                image = CocoImageModel.from_dict(item.value)
+                coco_image_lookup[image.id] = image
+                continue
+
+            # Validated here so that a malformed annotation fails the import before anything is saved
+            coco_annotation = CocoAnnotationModel.from_dict(item.value)
+            match = _match_annotation(
+                annotation_index,
+                coco_annotation,
+                category_id_to_objects,
+                image_id_to_frame_index,
+                label_row_data_hashes,
             )
+            annotation_index += 1
+            if match is None:
+                continue
+            annotation_offsets_by_data_hash[match[0].data_hash].extend((item.start, item.end))
+            annotated_image_ids[coco_annotation.image_id] = None
 
-        confidence = annotation.get_extra(confidence_field_name) if confidence_field_name is not None else None
-        coordinates = coco_annotation_to_encord_coordinates(
-            coco_annotation=annotation,
-            shape=ont_obj.shape,
-            width=coco_image.width,
-            height=coco_image.height,
-        )
-        obj_instance = ont_obj.create_instance()
-        obj_instance.set_for_frames(coordinates=coordinates, frames=frame_idx.frame, confidence=confidence)
-        label_row.add_object_instance(obj_instance)
+    # Images may come after the annotations in the file, so they can only be checked once it is read
+    for image_id in annotated_image_ids:
+        if image_id not in coco_image_lookup:
+            raise _missing_image_error(image_id)
 
-    with project.create_bundle() as bundle:
-        for label_row in label_rows.values():
-            label_row.save(bundle=bundle)
+    with open(path, "rb") as f:
 
+        def add_annotations(chunk: List[LabelRowV2]) -> None:
+            label_row_annotations: List[Tuple[LabelRowV2, CocoAnnotationToImport]] = []
+            for label_row in chunk:
+                offsets = annotation_offsets_by_data_hash.pop(label_row.data_hash, array("q"))
+                for start, end in zip(offsets[::2], offsets[1::2]):
+                    f.seek(start)
+                    coco_annotation = CocoAnnotationModel.from_dict(json.loads(f.read(end - start)))
+                    frame_idx = image_id_to_frame_index[coco_annotation.image_id]
+                    ont_obj = category_id_to_objects[coco_annotation.category_id]
+                    annotation = CocoAnnotationToImport(
+                        coco_annotation, frame_idx, ont_obj, coco_image_lookup[coco_annotation.image_id]
+                    )
+                    label_row_annotations.append((label_row, annotation))
+            add_coco_annotations(label_row_annotations, confidence_field_name, max_workers=max_workers)
 
-def coco_annotation_to_encord_coordinates(
-    coco_annotation: CocoAnnotationModel,
-    shape: Shape,
-    width: int,
-    height: int,
-) -> Union[PolygonCoordinates, BoundingBoxCoordinates, BitmaskCoordinates]:
+        _import_label_rows_in_chunks(project, label_rows, add_annotations, chunk_size)
+
+
+def _import_label_rows_in_chunks(
+    project: Project,
+    label_rows: Deque[LabelRowV2],
+    add_annotations: Callable[[List[LabelRowV2]], None],
+    chunk_size: int,
+) -> None:
+    """Initialise, label with `add_annotations` and save `label_rows`, `chunk_size` rows at a time.
+
+    The next chunk is initialised and the previous one is saved in the background while a chunk is labelled. Rows are
+    popped from `label_rows` as they are scheduled, so once saved they are freed unless the caller keeps other
+    references to them.
+    """
+
+    def next_chunk() -> List[LabelRowV2]:
+        return [label_rows.popleft() for _ in range(min(chunk_size, len(label_rows)))]
+
+    def initialise_chunk(chunk: List[LabelRowV2]) -> List[LabelRowV2]:
+        with project.create_bundle() as bundle:
+            for lr in chunk:
+                lr.initialise_labels(bundle=bundle)
+        return chunk
+
+    def save_chunk(chunk: List[LabelRowV2]) -> None:
+        with project.create_bundle() as bundle:
+            for lr in chunk:
+                lr.save(bundle=bundle)
+
+    # One thread initialises the next chunk while the other one saves the previous chunk
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        initialising = executor.submit(initialise_chunk, next_chunk())
+        saving: Optional[Future] = None
+        while True:
+            chunk = initialising.result()
+            if not chunk:
+                break
+            initialising = executor.submit(initialise_chunk, next_chunk())
+
+            add_annotations(chunk)
+
+            if saving is not None:
+                saving.result()
+            saving = executor.submit(save_chunk, chunk)
+            del chunk
+
+        if saving is not None:
+            saving.result()
+
+
+def add_coco_annotation(
+    label_row: LabelRowV2,
+    annotation: CocoAnnotationToImport,
+    confidence_field_name: Optional[str] = None,
+) -> None:
+    coco_annotation, _, ont_obj, coco_image = annotation
+    coordinates = coco_annotation_to_encord_coordinates(
+        coco_annotation=coco_annotation,
+        shape=ont_obj.shape,
+        width=coco_image.width,
+        height=coco_image.height,
+    )
+    _add_object_instance(label_row, annotation, coordinates, confidence_field_name)
+
+
+def add_coco_annotations(
+    label_row_annotations: Sequence[Tuple[LabelRowV2, CocoAnnotationToImport]],
+    confidence_field_name: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> None:
+    """Same as :func:`add_coco_annotation` for many annotations, whose coordinates are converted in one batch."""
+    all_coordinates = coco_annotations_to_encord_coordinates(
+        [annotation for _, annotation in label_row_annotations], max_workers=max_workers
+    )
+    for (label_row, annotation), coordinates in zip(label_row_annotations, all_coordinates):
+        _add_object_instance(label_row, annotation, coordinates, confidence_field_name)
+
+
+def _add_object_instance(
+    label_row: LabelRowV2,
+    annotation: CocoAnnotationToImport,
+    coordinates: EncordCoordinates,
+    confidence_field_name: Optional[str],
+) -> None:
+    coco_annotation, frame_idx, ont_obj, _ = annotation
+    confidence = coco_annotation.get_extra(confidence_field_name) if confidence_field_name is not None else None
+    obj_instance = ont_obj.create_instance()
+    obj_instance.set_for_frames(coordinates=coordinates, frames=frame_idx.frame, confidence=confidence)
+    label_row.add_object_instance(obj_instance)
+
+
+def _check_segmentation_matches_shape(coco_annotation: CocoAnnotationModel, shape: Shape) -> None:
     if shape == Shape.BOUNDING_BOX:
-        return coco_annotation.bbox.to_encord(img_w=width, img_h=height)
+        return
     elif shape == Shape.BITMASK:
         if not isinstance(coco_annotation.segmentation, CocoRLE):
             raise ValueError(
                 f"Mismatch in `labels_dict` for annotation id {coco_annotation.id}. Expected format was an RLE."
             )
-        return coco_annotation.segmentation.to_bitmask()
     elif shape == Shape.POLYGON:
-        if isinstance(coco_annotation.segmentation, CocoPolygon):
-            return coco_annotation.segmentation.to_encord(img_w=width, img_h=height)
-        elif isinstance(coco_annotation.segmentation, CocoRLE):
-            return rle_to_polygons_coordinates(
-                counts=coco_annotation.segmentation.counts,
-                height=coco_annotation.segmentation.size.height,
-                width=coco_annotation.segmentation.size.width,
-            )
-        else:
+        if not isinstance(coco_annotation.segmentation, (CocoPolygon, CocoRLE)):
             raise ValueError(
                 f"Mismatch in `labels_dict` for annotation id {coco_annotation.id}. Expected format was a list of polygons or RLE string."
             )
     else:
         raise ValueError(f"Ontology objects of shape {shape} are not supported for coco import")
+
+
+def coco_annotation_to_encord_coordinates(
+    coco_annotation: CocoAnnotationModel,
+    shape: Shape,
+    width: int,
+    height: int,
+) -> EncordCoordinates:
+    _check_segmentation_matches_shape(coco_annotation, shape)
+    segmentation = coco_annotation.segmentation
+    if shape == Shape.BOUNDING_BOX:
+        return coco_annotation.bbox.to_encord(img_w=width, img_h=height)
+    elif shape == Shape.BITMASK:
+        return cast(CocoRLE, segmentation).to_bitmask()
+    elif isinstance(segmentation, CocoPolygon):
+        return segmentation.to_encord(img_w=width, img_h=height)
+    else:
+        segmentation = cast(CocoRLE, segmentation)
+        return rle_to_polygons_coordinates(
+            counts=segmentation.counts,
+            height=segmentation.size.height,
+            width=segmentation.size.width,
+        )
+
+
+def coco_annotations_to_encord_coordinates(
+    annotations: Sequence[CocoAnnotationToImport],
+    max_workers: Optional[int] = None,
+) -> List[EncordCoordinates]:
+    """Same as :func:`coco_annotation_to_encord_coordinates` for many annotations at once.
+
+    The boxes and polygons of all annotations are normalised with a single NumPy operation each, and polygons are
+    created from the normalised arrays without a `PointCoordinate` per point. The contours of RLE masks imported as
+    polygons are found on `max_workers` threads, see :func:`rles_to_polygons_coordinates`.
+
+    Args:
+        annotations: The annotations to convert, with the ontology object and image of each.
+        max_workers: The number of threads for RLE masks imported as polygons.
+
+    Returns:
+        The coordinates of each annotation, in the order of `annotations`.
+    """
+    try:
+        import numpy as np  # type: ignore[missing-import]
+    except ImportError as e:
+        raise ImportError(
+            "The 'numpy' package is required to convert COCO annotations in batches. "
+            "Install it with: `pip install encord[coco]`"
+        ) from e
+
+    coordinates: List[Optional[EncordCoordinates]] = [None] * len(annotations)
+    box_indices: List[int] = []
+    polygon_indices: List[int] = []
+    rle_indices: List[int] = []
+    for i, (coco_annotation, _, ont_obj, coco_image) in enumerate(annotations):
+        segmentation = coco_annotation.segmentation
+        if ont_obj.shape == Shape.BOUNDING_BOX:
+            box_indices.append(i)
+        elif (
+            ont_obj.shape == Shape.POLYGON
+            and isinstance(segmentation, CocoPolygon)
+            and segmentation.values
+            and all(segmentation.values)
+        ):
+            polygon_indices.append(i)
+        elif ont_obj.shape == Shape.POLYGON and isinstance(segmentation, CocoRLE):
+            rle_indices.append(i)
+        else:
+            # Bitmasks need no normalisation, the rest are empty polygons or errors
+            coordinates[i] = coco_annotation_to_encord_coordinates(
+                coco_annotation=coco_annotation,
+                shape=ont_obj.shape,
+                width=coco_image.width,
+                height=coco_image.height,
+            )
+
+    if box_indices:
+        boxes = np.fromiter(
+            chain.from_iterable(annotations[i].annotation.bbox for i in box_indices),
+            dtype=np.float64,
+            count=4 * len(box_indices),
+        ).reshape(-1, 4)
+        sizes = np.array([(annotations[i].image.width, annotations[i].image.height) for i in box_indices])
+        for i, (x, y, w, h) in zip(box_indices, (boxes / np.tile(sizes, 2)).tolist()):
+            coordinates[i] = BoundingBoxCoordinates(top_left_x=x, top_left_y=y, width=w, height=h)
+
+    if polygon_indices:
+        rings = [
+            ring for i in polygon_indices for ring in cast(CocoPolygon, annotations[i].annotation.segmentation).values
+        ]
+        ring_lengths = np.array([len(ring) for ring in rings])
+        annotation_lengths = [
+            sum(len(ring) for ring in cast(CocoPolygon, annotations[i].annotation.segmentation).values)
+            for i in polygon_indices
+        ]
+        # `fromiter` over the flat values is much faster than `np.array` over the point tuples
+        points = np.fromiter(
+            chain.from_iterable(chain.from_iterable(rings)), dtype=np.float64, count=2 * int(ring_lengths.sum())
+        ).reshape(-1, 2)
+        sizes = np.array([(annotations[i].image.width, annotations[i].image.height) for i in polygon_indices])
+        normalised_rings = iter(
+            np.split(points / np.repeat(sizes, annotation_lengths, axis=0), np.cumsum(ring_lengths)[:-1])
+        )
+        for i in polygon_indices:
+            segmentation = cast(CocoPolygon, annotations[i].annotation.segmentation)
+            # Each polygon in the list is disjoint and has a single contour, as in `CocoPolygon.to_encord`
+            coordinates[i] = PolygonCoordinates.from_polygon_arrays(
+                [[next(normalised_rings)] for _ in segmentation.values]
+            )
+
+    if rle_indices:
+        rles = [
+            (segmentation.counts, segmentation.size.height, segmentation.size.width)
+            for segmentation in (cast(CocoRLE, annotations[i].annotation.segmentation) for i in rle_indices)
+        ]
+        for i, polygon_coordinates in zip(rle_indices, rles_to_polygons_coordinates(rles, max_workers=max_workers)):
+            coordinates[i] = polygon_coordinates
+
+    return cast(List[EncordCoordinates], coordinates)
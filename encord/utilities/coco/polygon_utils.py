@@ -1,23 +1,14 @@
-from typing import Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from encord.common.bitmask_operations import deserialise_bitmask
 from encord.objects.coordinates import PolygonCoordinates
 
+RLE_TO_POLYGONS_MAX_WORKERS = 8
 
-def find_contours(mask: Any) -> List[List[List[float]]]:
-    """
-    Find all contours in the given binary mask, including inner contours.
-    Returns polygons in GeoJSON format: triple nested list where:
-    - Top level = polygon
-    - Second level = list of rings (first is outer contour, rest are inner/holes)
-    - Third level = flat list of coordinates [x1, y1, x2, y2, ...]
-
-    Args:
-        mask: np.ndarray
 
-    Returns:
-        List of polygons in GeoJSON format
-    """
+def _find_contour_arrays(mask: Any) -> List[List[Any]]:
+    """Same as :func:`find_contours`, but every ring is an int32 array of shape [K, 2] of (x, y) points."""
     try:
         import cv2
         import numpy as np
@@ -32,33 +23,38 @@ def find_contours(mask: Any) -> List[List[List[float]]]:
         cv2.RETR_CCOMP,  # Retrieves all contours and organizes them into a two-level hierarchy
         cv2.CHAIN_APPROX_SIMPLE,
     )
+    if hierarchy is None or len(hierarchy) == 0:
+        return []
 
-    polygons: List[List[List[float]]] = []
-
-    # First, identify all outer contours (hierarchy[i][3] == -1)
-    if hierarchy is not None and len(hierarchy) > 0:
-        hierarchy = hierarchy[0]
+    # hierarchy[0][i][3] is the parent of contour i: -1 for outer contours, the outer contour's index for holes.
+    # Grouping by parent in one pass keeps the contour order of cv2, outer contours first within each polygon.
+    parents = hierarchy[0][:, 3].tolist()
+    polygons_by_outer_index: Dict[int, List[Any]] = {}
+    for i, parent in enumerate(parents):
+        if parent == -1:
+            polygons_by_outer_index[i] = [contours[i].reshape(-1, 2)]
+    for i, parent in enumerate(parents):
+        if parent != -1:
+            polygons_by_outer_index[parent].append(contours[i].reshape(-1, 2))
 
-        for i, contour in enumerate(contours):
-            if hierarchy[i][3] == -1:  # This is an outer contour
-                # Create a new polygon with this outer contour as the first ring
-                polygon = []
+    return list(polygons_by_outer_index.values())
 
-                # Add outer contour as first ring
-                outer_contour = contour.reshape(-1).tolist()
-                polygon.append(outer_contour)
 
-                # Find all holes for this contour
-                for j, inner_contour in enumerate(contours):
-                    # hierarchy[j][3] == i means this contour is a direct child of the outer contour
-                    if hierarchy[j][3] == i:
-                        # Add this inner contour (hole) to the polygon
-                        inner_points = inner_contour.reshape(-1).tolist()
-                        polygon.append(inner_points)
+def find_contours(mask: Any) -> List[List[List[float]]]:
+    """
+    Find all contours in the given binary mask, including inner contours.
+    Returns polygons in GeoJSON format: triple nested list where:
+    - Top level = polygon
+    - Second level = list of rings (first is outer contour, rest are inner/holes)
+    - Third level = flat list of coordinates [x1, y1, x2, y2, ...]
 
-                polygons.append(polygon)
+    Args:
+        mask: np.ndarray
 
-    return polygons
+    Returns:
+        List of polygons in GeoJSON format
+    """
+    return [[ring.reshape(-1).tolist() for ring in polygon] for polygon in _find_contour_arrays(mask)]
 
 
 def rle_to_polygons_coordinates(*, counts: str, height: int, width: int) -> PolygonCoordinates:
@@ -71,11 +67,35 @@ def rle_to_polygons_coordinates(*, counts: str, height: int, width: int) -> Poly
         ) from e
     buffer = deserialise_bitmask(counts, height * width)
     data: np.ndarray = np.frombuffer(buffer, dtype=np.uint8).reshape((height, width))
-    polygons = find_contours(data)
     # make coordinates relative to image size
-    for polygon in polygons:
-        for ring in polygon:
-            for i in range(0, len(ring), 2):
-                ring[i] /= width
-                ring[i + 1] /= height
-    return PolygonCoordinates.from_polygons_list(polygons)
+    scale = np.array([width, height], dtype=np.float64)
+    polygons = [[ring / scale for ring in polygon] for polygon in _find_contour_arrays(data)]
+    return PolygonCoordinates.from_polygon_arrays(polygons)
+
+
+def rles_to_polygons_coordinates(
+    rles: Sequence[Tuple[str, int, int]], *, max_workers: Optional[int] = None
+) -> List[PolygonCoordinates]:
+    """Convert many RLE masks to polygons at once, see :func:`rle_to_polygons_coordinates`.
+
+    Decoding and contour finding release the GIL, so the masks are converted on a thread pool.
+
+    Args:
+        rles: The masks as `(counts, height, width)` tuples.
+        max_workers: The number of threads, defaults to `RLE_TO_POLYGONS_MAX_WORKERS`.
+
+    Returns:
+        The polygons of each mask, in the order of `rles`.
+    """
+    if len(rles) <= 1:
+        return [
+            rle_to_polygons_coordinates(counts=counts, height=height, width=width) for counts, height, width in rles
+        ]
+
+    with ThreadPoolExecutor(max_workers=max_workers or RLE_TO_POLYGONS_MAX_WORKERS) as executor:
+        return list(
+            executor.map(
+                lambda rle: rle_to_polygons_coordinates(counts=rle[0], height=rle[1], width=rle[2]),
+                rles,
+            )
+        )
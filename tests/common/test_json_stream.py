@@ -0,0 +1,56 @@
+import io
+import json
+
+import pytest
+
+from encord.common.json_stream import iter_json_array_items
+
+DOCUMENT = {
+    "info": {"description": "ünïcode", "year": 2024},
+    "annotations": [
+        {"id": i, "image_id": i % 3, "bbox": [1.5, 2, 3, 4e-3], "note": None, "name": 'a"]},' + "é" * i}
+        for i in range(20)
+    ],
+    "licenses": [],
+    "images": [{"id": i, "file_name": f"ïmage-{i}.jpg", "width": 640, "height": 480} for i in range(3)],
+    "count": 1234567,
+}
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+@pytest.mark.parametrize("read_size", [1, 7, 1 << 20])
+def test_iter_json_array_items(indent, read_size):
+    data = json.dumps(DOCUMENT, indent=indent, ensure_ascii=False).encode("utf-8")
+
+    items = list(iter_json_array_items(io.BytesIO(data), ["images", "annotations", "licenses"], read_size=read_size))
+
+    assert [item.value for item in items if item.key == "annotations"] == DOCUMENT["annotations"]
+    assert [item.value for item in items if item.key == "images"] == DOCUMENT["images"]
+    assert {item.key for item in items} == {"annotations", "images"}
+    for item in items:
+        assert json.loads(data[item.start : item.end]) == item.value
+
+
+NUMBERS_DOCUMENT = (
+    b'{"version": 1.0, "x": [123.5, -0.25e-3, 7], "images": [{"id": 1, "bbox": [1.5, 2E+2, 30]}, 4.75], "n": 12}'
+)
+
+
+@pytest.mark.parametrize("read_size", range(1, len(NUMBERS_DOCUMENT) + 1))
+def test_iter_json_array_items_numbers_split_across_reads(read_size):
+    items = list(iter_json_array_items(io.BytesIO(NUMBERS_DOCUMENT), ["x", "images"], read_size=read_size))
+
+    document = json.loads(NUMBERS_DOCUMENT)
+    assert [item.value for item in items] == document["x"] + document["images"]
+    for item in items:
+        assert json.loads(NUMBERS_DOCUMENT[item.start : item.end]) == item.value
+
+
+def test_iter_json_array_items_empty_object():
+    assert list(iter_json_array_items(io.BytesIO(b" { } "), ["images"])) == []
+
+
+@pytest.mark.parametrize("data", [b"[]", b'{"images": [1, 2', b'{"images": [1] "annotations": []}'])
+def test_iter_json_array_items_invalid_json(data):
+    with pytest.raises(ValueError):
+        list(iter_json_array_items(io.BytesIO(data), ["images"]))
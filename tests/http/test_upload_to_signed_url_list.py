@@ -0,0 +1,114 @@
+import threading
+from pathlib import Path
+from typing import Any, List
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from encord.exceptions import CloudUploadError
+from encord.http import utils
+from encord.http.utils import CloudUploadSettings, _UploadConcurrency, upload_to_signed_url_list
+from encord.http.v2.payloads import Page
+from encord.orm.storage import StorageItemType, UploadSignedUrl
+
+
+class _ApiClient:
+    """Serves presigned URLs and records when each batch was requested."""
+
+    def __init__(self, events: List[str]) -> None:
+        self.events = events
+        self.lock = threading.Lock()
+
+    def get(self, path: str, params: Any, result_type: Any) -> Any:
+        with self.lock:
+            self.events.append("signed-urls")
+        return Page(
+            results=[
+                UploadSignedUrl(item_uuid=uuid4(), object_key=f"key-{uuid4()}", signed_url=f"https://upload/{uuid4()}")
+                for _ in range(params.count)
+            ]
+        )
+
+
+def _files(tmp_path: Path, count: int) -> List[Path]:
+    file_paths = []
+    for i in range(count):
+        file_path = tmp_path / f"image-{i}.jpg"
+        file_path.write_bytes(b"x" * i)
+        file_paths.append(file_path)
+    return file_paths
+
+
+def _upload(file_paths: List[Path], events: List[str], allow_failures: bool, **kwargs: Any) -> List[dict]:
+    api_client = _ApiClient(events)
+
+    def upload_single_file(file_path: Any, title: str, *args: Any, **kwargs: Any) -> None:
+        with api_client.lock:
+            events.append("upload")
+        if title.endswith("7.jpg"):
+            raise CloudUploadError(f"Error uploading file '{title}'")
+
+    config = MagicMock()
+    config.requests_settings.max_retries = 1
+    config.requests_settings.backoff_factor = 0.0
+    with patch.object(utils, "_upload_single_file", side_effect=upload_single_file):
+        return upload_to_signed_url_list(
+            file_paths,
+            config,
+            api_client,  # type: ignore[arg-type]
+            StorageItemType.IMAGE,
+            CloudUploadSettings(allow_failures=allow_failures),
+            **kwargs,
+        )
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 3])
+def test_upload_to_signed_url_list(tmp_path: Path, max_workers: Any) -> None:
+    file_paths = _files(tmp_path, 450)
+    events: List[str] = []
+
+    results = _upload(file_paths, events, allow_failures=True, max_workers=max_workers)
+
+    expected_titles = [file_path.name for file_path in file_paths if not file_path.name.endswith("7.jpg")]
+    assert [result["title"] for result in results] == expected_titles
+    assert len({result["data_hash"] for result in results}) == len(expected_titles)
+    assert events.count("signed-urls") == 3
+    # The last batch of signed URLs is only requested once the first batch is uploading
+    last_signed_urls = len(events) - 1 - events[::-1].index("signed-urls")
+    assert events.index("upload") < last_signed_urls
+
+
+def test_upload_to_signed_url_list_raises_failures(tmp_path: Path) -> None:
+    with pytest.raises(CloudUploadError):
+        _upload(_files(tmp_path, 10), [], allow_failures=False)
+
+
+def test_upload_to_signed_url_list_without_files() -> None:
+    assert _upload([], [], allow_failures=False) == []
+
+
+def test_upload_concurrency_grows_while_throughput_increases() -> None:
+    concurrency = _UploadConcurrency(initial=4, limit=64, now=0.0)
+    now = 0.0
+    # Throughput grows with the number of workers up to 16, and stays flat after that
+    tried = []
+    while concurrency.concurrency not in tried:
+        workers = concurrency.concurrency
+        tried.append(workers)
+        for _ in range(utils.UPLOAD_CONCURRENCY_WINDOW_UPLOADS_PER_WORKER * workers):
+            now += 1.0 / min(workers, 16)
+            concurrency.record(1000, now)
+
+    assert tried == [4, 8, 16, 32]
+    assert concurrency.concurrency == 16
+    # No more measurements are taken once settled
+    concurrency.record(1000, now + 1000.0)
+    assert concurrency.concurrency == 16
+
+
+def test_upload_concurrency_is_fixed_at_limit() -> None:
+    concurrency = _UploadConcurrency(initial=3, limit=3, now=0.0)
+    for i in range(100):
+        concurrency.record(1000, i * 0.001)
+    assert concurrency.concurrency == 3
@@ -914,3 +914,18 @@ def test_range_list_raises_for_space_based_object(ontology):
     # Act & Assert
     with pytest.raises(LabelRowError):
         _ = object_instance.range_list
+
+
+def test_get_objects_active_at_time_on_audio_space(ontology):
+    label_row = LabelRowV2(DATA_GROUP_METADATA, Mock(), ontology)
+    label_row.from_labels_dict(DATA_GROUP_TWO_AUDIO_NO_LABELS)
+    audio_space = label_row.get_space(id="audio-1-uuid", type_="audio")
+    speaker_1 = audio_obj_ontology_item.create_instance()
+    speaker_2 = audio_obj_ontology_item.create_instance()
+    audio_space.put_object_instance(speaker_1, ranges=[Range(start=30_000, end=40_000)])
+    audio_space.put_object_instance(speaker_2, ranges=[Range(start=37_000, end=38_000)])
+
+    assert audio_space.get_object_instances_at(37_200) == [speaker_1, speaker_2]
+    assert audio_space.get_object_instances_at(39_000) == [speaker_1]
+    assert audio_space.get_object_instances_at(41_000) == []
+    assert audio_space.get_nearest_object_instance(41_000) == speaker_1
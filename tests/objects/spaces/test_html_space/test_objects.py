@@ -773,3 +773,40 @@ def test_update_annotation_for_object_reflected_on_different_spaces(ontology):
         },
     }
     assert not DeepDiff(new_object_answers_dict, EXPECTED_NEW_OBJECT_ANSWERS_DICT)
+
+
+def test_query_objects_by_position_in_node(ontology):
+    label_row = LabelRowV2(DATA_GROUP_METADATA, Mock(), ontology)
+    label_row.from_labels_dict(DATA_GROUP_TWO_HTML_NO_LABELS)
+    html_space = label_row.get_space(id="html-1-uuid", type_="html")
+    in_node = html_text_obj_ontology_item.create_instance()
+    across_nodes = html_text_obj_ontology_item.create_instance()
+    html_space.put_object_instance(
+        in_node, ranges=HtmlRange(start=HtmlNode(xpath="/p[1]", offset=10), end=HtmlNode(xpath="/p[1]", offset=20))
+    )
+    html_space.put_object_instance(
+        across_nodes,
+        ranges=HtmlRange(start=HtmlNode(xpath="/p[1]", offset=50), end=HtmlNode(xpath="/p[2]", offset=5)),
+    )
+
+    assert html_space.get_object_instances_at(HtmlNode(xpath="/p[1]", offset=15)) == [in_node]
+    assert html_space.get_object_instances_at(HtmlNode(xpath="/p[1]", offset=1000)) == [across_nodes]
+    assert html_space.get_object_instances_at(HtmlNode(xpath="/p[2]", offset=3)) == [across_nodes]
+    assert html_space.get_object_instances_at(HtmlNode(xpath="/p[3]", offset=3)) == []
+    assert html_space.get_overlapping_object_instances(
+        HtmlRange(start=HtmlNode(xpath="/p[1]", offset=0), end=HtmlNode(xpath="/p[1]", offset=60))
+    ) == [in_node, across_nodes]
+    assert html_space.get_nearest_object_instance(HtmlNode(xpath="/p[1]", offset=30)) == in_node
+
+    with pytest.raises(LabelRowError):
+        html_space.get_overlapping_object_instances(
+            HtmlRange(start=HtmlNode(xpath="/p[1]", offset=0), end=HtmlNode(xpath="/p[2]", offset=0))
+        )
+
+    [annotation] = in_node.get_annotations()
+    annotation.ranges = HtmlRange(start=HtmlNode(xpath="/p[3]", offset=0), end=HtmlNode(xpath="/p[3]", offset=5))
+    html_space.remove_object_instance(across_nodes.object_hash)
+
+    assert html_space.get_object_instances_at(HtmlNode(xpath="/p[1]", offset=15)) == []
+    assert html_space.get_object_instances_at(HtmlNode(xpath="/p[3]", offset=3)) == [in_node]
+    assert html_space.get_nearest_object_instance(HtmlNode(xpath="/p[1]", offset=30)) is None
@@ -0,0 +1,181 @@
+"""Scale tests for the range-based storage of annotations on long videos.
+
+A scene-level classification on a long video used to take one entry per frame in every frame index. These tests make
+sure the storage stays proportional to the number of ranges instead.
+"""
+
+import time
+from dataclasses import replace
+from unittest.mock import Mock
+
+from encord.objects import Classification, LabelRowV2, Object
+from encord.objects.coordinates import BoundingBoxCoordinates
+from encord.objects.frames import Range
+from tests.objects.common import BASE_LABEL_ROW_METADATA
+from tests.objects.data import empty_video
+from tests.objects.data.all_types_ontology_structure import all_types_structure
+from tests.objects.data.data_group.two_videos import (
+    DATA_GROUP_TWO_VIDEOS_NO_LABELS,
+    DATA_GROUP_WITH_TWO_VIDEOS_METADATA,
+    VIDEO_SPACE_1_INFO,
+    VIDEO_SPACE_2_INFO,
+)
+
+text_classification = all_types_structure.get_child_by_hash("jPOcEsbw", Classification)
+box_ontology_item = all_types_structure.get_child_by_hash("MjI2NzEy", Object)
+
+NUM_FRAMES = 200_000
+# Classification instances on the label row still keep metadata per frame, so use a shorter video there
+NUM_LABEL_ROW_FRAMES = 20_000
+
+# Performance threshold (in seconds)
+PUT_SCENE_CLASSIFICATION_THRESHOLD = 0.1
+FILTER_BY_FRAMES_THRESHOLD = 0.1
+
+
+def _long_video_space_label_row(ontology) -> LabelRowV2:
+    metadata = replace(
+        DATA_GROUP_WITH_TWO_VIDEOS_METADATA,
+        spaces={
+            "video-1-uuid": {**VIDEO_SPACE_1_INFO, "number_of_frames": NUM_FRAMES},
+            "video-2-uuid": VIDEO_SPACE_2_INFO,
+        },
+    )
+    label_row = LabelRowV2(metadata, Mock(), ontology)
+    label_row.from_labels_dict(DATA_GROUP_TWO_VIDEOS_NO_LABELS)
+    return label_row
+
+
+def test_scene_classification_on_video_space_is_stored_as_one_range(ontology):
+    label_row = _long_video_space_label_row(ontology)
+    video_space = label_row.get_space(id="video-1-uuid", type_="video")
+    classification_instance = text_classification.create_instance()
+    classification_instance.set_answer(answer="Scene")
+
+    start = time.perf_counter()
+    video_space.put_classification_instance(classification_instance, frames=Range(0, NUM_FRAMES - 1), confidence=0.5)
+    elapsed = time.perf_counter() - start
+
+    print(f"\nput_classification_instance({NUM_FRAMES} frames): {elapsed:.4f}s")
+    frames_annotation_data = video_space._classification_hash_to_frames_annotation_data[
+        classification_instance.classification_hash
+    ]
+    assert len(list(frames_annotation_data.items())) == 1
+    assert elapsed < PUT_SCENE_CLASSIFICATION_THRESHOLD, (
+        f"put_classification_instance took {elapsed:.4f}s, threshold is {PUT_SCENE_CLASSIFICATION_THRESHOLD}s"
+    )
+    assert label_row._get_classification_instances(include_spaces=True, filter_frames=NUM_FRAMES - 1) == [
+        classification_instance
+    ]
+
+
+def test_updating_one_frame_of_shared_annotation_data(ontology):
+    label_row = _long_video_space_label_row(ontology)
+    video_space = label_row.get_space(id="video-1-uuid", type_="video")
+    object_instance = box_ontology_item.create_instance()
+    coordinates = BoundingBoxCoordinates(height=0.1, width=0.2, top_left_x=0.3, top_left_y=0.4)
+    video_space.put_object_instance(object_instance, frames=Range(0, 999), coordinates=coordinates, confidence=0.5)
+
+    annotations = {annotation.frame: annotation for annotation in video_space.get_annotations(type_="object")}
+    assert len(annotations) == 1000
+    annotations[500].confidence = 0.9
+
+    assert annotations[499].confidence == 0.5
+    assert annotations[500].confidence == 0.9
+    assert annotations[501].confidence == 0.5
+    frames_annotation_data = video_space._object_hash_to_frames_annotation_data[object_instance.object_hash]
+    assert [(start, end) for start, end, _ in frames_annotation_data.items()] == [(0, 499), (500, 500), (501, 999)]
+
+    video_space.remove_object_instance(object_instance.object_hash, frames=Range(100, 899))
+    assert [(start, end) for start, end, _ in frames_annotation_data.items()] == [(0, 99), (900, 999)]
+    assert label_row._get_object_instances(include_spaces=True, filter_frames=950) == [object_instance]
+    assert label_row._get_object_instances(include_spaces=True, filter_frames=500) == []
+
+
+def test_parsed_scene_classification_is_stored_as_one_range(ontology):
+    label_row = _long_video_space_label_row(ontology)
+    video_space = label_row.get_space(id="video-1-uuid", type_="video")
+    classification_instance = text_classification.create_instance()
+    classification_instance.set_answer(answer="Scene")
+    video_space.put_classification_instance(classification_instance, frames=Range(0, 999))
+
+    parsed_label_row = _long_video_space_label_row(ontology)
+    parsed_label_row.from_labels_dict(label_row.to_encord_dict())
+
+    parsed_video_space = parsed_label_row.get_space(id="video-1-uuid", type_="video")
+    frames_annotation_data = parsed_video_space._classification_hash_to_frames_annotation_data[
+        classification_instance.classification_hash
+    ]
+    assert [(start, end) for start, end, _ in frames_annotation_data.items()] == [(0, 999)]
+    assert parsed_label_row.to_encord_dict() == label_row.to_encord_dict()
+
+
+def test_label_row_classification_frames_are_stored_as_ranges(ontology):
+    label_row = LabelRowV2(replace(BASE_LABEL_ROW_METADATA, number_of_frames=NUM_LABEL_ROW_FRAMES), Mock(), ontology)
+    label_row.from_labels_dict(empty_video.labels)
+    classification_instance = text_classification.create_instance()
+    classification_instance.set_answer(answer="Scene")
+    classification_instance.set_for_frames(Range(0, NUM_LABEL_ROW_FRAMES - 1))
+
+    label_row.add_classification_instance(classification_instance)
+
+    assert label_row._hash_to_frames[classification_instance.classification_hash].ranges == [
+        (0, NUM_LABEL_ROW_FRAMES - 1)
+    ]
+    assert label_row._classifications_to_frames[text_classification].ranges == [(0, NUM_LABEL_ROW_FRAMES - 1)]
+
+    classification_instance.remove_from_frames(Range(10, NUM_LABEL_ROW_FRAMES - 1))
+    assert label_row._hash_to_frames[classification_instance.classification_hash].ranges == [(0, 9)]
+    assert label_row.get_classification_instances(filter_frames=9) == [classification_instance]
+    assert label_row.get_classification_instances(filter_frames=10) == []
+
+
+def test_filter_space_instances_by_frame_ranges(ontology):
+    label_row = _long_video_space_label_row(ontology)
+    video_space = label_row.get_space(id="video-1-uuid", type_="video")
+    coordinates = BoundingBoxCoordinates(height=0.1, width=0.2, top_left_x=0.3, top_left_y=0.4)
+    num_instances = 200
+    track_length = NUM_FRAMES // num_instances
+
+    object_instances = []
+    classification_instances = []
+    for i in range(num_instances):
+        # Each instance covers the first half of its own slice of the video
+        frames = Range(i * track_length, i * track_length + track_length // 2 - 1)
+        object_instance = box_ontology_item.create_instance()
+        video_space.put_object_instance(object_instance, frames=frames, coordinates=coordinates)
+        object_instances.append(object_instance)
+        classification_instance = text_classification.create_instance()
+        classification_instance.set_answer(answer=f"Slice {i}")
+        video_space.put_classification_instance(classification_instance, frames=frames)
+        classification_instances.append(classification_instance)
+
+    start = time.perf_counter()
+    all_objects = label_row._get_object_instances(include_spaces=True, filter_frames=Range(0, NUM_FRAMES - 1))
+    all_classifications = label_row._get_classification_instances(
+        include_spaces=True, filter_frames=Range(0, NUM_FRAMES - 1)
+    )
+    # Second halves of every slice are empty
+    no_objects = label_row._get_object_instances(
+        include_spaces=True,
+        filter_frames=[Range(i * track_length + track_length // 2, (i + 1) * track_length - 1) for i in range(10)],
+    )
+    elapsed = time.perf_counter() - start
+
+    print(f"\nfilter {num_instances} objects and classifications by {NUM_FRAMES} frames: {elapsed:.4f}s")
+    assert all_objects == object_instances
+    assert all_classifications == classification_instances
+    assert no_objects == []
+    assert elapsed < FILTER_BY_FRAMES_THRESHOLD, (
+        f"Filtering by frames took {elapsed:.4f}s, threshold is {FILTER_BY_FRAMES_THRESHOLD}s"
+    )
+
+    assert label_row._get_object_instances(
+        include_spaces=True, filter_frames=Range(track_length - 1, track_length + 1)
+    ) == [object_instances[1]]
+    assert label_row._get_classification_instances(include_spaces=True, filter_frames=[0, NUM_FRAMES - 1]) == [
+        classification_instances[0]
+    ]
+    assert video_space._get_object_frames(object_instances[3].object_hash).get_ranges() == [
+        Range(3 * track_length, 3 * track_length + track_length // 2 - 1)
+    ]
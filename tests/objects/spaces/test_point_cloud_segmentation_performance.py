@@ -0,0 +1,90 @@
+"""Performance tests for parsing and serialising point cloud segmentations.
+
+LiDAR segmentations can cover millions of points, so the RLE strings are decoded straight into ranges and encoded
+from them, without materialising the individual point indices.
+"""
+
+import time
+from copy import deepcopy
+from unittest.mock import Mock
+
+import numpy as np
+
+from encord.common.bitmask_operations.bitmask_operations import _rle_to_string, ranges_to_rle_counts
+from encord.objects import LabelRowV2, Object
+from encord.objects.frames import Range
+from tests.objects.data.all_types_ontology_structure import all_types_structure
+from tests.objects.data.data_group.scene import SCENE_METADATA, SCENE_NO_LABELS, SCENE_WITH_LABELS
+
+NUM_POINTS = 5_000_000
+NUM_SEGMENTS = 20_000
+
+# Performance threshold (in seconds)
+PARSE_THRESHOLD = 1.0
+SERIALISE_THRESHOLD = 1.0
+LABEL_ARRAY_THRESHOLD = 1.0
+
+segmentation_ontology_item = all_types_structure.get_child_by_hash("segmentationFeatureNodeHash", Object)
+
+
+def _large_segmentation_ranges() -> list:
+    segment_length = NUM_POINTS // NUM_SEGMENTS
+    # Label the first 90% of every segment
+    return [(i * segment_length, i * segment_length + segment_length * 9 // 10 - 1) for i in range(NUM_SEGMENTS)]
+
+
+def test_parse_and_serialise_multi_million_point_segmentation(ontology):
+    ranges = _large_segmentation_ranges()
+    rle_string = _rle_to_string(ranges_to_rle_counts(ranges))
+    labels = deepcopy(SCENE_WITH_LABELS)
+    labels["spaces"]["path/to/file1.pcd"]["labels"]["objects"][0]["segmentation"] = rle_string
+
+    label_row = LabelRowV2(SCENE_METADATA, Mock(), ontology)
+    start = time.perf_counter()
+    label_row.from_labels_dict(labels)
+    parse_time = time.perf_counter() - start
+
+    space = label_row.get_space(id="path/to/file1.pcd", type_="point_cloud")
+    [annotation] = space.get_annotations("object")
+    num_labelled_points = sum(end - start + 1 for start, end in ranges)
+    print(f"\nparse segmentation with {num_labelled_points} points: {parse_time:.4f}s")
+    assert annotation.ranges == [Range(start, end) for start, end in ranges]
+    assert parse_time < PARSE_THRESHOLD, f"Parsing took {parse_time:.4f}s, threshold is {PARSE_THRESHOLD}s"
+
+    start = time.perf_counter()
+    serialised = label_row.to_encord_dict()
+    serialise_time = time.perf_counter() - start
+
+    print(f"serialise segmentation with {num_labelled_points} points: {serialise_time:.4f}s")
+    assert serialised["spaces"]["path/to/file1.pcd"]["labels"]["objects"][0]["segmentation"] == rle_string
+    assert serialise_time < SERIALISE_THRESHOLD, (
+        f"Serialising took {serialise_time:.4f}s, threshold is {SERIALISE_THRESHOLD}s"
+    )
+
+
+def test_label_array_round_trip_on_multi_million_point_cloud():
+    label_row = LabelRowV2(SCENE_METADATA, Mock(), Mock(structure=all_types_structure))
+    label_row.from_labels_dict(SCENE_NO_LABELS)
+    space = label_row.get_space(id="path/to/file1.pcd", type_="point_cloud")
+    # Cycle between two classes and unlabelled points
+    label_array = np.tile(
+        np.repeat(np.array([1, 2, 0], dtype=np.int32), NUM_POINTS // (3 * NUM_SEGMENTS)), NUM_SEGMENTS
+    )
+
+    start = time.perf_counter()
+    space.from_label_array(label_array, labels={1: segmentation_ontology_item, 2: segmentation_ontology_item})
+    import_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    exported = space.to_label_array(num_points=label_array.shape[0], by="instance")
+    export_time = time.perf_counter() - start
+
+    print(f"\nfrom_label_array({label_array.shape[0]} points): {import_time:.4f}s")
+    print(f"to_label_array({label_array.shape[0]} points): {export_time:.4f}s")
+    assert np.array_equal(exported, label_array)
+    assert import_time < LABEL_ARRAY_THRESHOLD, (
+        f"from_label_array took {import_time:.4f}s, threshold is {LABEL_ARRAY_THRESHOLD}s"
+    )
+    assert export_time < LABEL_ARRAY_THRESHOLD, (
+        f"to_label_array took {export_time:.4f}s, threshold is {LABEL_ARRAY_THRESHOLD}s"
+    )
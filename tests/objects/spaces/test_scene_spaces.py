@@ -1,6 +1,7 @@
 from typing import cast
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 from deepdiff import DeepDiff
 
@@ -319,3 +320,61 @@ def test_point_cloud_segmentation_parses_static_attributes(ontology):
     # The static attribute should be populated from object_answers
     answer = obj.get_answer(segmentation_text_attribute)
     assert answer == "Test attribute answer"
+
+
+SEGMENTATION_LABEL_ID = all_types_structure.objects.index(segmentation_ontology_item) + 1
+
+
+def test_point_cloud_to_label_array():
+    label_row = LabelRowV2(SCENE_METADATA, Mock(), Mock(structure=all_types_structure))
+    label_row.from_labels_dict(SCENE_WITH_LABELS)
+    space = label_row.get_space(id="path/to/file1.pcd", type_="point_cloud")
+    second_instance = segmentation_ontology_item.create_instance()
+    # Overlaps the existing instance on points 4 and 5, and was placed later, so it takes precedence there
+    space.put_object_instance(second_instance, ranges=[Range(4, 7), Range(9, 9)])
+
+    by_feature = space.to_label_array(num_points=12)
+    by_instance = space.to_label_array(num_points=12, by="instance")
+    custom_ids = space.to_label_array(num_points=12, by="instance", label_ids={"hash1": 7})
+
+    assert by_feature.dtype == np.int32
+    s = SEGMENTATION_LABEL_ID
+    assert by_feature.tolist() == [s, s, s, s, s, s, s, s, 0, s, 0, 0]
+    assert by_instance.tolist() == [1, 1, 1, 1, 2, 2, 2, 2, 0, 2, 0, 0]
+    assert custom_ids.tolist() == [7, 7, 7, 7, 7, 7, 0, 0, 0, 0, 0, 0]
+
+    with pytest.raises(LabelRowError):
+        space.to_label_array(num_points=9)
+
+
+def test_point_cloud_from_label_array():
+    label_row = LabelRowV2(SCENE_METADATA, Mock(), Mock(structure=all_types_structure))
+    label_row.from_labels_dict(SCENE_NO_LABELS)
+    space1 = label_row.get_space(id="path/to/file1.pcd", type_="point_cloud")
+    space2 = label_row.get_space(id="path/to/file2.pcd", type_="point_cloud")
+    label_array = np.array([0, 3, 3, 0, 5, 5, 3, 3, 3, 0], dtype=np.uint8)
+
+    created = space1.from_label_array(
+        label_array, labels={3: segmentation_ontology_item, 5: segmentation_ontology_item}, confidence=0.8
+    )
+
+    assert [space1.get_object_ranges(obj) for obj in created] == [
+        [Range(1, 2), Range(6, 8)],
+        [Range(4, 5)],
+    ]
+    assert all(annotation.confidence == 0.8 for annotation in space1.get_annotations("object"))
+    assert space1.to_label_array(num_points=10, by="instance").tolist() == [0, 1, 1, 0, 2, 2, 1, 1, 1, 0]
+
+    # Place an existing instance on a second point cloud, with the default ontology order ids
+    [placed] = space2.from_label_array(
+        np.array([0, 0, SEGMENTATION_LABEL_ID]), labels={SEGMENTATION_LABEL_ID: created[1]}
+    )
+    assert placed is created[1]
+    assert space2.get_object_ranges(placed) == [Range(2, 2)]
+    [default_ids] = space2.from_label_array(np.array([SEGMENTATION_LABEL_ID, 0, 0]))
+    assert default_ids.ontology_item is segmentation_ontology_item
+
+    with pytest.raises(LabelRowError):
+        space1.from_label_array(np.array([0, 1, 2]), labels={1: segmentation_ontology_item})
+    with pytest.raises(LabelRowError):
+        space1.from_label_array(np.array([[0, 1]]))
@@ -904,3 +904,31 @@ def test_range_list_raises_for_space_based_text_object(ontology):
     # Act & Assert
     with pytest.raises(LabelRowError):
         _ = object_instance.range_list
+
+
+def test_query_objects_by_position(ontology):
+    label_row = LabelRowV2(DATA_GROUP_METADATA, Mock(), ontology)
+    label_row.from_labels_dict(DATA_GROUP_TWO_TEXT_NO_LABELS)
+    text_space = label_row.get_space(id="text-1-uuid", type_="text")
+    person = text_obj_ontology_item.create_instance()
+    place = text_obj_ontology_item.create_instance()
+    text_space.put_object_instance(person, ranges=[Range(start=0, end=9), Range(start=100, end=109)])
+    text_space.put_object_instance(place, ranges=Range(start=5, end=14))
+
+    assert text_space.get_overlapping_object_instances(Range(start=8, end=50)) == [person, place]
+    assert text_space.get_overlapping_object_instances(Range(start=15, end=99)) == []
+    assert text_space.get_object_instances_at(12) == [place]
+    assert text_space.get_nearest_object_instance(50) == place
+    assert text_space.get_nearest_object_instance(90) == person
+
+    # The index follows updates to the ranges of an object
+    text_space.remove_object_instance_from_range(person, Range(start=0, end=9))
+    [place_annotation] = place.get_annotations()
+    place_annotation.ranges = [Range(start=200, end=210)]
+
+    assert text_space.get_object_instances_at(5) == []
+    assert text_space.get_nearest_object_instance(0) == person
+    assert text_space.get_object_instances_at(205) == [place]
+
+    text_space.remove_object_instance(place.object_hash)
+    assert text_space.get_nearest_object_instance(205) == person
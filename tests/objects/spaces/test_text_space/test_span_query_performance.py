@@ -0,0 +1,58 @@
+"""Performance tests for position queries on text spaces.
+
+Review tools query the entities around the cursor on every keystroke, on documents with tens of thousands of entity
+spans. These queries use the span index of the space instead of scanning the ranges of every object.
+"""
+
+import random
+import time
+from unittest.mock import Mock
+
+from encord.objects import LabelRowV2, Object
+from encord.objects.frames import Range
+from tests.objects.data.all_types_ontology_structure import all_types_structure
+from tests.objects.data.data_group.two_text import DATA_GROUP_METADATA, DATA_GROUP_TWO_TEXT_NO_LABELS
+
+text_obj_ontology_item = all_types_structure.get_child_by_hash("textFeatureNodeHash", Object)
+
+NUM_SPANS = 50_000
+NUM_CHARACTERS = 2_000_000
+NUM_QUERIES = 1_000
+
+# Performance threshold (in seconds)
+QUERY_THRESHOLD = 0.5
+
+
+def test_span_queries_on_large_document(ontology):
+    label_row = LabelRowV2(DATA_GROUP_METADATA, Mock(), ontology)
+    label_row.from_labels_dict(DATA_GROUP_TWO_TEXT_NO_LABELS)
+    text_space = label_row.get_space(id="text-1-uuid", type_="text")
+
+    rng = random.Random(0)
+    spans = []
+    for _ in range(NUM_SPANS):
+        start = rng.randrange(NUM_CHARACTERS)
+        end = start + rng.randint(1, 40)
+        object_instance = text_obj_ontology_item.create_instance()
+        text_space.put_object_instance(object_instance, ranges=Range(start=start, end=end))
+        spans.append((start, end, object_instance))
+
+    positions = [rng.randrange(NUM_CHARACTERS) for _ in range(NUM_QUERIES)]
+    start_time = time.perf_counter()
+    results = [
+        (
+            text_space.get_object_instances_at(position),
+            text_space.get_overlapping_object_instances(Range(start=position - 500, end=position + 500)),
+            text_space.get_nearest_object_instance(position),
+        )
+        for position in positions
+    ]
+    elapsed = time.perf_counter() - start_time
+
+    print(f"\n{NUM_QUERIES} x 3 span queries over {NUM_SPANS} spans: {elapsed:.4f}s")
+    assert elapsed < QUERY_THRESHOLD, f"Span queries took {elapsed:.4f}s, threshold is {QUERY_THRESHOLD}s"
+
+    for position, (at_position, _, nearest) in zip(positions[:20], results):
+        expected = {obj.object_hash for start, end, obj in spans if start <= position <= end}
+        assert {obj.object_hash for obj in at_position} == expected
+        assert nearest is not None
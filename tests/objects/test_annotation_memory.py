@@ -0,0 +1,81 @@
+"""Memory regression tests for annotation objects.
+
+Dense video label rows hold one set of annotation objects per object per frame, so the per-annotation footprint
+bounds how many rows fit in memory. Before these objects used `__slots__`, a bounding box on a video frame took
+~480 bytes and a polygon point ~130 bytes.
+"""
+
+import copy
+import pickle
+import tracemalloc
+from typing import Callable
+
+from encord.objects import ObjectInstance
+from encord.objects.coordinates import BoundingBoxCoordinates, PointCoordinate, PolygonCoordinates
+from tests.objects.data.all_types_ontology_structure import all_types_structure
+
+NUM_FRAMES = 10_000
+NUM_POINTS = 100_000
+
+# Memory thresholds (in bytes)
+# These are based on current usage and should alert if there's regression
+BYTES_PER_BOX_ANNOTATION_THRESHOLD = 360
+BYTES_PER_POLYGON_POINT_THRESHOLD = 100
+
+box_ontology_object = all_types_structure.get_child_by_hash("MjI2NzEy")
+polygon_ontology_object = all_types_structure.get_child_by_hash("ODkxMzAx")
+
+
+def _allocated_bytes(fn: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = fn()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del result
+    return after - before
+
+
+def test_bytes_per_box_annotation():
+    def create_track() -> ObjectInstance:
+        object_instance = box_ontology_object.create_instance()
+        for frame in range(NUM_FRAMES):
+            object_instance.set_for_frames(
+                BoundingBoxCoordinates(height=0.1, width=0.2, top_left_x=0.3, top_left_y=0.4), frames=frame
+            )
+        return object_instance
+
+    bytes_per_annotation = _allocated_bytes(create_track) / NUM_FRAMES
+
+    print(f"\nbounding box annotation: {bytes_per_annotation:.0f} bytes")
+    assert bytes_per_annotation < BYTES_PER_BOX_ANNOTATION_THRESHOLD, (
+        f"Bounding box annotation took {bytes_per_annotation:.0f} bytes, "
+        f"threshold is {BYTES_PER_BOX_ANNOTATION_THRESHOLD} bytes"
+    )
+
+
+def test_bytes_per_polygon_point():
+    def create_polygon() -> PolygonCoordinates:
+        return PolygonCoordinates(values=[PointCoordinate(x=i / NUM_POINTS, y=0.5) for i in range(NUM_POINTS)])
+
+    bytes_per_point = _allocated_bytes(create_polygon) / NUM_POINTS
+
+    print(f"\npolygon point: {bytes_per_point:.0f} bytes")
+    assert bytes_per_point < BYTES_PER_POLYGON_POINT_THRESHOLD, (
+        f"Polygon point took {bytes_per_point:.0f} bytes, threshold is {BYTES_PER_POLYGON_POINT_THRESHOLD} bytes"
+    )
+
+
+def test_compact_annotation_objects_can_be_copied():
+    object_instance = box_ontology_object.create_instance()
+    coordinates = BoundingBoxCoordinates(height=0.1, width=0.2, top_left_x=0.3, top_left_y=0.4)
+    object_instance.set_for_frames(coordinates, frames=[0, 1], confidence=0.5)
+
+    copied = object_instance.copy()
+
+    assert copied.get_annotation(1).coordinates == coordinates
+    assert copied.get_annotation(1).confidence == 0.5
+    assert pickle.loads(pickle.dumps(coordinates)) == coordinates
+    assert copy.deepcopy(PointCoordinate(x=0.1, y=0.2)) == PointCoordinate(x=0.1, y=0.2)
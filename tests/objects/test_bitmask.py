@@ -1,20 +1,42 @@
+import time
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 
+import encord.objects.bitmask
 from encord.common.bitmask_operations.bitmask_operations import (
     _mask_to_rle,
     _rle_to_mask,
     _rle_to_string,
     _string_to_rle,
+    crop_ranges,
+    merge_rle_counts,
     ranges_to_rle_counts,
+    rle_counts_area,
+    rle_counts_bbox,
+    rle_counts_intersection,
+    rle_counts_iou,
+    rle_counts_to_ranges,
+    rle_counts_union,
     rle_string_to_points,
+    rle_string_to_ranges,
     serialise_bitmask,
     transpose_bytearray,
+    uncrop_ranges,
 )
+from encord.exceptions import EncordException
 from encord.objects.bitmask import (
     BitmaskCoordinates,
+    clear_decoded_bitmask_cache,
+    set_decoded_bitmask_cache_size,
 )
 
+# Performance threshold (in seconds)
+PAIRWISE_IOU_THRESHOLD = 2.0
+DECODE_CROPPED_MASK_THRESHOLD = 0.005
+CACHED_VIEWS_THRESHOLD = 0.001
+
 
 def test_rle_decode():
     resolution = 1914 * 2294
@@ -147,6 +169,22 @@ def test_rle_string_to_points(rle_string, expected):
     assert rle_string_to_points(rle_string) == expected
 
 
+@pytest.mark.parametrize(
+    "rle_string,expected",
+    [
+        ("", []),
+        ("04", [(0, 3)]),
+        ("0341", [(0, 2), (7, 10)]),
+    ],
+)
+def test_rle_string_to_ranges(rle_string, expected):
+    assert rle_string_to_ranges(rle_string) == expected
+
+
+def test_rle_counts_to_ranges_merges_touching_runs():
+    assert rle_counts_to_ranges([2, 3, 0, 2, 0, 0, 5]) == [(2, 6)]
+
+
 def test_ranges_rle_roundtrip():
     # Ranges: 0, 5, 10-12, 100-105
     ranges = [(0, 0), (5, 5), (10, 12), (100, 105)]
@@ -155,3 +193,281 @@ def test_ranges_rle_roundtrip():
     encoded = _rle_to_string(rle_counts)
     decoded = rle_string_to_points(encoded)
     assert decoded == expected_points
+    assert rle_string_to_ranges(encoded) == ranges
+
+
+def _random_masks(count: int, height: int, width: int, seed: int) -> list:
+    rng = np.random.default_rng(seed)
+    masks = []
+    for _ in range(count):
+        mask = np.zeros((height, width), dtype=bool)
+        for _ in range(rng.integers(0, 4)):
+            top, left = rng.integers(0, height), rng.integers(0, width)
+            mask[top : top + rng.integers(1, height), left : left + rng.integers(1, width)] = True
+        masks.append(mask)
+    return masks
+
+
+def _numpy_bbox(mask: np.ndarray):
+    rows, cols = np.nonzero(mask)
+    if len(rows) == 0:
+        return None
+    return rows.min(), cols.min(), rows.max() - rows.min() + 1, cols.max() - cols.min() + 1
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_bitmask_algebra_matches_decoded_masks(seed):
+    masks = _random_masks(4, 23, 17, seed)
+    bitmasks = [BitmaskCoordinates(mask) for mask in masks]
+
+    for mask, bitmask in zip(masks, bitmasks):
+        assert bitmask.area() == mask.sum()
+        assert bitmask.bbox() == _numpy_bbox(mask)
+
+    a, b = masks[0], masks[1]
+    union = bitmasks[0].union(bitmasks[1])
+    intersection = bitmasks[0].intersection(bitmasks[1])
+    assert np.array_equal(union.to_numpy_array(), a | b)
+    assert np.array_equal(intersection.to_numpy_array(), a & b)
+    # The results are encoded exactly like masks created from arrays
+    assert union.to_dict() == BitmaskCoordinates(a | b).to_dict()
+    assert intersection.to_dict() == BitmaskCoordinates(a & b).to_dict()
+
+    union_area = (a | b).sum()
+    assert bitmasks[0].iou(bitmasks[1]) == pytest.approx((a & b).sum() / union_area if union_area else 0.0)
+
+    merged = BitmaskCoordinates.merge_many(bitmasks)
+    assert merged.to_dict() == BitmaskCoordinates(np.logical_or.reduce(masks)).to_dict()
+
+
+def test_bitmask_algebra_on_empty_and_full_masks():
+    empty = BitmaskCoordinates(np.zeros((3, 4), dtype=bool))
+    full = BitmaskCoordinates(np.ones((3, 4), dtype=bool))
+
+    assert empty.area() == 0
+    assert empty.bbox() is None
+    assert full.bbox() == (0, 0, 3, 4)
+    assert empty.iou(empty) == 0.0
+    assert full.iou(full) == 1.0
+    assert empty.union(full).to_dict() == full.to_dict()
+    assert empty.intersection(full).to_dict() == empty.to_dict()
+
+
+def test_bitmask_algebra_requires_same_shape():
+    with pytest.raises(EncordException):
+        BitmaskCoordinates(np.zeros((3, 4), dtype=bool)).iou(BitmaskCoordinates(np.zeros((4, 3), dtype=bool)))
+
+    with pytest.raises(EncordException):
+        BitmaskCoordinates.merge_many([])
+
+
+def test_rle_counts_bbox_of_run_wrapping_rows():
+    # A run from the last column of row 0 to the first column of row 1
+    assert rle_counts_bbox([3, 2, 7], width=4) == (0, 0, 2, 4)
+
+
+def test_rle_counts_algebra():
+    a = _mask_to_rle(bytes([0, 1, 1, 1, 0, 0, 1, 0]))
+    b = _mask_to_rle(bytes([1, 1, 0, 0, 0, 0, 1, 1]))
+
+    assert rle_counts_area(a) == 4
+    assert rle_counts_union(a, b, size=8) == _mask_to_rle(bytes([1, 1, 1, 1, 0, 0, 1, 1]))
+    assert rle_counts_intersection(a, b, size=8) == _mask_to_rle(bytes([0, 1, 0, 0, 0, 0, 1, 0]))
+    assert rle_counts_iou(a, b) == pytest.approx(2 / 6)
+
+
+@pytest.mark.parametrize("crop", [(0, 0, 4, 5), (1, 1, 2, 3), (1, 0, 3, 5), (2, 4, 2, 1)])
+def test_crop_and_uncrop_ranges(crop):
+    mask = np.array(
+        [
+            [0, 1, 1, 0, 1],
+            [1, 1, 1, 1, 1],
+            [1, 0, 0, 1, 1],
+            [1, 1, 0, 0, 1],
+        ],
+        dtype=bool,
+    )
+    top, left, height, width = crop
+    ranges = rle_counts_to_ranges(_mask_to_rle(mask.tobytes()))
+    cropped_mask = mask[top : top + height, left : left + width]
+
+    cropped = crop_ranges(ranges, mask.shape[1], crop)
+
+    assert cropped == rle_counts_to_ranges(_mask_to_rle(cropped_mask.tobytes()))
+    expected_uncropped = np.zeros_like(mask)
+    expected_uncropped[top : top + height, left : left + width] = cropped_mask
+    assert uncrop_ranges(cropped, mask.shape[1], crop) == rle_counts_to_ranges(
+        _mask_to_rle(expected_uncropped.tobytes())
+    )
+
+
+def test_merge_rle_counts_joins_touching_runs():
+    assert merge_rle_counts([[0, 2, 8], [2, 2, 6]], size=10) == [0, 4, 6]
+
+
+def test_pairwise_iou_on_a_frame():
+    height, width = 1080, 1920
+    rng = np.random.default_rng(0)
+    rows, cols = np.ogrid[:height, :width]
+    masks = []
+    # Object-sized blobs, some of which overlap
+    for _ in range(200):
+        center_row, center_col = rng.integers(0, height), rng.integers(0, width)
+        radius = rng.integers(20, 150)
+        masks.append((rows - center_row) ** 2 + (cols - center_col) ** 2 < radius**2)
+    bitmasks = [BitmaskCoordinates(mask) for mask in masks]
+
+    start = time.perf_counter()
+    ious = [[a.iou(b) for b in bitmasks] for a in bitmasks]
+    elapsed = time.perf_counter() - start
+
+    print(f"\npairwise IoU of {len(bitmasks)} masks: {elapsed:.4f}s")
+    for i, j in [(0, 1), (2, 3), (5, 7)]:
+        a, b = masks[i], masks[j]
+        assert ious[i][j] == pytest.approx((a & b).sum() / (a | b).sum())
+    assert elapsed < PAIRWISE_IOU_THRESHOLD, (
+        f"Pairwise IoU of {len(bitmasks)} masks took {elapsed:.4f}s, threshold is {PAIRWISE_IOU_THRESHOLD}s"
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_cropped_bitmask_matches_full_frame_bitmask(seed):
+    mask = _random_masks(1, 23, 17, seed)[0]
+    full = BitmaskCoordinates(mask)
+    cropped = BitmaskCoordinates(mask, cropped=True)
+
+    assert cropped.is_cropped and not full.is_cropped
+    assert cropped.to_dict() == full.to_dict()
+    assert np.array_equal(cropped.to_numpy_array(), mask)
+    assert cropped.area() == full.area()
+    assert cropped.bbox() == full.bbox()
+
+    bbox = full.bbox()
+    if bbox is None:
+        expected_crop = np.zeros((0, 0), dtype=bool)
+    else:
+        top, left, height, width = bbox
+        expected_crop = mask[top : top + height, left : left + width]
+    assert np.array_equal(cropped.to_numpy_array(cropped=True), expected_crop)
+    assert np.array_equal(full.to_numpy_array(cropped=True), expected_crop)
+
+
+def test_cropped_bitmask_algebra_and_round_trip():
+    a = np.zeros((10, 12), dtype=bool)
+    a[2:5, 3:9] = True
+    b = np.zeros((10, 12), dtype=bool)
+    b[4:8, 0:4] = True
+    cropped_a = BitmaskCoordinates(a, cropped=True)
+
+    assert cropped_a.to_dict()["height"] == 10
+    assert cropped_a.to_dict()["width"] == 12
+    assert cropped_a.union(BitmaskCoordinates(b)).is_cropped
+    assert np.array_equal(cropped_a.union(BitmaskCoordinates(b)).to_numpy_array(), a | b)
+    assert np.array_equal(cropped_a.intersection(BitmaskCoordinates(b)).to_numpy_array(), a & b)
+    assert BitmaskCoordinates.from_dict(cropped_a.to_dict()).to_dict() == BitmaskCoordinates(a).to_dict()
+
+
+def test_decode_small_object_on_4k_frame_cropped():
+    height, width = 2160, 3840
+    mask = np.zeros((height, width), dtype=bool)
+    mask[1000:1100, 2000:2150] = True
+    bitmask = BitmaskCoordinates(mask, cropped=True)
+
+    start = time.perf_counter()
+    crop = bitmask.to_numpy_array(cropped=True)
+    cropped_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    full = bitmask.to_numpy_array()
+    full_elapsed = time.perf_counter() - start
+
+    print(f"\ndecode small object on {height}x{width} frame: cropped {cropped_elapsed:.4f}s, full {full_elapsed:.4f}s")
+    assert crop.shape == (100, 150) and crop.all()
+    assert np.array_equal(full, mask)
+    assert cropped_elapsed < DECODE_CROPPED_MASK_THRESHOLD, (
+        f"Decoding a cropped mask took {cropped_elapsed:.4f}s, threshold is {DECODE_CROPPED_MASK_THRESHOLD}s"
+    )
+
+
+def test_cropped_bitmask_encodes_full_frame_once():
+    mask = np.zeros((2160, 3840), dtype=bool)
+    mask[1000:1100, 2000:2150] = True
+    bitmask = BitmaskCoordinates(mask, cropped=True)
+
+    with patch.object(
+        encord.objects.bitmask, "ranges_to_mask_rle_counts", wraps=encord.objects.bitmask.ranges_to_mask_rle_counts
+    ) as ranges_to_mask_rle_counts:
+        assert bitmask._shape() == (2160, 3840)
+        assert ranges_to_mask_rle_counts.call_count == 0
+        assert bitmask.to_dict() == bitmask.to_dict() == BitmaskCoordinates(mask).to_dict()
+        assert ranges_to_mask_rle_counts.call_count == 1
+
+
+@pytest.fixture
+def decoded_bitmask_cache():
+    set_decoded_bitmask_cache_size(10_000_000)
+    yield
+    set_decoded_bitmask_cache_size(0)
+
+
+def test_numpy_view_is_read_only_and_matches_array(decoded_bitmask_cache):
+    mask = _random_masks(1, 23, 17, seed=1)[0]
+    bitmask = BitmaskCoordinates(mask)
+
+    view = bitmask.to_numpy_view()
+
+    assert np.array_equal(view, mask)
+    assert not view.flags.writeable
+    assert bitmask.to_memoryview().readonly
+    assert bitmask.to_memoryview().tobytes() == mask.tobytes()
+    # Arrays from .to_numpy_array() are still copies that can be modified
+    array = bitmask.to_numpy_array()
+    array[:] = True
+    assert np.array_equal(bitmask.to_numpy_view(), mask)
+
+
+def test_decoded_bitmask_cache_shares_buffers(decoded_bitmask_cache):
+    mask = _random_masks(1, 23, 17, seed=2)[0]
+    bitmask = BitmaskCoordinates(mask)
+    cropped = BitmaskCoordinates(mask, cropped=True)
+
+    assert bitmask.to_memoryview().obj is bitmask.to_memoryview().obj
+    assert BitmaskCoordinates(bitmask.to_dict()).to_memoryview().obj is bitmask.to_memoryview().obj
+    assert np.array_equal(cropped.to_numpy_view(), mask)
+
+    clear_decoded_bitmask_cache()
+    set_decoded_bitmask_cache_size(0)
+    assert bitmask.to_memoryview().obj is not bitmask.to_memoryview().obj
+
+
+def test_decoded_bitmask_cache_evicts_least_recently_used():
+    set_decoded_bitmask_cache_size(2 * 100)
+    try:
+        bitmasks = [BitmaskCoordinates(np.eye(10, k=k, dtype=bool)) for k in range(3)]
+        first = bitmasks[0].to_memoryview().obj
+        second = bitmasks[1].to_memoryview().obj
+        assert bitmasks[0].to_memoryview().obj is first
+
+        # Evicts the second mask, which is now the least recently used one
+        bitmasks[2].to_memoryview()
+        assert bitmasks[0].to_memoryview().obj is first
+        assert bitmasks[1].to_memoryview().obj is not second
+    finally:
+        set_decoded_bitmask_cache_size(0)
+
+
+def test_repeated_decode_with_cache(decoded_bitmask_cache):
+    mask = _random_masks(1, 2160, 3840, seed=3)[0]
+    bitmask = BitmaskCoordinates(mask)
+    bitmask.to_numpy_view()
+
+    start = time.perf_counter()
+    for _ in range(10):
+        view = bitmask.to_numpy_view()
+    elapsed = time.perf_counter() - start
+
+    print(f"\n10 cached views of a 4K mask: {elapsed:.4f}s")
+    assert np.array_equal(view, mask)
+    assert elapsed < CACHED_VIEWS_THRESHOLD, (
+        f"10 cached views of a 4K mask took {elapsed:.4f}s, threshold is {CACHED_VIEWS_THRESHOLD}s"
+    )
@@ -1,5 +1,9 @@
+import time
+
 import numpy as np
+import pytest
 
+from encord.common.bitmask_operations import bitmask_operations as python_bitmask_operations
 from encord.common.bitmask_operations.bitmask_operations_numpy import (
     _mask_to_rle,
     _rle_to_mask,
@@ -12,6 +16,9 @@ from encord.objects.bitmask import (
     BitmaskCoordinates,
 )
 
+# Performance threshold (in seconds)
+DECODE_4K_MASK_THRESHOLD = 0.2
+
 
 def test_rle_decode():
     resolution = 1914 * 2294
@@ -117,3 +124,49 @@ def test_serialise_bitmask_empty():
     mask_decoded = BitmaskCoordinates(mask_encoded).to_numpy_array()
 
     assert np.array_equal(mask, mask_decoded)  # Mask is inverted and the test fails.
+
+
+@pytest.mark.parametrize(
+    "rle",
+    [
+        [],
+        [0],
+        [0, 5],
+        [5, 2, 5],
+        [1, 1, 1, 1, 1, 1, 1, 1],
+        [15, 16, 17, 31, 32, 33, 0, 1],
+        [1000, 3, 2000000, 70000, 5, 123456789, 2**40, 7],
+    ],
+)
+def test_rle_string_codec_matches_python_implementation(rle):
+    rle_string = _rle_to_string(rle)
+
+    assert rle_string == python_bitmask_operations._rle_to_string(rle)
+    assert _string_to_rle(rle_string) == python_bitmask_operations._string_to_rle(rle_string) == rle
+
+
+def test_rle_to_mask_matches_python_implementation():
+    rng = np.random.default_rng(0)
+    rle = rng.integers(0, 50, size=1001).tolist()
+    size = sum(rle) + 10
+
+    assert _rle_to_mask(rle, size) == python_bitmask_operations._rle_to_mask(rle, size)
+
+
+def test_decode_4k_mask():
+    height, width = 2160, 3840
+    mask = np.zeros((height, width), dtype=bool)
+    # A few thousand runs across the mask
+    for i in range(0, height, 4):
+        mask[i, (i * 7) % width : (i * 7) % width + 500] = True
+    bitmask = BitmaskCoordinates(mask)
+
+    start = time.perf_counter()
+    decoded = bitmask.to_numpy_array()
+    elapsed = time.perf_counter() - start
+
+    print(f"\ndecode {height}x{width} mask: {elapsed:.4f}s")
+    assert np.array_equal(decoded, mask)
+    assert elapsed < DECODE_4K_MASK_THRESHOLD, (
+        f"Decoding a 4K mask took {elapsed:.4f}s, threshold is {DECODE_4K_MASK_THRESHOLD}s"
+    )
@@ -0,0 +1,131 @@
+import time
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pycocotools")
+
+from pycocotools import mask as cocomask
+
+from encord.common import bitmask_operations
+from encord.common.bitmask_operations import bitmask_operations as python_bitmask_operations
+from encord.common.bitmask_operations import bitmask_operations_numpy as numpy_bitmask_operations
+from encord.common.bitmask_operations.bitmask_operations_pycocotools import (
+    coco_rle_to_row_major_string,
+    deserialise_bitmask,
+    serialise_bitmask,
+)
+
+# Performance threshold (in seconds)
+ENCODE_4K_MASK_THRESHOLD = 0.05
+DECODE_4K_MASK_THRESHOLD = 0.1
+
+
+def _random_mask(height: int, width: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    # Runs of random length rather than independent pixels, like real segmentations
+    run_lengths = rng.integers(1, 40, size=height * width)
+    values = np.arange(len(run_lengths)) % 2
+    return np.repeat(values, run_lengths)[: height * width].astype(bool).reshape(height, width)
+
+
+def _4k_mask() -> np.ndarray:
+    height, width = 2160, 3840
+    mask = np.zeros((height, width), dtype=bool)
+    for i in range(0, height, 4):
+        mask[i, (i * 7) % width : (i * 7) % width + 500] = True
+    return mask
+
+
+def test_pycocotools_backend_is_selected():
+    assert bitmask_operations.serialise_bitmask is serialise_bitmask
+    assert bitmask_operations.deserialise_bitmask is deserialise_bitmask
+
+
+@pytest.mark.parametrize(
+    "mask",
+    [
+        b"",
+        b"\x00",
+        b"\x01",
+        b"\x00\x00\x01\x01\x00",
+        b"\x01\x01\x01",
+        bytes(1000),
+        b"\x01" * 1000,
+    ],
+)
+def test_serialise_bitmask_matches_other_backends(mask):
+    serialised = serialise_bitmask(mask)
+
+    assert serialised == python_bitmask_operations.serialise_bitmask(mask)
+    assert serialised == numpy_bitmask_operations.serialise_bitmask(mask)
+    assert deserialise_bitmask(serialised, len(mask)) == mask
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_mask_round_trip_matches_other_backends(seed):
+    mask = _random_mask(37, 53, seed).tobytes()
+
+    serialised = serialise_bitmask(mask)
+
+    assert serialised == numpy_bitmask_operations.serialise_bitmask(mask)
+    assert deserialise_bitmask(serialised, len(mask)) == mask
+    assert deserialise_bitmask(serialised, len(mask)) == python_bitmask_operations.deserialise_bitmask(
+        serialised, len(mask)
+    )
+
+
+def test_deserialise_bitmask_with_counts_not_covering_the_mask():
+    # Counts that end early leave the tail of the mask empty, as in the other backends
+    serialised = python_bitmask_operations._rle_to_string([2, 3])
+
+    assert deserialise_bitmask(serialised, 10) == python_bitmask_operations.deserialise_bitmask(serialised, 10)
+    assert deserialise_bitmask("", 4) == bytes(4)
+
+    with pytest.raises(IndexError):
+        deserialise_bitmask(serialised, 4)
+
+
+@pytest.mark.parametrize("as_string", [True, False])
+def test_coco_rle_to_row_major_string(as_string):
+    mask = _random_mask(19, 31, seed=0)
+    coco_rle = cocomask.encode(np.asfortranarray(mask.astype(np.uint8)))
+    counts = coco_rle["counts"].decode("ascii")
+    if not as_string:
+        counts = python_bitmask_operations._string_to_rle(counts)
+
+    row_major = coco_rle_to_row_major_string(counts, shape=mask.shape)
+
+    assert row_major == python_bitmask_operations.coco_rle_to_row_major_string(counts, shape=mask.shape)
+    assert row_major == numpy_bitmask_operations.coco_rle_to_row_major_string(counts, shape=mask.shape)
+    assert deserialise_bitmask(row_major, mask.size) == mask.tobytes()
+
+
+def test_encode_4k_mask():
+    mask = _4k_mask()
+    raw_mask = mask.tobytes()
+
+    start = time.perf_counter()
+    serialised = serialise_bitmask(raw_mask)
+    elapsed = time.perf_counter() - start
+
+    print(f"\nencode {mask.shape[0]}x{mask.shape[1]} mask with pycocotools: {elapsed:.4f}s")
+    assert serialised == numpy_bitmask_operations.serialise_bitmask(raw_mask)
+    assert elapsed < ENCODE_4K_MASK_THRESHOLD, (
+        f"Encoding a 4K mask took {elapsed:.4f}s, threshold is {ENCODE_4K_MASK_THRESHOLD}s"
+    )
+
+
+def test_decode_4k_mask():
+    mask = _4k_mask()
+    serialised = serialise_bitmask(mask.tobytes())
+
+    start = time.perf_counter()
+    decoded = deserialise_bitmask(serialised, mask.size)
+    elapsed = time.perf_counter() - start
+
+    print(f"\ndecode {mask.shape[0]}x{mask.shape[1]} mask with pycocotools: {elapsed:.4f}s")
+    assert decoded == mask.tobytes()
+    assert elapsed < DECODE_4K_MASK_THRESHOLD, (
+        f"Decoding a 4K mask took {elapsed:.4f}s, threshold is {DECODE_4K_MASK_THRESHOLD}s"
+    )
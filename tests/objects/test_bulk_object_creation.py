@@ -0,0 +1,306 @@
+import time
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from encord.exceptions import LabelRowError
+from encord.objects import LabelRowV2, Object, ObjectInstance
+from encord.objects.coordinates import (
+    BoundingBoxCoordinates,
+    PointCoordinate,
+    PolygonCoordinates,
+    PolylineCoordinates,
+)
+from tests.objects.common import BASE_LABEL_ROW_METADATA
+from tests.objects.data import empty_video
+from tests.objects.data.all_types_ontology_structure import all_types_structure
+from tests.objects.objects_test_utils import validate_label_row_serialisation
+
+box_ontology_item = all_types_structure.get_child_by_hash("MjI2NzEy", Object)
+polygon_ontology_item = all_types_structure.get_child_by_hash("ODkxMzAx", Object)
+polyline_ontology_item = all_types_structure.get_child_by_hash("OTcxMzIy", Object)
+keypoint_ontology_item = all_types_structure.get_child_by_hash("MTY2MTQx", Object)
+audio_ontology_item = all_types_structure.get_child_by_hash("KVfzNkFy", Object)
+
+NUM_DETECTIONS = 20_000
+
+# Performance threshold (in seconds)
+BULK_CREATE_THRESHOLD = 2
+SET_TRACK_THRESHOLD = 0.5
+
+
+def _empty_video_label_row(all_types_ontology) -> LabelRowV2:
+    label_row = LabelRowV2(BASE_LABEL_ROW_METADATA, Mock(), all_types_ontology)
+    label_row.from_labels_dict(empty_video.labels)
+    return label_row
+
+
+def test_add_bounding_boxes_from_arrays(all_types_ontology):
+    label_row = _empty_video_label_row(all_types_ontology)
+    boxes = np.array([[0.1, 0.2, 0.3, 0.4], [0.5, 0.5, 0.1, 0.1], [0.0, 0.0, 1.0, 1.0]])
+
+    object_instances = label_row.add_objects_from_arrays(
+        box_ontology_item,
+        frames=np.array([0, 0, 7]),
+        coordinates=boxes,
+        confidences=np.array([0.9, 0.5, 0.1]),
+        object_hashes=["a", "b", "c"],
+    )
+
+    assert [o.object_hash for o in object_instances] == ["a", "b", "c"]
+    assert label_row.get_object_instances() == object_instances
+    assert label_row.get_object_instances(filter_frames=0) == object_instances[:2]
+    assert label_row.get_object_instances(filter_frames=7) == object_instances[2:]
+
+    annotation = object_instances[0].get_annotation(0)
+    assert annotation.coordinates == BoundingBoxCoordinates(top_left_x=0.1, top_left_y=0.2, width=0.3, height=0.4)
+    assert annotation.confidence == 0.9
+    assert annotation.manual_annotation is False
+    assert object_instances[2].get_annotation_frames() == {7}
+
+    validate_label_row_serialisation(label_row)
+
+
+def test_bulk_objects_match_per_object_path(all_types_ontology):
+    bulk_label_row = _empty_video_label_row(all_types_ontology)
+    bulk_label_row.add_objects_from_arrays(
+        box_ontology_item,
+        frames=[3, 4],
+        coordinates=[[0.1, 0.2, 0.3, 0.4], [0.2, 0.3, 0.4, 0.5]],
+        confidences=[0.8, 0.7],
+        object_hashes=["a", "b"],
+        manual_annotation=True,
+    )
+
+    label_row = _empty_video_label_row(all_types_ontology)
+    for object_hash, frame, (x, y, w, h), confidence in [
+        ("a", 3, (0.1, 0.2, 0.3, 0.4), 0.8),
+        ("b", 4, (0.2, 0.3, 0.4, 0.5), 0.7),
+    ]:
+        object_instance = box_ontology_item.create_instance()
+        object_instance._object_hash = object_hash
+        object_instance.set_for_frames(
+            BoundingBoxCoordinates(height=h, width=w, top_left_x=x, top_left_y=y),
+            frames=frame,
+            confidence=confidence,
+        )
+        label_row.add_object_instance(object_instance)
+
+    def without_timestamps(d):
+        for data_unit in d["data_units"].values():
+            for frame_labels in data_unit["labels"].values():
+                for obj in frame_labels["objects"]:
+                    del obj["createdAt"], obj["lastEditedAt"]
+        return d
+
+    assert without_timestamps(bulk_label_row.to_encord_dict()) == without_timestamps(label_row.to_encord_dict())
+
+
+def test_add_polygons_polylines_and_points_from_arrays(all_types_ontology):
+    label_row = _empty_video_label_row(all_types_ontology)
+
+    polygons = label_row.add_objects_from_arrays(
+        polygon_ontology_item,
+        frames=1,
+        coordinates=[np.array([[0.1, 0.1], [0.2, 0.1], [0.2, 0.2]]), np.array([[0.5, 0.5], [0.6, 0.5], [0.6, 0.6]])],
+    )
+    polylines = label_row.add_objects_from_arrays(
+        polyline_ontology_item, frames=[2], coordinates=[[[0.1, 0.1], [0.3, 0.3]]]
+    )
+    points = label_row.add_objects_from_arrays(
+        keypoint_ontology_item, frames=[1, 2], coordinates=np.array([[0.1, 0.2], [0.3, 0.4]])
+    )
+
+    assert polygons[1].get_annotation(1).coordinates.values == [
+        PointCoordinate(0.5, 0.5),
+        PointCoordinate(0.6, 0.5),
+        PointCoordinate(0.6, 0.6),
+    ]
+    assert isinstance(polygons[0].get_annotation(1).coordinates, PolygonCoordinates)
+    assert polylines[0].get_annotation(2).coordinates == PolylineCoordinates(
+        values=[PointCoordinate(0.1, 0.1), PointCoordinate(0.3, 0.3)]
+    )
+    assert points[1].get_annotation(2).coordinates == PointCoordinate(0.3, 0.4)
+    assert len(label_row.get_object_instances(filter_frames=1)) == 3
+
+    validate_label_row_serialisation(label_row)
+
+
+def test_add_objects_from_arrays_validation(all_types_ontology):
+    label_row = _empty_video_label_row(all_types_ontology)
+    boxes = np.zeros((2, 4))
+
+    with pytest.raises(LabelRowError):
+        label_row.add_objects_from_arrays(box_ontology_item, frames=[0, 1], coordinates=np.zeros((2, 3)))
+
+    with pytest.raises(LabelRowError):
+        label_row.add_objects_from_arrays(box_ontology_item, frames=[0, 1, 2], coordinates=boxes)
+
+    with pytest.raises(LabelRowError):
+        label_row.add_objects_from_arrays(box_ontology_item, frames=[0, label_row.number_of_frames], coordinates=boxes)
+
+    with pytest.raises(LabelRowError):
+        label_row.add_objects_from_arrays(box_ontology_item, frames=[-1, 0], coordinates=boxes)
+
+    with pytest.raises(LabelRowError):
+        label_row.add_objects_from_arrays(box_ontology_item, frames=np.array([0.5, 1.7]), coordinates=boxes)
+
+    with pytest.raises(LabelRowError):
+        label_row.add_objects_from_arrays(box_ontology_item, frames=1.0, coordinates=boxes)
+
+    with pytest.raises(LabelRowError):
+        label_row.add_objects_from_arrays(box_ontology_item, frames=0, coordinates=boxes, confidences=[1.0])
+
+    with pytest.raises(LabelRowError):
+        label_row.add_objects_from_arrays(box_ontology_item, frames=0, coordinates=boxes, object_hashes=["a", "a"])
+
+    with pytest.raises(LabelRowError):
+        label_row.add_objects_from_arrays(audio_ontology_item, frames=0, coordinates=boxes)
+
+    label_row.add_objects_from_arrays(box_ontology_item, frames=0, coordinates=boxes, object_hashes=["a", "b"])
+    with pytest.raises(LabelRowError):
+        label_row.add_objects_from_arrays(box_ontology_item, frames=0, coordinates=boxes, object_hashes=["b", "c"])
+
+    # Failed calls leave the label row untouched
+    assert [o.object_hash for o in label_row.get_object_instances()] == ["a", "b"]
+
+
+def test_add_objects_from_arrays_performance(all_types_ontology):
+    label_row = _empty_video_label_row(all_types_ontology)
+    rng = np.random.default_rng(0)
+    frames = rng.integers(0, label_row.number_of_frames, NUM_DETECTIONS)
+    boxes = rng.random((NUM_DETECTIONS, 4))
+
+    start = time.perf_counter()
+    label_row.add_objects_from_arrays(box_ontology_item, frames=frames, coordinates=boxes)
+    elapsed = time.perf_counter() - start
+
+    print(f"\nadd_objects_from_arrays({NUM_DETECTIONS} boxes): {elapsed:.3f}s")
+    assert len(label_row.get_object_instances()) == NUM_DETECTIONS
+    assert elapsed < BULK_CREATE_THRESHOLD, (
+        f"add_objects_from_arrays took {elapsed:.3f}s, threshold is {BULK_CREATE_THRESHOLD}s"
+    )
+
+
+def _attached_box_instance(label_row: LabelRowV2) -> ObjectInstance:
+    object_instance = box_ontology_item.create_instance()
+    object_instance.set_for_frames(BoundingBoxCoordinates(height=0.1, width=0.1, top_left_x=0.1, top_left_y=0.1))
+    label_row.add_object_instance(object_instance)
+    return object_instance
+
+
+def test_set_track_from_arrays(all_types_ontology):
+    label_row = _empty_video_label_row(all_types_ontology)
+    object_instance = _attached_box_instance(label_row)
+
+    object_instance.set_track(
+        frames=np.array([5, 6, 10]),
+        coordinates=np.array([[0.1, 0.1, 0.2, 0.2], [0.2, 0.2, 0.2, 0.2], [0.3, 0.3, 0.2, 0.2]]),
+        confidences=np.array([0.9, 0.8, 0.7]),
+        manual_annotations=[False, False, True],
+    )
+
+    assert object_instance.get_annotation_frames() == {0, 5, 6, 10}
+    assert label_row.get_object_instances(filter_frames=6) == [object_instance]
+    annotation = object_instance.get_annotation(10)
+    assert annotation.coordinates == BoundingBoxCoordinates(top_left_x=0.3, top_left_y=0.3, width=0.2, height=0.2)
+    assert annotation.confidence == 0.7
+    assert annotation.manual_annotation is True
+    assert object_instance.get_annotation(5).manual_annotation is False
+
+    validate_label_row_serialisation(label_row)
+
+
+def test_set_track_matches_set_for_frames():
+    coordinates = [
+        BoundingBoxCoordinates(height=0.1, width=0.2, top_left_x=0.01 * frame, top_left_y=0.3) for frame in range(5)
+    ]
+
+    track_instance = box_ontology_item.create_instance()
+    track_instance.set_track(frames=list(range(5)), coordinates=coordinates, confidences=[0.5] * 5)
+
+    per_frame_instance = box_ontology_item.create_instance()
+    for frame, frame_coordinates in enumerate(coordinates):
+        per_frame_instance.set_for_frames(frame_coordinates, frames=frame, confidence=0.5)
+
+    for frame in range(5):
+        track_annotation = track_instance.get_annotation(frame)
+        per_frame_annotation = per_frame_instance.get_annotation(frame)
+        assert track_annotation.coordinates == per_frame_annotation.coordinates
+        assert track_annotation.confidence == per_frame_annotation.confidence
+        assert track_annotation.manual_annotation == per_frame_annotation.manual_annotation
+
+
+def test_set_track_overwrite(all_types_ontology):
+    label_row = _empty_video_label_row(all_types_ontology)
+    object_instance = box_ontology_item.create_instance()
+    object_instance.set_for_frames(
+        BoundingBoxCoordinates(height=0.1, width=0.1, top_left_x=0.1, top_left_y=0.1), frames=1, confidence=0.3
+    )
+    label_row.add_object_instance(object_instance)
+    boxes = np.full((2, 4), 0.5)
+
+    with pytest.raises(LabelRowError):
+        object_instance.set_track(frames=[0, 1], coordinates=boxes)
+    assert object_instance.get_annotation_frames() == {1}
+    assert label_row.get_object_instances(filter_frames=0) == []
+
+    object_instance.set_track(frames=[0, 1], coordinates=boxes, overwrite=True)
+    assert object_instance.get_annotation_frames() == {0, 1}
+    assert object_instance.get_annotation(1).coordinates == BoundingBoxCoordinates(
+        height=0.5, width=0.5, top_left_x=0.5, top_left_y=0.5
+    )
+    # Existing metadata is kept unless it is given explicitly
+    assert object_instance.get_annotation(1).confidence == 0.3
+    assert label_row.get_object_instances(filter_frames=0) == [object_instance]
+
+
+def test_set_track_validation(all_types_ontology):
+    label_row = _empty_video_label_row(all_types_ontology)
+    object_instance = _attached_box_instance(label_row)
+    boxes = np.zeros((2, 4))
+
+    with pytest.raises(LabelRowError):
+        object_instance.set_track(frames=[0, 0], coordinates=boxes)
+
+    with pytest.raises(LabelRowError):
+        object_instance.set_track(frames=[0, 1, 2], coordinates=boxes)
+
+    with pytest.raises(LabelRowError):
+        object_instance.set_track(frames=[0, label_row.number_of_frames], coordinates=boxes)
+
+    with pytest.raises(LabelRowError):
+        object_instance.set_track(frames=[0, 1], coordinates=boxes, confidences=[1.0])
+
+    with pytest.raises(LabelRowError):
+        object_instance.set_track(frames=[0, 1], coordinates=[PointCoordinate(0.1, 0.1), PointCoordinate(0.2, 0.2)])
+
+    with pytest.raises(LabelRowError):
+        audio_ontology_item.create_instance().set_track(frames=[0], coordinates=boxes[:1])
+
+    with pytest.raises(LabelRowError):
+        object_instance.set_track(frames=np.array([0.5, 1.7]), coordinates=boxes)
+
+    with pytest.raises(ValueError):
+        object_instance.set_track(frames=[1, 2], coordinates=boxes, created_by="not an email")
+
+    with pytest.raises(ValueError):
+        object_instance.set_track(frames=[1, 2], coordinates=boxes, last_edited_by="not an email")
+
+    assert object_instance.get_annotation_frames() == {0}
+
+
+def test_set_track_performance(all_types_ontology):
+    label_row = _empty_video_label_row(all_types_ontology)
+    object_instance = _attached_box_instance(label_row)
+    num_frames = label_row.number_of_frames
+    boxes = np.random.default_rng(0).random((num_frames, 4))
+
+    start = time.perf_counter()
+    object_instance.set_track(frames=np.arange(num_frames), coordinates=boxes, overwrite=True)
+    elapsed = time.perf_counter() - start
+
+    print(f"\nset_track({num_frames} frames): {elapsed:.3f}s")
+    assert len(label_row.get_object_instances(filter_frames=num_frames - 1)) == 1
+    assert elapsed < SET_TRACK_THRESHOLD, f"set_track took {elapsed:.3f}s, threshold is {SET_TRACK_THRESHOLD}s"
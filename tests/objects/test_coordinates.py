@@ -1,6 +1,7 @@
 import logging
 from copy import copy
 
+import numpy as np
 import pytest
 
 from encord.exceptions import LabelRowError
@@ -79,6 +80,28 @@ def test_polygon_coordinates_from_polygons_list():
     ]
 
 
+def test_polygon_coordinates_from_polygon_arrays():
+    flat_polygons = [
+        [[0.0, 0.0, 0.1, 0.1, 0.2, 0.2], [0.05, 0.05, 0.06, 0.06, 0.07, 0.07]],
+        [[0.3, 0.3, 0.4, 0.4, 0.5, 0.5]],
+    ]
+    expected = PolygonCoordinates.from_polygons_list(flat_polygons)
+    arrays = [[np.array(ring).reshape(-1, 2) for ring in polygon] for polygon in flat_polygons]
+
+    c1 = PolygonCoordinates.from_polygon_arrays(arrays)
+    assert c1.to_dict() == expected.to_dict()
+    assert c1.to_dict("multiple_polygons") == expected.to_dict("multiple_polygons")
+    # Point objects are created on first access
+    assert c1.polygons == expected.polygons
+    assert c1.values == expected.values
+    assert c1.to_dict("multiple_polygons") == expected.to_dict("multiple_polygons")
+
+    with pytest.raises(LabelRowError):
+        PolygonCoordinates.from_polygon_arrays([])
+    with pytest.raises(LabelRowError):
+        PolygonCoordinates.from_polygon_arrays([[np.zeros((3, 3))]])
+
+
 def test_polyline_coordinates():
     p1 = PolylineCoordinates.from_dict({"polyline": [{"x": 0, "y": 0}, {"x": 1, "y": 1}]})
     assert p1.values == [PointCoordinate(x=0, y=0), PointCoordinate(x=1, y=1)]
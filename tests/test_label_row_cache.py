@@ -0,0 +1,181 @@
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+from unittest.mock import MagicMock, patch
+
+from encord import Project
+from encord.client import EncordClientProject
+from encord.objects import LabelRowV2
+from encord.objects.label_row_cache import LabelRowCache, LabelRowCacheKey
+from encord.orm.label_row import LabelRow, LabelRowMetadata, LabelStatus
+from tests.test_data.label_rows_metadata_blurb import (
+    LABEL_ROW_BLURB,
+    LABEL_ROW_METADATA_BLURB,
+)
+
+
+def _key(label_hash: str, last_edited_at: datetime = datetime(2024, 1, 1)) -> LabelRowCacheKey:
+    return LabelRowCacheKey(label_hash=label_hash, branch_name="main", last_edited_at=last_edited_at)
+
+
+def test_cache_round_trip(tmp_path: Path) -> None:
+    cache = LabelRowCache(tmp_path)
+    key = _key("label-1")
+    assert cache.get(key) is None
+
+    cache.put(key, {"label_hash": "label-1", "data_units": {"a": [1, 2, 3]}})
+
+    assert key in cache
+    assert cache.get(key) == {"label_hash": "label-1", "data_units": {"a": [1, 2, 3]}}
+    assert cache.size_bytes > 0
+
+    # A new cache instance picks up the entries written by the previous one
+    assert LabelRowCache(tmp_path).get(key) == {"label_hash": "label-1", "data_units": {"a": [1, 2, 3]}}
+
+
+def test_cache_is_keyed_by_last_edited_at(tmp_path: Path) -> None:
+    cache = LabelRowCache(tmp_path)
+    old_key = _key("label-1", datetime(2024, 1, 1))
+    new_key = _key("label-1", datetime(2024, 1, 2))
+
+    cache.put(old_key, {"version": 1})
+    assert cache.get(new_key) is None
+
+    cache.put(new_key, {"version": 2})
+    assert cache.get(new_key) == {"version": 2}
+    # The stale version is replaced rather than kept around
+    assert cache.get(old_key) is None
+    assert len(cache) == 1
+
+
+def test_cache_is_keyed_by_variant(tmp_path: Path) -> None:
+    cache = LabelRowCache(tmp_path)
+    full_key = _key("label-1")
+    filtered_key = LabelRowCacheKey(
+        label_hash="label-1",
+        branch_name="main",
+        last_edited_at=datetime(2024, 1, 1),
+        variant=LabelRowCacheKey.variant_from_options(include_object_feature_hashes={"a"}),
+    )
+
+    cache.put(full_key, {"filtered": False})
+    assert cache.get(filtered_key) is None
+
+    cache.put(filtered_key, {"filtered": True})
+    assert cache.get(full_key) == {"filtered": False}
+    assert cache.get(filtered_key) == {"filtered": True}
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    payload = {"data": "x" * 1000}
+    cache = LabelRowCache(tmp_path, compression_level=0)
+    cache.put(_key("label-0"), payload)
+    entry_size = cache.size_bytes
+
+    cache = LabelRowCache(tmp_path, max_size_bytes=entry_size * 2, compression_level=0)
+    cache.put(_key("label-1"), payload)
+    assert cache.get(_key("label-0")) is not None  # label-0 is now the most recently used
+
+    cache.put(_key("label-2"), payload)
+
+    assert cache.size_bytes <= entry_size * 2
+    assert cache.get(_key("label-0")) is not None
+    assert cache.get(_key("label-1")) is None
+    assert cache.get(_key("label-2")) is not None
+
+
+@patch.object(EncordClientProject, "get_label_rows")
+@patch.object(EncordClientProject, "list_label_rows")
+def test_initialise_labels_uses_cache(
+    list_label_rows_mock: MagicMock, get_label_rows_mock: MagicMock, project: Project, tmp_path: Path
+) -> None:
+    list_label_rows_mock.return_value = [LabelRowMetadata.from_dict(row) for row in LABEL_ROW_METADATA_BLURB]
+    get_label_rows_mock.return_value = [LabelRow(row) for row in LABEL_ROW_BLURB]
+    cache = LabelRowCache(tmp_path)
+
+    rows = project.list_label_rows_v2()
+    with project.create_bundle() as bundle:
+        for row in rows:
+            row.initialise_labels(bundle=bundle, cache=cache)
+
+    get_label_rows_mock.assert_called_once()
+    assert len(cache) == len(rows)
+    expected = [row.to_encord_dict() for row in rows]
+
+    get_label_rows_mock.reset_mock()
+    rows = project.list_label_rows_v2()
+    with project.create_bundle() as bundle:
+        for row in rows:
+            row.initialise_labels(bundle=bundle, cache=cache)
+
+    get_label_rows_mock.assert_not_called()
+    assert [row.to_encord_dict() for row in rows] == expected
+
+    # Rows edited on the server since they were cached are downloaded again
+    edited_metadata = [dict(row, last_edited_at="2030-01-01T00:00:00") for row in LABEL_ROW_METADATA_BLURB[:1]]
+    list_label_rows_mock.return_value = [
+        LabelRowMetadata.from_dict(row) for row in edited_metadata + LABEL_ROW_METADATA_BLURB[1:]
+    ]
+    get_label_rows_mock.return_value = [LabelRow(LABEL_ROW_BLURB[0])]
+    rows = project.list_label_rows_v2()
+    with project.create_bundle() as bundle:
+        for row in rows:
+            row.initialise_labels(bundle=bundle, cache=cache)
+
+    get_label_rows_mock.assert_called_once()
+    assert get_label_rows_mock.call_args[1]["uids"] == [LABEL_ROW_METADATA_BLURB[0]["label_hash"]]
+    assert all(row.is_labelling_initialised for row in rows)
+
+
+def _initialise_rows(project: Project, cache: Optional[LabelRowCache]) -> List[LabelRowV2]:
+    rows = project.list_label_rows_v2()
+    with project.create_bundle() as bundle:
+        for row in rows:
+            row.initialise_labels(bundle=bundle, cache=cache)
+    return rows
+
+
+@patch.object(EncordClientProject, "get_label_rows")
+@patch.object(EncordClientProject, "list_label_rows")
+def test_initialise_labels_from_cache_uses_current_metadata(
+    list_label_rows_mock: MagicMock, get_label_rows_mock: MagicMock, project: Project, tmp_path: Path
+) -> None:
+    list_label_rows_mock.return_value = [LabelRowMetadata.from_dict(row) for row in LABEL_ROW_METADATA_BLURB]
+    get_label_rows_mock.return_value = [LabelRow(row) for row in LABEL_ROW_BLURB]
+    cache = LabelRowCache(tmp_path)
+    _initialise_rows(project, cache)
+
+    # The tasks moved on and the data was renamed without their labels being edited, so `last_edited_at` is unchanged
+    moved = {
+        "label_status": "LABELLED",
+        "annotation_task_status": "COMPLETED",
+        "data_title": "renamed.mp4",
+        "dataset_title": "Renamed dataset",
+    }
+    list_label_rows_mock.return_value = [
+        LabelRowMetadata.from_dict(dict(row, **moved)) for row in LABEL_ROW_METADATA_BLURB
+    ]
+    get_label_rows_mock.return_value = [LabelRow(dict(row, **moved)) for row in LABEL_ROW_BLURB]
+    downloaded_rows = _initialise_rows(project, cache=None)
+    get_label_rows_mock.reset_mock()
+
+    cached_rows = _initialise_rows(project, cache)
+
+    get_label_rows_mock.assert_not_called()
+    for cached_row, downloaded_row in zip(cached_rows, downloaded_rows):
+        assert cached_row.label_status == LabelStatus.LABELLED
+        assert cached_row.data_title == "renamed.mp4"
+        assert cached_row.dataset_title == "Renamed dataset"
+        assert cached_row.to_encord_dict() == downloaded_row.to_encord_dict()
+
+    # Moving to another workflow stage is picked up too
+    list_label_rows_mock.return_value = [
+        LabelRowMetadata.from_dict(dict(row, workflow_graph_node={"uuid": "complete", "title": "Complete"}))
+        for row in LABEL_ROW_METADATA_BLURB
+    ]
+    cached_rows = _initialise_rows(project, cache)
+
+    get_label_rows_mock.assert_not_called()
+    for cached_row in cached_rows:
+        assert cached_row.workflow_graph_node is not None
+        assert cached_row.workflow_graph_node.title == "Complete"
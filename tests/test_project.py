@@ -1,13 +1,58 @@
+import dataclasses
+import json
 import uuid
+from copy import deepcopy
+from typing import Any, Dict, List
 from unittest.mock import MagicMock, PropertyMock, patch
 
+import pytest
+
 from encord.client import EncordClientProject
 from encord.http.v2.api_client import ApiClient
 from encord.http.v2.payloads import Page
-from encord.orm.label_row import LabelRow
+from encord.objects import LabelRowV2, Object, OntologyStructure, Shape
+from encord.orm.label_row import LabelRow, LabelRowMetadata
 from encord.orm.project import Project as OrmProject
 from encord.orm.project import ProjectDataset
 from encord.project import Project
+from encord.utilities.coco.exporter import CocoExporter
+from tests.objects.common import BASE_LABEL_ROW_METADATA
+from tests.objects.data import (
+    data_1,
+    empty_video,
+    image_group_with_reviews,
+    native_image_data,
+    native_image_data_classification_with_no_answer,
+    skeleton_coordinates,
+    video_with_classifications,
+    video_with_dynamic_classifications,
+    video_with_dynamic_classifications_ui_constructed,
+)
+from tests.objects.data.all_ontology_types import all_ontology_types
+from tests.objects.data.all_types_ontology_structure import all_types_structure
+from tests.objects.data.audio_labels import AUDIO_LABELS, EMPTY_AUDIO_LABELS
+from tests.objects.data.audio_objects import AUDIO_OBJECTS
+from tests.objects.data.data_group import (
+    all_modalities,
+    multilayer_image,
+    scene,
+    two_audio,
+    two_html,
+    two_images,
+    two_text,
+    two_videos,
+)
+from tests.objects.data.dicom_labels import dicom_labels
+from tests.objects.data.dicom_labels_with_metadata import DICOM_LABELS_WITH_METADATA_TEST_BLURB
+from tests.objects.data.dynamic_classifications_ontology import dynamic_classifications_ontology
+from tests.objects.data.empty_image_group import empty_image_group_labels, empty_image_group_ontology
+from tests.objects.data.global_classification_labels import GLOBAL_CLASSIFICATION_LABELS
+from tests.objects.data.html_text_labels import EMPTY_HTML_TEXT_LABELS, HTML_TEXT_LABELS
+from tests.objects.data.image_group import image_group_labels, image_group_ontology
+from tests.objects.data.ontology_with_many_dynamic_classifications import (
+    ontology as ontology_with_many_dynamic_classifications,
+)
+from tests.objects.data.plain_text import EMPTY_PLAIN_TEXT_LABELS, PLAIN_TEXT_LABELS
 
 UID = "d958ddbb-fcd0-477a-adf9-de14431dbbd2"
 
@@ -54,3 +99,236 @@ def test_project_datasets(api_get: MagicMock, project: Project) -> None:
         "title": "test dataset",
         "description": "my test dataset",
     }
+
+
+def _label_row_mocks(label_dicts: List[Dict[str, Any]]) -> List[MagicMock]:
+    rows = []
+    for label_dict in label_dicts:
+        row = MagicMock()
+        row.label_hash = label_dict["label_hash"]
+        rows.append(row)
+    return rows
+
+
+def _round_trip(
+    label_dict: Dict[str, Any],
+    ontology_structure: OntologyStructure,
+    metadata: LabelRowMetadata = BASE_LABEL_ROW_METADATA,
+) -> Dict[str, Any]:
+    return _label_row(label_dict, ontology_structure, metadata, parse=True).to_encord_dict()
+
+
+def _label_row(
+    label_dict: Dict[str, Any], ontology_structure: OntologyStructure, metadata: LabelRowMetadata, parse: bool = False
+) -> LabelRowV2:
+    ontology = MagicMock()
+    ontology.structure = ontology_structure
+    label_row = LabelRowV2(dataclasses.replace(metadata, label_hash=label_dict["label_hash"]), MagicMock(), ontology)
+    if parse:
+        label_row.from_labels_dict(deepcopy(label_dict))
+    return label_row
+
+
+_BOX_ONTOLOGY = OntologyStructure(
+    objects=[
+        Object(
+            uid=1, name="Box", color="#D33115", shape=Shape.BOUNDING_BOX, feature_node_hash="MjI2NzEy", attributes=[]
+        )
+    ]
+)
+_DICOM_METADATA = dataclasses.replace(
+    BASE_LABEL_ROW_METADATA, data_type="DICOM", number_of_frames=56, height=512, width=512
+)
+
+# Every label fixture, with the ontology and metadata it is parsed with
+_LABEL_FIXTURES = [
+    pytest.param(data_1.labels, OntologyStructure.from_dict(data_1.ontology), BASE_LABEL_ROW_METADATA, id="data_1"),
+    pytest.param(
+        skeleton_coordinates.labels,
+        OntologyStructure.from_dict(skeleton_coordinates.ontology),
+        BASE_LABEL_ROW_METADATA,
+        id="skeleton_coordinates",
+    ),
+    pytest.param(
+        native_image_data.labels,
+        OntologyStructure.from_dict(all_ontology_types),
+        BASE_LABEL_ROW_METADATA,
+        id="native_image_data",
+    ),
+    pytest.param(
+        native_image_data_classification_with_no_answer.labels,
+        all_types_structure,
+        BASE_LABEL_ROW_METADATA,
+        id="native_image_data_classification_with_no_answer",
+    ),
+    pytest.param(
+        image_group_with_reviews.labels, all_types_structure, BASE_LABEL_ROW_METADATA, id="image_group_with_reviews"
+    ),
+    pytest.param(empty_video.labels, all_types_structure, BASE_LABEL_ROW_METADATA, id="empty_video"),
+    pytest.param(
+        video_with_classifications.labels, all_types_structure, BASE_LABEL_ROW_METADATA, id="video_with_classifications"
+    ),
+    pytest.param(
+        video_with_classifications.labels_without_answer_meta,
+        all_types_structure,
+        BASE_LABEL_ROW_METADATA,
+        id="video_with_classifications_without_answer_meta",
+    ),
+    pytest.param(
+        video_with_dynamic_classifications.labels,
+        OntologyStructure.from_dict(ontology_with_many_dynamic_classifications),
+        BASE_LABEL_ROW_METADATA,
+        id="video_with_dynamic_classifications",
+    ),
+    pytest.param(
+        video_with_dynamic_classifications_ui_constructed.labels,
+        OntologyStructure.from_dict(ontology_with_many_dynamic_classifications),
+        BASE_LABEL_ROW_METADATA,
+        id="video_with_dynamic_classifications_ui_constructed",
+    ),
+    pytest.param(AUDIO_LABELS, all_types_structure, BASE_LABEL_ROW_METADATA, id="audio_labels"),
+    pytest.param(EMPTY_AUDIO_LABELS, all_types_structure, BASE_LABEL_ROW_METADATA, id="empty_audio_labels"),
+    pytest.param(AUDIO_OBJECTS, all_types_structure, BASE_LABEL_ROW_METADATA, id="audio_objects"),
+    pytest.param(
+        dicom_labels,
+        OntologyStructure.from_dict(dynamic_classifications_ontology),
+        BASE_LABEL_ROW_METADATA,
+        id="dicom_labels",
+    ),
+    pytest.param(
+        DICOM_LABELS_WITH_METADATA_TEST_BLURB, _BOX_ONTOLOGY, _DICOM_METADATA, id="dicom_labels_with_metadata"
+    ),
+    pytest.param(
+        empty_image_group_labels,
+        OntologyStructure.from_dict(empty_image_group_ontology),
+        BASE_LABEL_ROW_METADATA,
+        id="empty_image_group",
+    ),
+    pytest.param(
+        image_group_labels, OntologyStructure.from_dict(image_group_ontology), BASE_LABEL_ROW_METADATA, id="image_group"
+    ),
+    pytest.param(
+        GLOBAL_CLASSIFICATION_LABELS, all_types_structure, BASE_LABEL_ROW_METADATA, id="global_classification_labels"
+    ),
+    pytest.param(HTML_TEXT_LABELS, all_types_structure, BASE_LABEL_ROW_METADATA, id="html_text_labels"),
+    pytest.param(EMPTY_HTML_TEXT_LABELS, all_types_structure, BASE_LABEL_ROW_METADATA, id="empty_html_text_labels"),
+    pytest.param(PLAIN_TEXT_LABELS, all_types_structure, BASE_LABEL_ROW_METADATA, id="plain_text_labels"),
+    pytest.param(EMPTY_PLAIN_TEXT_LABELS, all_types_structure, BASE_LABEL_ROW_METADATA, id="empty_plain_text_labels"),
+    pytest.param(
+        all_modalities.DATA_GROUP_WITH_LABELS,
+        all_types_structure,
+        all_modalities.DATA_GROUP_METADATA,
+        id="data_group_all_modalities",
+    ),
+    pytest.param(
+        multilayer_image.DATA_GROUP_MULTILAYER_IMAGE_LABELS,
+        all_types_structure,
+        multilayer_image.DATA_GROUP_MULTILAYER_IMAGE_METADATA,
+        id="data_group_multilayer_image",
+    ),
+    pytest.param(scene.SCENE_WITH_LABELS, all_types_structure, scene.SCENE_METADATA, id="scene"),
+    pytest.param(
+        two_audio.DATA_GROUP_WITH_TWO_AUDIO_LABELS,
+        all_types_structure,
+        two_audio.DATA_GROUP_METADATA,
+        id="data_group_two_audio",
+    ),
+    pytest.param(
+        two_html.DATA_GROUP_WITH_TWO_HTML, all_types_structure, two_html.DATA_GROUP_METADATA, id="data_group_two_html"
+    ),
+    pytest.param(
+        two_images.DATA_GROUP_WITH_TWO_IMAGES_LABELS,
+        all_types_structure,
+        two_images.DATA_GROUP_METADATA,
+        id="data_group_two_images",
+    ),
+    pytest.param(
+        two_text.DATA_GROUP_WITH_TWO_TEXT_LABELS,
+        all_types_structure,
+        two_text.DATA_GROUP_METADATA,
+        id="data_group_two_text",
+    ),
+    pytest.param(
+        two_videos.DATA_GROUP_WITH_TWO_VIDEOS_LABELS,
+        all_types_structure,
+        two_videos.DATA_GROUP_WITH_TWO_VIDEOS_METADATA,
+        id="data_group_two_videos",
+    ),
+]
+
+
+@pytest.mark.parametrize("label_dict, ontology_structure, metadata", _LABEL_FIXTURES)
+def test_export_coco_labels_matches_label_row_round_trip(
+    project: Project, label_dict: Dict[str, Any], ontology_structure: OntologyStructure, metadata: LabelRowMetadata
+) -> None:
+    try:
+        expected = CocoExporter([_round_trip(label_dict, ontology_structure, metadata)], ontology=ontology_structure)
+        expected_coco_labels: Any = expected.export()
+    except Exception as e:
+        # Data groups cannot be exported to COCO, which must fail the same way
+        expected_coco_labels = e
+
+    with (
+        patch.object(
+            Project, "list_label_rows_v2", return_value=[_label_row(label_dict, ontology_structure, metadata)]
+        ),
+        patch.object(Project, "ontology_structure", new_callable=PropertyMock, return_value=ontology_structure),
+        patch.object(project._client, "get_label_rows", return_value=[deepcopy(label_dict)]) as get_label_rows,
+    ):
+        if isinstance(expected_coco_labels, Exception):
+            with pytest.raises(type(expected_coco_labels)):
+                project.export_coco_labels(
+                    include_object_feature_hashes={"a"}, include_classification_feature_hashes={"b"}
+                )
+        else:
+            coco_labels = project.export_coco_labels(
+                include_object_feature_hashes={"a"}, include_classification_feature_hashes={"b"}
+            )
+            assert coco_labels == expected_coco_labels
+
+    get_label_rows.assert_called_once_with(
+        [label_dict["label_hash"]],
+        get_signed_url=False,
+        include_object_feature_hashes={"a"},
+        include_classification_feature_hashes={"b"},
+    )
+
+
+def test_export_coco_labels_initialises_unlabelled_rows(project: Project) -> None:
+    ontology_structure = OntologyStructure.from_dict(data_1.ontology)
+    labelled_row, unlabelled_row = _label_row_mocks([data_1.labels, {**data_1.labels, "label_hash": None}])
+    unlabelled_row.to_encord_dict.return_value = data_1.labels
+
+    with (
+        patch.object(Project, "list_label_rows_v2", return_value=[unlabelled_row, labelled_row]),
+        patch.object(Project, "ontology_structure", new_callable=PropertyMock, return_value=ontology_structure),
+        patch.object(project._client, "get_label_rows", return_value=[data_1.labels]) as get_label_rows,
+    ):
+        coco_labels = project.export_coco_labels()
+
+    assert coco_labels == CocoExporter([data_1.labels, data_1.labels], ontology=ontology_structure).export()
+    get_label_rows.assert_called_once()
+    unlabelled_row.initialise_labels.assert_called_once()
+    labelled_row.initialise_labels.assert_not_called()
+
+
+def test_export_coco_labels_to_writes_label_rows_in_chunks(project: Project, tmp_path) -> None:
+    label_dicts = [{**data_1.labels, "label_hash": str(i)} for i in range(5)]
+    ontology_structure = OntologyStructure.from_dict(data_1.ontology)
+    path = tmp_path / "coco.json"
+
+    def get_label_rows(uids: List[str], *args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+        return [label_dict for label_dict in label_dicts if label_dict["label_hash"] in uids]
+
+    with (
+        patch.object(Project, "list_label_rows_v2", return_value=_label_row_mocks(label_dicts)),
+        patch.object(Project, "ontology_structure", new_callable=PropertyMock, return_value=ontology_structure),
+        patch.object(project._client, "get_label_rows", side_effect=get_label_rows) as get_label_rows_mock,
+    ):
+        expected = project.export_coco_labels()
+        project.export_coco_labels_to(path, chunk_size=2)
+
+    with open(path) as f:
+        assert json.load(f) == json.loads(json.dumps(expected))
+    # One call for the whole export, then one call per chunk
+    assert get_label_rows_mock.call_count == 1 + 3
@@ -0,0 +1,177 @@
+from pathlib import Path
+from typing import Any, Collection, Dict, List, Set
+from unittest.mock import MagicMock, patch
+from uuid import UUID, uuid4
+
+import pytest
+
+import encord.storage
+from encord.exceptions import CloudUploadError, EncordException
+from encord.http.v2.payloads import Page
+from encord.orm.dataset import DataUnitError, LongPollingStatus
+from encord.orm.storage import (
+    PostUploadJobParams,
+    StorageItemType,
+    StorageItemWithName,
+    UploadLongPollingState,
+    UploadSignedUrl,
+    UploadSignedUrlsPayload,
+)
+from encord.storage import StorageFolder
+
+
+class _ApiClient:
+    """Serves signed URLs and upload jobs, and registers all uploaded items except `rejected_titles`.
+
+    The signed URL requests, job starts and job polls whose (zero-based) index is in the matching `failing_*` set fail.
+    """
+
+    def __init__(
+        self,
+        rejected_titles: Set[str],
+        failing_signed_urls: Collection[int] = (),
+        failing_job_starts: Collection[int] = (),
+        failing_polls: Collection[int] = (),
+    ) -> None:
+        self.rejected_titles = rejected_titles
+        self.failing_signed_urls = failing_signed_urls
+        self.failing_job_starts = failing_job_starts
+        self.failing_polls = failing_polls
+        self.signed_url_counts: List[int] = []
+        self.job_starts = 0
+        self.jobs: Dict[UUID, PostUploadJobParams] = {}
+        self.polled_jobs: List[UUID] = []
+
+    def post(self, path: str, params: Any, payload: Any, result_type: Any, **kwargs: Any) -> Any:
+        if path.endswith("/upload-signed-urls"):
+            assert isinstance(payload, UploadSignedUrlsPayload)
+            self.signed_url_counts.append(payload.count)
+            if len(self.signed_url_counts) - 1 in self.failing_signed_urls:
+                raise EncordException("signed urls unavailable")
+            return Page(
+                results=[
+                    UploadSignedUrl(item_uuid=uuid4(), object_key=f"key-{uuid4()}", signed_url=f"https://upload/{i}")
+                    for i in range(payload.count)
+                ]
+            )
+        assert path.endswith("/data-upload-jobs")
+        assert payload.ignore_errors
+        self.job_starts += 1
+        if self.job_starts - 1 in self.failing_job_starts:
+            raise EncordException("job not started")
+        upload_job_id = uuid4()
+        self.jobs[upload_job_id] = payload
+        return upload_job_id
+
+    def get(self, path: str, params: Any, result_type: Any) -> Any:
+        upload_job_id = UUID(path.rsplit("/", 1)[-1])
+        self.polled_jobs.append(upload_job_id)
+        if len(self.polled_jobs) - 1 in self.failing_polls:
+            raise EncordException("job status unavailable")
+        images = self.jobs[upload_job_id].data_items.images
+        return UploadLongPollingState(
+            status=LongPollingStatus.DONE,
+            items_with_names=[
+                StorageItemWithName(item_uuid=image.placeholder_item_uuid, name=image.title)
+                for image in images
+                if image.title not in self.rejected_titles
+            ],
+            errors=[f"{title} rejected" for title in self.rejected_titles],
+            units_pending_count=0,
+            units_done_count=len(images),
+            units_error_count=0,
+            units_cancelled_count=0,
+            unit_errors=[
+                DataUnitError(
+                    object_urls=[image.object_url],
+                    error=f"{image.title} rejected",
+                    subtask_uuid=uuid4(),
+                    action_description="Registering the item",
+                )
+                for image in images
+                if image.title in self.rejected_titles
+            ],
+        )
+
+
+def _storage_folder(api_client: _ApiClient) -> StorageFolder:
+    orm_folder = MagicMock()
+    orm_folder.uuid = uuid4()
+    return StorageFolder(api_client, orm_folder)  # type: ignore[arg-type]
+
+
+def _upload_single_file(file_path: Any, title: str, *args: Any, **kwargs: Any) -> None:
+    with open(file_path, "rb"):
+        pass
+    if "fail" in title:
+        raise CloudUploadError(f"Error uploading file '{title}'")
+
+
+@pytest.mark.parametrize("job_max_items", [10000, 100])
+def test_upload_files(tmp_path: Path, job_max_items: int) -> None:
+    file_paths: List[Path] = []
+    for i in range(450):
+        file_path = tmp_path / f"image-{i}.jpg"
+        file_path.write_bytes(b"")
+        file_paths.append(file_path)
+    failed_upload = tmp_path / "image-fail.jpg"
+    failed_upload.write_bytes(b"")
+    missing_file = tmp_path / "image-missing.jpg"
+    file_paths[10:10] = [failed_upload, missing_file]
+    api_client = _ApiClient(rejected_titles={"image-20.jpg"})
+
+    with patch.object(encord.storage, "_upload_single_file", side_effect=_upload_single_file):
+        with patch.object(encord.storage, "UPLOAD_FILES_JOB_MAX_ITEMS", job_max_items):
+            results = _storage_folder(api_client).upload_files(file_paths, StorageItemType.IMAGE, max_workers=3)
+
+    assert [result.file_path for result in results] == file_paths
+    failed = {result.title for result in results if result.item_uuid is None}
+    assert failed == {"image-fail.jpg", "image-missing.jpg", "image-20.jpg"}
+    assert all(result.error for result in results if result.item_uuid is None)
+    assert all(result.error is None for result in results if result.item_uuid is not None)
+    assert len({result.item_uuid for result in results if result.item_uuid is not None}) == 449
+
+    assert api_client.signed_url_counts == [200, 200, 52]
+    assert sorted(api_client.polled_jobs) == sorted(api_client.jobs)
+    registered_titles = [image.title for job in api_client.jobs.values() for image in job.data_items.images]
+    assert len(registered_titles) == 450
+    # One job per batch of signed URLs once a batch reaches the limit, a single job otherwise
+    assert len(api_client.jobs) == (1 if job_max_items == 10000 else 3)
+    (rejected,) = [result for result in results if result.title == "image-20.jpg"]
+    assert rejected.error == "Could not register image-20.jpg: image-20.jpg rejected"
+
+
+def test_upload_files_partial_failures(tmp_path: Path) -> None:
+    file_paths: List[Path] = []
+    for i in range(650):
+        file_path = tmp_path / f"image-{i}.jpg"
+        file_path.write_bytes(b"")
+        file_paths.append(file_path)
+    rejected_titles = {f"image-{i}.jpg" for i in range(600, 650)}
+    # Batch 0 fails to start its job, batch 1 gets no upload locations, batch 2 fails to report its status
+    api_client = _ApiClient(rejected_titles, failing_signed_urls={1}, failing_job_starts={0}, failing_polls={0})
+
+    with patch.object(encord.storage, "_upload_single_file", side_effect=_upload_single_file):
+        with patch.object(encord.storage, "UPLOAD_FILES_JOB_MAX_ITEMS", 100):
+            results = _storage_folder(api_client).upload_files(file_paths, StorageItemType.IMAGE, max_workers=3)
+
+    assert api_client.signed_url_counts == [200, 200, 200, 50]
+    assert len(api_client.jobs) == 2
+    errors = [result.error or "" for result in results]
+    # The failed request is reported with its context, such as its timestamp
+    assert all(errors[i].startswith(f"Could not register image-{i}.jpg: job not started ") for i in range(200))
+    assert all(
+        errors[i].startswith(f"Could not get an upload location for image-{i}.jpg: signed urls unavailable ")
+        for i in range(200, 400)
+    )
+    assert all(
+        errors[i].startswith(f"Could not register image-{i}.jpg: job status unavailable ") for i in range(400, 600)
+    )
+    # Each rejected file only reports its own error, not those of the whole job
+    assert errors[600:] == [f"Could not register image-{i}.jpg: image-{i}.jpg rejected" for i in range(600, 650)]
+    assert all(result.item_uuid is None for result in results)
+
+
+def test_upload_files_unsupported_item_type() -> None:
+    with pytest.raises(ValueError):
+        _storage_folder(_ApiClient(set())).upload_files([], StorageItemType.DICOM_FILE)
@@ -1,9 +1,17 @@
+import json
+import time
+from copy import deepcopy
 from typing import Any, Dict, List
 
+import cv2
+import numpy as np
 import pytest
 from deepdiff import DeepDiff
-from shapely.geometry import MultiPolygon
+from pycocotools import mask as cocomask
+from shapely.geometry import MultiPolygon, Polygon
 
+from encord.objects.attributes import Attribute, ChecklistAttribute, RadioAttribute
+from encord.objects.common import Shape
 from encord.utilities.coco.exporter import CocoExporter, OntologyStructure
 from tests.utilities.coco.data.exporter import (
     COCO_EXPORTER_EXPECTED_RES,
@@ -15,6 +23,10 @@ from tests.utilities.coco.data.exporter import (
     ONTOLOGY_STRUCTURE_DICT,
 )
 
+# Performance threshold (in seconds)
+EXPORT_LARGE_ONTOLOGY_THRESHOLD = 1.5
+EXPORT_SMALL_MULTIPOLYGONS_ON_4K_IMAGES_THRESHOLD = 1.0
+
 
 @pytest.fixture
 def coco_exporter() -> CocoExporter:
@@ -98,3 +110,276 @@ def test_get_rle_segmentation_from_multipolygon(
     segmentation = coco_exporter.get_rle_segmentation_from_multipolygon(multipolygon, w, h)
 
     assert not DeepDiff(segmentation, expected_segmentation)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, len(LABELS_LIST)])
+def test_export_to_file_matches_export(tmp_path, chunk_size: int) -> None:
+    ontology = OntologyStructure.from_dict(ONTOLOGY_STRUCTURE_DICT)
+    expected = json.loads(json.dumps(CocoExporter(LABELS_LIST, ontology=ontology).export()))
+    chunks = [LABELS_LIST[i : i + chunk_size] for i in range(0, len(LABELS_LIST), chunk_size)]
+    path = tmp_path / "coco.json"
+
+    CocoExporter([], ontology=ontology).export_to_file(path, iter(chunks))
+
+    with open(path) as f:
+        assert json.load(f) == expected
+
+
+def test_export_to_file_without_chunks(tmp_path, coco_exporter: CocoExporter) -> None:
+    ontology = OntologyStructure.from_dict(ONTOLOGY_STRUCTURE_DICT)
+    expected = json.loads(json.dumps(CocoExporter(LABELS_LIST, ontology=ontology).export()))
+    path = tmp_path / "coco.json"
+
+    coco_exporter.export_to_file(path)
+
+    with open(path) as f:
+        assert json.load(f) == expected
+
+
+def test_export_to_file_with_no_labels(tmp_path) -> None:
+    ontology = OntologyStructure.from_dict(ONTOLOGY_STRUCTURE_DICT)
+    path = tmp_path / "coco.json"
+
+    CocoExporter([], ontology=ontology).export_to_file(path, iter([]))
+
+    with open(path) as f:
+        assert json.load(f) == CocoExporter([], ontology=ontology).export()
+
+
+def _full_image_rle_segmentation(multipolygon: MultiPolygon, w: int, h: int) -> Dict[str, Any]:
+    mask = np.zeros((h, w), dtype=np.uint8)
+    for polygon in sorted(multipolygon.geoms, key=lambda p: p.area, reverse=True):
+        cv2.fillPoly(mask, [np.array(polygon.exterior.coords, dtype=np.int32)], color=(255, 255, 255))
+        for interior in polygon.interiors:
+            cv2.fillPoly(mask, [np.array(interior.coords, dtype=np.int32)], color=(0, 0, 0))
+    segmentation = cocomask.encode(np.asfortranarray(mask))
+    segmentation["counts"] = segmentation["counts"].decode("ascii")
+    return segmentation
+
+
+@pytest.mark.parametrize(
+    "polygons",
+    [
+        [],
+        # Inside of the image
+        [(((2.5, 3.5), (20.2, 4.1), (15.7, 18.9)),)],
+        # With a hole that reaches out of the polygon
+        [(((10, 10), (30, 10), (30, 30), (10, 30)), [((25, 15), (35, 15), (35, 20))])],
+        # Beyond the borders of the image, so that the runs continue from one column into the next one
+        [(((-5, -5), (50, 0), (45, 60), (0, 45)),), (((35, 2), (38, 2), (38, 6)),)],
+        [(((39, 29), (60, 29), (60, 60), (39, 60)),)],
+        [(((-10, -10), (-5, -10), (-5, -5)),)],
+    ],
+)
+def test_get_rle_segmentation_from_multipolygon_matches_full_image_rasterisation(
+    coco_exporter: CocoExporter, polygons
+) -> None:
+    w, h = 40, 30
+    multipolygon = MultiPolygon(polygons)
+
+    segmentation = coco_exporter.get_rle_segmentation_from_multipolygon(multipolygon, w, h)
+
+    assert segmentation == _full_image_rle_segmentation(multipolygon, w, h)
+
+
+def test_get_simple_polygons_geometry_matches_shapely(coco_exporter: CocoExporter) -> None:
+    w, h = 640, 480
+    polygon_list = [{"x": 0.1, "y": 0.2}, {"x": 0.5, "y": 0.15}, {"x": 0.45, "y": 0.7}, {"x": 0.12, "y": 0.6}]
+    polygon_dict = {str(i): point for i, point in enumerate(reversed(polygon_list))}
+    triangle = [{"x": 0.9, "y": 0.9}, {"x": 0.95, "y": 0.91}, {"x": 0.93, "y": 0.99}]
+
+    geometries = coco_exporter.get_simple_polygons_geometry([polygon_list, polygon_dict, triangle], w, h)
+
+    for polygon_dict_or_list, (segmentation, area, bbox) in zip([polygon_list, polygon_dict, triangle], geometries):
+        points = coco_exporter.get_polygon_from_dict_or_list(polygon_dict_or_list, w, h)
+        polygon = Polygon(points)
+        x, y, x_max, y_max = polygon.bounds
+        assert segmentation == [coordinate for point in points for coordinate in point]
+        assert area == polygon.area
+        assert bbox == (x, y, x_max - x, y_max - y)
+    assert coco_exporter.get_simple_polygons_geometry([], w, h) == []
+
+
+def _labels_with_distinct_data_hashes(copies: int) -> List[Dict[str, Any]]:
+    labels_list = []
+    for i in range(copies):
+        for labels in deepcopy(LABELS_LIST):
+            for data_unit in labels["data_units"].values():
+                data_unit["data_hash"] = f"{data_unit['data_hash']}-{i}"
+            labels_list.append(labels)
+    return labels_list
+
+
+@pytest.mark.parametrize("max_workers", [1, 2, 3])
+@pytest.mark.parametrize(
+    "labels_list",
+    [
+        LABELS_LIST,
+        _labels_with_distinct_data_hashes(copies=5),
+        # The same data in several rows, where later rows overwrite the image ids of earlier ones
+        LABELS_LIST * 3,
+    ],
+)
+def test_export_parallel_matches_export(labels_list: List[Dict[str, Any]], max_workers: int) -> None:
+    ontology = OntologyStructure.from_dict(ONTOLOGY_STRUCTURE_DICT)
+    expected = CocoExporter(labels_list, ontology=ontology).export()
+
+    coco_dict = CocoExporter(labels_list, ontology=ontology).export_parallel(max_workers=max_workers)
+
+    assert not DeepDiff(expected, coco_dict)
+
+
+def test_export_parallel_with_no_labels() -> None:
+    ontology = OntologyStructure.from_dict(ONTOLOGY_STRUCTURE_DICT)
+
+    assert CocoExporter([], ontology=ontology).export_parallel() == CocoExporter([], ontology=ontology).export()
+
+
+def test_export_parallel_takes_dynamic_classifications_from_first_annotated_row() -> None:
+    ontology = OntologyStructure.from_dict(ONTOLOGY_STRUCTURE_DICT)
+    labels_list = _labels_with_distinct_data_hashes(copies=5)
+    # Like the serial exporter, every shard must use the dynamic answers of the first row, which here cover the
+    # images of all copies of its objects
+    for object_actions in labels_list[0]["object_actions"].values():
+        for action in object_actions["actions"]:
+            action["range"] = [[0, 1000]]
+    expected = CocoExporter(labels_list, ontology=ontology).export()
+
+    coco_dict = CocoExporter(labels_list, ontology=ontology).export_parallel(max_workers=2)
+
+    assert not DeepDiff(expected, coco_dict)
+
+
+def _large_ontology(num_classes: int) -> OntologyStructure:
+    ontology = OntologyStructure()
+    for i in range(num_classes):
+        object_ = ontology.add_object(name=f"class {i}", shape=Shape.BOUNDING_BOX)
+        checklist = object_.add_attribute(ChecklistAttribute, name=f"checklist {i}")
+        radio = object_.add_attribute(RadioAttribute, name=f"radio {i}", dynamic=True)
+        for j in range(5):
+            checklist.add_option(label=f"checklist {i} option {j}")
+            radio.add_option(label=f"radio {i} option {j}")
+    return ontology
+
+
+def _bounding_box_labels(ontology: OntologyStructure, num_images: int, objects_per_image: int) -> List[Dict[str, Any]]:
+    labels_list = []
+    for i in range(num_images):
+        objects = [
+            {
+                "objectHash": f"object-{i}-{j}",
+                "featureHash": ontology.objects[(i * objects_per_image + j) % len(ontology.objects)].feature_node_hash,
+                "shape": "bounding_box",
+                "manualAnnotation": True,
+                "boundingBox": {"x": 0.1, "y": 0.2, "w": 0.3, "h": 0.4},
+            }
+            for j in range(objects_per_image)
+        ]
+        data_unit = {
+            "data_hash": f"data-{i}",
+            "data_type": "image/jpeg",
+            "data_title": "image.jpg",
+            "data_link": "https://example.com/image.jpg",
+            "width": 100,
+            "height": 50,
+            "labels": {"objects": objects},
+        }
+        labels_list.append(
+            {
+                "data_title": "image.jpg",
+                "data_type": "image",
+                "data_units": {f"data-{i}": data_unit},
+                "object_answers": {},
+                "object_actions": {},
+            }
+        )
+    return labels_list
+
+
+def test_unselected_attributes_use_overridden_attributes_lookup() -> None:
+    ontology = _large_ontology(num_classes=2)
+    first_class, second_class = ontology.objects
+
+    class SwappedAttributesExporter(CocoExporter):
+        def get_attributes_for_feature_hash(self, feature_hash: str) -> List[Attribute]:
+            if feature_hash == first_class.feature_node_hash:
+                return list(second_class.attributes)
+            return super().get_attributes_for_feature_hash(feature_hash)
+
+    labels_list = _bounding_box_labels(ontology, num_images=1, objects_per_image=1)
+    coco_dict = SwappedAttributesExporter(labels_list, ontology=ontology).export()
+
+    assert coco_dict["annotations"][0]["attributes"]["classifications"] == {
+        **{f"checklist 1 option {j}": False for j in range(5)},
+        "radio 1": None,
+    }
+    assert CocoExporter(labels_list, ontology=ontology).get_attributes_for_feature_hash("unknown") == []
+
+
+def test_export_with_large_ontology():
+    ontology = _large_ontology(num_classes=500)
+    labels_list = _bounding_box_labels(ontology, num_images=2000, objects_per_image=10)
+
+    start = time.perf_counter()
+    coco_dict = CocoExporter(labels_list, ontology=ontology).export()
+    elapsed = time.perf_counter() - start
+
+    print(f"\nexport {len(coco_dict['annotations'])} annotations with {len(ontology.objects)} classes: {elapsed:.4f}s")
+    assert len(coco_dict["annotations"]) == 20000
+    assert coco_dict["annotations"][-1]["bbox"] == [10.0, 10.0, 30.0, 20.0]
+    assert elapsed < EXPORT_LARGE_ONTOLOGY_THRESHOLD, (
+        f"Exporting with a large ontology took {elapsed:.4f}s, threshold is {EXPORT_LARGE_ONTOLOGY_THRESHOLD}s"
+    )
+
+
+def test_export_small_multipolygons_on_4k_images():
+    ontology = OntologyStructure()
+    polygon_class = ontology.add_object(name="polygon", shape=Shape.POLYGON)
+
+    def ring(x: float, y: float, radius: float) -> List[float]:
+        return [x - radius, y - radius, x + radius, y - radius, x + radius, y + radius, x - radius, y + radius]
+
+    centers = [(x / 10 + 0.05, y / 5 + 0.1) for y in range(5) for x in range(10)]
+    labels_list = []
+    for i in range(10):
+        objects = [
+            {
+                "objectHash": f"object-{i}-{j}",
+                "featureHash": polygon_class.feature_node_hash,
+                "shape": "polygon",
+                "manualAnnotation": True,
+                "polygons": [[ring(*center, radius=0.01), ring(*center, radius=0.004)]],
+            }
+            for j, center in enumerate(centers)
+        ]
+        labels_list.append(
+            {
+                "data_title": "image.jpg",
+                "data_type": "image",
+                "data_units": {
+                    f"data-{i}": {
+                        "data_hash": f"data-{i}",
+                        "data_type": "image/jpeg",
+                        "data_title": "image.jpg",
+                        "data_link": "https://example.com/image.jpg",
+                        "width": 3840,
+                        "height": 2160,
+                        "labels": {"objects": objects},
+                    }
+                },
+                "object_answers": {},
+                "object_actions": {},
+            }
+        )
+
+    start = time.perf_counter()
+    coco_dict = CocoExporter(labels_list, ontology=ontology).export()
+    elapsed = time.perf_counter() - start
+
+    print(f"\nexport {len(coco_dict['annotations'])} multipolygons on 4K images: {elapsed:.4f}s")
+    assert len(coco_dict["annotations"]) == 500
+    assert all(annotation["iscrowd"] == 1 for annotation in coco_dict["annotations"])
+    assert elapsed < EXPORT_SMALL_MULTIPOLYGONS_ON_4K_IMAGES_THRESHOLD, (
+        f"Exporting small multipolygons on 4K images took {elapsed:.4f}s, "
+        f"threshold is {EXPORT_SMALL_MULTIPOLYGONS_ON_4K_IMAGES_THRESHOLD}s"
+    )
@@ -0,0 +1,420 @@
+import gc
+import json
+import logging
+import time
+import weakref
+from typing import Any, Dict, List, Set
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from encord.objects.common import Shape
+from encord.objects.coordinates import BoundingBoxCoordinates
+from encord.objects.ontology_structure import OntologyStructure
+from encord.utilities.coco.datastructure import CocoAnnotationModel, CocoImageModel, CocoRootModel, FrameIndex
+from encord.utilities.coco.importer import (
+    CocoAnnotationToImport,
+    coco_annotation_to_encord_coordinates,
+    coco_annotations_to_encord_coordinates,
+    import_coco_labels,
+    import_coco_labels_from_file,
+)
+
+# Performance threshold (in seconds)
+CONVERT_MANY_POLYGONS_THRESHOLD = 0.5
+
+
+def _coco_dict(num_images: int, annotations_per_image: int) -> Dict[str, Any]:
+    return {
+        "categories": [{"id": 1, "name": "box"}],
+        "images": [{"id": i, "width": 200, "height": 100} for i in range(num_images)],
+        "annotations": [
+            {
+                "id": i * annotations_per_image + j,
+                "image_id": i,
+                "category_id": 1,
+                "bbox": [10.0 * j, 20.0, 40.0, 50.0],
+                "area": 2000.0,
+                "iscrowd": 0,
+            }
+            for i in range(num_images)
+            for j in range(annotations_per_image)
+        ],
+    }
+
+
+def _coco(num_images: int, annotations_per_image: int) -> CocoRootModel:
+    return CocoRootModel.from_dict(_coco_dict(num_images, annotations_per_image))
+
+
+class _Project:
+    """Tracks which label rows have initialised labels that are not saved yet."""
+
+    def __init__(self, data_hashes: List[str]) -> None:
+        self.ontology_structure = OntologyStructure()
+        self.box = self.ontology_structure.add_object(name="box", shape=Shape.BOUNDING_BOX)
+        self.mask = self.ontology_structure.add_object(name="mask", shape=Shape.BITMASK)
+        self.unsaved: Set[str] = set()
+        self.max_unsaved = 0
+        self.saved: List[str] = []
+        self.label_rows = [self._label_row(data_hash) for data_hash in data_hashes]
+
+    def _label_row(self, data_hash: str) -> MagicMock:
+        label_row = MagicMock()
+        label_row.data_hash = data_hash
+
+        def initialise_labels(**kwargs: Any) -> None:
+            self.unsaved.add(data_hash)
+            self.max_unsaved = max(self.max_unsaved, len(self.unsaved))
+
+        def save(**kwargs: Any) -> None:
+            self.unsaved.remove(data_hash)
+            self.saved.append(data_hash)
+
+        label_row.initialise_labels.side_effect = initialise_labels
+        label_row.save.side_effect = save
+        return label_row
+
+    def list_label_rows_v2(self, data_hashes: List[str], branch_name: Any = None) -> List[MagicMock]:
+        return [label_row for label_row in self.label_rows if label_row.data_hash in data_hashes]
+
+    def create_bundle(self) -> MagicMock:
+        return MagicMock()
+
+
+def _added_boxes(label_row: MagicMock) -> List[BoundingBoxCoordinates]:
+    return [call.args[0].get_annotation(0).coordinates for call in label_row.add_object_instance.call_args_list]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 100])
+def test_import_coco_labels_in_chunks(chunk_size: int) -> None:
+    data_hashes = [f"data-{i}" for i in range(10)]
+    project = _Project(data_hashes)
+    image_id_to_frame_index = {i: FrameIndex(data_hash) for i, data_hash in enumerate(data_hashes)}
+
+    import_coco_labels(
+        project,  # type: ignore[arg-type]
+        _coco(num_images=10, annotations_per_image=2),
+        {1: project.box.feature_node_hash},
+        image_id_to_frame_index,
+        chunk_size=chunk_size,
+    )
+
+    assert sorted(project.saved) == data_hashes
+    assert not project.unsaved
+    # The chunk being converted, the next one being initialised and the previous one being saved
+    assert project.max_unsaved <= 3 * chunk_size
+    for label_row in project.label_rows:
+        assert label_row.initialise_labels.call_count == 1
+        assert _added_boxes(label_row) == [
+            BoundingBoxCoordinates(top_left_x=0.0, top_left_y=0.2, width=0.2, height=0.5),
+            BoundingBoxCoordinates(top_left_x=0.05, top_left_y=0.2, width=0.2, height=0.5),
+        ]
+
+
+class _LabelRow:
+    """A label row that records when it is initialised, and is not referenced by its project."""
+
+    def __init__(self, data_hash: str, initialised: "weakref.WeakSet[_LabelRow]", live_counts: List[int]) -> None:
+        self.data_hash = data_hash
+        self._initialised = initialised
+        self._live_counts = live_counts
+
+    def initialise_labels(self, **kwargs: Any) -> None:
+        self._initialised.add(self)
+
+    def add_object_instance(self, object_instance: Any) -> None:
+        pass
+
+    def save(self, **kwargs: Any) -> None:
+        gc.collect()
+        self._live_counts.append(len(self._initialised))
+
+
+class _WeakProject(_Project):
+    def __init__(self, data_hashes: List[str]) -> None:
+        super().__init__([])
+        self.data_hashes = data_hashes
+        self.initialised: "weakref.WeakSet[_LabelRow]" = weakref.WeakSet()
+        self.live_counts: List[int] = []
+
+    def list_label_rows_v2(self, data_hashes: List[str], branch_name: Any = None) -> List[Any]:
+        return [_LabelRow(data_hash, self.initialised, self.live_counts) for data_hash in self.data_hashes]
+
+
+@pytest.mark.parametrize("from_file", [False, True])
+def test_import_coco_labels_frees_saved_label_rows(tmp_path, from_file: bool) -> None:
+    data_hashes = [f"data-{i}" for i in range(20)]
+    image_id_to_frame_index = {i: FrameIndex(data_hash) for i, data_hash in enumerate(data_hashes)}
+    coco_dict = _coco_dict(num_images=20, annotations_per_image=1)
+    project = _WeakProject(data_hashes)
+
+    if from_file:
+        path = tmp_path / "coco.json"
+        path.write_text(json.dumps(coco_dict), encoding="utf-8")
+        import_coco_labels_from_file(
+            project,  # type: ignore[arg-type]
+            path,
+            {1: project.box.feature_node_hash},
+            image_id_to_frame_index,
+            chunk_size=2,
+        )
+    else:
+        import_coco_labels(
+            project,  # type: ignore[arg-type]
+            CocoRootModel.from_dict(coco_dict),
+            {1: project.box.feature_node_hash},
+            image_id_to_frame_index,
+            chunk_size=2,
+        )
+
+    assert len(project.live_counts) == 20
+    # The chunk being saved, the one being labelled and the next one being initialised
+    assert max(project.live_counts) <= 3 * 2
+    gc.collect()
+    assert len(project.initialised) == 0
+
+
+def test_import_coco_labels_skips_unmatched_annotations(caplog) -> None:
+    project = _Project(["data-0"])
+    image_id_to_frame_index: Dict[int, FrameIndex] = {0: FrameIndex("data-0"), 1: FrameIndex("data-unknown")}
+
+    with caplog.at_level(logging.WARNING):
+        import_coco_labels(
+            project,  # type: ignore[arg-type]
+            _coco(num_images=3, annotations_per_image=1),
+            {1: project.box.feature_node_hash},
+            image_id_to_frame_index,
+        )
+
+    assert project.saved == ["data-0"]
+    assert len(_added_boxes(project.label_rows[0])) == 1
+    assert "Data hash `data-unknown`" in caplog.text
+    assert "Image id `2`" in caplog.text
+
+
+def test_import_coco_labels_with_missing_image_saves_nothing() -> None:
+    project = _Project(["data-0", "data-1"])
+    coco = _coco(num_images=2, annotations_per_image=1)
+    coco.images = coco.images[:1]
+
+    with pytest.raises(ValueError):
+        import_coco_labels(
+            project,  # type: ignore[arg-type]
+            coco,
+            {1: project.box.feature_node_hash},
+            {0: FrameIndex("data-0"), 1: FrameIndex("data-1")},
+            chunk_size=1,
+        )
+
+    assert project.saved == []
+
+
+def _streamed_coco_dict(num_images: int, annotations_per_image: int) -> Dict[str, Any]:
+    coco_dict = _coco_dict(num_images, annotations_per_image)
+    for annotation in coco_dict["annotations"]:
+        annotation["comment"] = "überprüft"
+    # Images after annotations, which a streamed import only sees once all annotations are read
+    return {
+        "info": {"description": "streamed"},
+        "annotations": coco_dict["annotations"],
+        "categories": coco_dict["categories"],
+        "images": coco_dict["images"],
+    }
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 100])
+def test_import_coco_labels_from_file_matches_import_coco_labels(tmp_path, chunk_size: int) -> None:
+    data_hashes = [f"data-{i}" for i in range(10)]
+    # The last image is not in the project, so its annotations are skipped by both imports
+    image_id_to_frame_index = {i: FrameIndex(data_hash) for i, data_hash in enumerate(data_hashes + ["data-unknown"])}
+    coco_dict = _streamed_coco_dict(num_images=11, annotations_per_image=3)
+    path = tmp_path / "coco.json"
+    path.write_text(json.dumps(coco_dict, ensure_ascii=False), encoding="utf-8")
+
+    project = _Project(data_hashes)
+    import_coco_labels(
+        project,  # type: ignore[arg-type]
+        CocoRootModel.from_dict(coco_dict),
+        {1: project.box.feature_node_hash},
+        image_id_to_frame_index,
+        chunk_size=chunk_size,
+    )
+    streamed_project = _Project(data_hashes)
+    import_coco_labels_from_file(
+        streamed_project,  # type: ignore[arg-type]
+        path,
+        {1: streamed_project.box.feature_node_hash},
+        image_id_to_frame_index,
+        chunk_size=chunk_size,
+    )
+
+    assert sorted(streamed_project.saved) == data_hashes
+    assert streamed_project.max_unsaved <= 3 * chunk_size
+    for label_row, streamed_label_row in zip(project.label_rows, streamed_project.label_rows):
+        assert len(_added_boxes(streamed_label_row)) == 3
+        assert _added_boxes(streamed_label_row) == _added_boxes(label_row)
+
+
+def test_import_coco_labels_from_file_with_missing_image_saves_nothing(tmp_path) -> None:
+    project = _Project(["data-0", "data-1"])
+    coco_dict = _streamed_coco_dict(num_images=2, annotations_per_image=1)
+    coco_dict["images"] = coco_dict["images"][:1]
+    path = tmp_path / "coco.json"
+    path.write_text(json.dumps(coco_dict), encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        import_coco_labels_from_file(
+            project,  # type: ignore[arg-type]
+            path,
+            {1: project.box.feature_node_hash},
+            {0: FrameIndex("data-0"), 1: FrameIndex("data-1")},
+            chunk_size=1,
+        )
+
+    assert project.saved == []
+
+
+def _coco_dict_with_invalid_last_annotation(num_images: int) -> Dict[str, Any]:
+    coco_dict = _streamed_coco_dict(num_images, annotations_per_image=1)
+    # A polygon for a bitmask object, in the chunk of the last label row
+    coco_dict["annotations"][-1]["category_id"] = 2
+    coco_dict["annotations"][-1]["segmentation"] = [[0.0, 0.0, 10.0, 0.0, 10.0, 10.0]]
+    return coco_dict
+
+
+def test_import_coco_labels_with_invalid_annotation_saves_nothing(tmp_path) -> None:
+    data_hashes = [f"data-{i}" for i in range(5)]
+    image_id_to_frame_index = {i: FrameIndex(data_hash) for i, data_hash in enumerate(data_hashes)}
+    coco_dict = _coco_dict_with_invalid_last_annotation(num_images=5)
+    path = tmp_path / "coco.json"
+    path.write_text(json.dumps(coco_dict), encoding="utf-8")
+
+    project = _Project(data_hashes)
+    with pytest.raises(ValueError, match="Expected format was an RLE"):
+        import_coco_labels(
+            project,  # type: ignore[arg-type]
+            CocoRootModel.from_dict(coco_dict),
+            {1: project.box.feature_node_hash, 2: project.mask.feature_node_hash},
+            image_id_to_frame_index,
+            chunk_size=1,
+        )
+    assert project.saved == []
+
+    streamed_project = _Project(data_hashes)
+    with pytest.raises(ValueError, match="Expected format was an RLE"):
+        import_coco_labels_from_file(
+            streamed_project,  # type: ignore[arg-type]
+            path,
+            {1: streamed_project.box.feature_node_hash, 2: streamed_project.mask.feature_node_hash},
+            image_id_to_frame_index,
+            chunk_size=1,
+        )
+    assert streamed_project.saved == []
+
+
+def _annotations_to_import(ontology_structure: OntologyStructure, num_images: int) -> List[CocoAnnotationToImport]:
+    objects = {
+        shape: ontology_structure.add_object(name=shape.value, shape=shape)
+        for shape in [Shape.BOUNDING_BOX, Shape.POLYGON, Shape.BITMASK]
+    }
+    rng = np.random.default_rng(0)
+    mask = np.zeros((30, 40), dtype=np.uint8, order="F")
+    mask[5:20, 10:30] = 1
+    mask[10:15, 15:20] = 0
+    rle = {"size": [30, 40], "counts": [int(c) for c in _column_major_counts(mask)]}
+
+    annotations = []
+    for i in range(num_images):
+        image = CocoImageModel.from_dict({"id": i, "width": 40 + i, "height": 30 + 2 * i})
+        polygons = [(rng.random(2 * int(rng.integers(3, 20))) * 30).tolist() for _ in range(int(rng.integers(1, 4)))]
+        for shape, segmentation in [
+            (Shape.BOUNDING_BOX, None),
+            (Shape.POLYGON, polygons),
+            (Shape.POLYGON, None),
+            (Shape.POLYGON, rle),
+            (Shape.BITMASK, rle),
+        ]:
+            annotation = {
+                "id": len(annotations),
+                "image_id": i,
+                "category_id": 1,
+                "bbox": [1.5 * i, 2, 10, 7.25],
+                "area": 1.0,
+                "iscrowd": 0,
+            }
+            if segmentation is not None:
+                annotation["segmentation"] = segmentation
+            annotations.append(
+                CocoAnnotationToImport(
+                    CocoAnnotationModel.from_dict(annotation), FrameIndex(f"data-{i}"), objects[shape], image
+                )
+            )
+    return annotations
+
+
+def _column_major_counts(mask: np.ndarray) -> List[int]:
+    flat = mask.flatten(order="F")
+    changes = np.flatnonzero(np.diff(flat)) + 1
+    boundaries = np.concatenate([[0], changes, [flat.size]])
+    counts = np.diff(boundaries).tolist()
+    return counts if flat[0] == 0 else [0, *counts]
+
+
+def _comparable(coordinates: Any) -> Any:
+    return coordinates.to_dict() if hasattr(coordinates, "to_dict") else coordinates
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 2])
+def test_coco_annotations_to_encord_coordinates_matches_single_conversion(max_workers) -> None:
+    annotations = _annotations_to_import(OntologyStructure(), num_images=5)
+
+    batch = coco_annotations_to_encord_coordinates(annotations, max_workers=max_workers)
+
+    assert len(batch) == len(annotations)
+    for annotation, coordinates in zip(annotations, batch):
+        expected = coco_annotation_to_encord_coordinates(
+            coco_annotation=annotation.annotation,
+            shape=annotation.ontology_object.shape,
+            width=annotation.image.width,
+            height=annotation.image.height,
+        )
+        assert type(coordinates) is type(expected)
+        assert _comparable(coordinates) == _comparable(expected)
+
+
+def test_convert_many_polygons() -> None:
+    ontology_structure = OntologyStructure()
+    polygon = ontology_structure.add_object(name="polygon", shape=Shape.POLYGON)
+    image = CocoImageModel.from_dict({"id": 0, "width": 1920, "height": 1080})
+    rng = np.random.default_rng(0)
+    annotations = [
+        CocoAnnotationToImport(
+            CocoAnnotationModel.from_dict(
+                {
+                    "id": i,
+                    "image_id": 0,
+                    "category_id": 1,
+                    "segmentation": [(rng.random(200) * 1000).tolist()],
+                    "bbox": [0, 0, 1000, 1000],
+                    "area": 1.0,
+                    "iscrowd": 0,
+                }
+            ),
+            FrameIndex("data-0"),
+            polygon,
+            image,
+        )
+        for i in range(5000)
+    ]
+
+    start = time.perf_counter()
+    coordinates = coco_annotations_to_encord_coordinates(annotations)
+    elapsed = time.perf_counter() - start
+
+    print(f"\nconvert {len(annotations)} polygons of 100 points: {elapsed:.4f}s")
+    assert len(coordinates) == len(annotations)
+    assert elapsed < CONVERT_MANY_POLYGONS_THRESHOLD, (
+        f"Converting {len(annotations)} polygons took {elapsed:.4f}s, threshold is {CONVERT_MANY_POLYGONS_THRESHOLD}s"
+    )
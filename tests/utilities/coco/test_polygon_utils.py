@@ -1,9 +1,18 @@
+import time
+
 import numpy as np
 import pytest
 
 from encord.common.bitmask_operations import serialise_bitmask
 from encord.objects.coordinates import PointCoordinate, PolygonCoordinates
-from encord.utilities.coco.polygon_utils import find_contours, rle_to_polygons_coordinates
+from encord.utilities.coco.polygon_utils import (
+    find_contours,
+    rle_to_polygons_coordinates,
+    rles_to_polygons_coordinates,
+)
+
+# Performance threshold (in seconds)
+MANY_FRAGMENTS_THRESHOLD = 1.0
 
 
 @pytest.fixture
@@ -66,3 +75,61 @@ def test_rle_to_polygons_coordinates(polygon_with_hole: np.ndarray) -> None:
             ],
         ]
     ]
+
+
+def _fragmented_mask(height: int, width: int, seed: int) -> np.ndarray:
+    # Small squares, some of them with a hole, like the fragments of a panoptic segmentation
+    rng = np.random.default_rng(seed)
+    array = np.zeros((height, width), dtype=np.uint8)
+    for top in range(0, height - 8, 10):
+        for left in range(0, width - 8, 10):
+            if rng.random() < 0.5:
+                array[top : top + 8, left : left + 8] = 1
+                if rng.random() < 0.5:
+                    array[top + 3 : top + 5, left + 3 : left + 5] = 0
+    return array
+
+
+def test_find_contours_groups_holes_with_their_outer_contour() -> None:
+    array = _fragmented_mask(100, 100, seed=0)
+
+    polygons = find_contours(array)
+
+    assert len(polygons) == int(array[::10, ::10].sum())
+    for polygon in polygons:
+        outer_xs, outer_ys = polygon[0][0::2], polygon[0][1::2]
+        for hole in polygon[1:]:
+            assert min(outer_xs) < min(hole[0::2]) and max(hole[0::2]) < max(outer_xs)
+            assert min(outer_ys) < min(hole[1::2]) and max(hole[1::2]) < max(outer_ys)
+
+
+def test_rles_to_polygons_coordinates_matches_single_conversion() -> None:
+    masks = [_fragmented_mask(60, 80, seed=seed) for seed in range(4)]
+    rles = [(serialise_bitmask(mask.tobytes()), 60, 80) for mask in masks]
+
+    batch = rles_to_polygons_coordinates(rles, max_workers=2)
+
+    assert len(batch) == len(rles)
+    for polygons, (counts, height, width) in zip(batch, rles):
+        expected = rle_to_polygons_coordinates(counts=counts, height=height, width=width)
+        assert polygons.polygons == expected.polygons
+        assert polygons.to_dict("multiple_polygons") == expected.to_dict("multiple_polygons")
+
+
+def test_rle_to_polygons_coordinates_with_many_fragments() -> None:
+    height, width = 1000, 1000
+    rles = [
+        (serialise_bitmask(_fragmented_mask(height, width, seed=seed).tobytes()), height, width) for seed in range(4)
+    ]
+
+    start = time.perf_counter()
+    results = rles_to_polygons_coordinates(rles)
+    serialised = [polygons.to_dict("multiple_polygons") for polygons in results]
+    elapsed = time.perf_counter() - start
+
+    print(f"\nconvert {len(rles)} masks with {len(serialised[0])} fragments each: {elapsed:.4f}s")
+    assert len(serialised[0]) > 1000
+    assert elapsed < MANY_FRAGMENTS_THRESHOLD, (
+        f"Converting {len(rles)} masks with many fragments took {elapsed:.4f}s, "
+        f"threshold is {MANY_FRAGMENTS_THRESHOLD}s"
+    )
@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+from encord.common import interval_index
+from encord.common.interval_index import IntervalIndex
+
+
+@pytest.fixture
+def index() -> IntervalIndex[str]:
+    index: IntervalIndex[str] = IntervalIndex()
+    index.add(10, 20, "a")
+    index.add(15, 30, "b")
+    index.add(40, 40, "c")
+    index.add(0, 100, "d")
+    return index
+
+
+def test_overlapping(index: IntervalIndex[str]) -> None:
+    assert index.overlapping(21, 39) == [(0, 100, "d"), (15, 30, "b")]
+    assert index.overlapping(101, 200) == []
+    assert [key for _, _, key in index.overlapping(0, 100)] == ["d", "a", "b", "c"]
+
+
+def test_at(index: IntervalIndex[str]) -> None:
+    assert index.at(15) == [(0, 100, "d"), (10, 20, "a"), (15, 30, "b")]
+    assert index.at(40) == [(0, 100, "d"), (40, 40, "c")]
+
+
+def test_nearest() -> None:
+    index: IntervalIndex[str] = IntervalIndex()
+    assert index.nearest(5) is None
+
+    index.add(10, 20, "a")
+    index.add(30, 30, "b")
+    assert index.nearest(0) == (10, 20, "a")
+    assert index.nearest(15) == (10, 20, "a")
+    assert index.nearest(24) == (10, 20, "a")
+    assert index.nearest(26) == (30, 30, "b")
+    # Ties go to the interval before the point
+    assert index.nearest(25) == (10, 20, "a")
+    assert index.nearest(1000) == (30, 30, "b")
+
+
+def test_remove(index: IntervalIndex[str]) -> None:
+    assert index.remove(0, 100, "d")
+    assert not index.remove(0, 100, "d")
+    assert not index.remove(10, 20, "b")
+
+    assert len(index) == 3
+    assert index.at(35) == []
+    assert index.nearest(35) == (15, 30, "b")
+
+
+def test_add_invalid_interval() -> None:
+    with pytest.raises(ValueError):
+        IntervalIndex().add(5, 4, "a")
+
+
+def test_matches_brute_force_across_blocks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(interval_index, "_BLOCK_SIZE", 4)
+    rng = random.Random(0)
+    index: IntervalIndex[str] = IntervalIndex()
+    intervals = set()
+
+    for step in range(2000):
+        if intervals and rng.random() < 0.4:
+            interval = rng.choice(sorted(intervals))
+            intervals.remove(interval)
+            assert index.remove(*interval)
+        else:
+            start = rng.randint(0, 1000)
+            interval = (start, start + rng.choice([0, 5, 50, 500]), str(step))
+            intervals.add(interval)
+            index.add(*interval)
+
+        point = rng.randint(-10, 1600)
+        assert index.overlapping(point, point + 20) == sorted(
+            i for i in intervals if i[0] <= point + 20 and i[1] >= point
+        )
+
+        nearest = index.nearest(point)
+        distances = [max(i[0] - point, point - i[1], 0) for i in intervals]
+        if nearest is None:
+            assert not intervals
+        else:
+            assert max(nearest[0] - point, point - nearest[1], 0) == min(distances)
+
+    assert list(index) == sorted(intervals)
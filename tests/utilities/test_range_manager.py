@@ -62,6 +62,15 @@ def test_get_intersection_with_other_frames(range_manager: RangeManager) -> None
 
 
 # Initialization tests
+def test_intersects(range_manager: RangeManager) -> None:
+    assert range_manager.intersects(RangeManager(frame_class=Range(start=0, end=2)))
+    assert range_manager.intersects(RangeManager(frame_class=[7, 8, 15]))
+    assert range_manager.intersects(RangeManager(frame_class=Range(start=0, end=100)))
+    assert not range_manager.intersects(RangeManager(frame_class=[0, 1, 6, 7, 8, 9, 21]))
+    assert not range_manager.intersects(RangeManager())
+    assert not RangeManager().intersects(range_manager)
+
+
 def test_initialize_with_single_int() -> None:
     rm = RangeManager(frame_class=5)
     actual_ranges = rm.get_ranges()
@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+
+import pytest
+
+from encord.common.range_map import RangeMap
+
+
+@dataclass
+class Value:
+    label: str
+
+
+@pytest.fixture
+def range_map() -> RangeMap[Value]:
+    range_map: RangeMap[Value] = RangeMap()
+    range_map.set(2, 5, Value("a"))
+    range_map.set(10, 20, Value("b"))
+    return range_map
+
+
+def test_get(range_map: RangeMap[Value]) -> None:
+    assert range_map.get(1) is None
+    assert range_map.get(2) == Value("a")
+    assert range_map.get(5) == Value("a")
+    assert range_map.get(6) is None
+    assert range_map.get(20) == Value("b")
+    assert 15 in range_map
+    assert 21 not in range_map
+
+
+def test_set_merges_equal_adjacent_values(range_map: RangeMap[Value]) -> None:
+    range_map.set(6, 9, Value("a"))
+    assert [(start, end) for start, end, _ in range_map.items()] == [(2, 9), (10, 20)]
+
+    range_map.set(21, 21, Value("b"))
+    assert [(start, end) for start, end, _ in range_map.items()] == [(2, 9), (10, 21)]
+    assert range_map.ranges() == [(2, 21)]
+
+
+def test_set_overwrites_part_of_segment(range_map: RangeMap[Value]) -> None:
+    range_map.set(12, 14, Value("c"))
+
+    assert [(start, end, value.label) for start, end, value in range_map.items()] == [
+        (2, 5, "a"),
+        (10, 11, "b"),
+        (12, 14, "c"),
+        (15, 20, "b"),
+    ]
+    # The split parts of a segment do not share a value
+    assert range_map.get(11) is not range_map.get(15)
+
+
+def test_remove(range_map: RangeMap[Value]) -> None:
+    removed = range_map.remove(4, 12)
+
+    assert removed == [(4, 5), (10, 12)]
+    assert [(start, end) for start, end, _ in range_map.items()] == [(2, 3), (13, 20)]
+    assert range_map.remove(30, 40) == []
+
+    range_map.remove(0, 100)
+    assert not range_map
+
+
+def test_isolate_allows_in_place_updates(range_map: RangeMap[Value]) -> None:
+    [(start, end, value)] = range_map.isolate(15, 15)
+    value.label = "changed"
+
+    assert (start, end) == (15, 15)
+    assert range_map.get(14) == Value("b")
+    assert range_map.get(15) == Value("changed")
+    assert range_map.get(16) == Value("b")
+
+
+def test_intersects_and_keys(range_map: RangeMap[Value]) -> None:
+    assert range_map.intersects(0, 2)
+    assert range_map.intersects(6, 10)
+    assert not range_map.intersects(6, 9)
+    assert list(range_map.keys()) == [2, 3, 4, 5, *range(10, 21)]